@@ -1,5 +1,6 @@
 from .headers import Header, Frame
 from .chunks import (
+    CHUNK_HEADER,
     Chunk,
     OldPaleteChunk_0x0004,
     OldPaleteChunk_0x0011,
@@ -16,6 +17,21 @@ from .chunks import (
 )
 
 
+# Chunk type -> class; layer chunks (0x2004) are numbered while parsing and handled separately
+CHUNK_TYPES = {
+    0x0004: OldPaleteChunk_0x0004,
+    0x0011: OldPaleteChunk_0x0011,
+    0x2005: CelChunk,
+    0x2006: CelExtraChunk,
+    0x2016: MaskChunk,
+    0x2017: PathChunk,
+    0x2018: FrameTagsChunk,
+    0x2019: PaletteChunk,
+    0x2020: UserDataChunk,
+    0x2022: SliceChunk,
+}
+
+
 class AsepriteFile(object):
     def __init__(self, data):
         self.header, self.frames = AsepriteFile.parse_data(data)
@@ -42,6 +58,8 @@ class AsepriteFile(object):
 
     @staticmethod
     def parse_data(data):
+        # Chunks keep zero-copy views into the file; cel pixels are inflated on first use
+        data = memoryview(data)
         head = Header(data)
         data_offset = Header.header_size
         frames = []
@@ -50,39 +68,24 @@ class AsepriteFile(object):
             frame = Frame(data, data_offset)
             frames.append(frame)
             frame.chunks = []
-            data_offset += frame.frame_size
+            chunk_offset = data_offset + Frame.frame_size
             for c in range(frame.num_chunks):
-                chunk = Chunk(data, data_offset)
-                if chunk.chunk_type == 0x2004:
-                    layer = LayerChunk(data, layer_index, data_offset)
+                (chunk_size, chunk_type) = CHUNK_HEADER.unpack_from(data, chunk_offset)
+                if chunk_type == 0x2004:
+                    layer = LayerChunk(data, layer_index, chunk_offset)
                     if layer.layer_type & 1 == 1:
                         frame.chunks.append(LayerGroupChunk(layer))
                     else:
                         frame.chunks.append(layer)
                     layer_index += 1
-                elif chunk.chunk_type == 0x2005:
-                    frame.chunks.append(CelChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2006:
-                    frame.chunks.append(CelExtraChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2016:
-                    frame.chunks.append(MaskChunk(data, data_offset))
-                elif chunk.chunk_type == 0x0004:
-                    frame.chunks.append(OldPaleteChunk_0x0004(data, data_offset))
-                elif chunk.chunk_type == 0x0011:
-                    frame.chunks.append(OldPaleteChunk_0x0011(data, data_offset))
-                elif chunk.chunk_type == 0x2017:
-                    frame.chunks.append(PathChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2018:
-                    frame.chunks.append(FrameTagsChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2019:
-                    frame.chunks.append(PaletteChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2020:
-                    frame.chunks.append(UserDataChunk(data, data_offset))
-                elif chunk.chunk_type == 0x2022:
-                    frame.chunks.append(SliceChunk(data, data_offset))
                 else:
-                    print("Skipped 0x{:04x}".format(chunk.chunk_type))
+                    chunk_class = CHUNK_TYPES.get(chunk_type)
+                    # Chunks this parser doesn't know (color profile, external files,
+                    # tilesets, ...) don't affect the drawn frames and are skipped
+                    if chunk_class is not None:
+                        frame.chunks.append(chunk_class(data, chunk_offset))
 
-                data_offset += chunk.chunk_size
+                chunk_offset += chunk_size
+            data_offset += frame.size
 
         return head, frames
@@ -2,11 +2,36 @@ from struct import Struct
 import zlib
 import math
 
+# Precompiled structs shared by every chunk instance. `data` is a memoryview over the
+# whole file, so the payloads below are zero-copy views rather than byte slices.
+WORD = Struct('<H')
+DWORD = Struct('<I')
+CHUNK_HEADER = Struct('<IH')
+CHUNK_HEADER_SIZE = CHUNK_HEADER.size
+
+OLD_PALETTE_PACKET = Struct('<BB')
+OLD_PALETTE_COLOR = Struct('<BBB')
+LAYER = Struct('<HHHHHHB3x')
+CEL = Struct('<HhhBH7x')
+CEL_SIZE = Struct('<HH')
+CEL_EXTRA = Struct('<HLLLL16x')
+MASK = Struct('<hhHH8x')
+FRAME_TAGS_HEAD = Struct('<H8x')
+FRAME_TAG = Struct('<HHB8x3Bx')
+PALETTE = Struct('<III8x')
+PALETTE_COLOR = Struct('<HBBBB')
+USER_DATA_COLOR = Struct('<BBBB')
+SLICE_CHUNK = Struct('<III')
+SLICE_KEY = Struct('<IiiII')
+SLICE_CENTER = Struct('<iiII')
+SLICE_PIVOT = Struct('<ii')
+
+
 # They're not 0-terminated strings, but they're prefixed with their size
 def parse_string(data, string_offset):
-    (string_length,) = Struct('<H').unpack_from(data, string_offset)
-
-    (string_name, ) = Struct('<{}s'.format(string_length)).unpack_from(data, string_offset+2)
+    (string_length,) = WORD.unpack_from(data, string_offset)
+    start = string_offset + 2
+    string_name = bytes(data[start:start + string_length])
     return (string_length + 2, string_name.decode('utf-8'))
 
 
@@ -14,27 +39,24 @@ class Chunk(object):
     chunk_format = '<IH'
 
     def __init__(self, data, data_offset=0):
-        chunk_struct = Struct(Chunk.chunk_format)
-        (self.chunk_size, self.chunk_type) = chunk_struct.unpack_from(data, data_offset)
+        (self.chunk_size, self.chunk_type) = CHUNK_HEADER.unpack_from(data, data_offset)
 
 class OldPaleteChunk_0x0004(Chunk):
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
 
-        packet_struct = Struct('<BB')
-        color_packet_struct = Struct('<BBB')
-
-        (self.num_packets,) = Struct('<H').unpack_from(data, data_offset+6)
+        (self.num_packets,) = WORD.unpack_from(data, data_offset+6)
         self.packets = []
 
         packet_offset = data_offset + 8
         for packet_index in range(self.num_packets):
             packet = {'colors':[]}
-            (packet['previous_packet_skip'], num_colors) = packet_struct.unpack_from(data, packet_offset)
+            (packet['previous_packet_skip'], num_colors) = OLD_PALETTE_PACKET.unpack_from(data, packet_offset)
             packet_offset += 2
-            for color in range(0, num_colors):
-                (red, blue, green) = color_packet_struct.unpack_from(data, packet_offset)
-                packet['colors'].append([red, blue, green])
+            # 0 means 256 colors
+            for color in range(0, num_colors or 256):
+                (red, green, blue) = OLD_PALETTE_COLOR.unpack_from(data, packet_offset)
+                packet['colors'].append([red, green, blue])
                 packet_offset += 3
 
             self.packets.append(packet)
@@ -43,19 +65,18 @@ class OldPaleteChunk_0x0011(Chunk):
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
 
-        packet_struct = Struct('<BB')
-        color_packet_struct = Struct('<BBB')
-        self.num_packets = Struct('<H').unpack_from(data, data_offset)
+        (self.num_packets,) = WORD.unpack_from(data, data_offset+6)
         self.packets = []
 
-        packet_offset = data_offset + 6
+        packet_offset = data_offset + 8
         for packet_index in range(self.num_packets):
             packet = {'colors':[]}
-            (packet.previous_packet_skip, num_colors) = packet_struct.unpack_from(data, packet_offset)
+            (packet['previous_packet_skip'], num_colors) = OLD_PALETTE_PACKET.unpack_from(data, packet_offset)
             packet_offset += 2
-            for color in range(0, num_colors):
-                (red, blue, green) = color_packet_struct.unpack_from(data, packet_offset)
-                packet['colors'].append([red, blue, green])
+            # 0 means 256 colors, components are 0-63
+            for color in range(0, num_colors or 256):
+                (red, green, blue) = OLD_PALETTE_COLOR.unpack_from(data, packet_offset)
+                packet['colors'].append([red, green, blue])
                 packet_offset += 3
 
             self.packets.append(packet)
@@ -65,7 +86,6 @@ class LayerChunk(Chunk):
 
     def __init__(self, data, layer_index, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        layer_struct = Struct(LayerChunk.layer_format)
         (
             self.flags,
             self.layer_type,
@@ -74,14 +94,16 @@ class LayerChunk(Chunk):
             self.default_height,
             self.blend_mode,
             self.opacity
-        ) = layer_struct.unpack_from(data, data_offset + 6)
-        _, self.name = parse_string(data, data_offset + 6 + layer_struct.size)
+        ) = LAYER.unpack_from(data, data_offset + 6)
+        _, self.name = parse_string(data, data_offset + 6 + LAYER.size)
         self.layer_index = layer_index
 
 
 class LayerGroupChunk(LayerChunk):
     def __init__(self, base_layer : LayerChunk):
         """Constructed from its base version"""
+        self.chunk_size = base_layer.chunk_size
+        self.chunk_type = base_layer.chunk_type
         self.flags = base_layer.flags
         self.layer_type = base_layer.layer_type
         self.layer_child_level = base_layer.layer_child_level
@@ -94,6 +116,24 @@ class LayerGroupChunk(LayerChunk):
         self.children = []
 
 
+class CelData(dict):
+    """Cel dictionary whose 'data' entry (the pixel bytes) is produced on first access
+
+    Compressed cels keep a view of their zlib stream and are only inflated when a frame
+    using them is drawn; raw cels expose a view into the file without copying."""
+
+    def __init__(self, width, height, payload, compressed):
+        dict.__init__(self, width=width, height=height)
+        self.payload = payload
+        self.compressed = compressed
+
+    def __missing__(self, key):
+        if key != 'data':
+            raise KeyError(key)
+        pixels = zlib.decompress(self.payload) if self.compressed else self.payload
+        self['data'] = pixels
+        return pixels
+
 
 class CelChunk(Chunk):
     cel_format = '<HhhBH7x'
@@ -101,69 +141,56 @@ class CelChunk(Chunk):
 
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        cel_struct = Struct(CelChunk.cel_format)
         (
             self.layer_index,
             self.x_pos,
             self.y_pos,
             self.opacity,
             self.cel_type
-        ) = cel_struct.unpack_from(data, data_offset + 6)
-        cel_offset = data_offset + cel_struct.size + 6
-        cel_struct = Struct(CelChunk.cel_type_format)
-        if self.cel_type == 0:
-            self.data = {}
-            (
-                self.data['width'],
-                self.data['height']
-            ) = cel_struct.unpack_from(data, cel_offset)
-            start_range = cel_offset + cel_struct.size
+        ) = CEL.unpack_from(data, data_offset + 6)
+        cel_offset = data_offset + CEL.size + 6
+        if self.cel_type == 0 or self.cel_type == 2:
+            (width, height) = CEL_SIZE.unpack_from(data, cel_offset)
+            start_range = cel_offset + CEL_SIZE.size
             end_range = data_offset + self.chunk_size
-            self.data['data'] = data[start_range:end_range]
+            self.data = CelData(width, height, data[start_range:end_range], self.cel_type == 2)
         elif self.cel_type == 1:
-            self.data = {'link': Struct('<H').unpack_from(data, cel_offset)}
-        elif self.cel_type == 2:
+            (link,) = WORD.unpack_from(data, cel_offset)
+            self.data = {'link': link}
+        else:
+            # Compressed tilemaps and future cel types carry no image data we can draw
             self.data = {}
-            (
-                self.data['width'],
-                self.data['height']
-            ) = cel_struct.unpack_from(data, cel_offset)
-            start_range = cel_offset + cel_struct.size
-            end_range = data_offset + self.chunk_size
-            self.data['data'] = zlib.decompress(data[start_range:end_range])
 
 class CelExtraChunk(Chunk):
     celextra_format = '<HLLLL16x'
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        cel_struct = Struct(CelExtraChunk.celextra_format)
         (
             self.flags,
             self.precise_x_pos,
             self.precise_y_pos,
             self.cel_width,
             self.cel_height
-        ) = cel_struct.unpack_from(data, data_offset + 6)
+        ) = CEL_EXTRA.unpack_from(data, data_offset + 6)
 
 class MaskChunk(Chunk):
     mask_format = '<hhHH8x'
 
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        mask_struct = Struct(MaskChunk.mask_format)
         (
             self.x_pos,
             self.y_pos,
             self.width,
             self.height
-        ) = mask_struct.unpack_from(data, data_offset + 6)
+        ) = MASK.unpack_from(data, data_offset + 6)
 
-        name_offset = data_offset + 6 + mask_struct.size
+        name_offset = data_offset + 6 + MASK.size
         string_size, self.name = parse_string(data, name_offset)
 
         start_range = name_offset + string_size
         end_range = start_range + math.ceil(self.height*((self.width+7)/8))
-        self.bitmap = data[start_range:start_range:end_range]
+        self.bitmap = data[start_range:end_range]
 
 class PathChunk(Chunk):
     pass
@@ -174,14 +201,11 @@ class FrameTagsChunk(Chunk):
 
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        palette_struct = Struct(FrameTagsChunk.frametag_head_format)
-        (num_tags,) = palette_struct.unpack_from(data, data_offset + 6)
-
+        (num_tags,) = FRAME_TAGS_HEAD.unpack_from(data, data_offset + 6)
 
         self.tags = []
-        tag_offset = data_offset + palette_struct.size + 6
+        tag_offset = data_offset + FRAME_TAGS_HEAD.size + 6
 
-        palette_tag_struct = Struct(FrameTagsChunk.frametag_format)
         for index in range(num_tags):
             tag = {'color':{}}
             (
@@ -191,9 +215,9 @@ class FrameTagsChunk(Chunk):
                 tag['color']['red'],
                 tag['color']['green'],
                 tag['color']['blue']
-            ) = palette_tag_struct.unpack_from(data, tag_offset)
+            ) = FRAME_TAG.unpack_from(data, tag_offset)
             self.tags.append(tag)
-            tag_offset += palette_tag_struct.size
+            tag_offset += FRAME_TAG.size
             string_size, tag['name'] = parse_string(data, tag_offset)
             tag_offset += string_size
 
@@ -202,26 +226,24 @@ class PaletteChunk(Chunk):
 
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
-        palette_struct = Struct(PaletteChunk.palette_format)
         (
             self.palette_size,
             self.first_color_index,
             self.last_color_index
-        ) = palette_struct.unpack_from(data, data_offset + 6)
-        color_struct = Struct('<HBBBB')
+        ) = PALETTE.unpack_from(data, data_offset + 6)
         self.colors = []
 
-        color_offset = data_offset + 6 + palette_struct.size
+        color_offset = data_offset + 6 + PALETTE.size
         for index in range(self.first_color_index, self.last_color_index+1):
             color = {'name':None}
             (
                 color['flags'],
                 color['red'],
-                color['blue'],
                 color['green'],
+                color['blue'],
                 color['alpha']
-            ) = color_struct.unpack_from(data, color_offset)
-            color_offset += color_struct.size
+            ) = PALETTE_COLOR.unpack_from(data, color_offset)
+            color_offset += PALETTE_COLOR.size
             if color['flags'] & 1 != 0:
                 string_size, color['name'] = parse_string(data, color_offset)
                 color_offset += string_size
@@ -232,7 +254,7 @@ class UserDataChunk(Chunk):
     def __init__(self, data, data_offset=0):
         Chunk.__init__(self, data, data_offset)
         userdata_offset = data_offset + 6
-        (self.flags,) = Struct('<I').unpack_from(data, userdata_offset)
+        (self.flags,) = DWORD.unpack_from(data, userdata_offset)
         userdata_offset += 4
         if self.flags & 1 != 0:
             string_size, self.string = parse_string(data, userdata_offset)
@@ -243,7 +265,7 @@ class UserDataChunk(Chunk):
                 self.green,
                 self.blue,
                 self.alpha
-            ) = Struct('<BBBB').unpack_from(data, userdata_offset)
+            ) = USER_DATA_COLOR.unpack_from(data, userdata_offset)
 
 class SliceChunk(Chunk):
     slice_chunk_format = '<III'
@@ -257,9 +279,8 @@ class SliceChunk(Chunk):
         Chunk.__init__(self, data, data_offset)
         slice_offset  = data_offset + 6
 
-        slice_chunk_struct = Struct(SliceChunk.slice_chunk_format)
-        num_slices, self.flags, self.reserved = slice_chunk_struct.unpack_from(data, slice_offset)
-        slice_offset += slice_chunk_struct.size
+        num_slices, self.flags, self.reserved = SLICE_CHUNK.unpack_from(data, slice_offset)
+        slice_offset += SLICE_CHUNK.size
 
         string_size, self.name = parse_string(data, slice_offset)
         slice_offset += string_size
@@ -267,7 +288,6 @@ class SliceChunk(Chunk):
         self.slices = []
 
         for i in range(num_slices):
-            slice_struct = Struct(SliceChunk.slice_format)
             slice = {}
             (
                 slice['start_frame'],
@@ -275,24 +295,22 @@ class SliceChunk(Chunk):
                 slice['y'],
                 slice['width'],
                 slice['height']
-            ) = slice_struct.unpack_from(data, slice_offset)
-            slice_offset += slice_struct.size
+            ) = SLICE_KEY.unpack_from(data, slice_offset)
+            slice_offset += SLICE_KEY.size
             if self.flags & 1 != 0:
-                slice_bit_1_struct = Struct(SliceChunk.slice_bit_1_format)
                 slice['center'] = {}
                 (
                     slice['center']['x'],
                     slice['center']['y'],
                     slice['center']['width'],
                     slice['center']['height']
-                ) = slice_bit_1_struct.unpack_from(data, slice_offset)
-                slice_offset += slice_bit_1_struct.size
+                ) = SLICE_CENTER.unpack_from(data, slice_offset)
+                slice_offset += SLICE_CENTER.size
             if self.flags & 2 != 0:
-                slice_bit_2_struct = Struct(SliceChunk.slice_bit_2_format)
                 slice['pivot'] = {}
                 (
                     slice['pivot']['x'],
                     slice['pivot']['y'],
-                ) = slice_bit_2_struct.unpack_from(data, slice_offset)
-                slice_offset += slice_bit_2_struct.size
-            self.slices.append(slice)
\ No newline at end of file
+                ) = SLICE_PIVOT.unpack_from(data, slice_offset)
+                slice_offset += SLICE_PIVOT.size
+            self.slices.append(slice)
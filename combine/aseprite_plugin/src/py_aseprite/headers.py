@@ -1,13 +1,14 @@
 from struct import Struct
 
+HEADER = Struct('<IHHHHHI2x8xB3xHBB92x')
+FRAME = Struct('<IHHH2xI')
+
 
 class Header(object):
     header_format = '<IHHHHHI2x8xB3xHBB92x'
     header_size = 128
 
     def __init__(self, data, data_offset = 0):
-        header_struct = Struct(Header.header_format)
-
         (
             self.filesize,
             self.magic_number,
@@ -20,7 +21,7 @@ class Header(object):
             self.num_colors,
             self.pixel_width,
             self.pixel_height
-        ) = header_struct.unpack_from(data, data_offset)
+        ) = HEADER.unpack_from(data, data_offset)
 
         if self.magic_number != 0xA5E0:
             raise ValueError('Incorrect magic number, expected {:x}, got {:x}'.format(0xA5E0, self.magic_number))
@@ -30,13 +31,16 @@ class Frame(object):
     frame_size = 16
 
     def __init__(self, data, data_offset = 0):
-        frame_struct = Struct(Frame.frame_format)
         (
             self.size,
             self.magic_number,
             self.num_chunks,
-            self.frame_duration
-        ) = frame_struct.unpack_from(data, data_offset)
+            self.frame_duration,
+            num_chunks
+        ) = FRAME.unpack_from(data, data_offset)
+        # Newer files store the chunk count in a DWORD; 0 means use the old WORD field
+        if num_chunks:
+            self.num_chunks = num_chunks
 
         if self.magic_number != 0xF1FA:
             raise ValueError('Incorrect magic number, expected {:x}, got {:x}'.format(0xF1FA, self.magic_number))
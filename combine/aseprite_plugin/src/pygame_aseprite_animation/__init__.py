@@ -1,4 +1,5 @@
 from .pygame_aseprite_animation import Animation
 from .pygame_aseprite_animation import AnimationManager
+from .cache import load_animation
 
-__all__ = ["Animation", "AnimationManager"]
\ No newline at end of file
+__all__ = ["Animation", "AnimationManager", "load_animation"]
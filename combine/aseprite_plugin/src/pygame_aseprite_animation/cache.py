@@ -0,0 +1,136 @@
+"""On-disk cache of decoded animations
+
+Decoding an .aseprite file means parsing every chunk, inflating every cel and
+compositing the layers. The result only changes when the file does, so the
+flattened frames are stored as one horizontal sprite-strip PNG next to a JSON
+sidecar holding the frame durations, tags and slices. Both are named after a
+hash of the file contents, so an edited file simply misses the cache; a
+repeat load is one PNG decode.
+
+A load can be scoped to some tags: only their frames are decoded and
+stored, and a later load that needs more frames decodes the missing ones
+and rewrites the entry with the union.
+
+Usage:
+
+    animation = load_animation('player.aseprite', tags=('idle', 'run'))
+    idle = animation.tag_ranges()['Idle']
+"""
+from .pygame_aseprite_animation import Animation
+from .pygame_aseprite_animation import read_tags
+from .pygame_aseprite_animation import select_tags
+
+from pathlib import Path
+import hashlib
+import json
+import pygame
+
+CACHE_VERSION = 3
+CACHE_DIRNAME = '__asecache__'
+
+
+def file_hash(data):
+    """Content hash used to name cache entries
+
+    :data: the raw bytes of the .ase/.aseprite file\\n
+    :return: hex digest"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def cache_paths(filedir, digest, cache_dir=None):
+    """Strip and sidecar paths for a file
+
+    :filedir: path of the .ase/.aseprite file\\n
+    :digest: file_hash() of its contents\\n
+    :cache_dir: directory for cache entries; defaults to __asecache__ next to the file\\n
+    :return: (png path, json path)"""
+    filedir = Path(filedir)
+    directory = Path(cache_dir) if cache_dir is not None else filedir.parent / CACHE_DIRNAME
+    stem = '{}-{}'.format(filedir.stem, digest[:16])
+    return directory / (stem + '.png'), directory / (stem + '.json')
+
+
+def read_cache(strip_path, sidecar_path, digest):
+    """Loads a cache entry
+
+    :return: (metadata dict, {num_frame: Surface}), or None when the entry is missing, stale or unreadable"""
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION or meta.get('hash') != digest:
+            return None
+        strip = pygame.image.load(str(strip_path))
+    except (OSError, ValueError, pygame.error):
+        return None
+    width, height = meta['width'], meta['height']
+    indices = meta['frames']
+    if strip.get_size() != (width * len(indices), height):
+        return None
+    frames = {num_frame: strip.subsurface((index * width, 0, width, height)) for index, num_frame in enumerate(indices)}
+    return meta, frames
+
+
+def write_cache(animation, strip_path, sidecar_path, digest):
+    """Stores every frame of an animation decoded so far. Failing to write (read-only install, ...) is not an error
+
+    :return: True when the entry was written"""
+    frames = animation.animation_frames.decoded()
+    if not frames:
+        return False
+    indices = sorted(frames)
+    width, height = frames[indices[0]].get_size()
+    strip = pygame.Surface((width * len(indices), height), pygame.SRCALPHA)
+    for index, num_frame in enumerate(indices):
+        strip.blit(frames[num_frame], (index * width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    tags = read_tags(animation.aseprite_file) if animation.aseprite_file is not None else animation.tags
+    meta = {
+        'version': CACHE_VERSION,
+        'hash': digest,
+        'width': width,
+        'height': height,
+        'frames': indices,
+        'durations': list(animation.frame_duration),
+        'tags': tags,
+        'slices': animation.slices,
+    }
+    try:
+        strip_path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(strip, str(strip_path))
+        # Sidecar last: its presence marks the entry complete
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except (OSError, pygame.error):
+        return False
+    return True
+
+
+def load_animation(filedir, cache_dir=None, tags=None, lazy=False):
+    """Loads an .ase/.aseprite file through the cache
+
+    :filedir: Path to your .ase or .aseprite files\n
+    :cache_dir: where cache entries live; defaults to __asecache__ next to the file\n
+    :tags: optional tag names (case-insensitive) to load; only their frames are decoded\n
+    :lazy: if True nothing is decoded up front; call prefetch() or let frames decode on access.
+    Frames decoded after the call are not written back to the cache\n
+    :return: Animation object with animation_frames, frame_duration, tags and slices"""
+    with open(filedir, 'rb') as f:
+        digest = file_hash(f.read())
+    strip_path, sidecar_path = cache_paths(filedir, digest, cache_dir)
+    entry = read_cache(strip_path, sidecar_path, digest)
+    if entry is not None:
+        meta, frames = entry
+        animation = Animation.from_frames(frames, meta['durations'], select_tags(meta.get('tags', ()), tags),
+                                          meta.get('slices', ()), filedir)
+        animation.tag_subset = tags is not None
+        if lazy or all(num_frame in frames for num_frame in animation.tag_frames()):
+            return animation
+        cached = len(frames)
+    else:
+        animation = Animation(filedir, tags, _lazy=True)
+        if lazy:
+            return animation
+        cached = 0
+    animation.prefetch()
+    if len(animation.animation_frames.decoded()) > cached:
+        write_cache(animation, strip_path, sidecar_path, digest)
+    return animation
@@ -1,32 +1,279 @@
 from py_aseprite import AsepriteFile
 from py_aseprite import CelChunk
+from py_aseprite import LayerGroupChunk
+from py_aseprite import PaletteChunk
+from py_aseprite import OldPaleteChunk_0x0004
+from py_aseprite import FrameTagsChunk
+from py_aseprite import SliceChunk
 
+from collections.abc import Sequence
 from enum import Enum
 from pathlib import Path
+import numpy as np
 import pygame
 import time
 
+# Header color depths (bits per pixel)
+COLOR_DEPTH_RGBA = 32
+COLOR_DEPTH_GRAYSCALE = 16
+COLOR_DEPTH_INDEXED = 8
+
+# Layer flags and header flags
+LAYER_VISIBLE = 1
+HEADER_LAYER_OPACITY_VALID = 1
+
+# Cel types
+CEL_LINKED = 1
+
+# Aseprite blend modes that pygame can reproduce: mode -> (blit flag, neutral colour)
+# The neutral colour is what a fully transparent source pixel must become so that
+# the blend leaves the destination untouched. Other modes are drawn as normal.
+BLEND_NORMAL = 0
+BLEND_FLAGS = {
+    1: (pygame.BLEND_RGB_MULT, 255),    # multiply
+    4: (pygame.BLEND_RGB_MIN, 255),     # darken
+    5: (pygame.BLEND_RGB_MAX, 0),       # lighten
+    16: (pygame.BLEND_RGB_ADD, 0),      # addition
+    17: (pygame.BLEND_RGB_SUB, 0),      # subtract
+}
+
+
+def palette_table(aseprite_file):
+    """Builds a (256, 4) uint8 RGBA lookup table from the file's palette chunks
+
+    :aseprite_file: parsed AsepriteFile\n
+    :return: numpy array indexed by palette entry; unset entries are transparent black"""
+    table = np.zeros((256, 4), dtype=np.uint8)
+    chunks = [chunk for frame in aseprite_file.frames for chunk in frame.chunks]
+    palettes = [chunk for chunk in chunks if isinstance(chunk, PaletteChunk)]
+    if palettes:
+        for chunk in palettes:
+            for offset, color in enumerate(chunk.colors):
+                index = chunk.first_color_index + offset
+                if index < 256:
+                    table[index] = (color['red'], color['green'], color['blue'], color['alpha'])
+    else:
+        # Files written before the new palette chunk only carry the old one (no alpha)
+        for chunk in chunks:
+            if isinstance(chunk, OldPaleteChunk_0x0004):
+                index = 0
+                for packet in chunk.packets:
+                    index += packet['previous_packet_skip']
+                    for rgb in packet['colors']:
+                        if index < 256:
+                            table[index] = (*rgb, 255)
+                        index += 1
+    return table
+
+
+def decode_cel_pixels(cel, color_depth, palette=None, transparent_index=0):
+    """Converts a cel's raw pixel buffer to numpy arrays in one pass
+
+    :cel: CelChunk holding raw or decompressed image data\n
+    :color_depth: header color depth (32, 16 or 8)\n
+    :palette: (256, 4) table from palette_table(), needed for indexed files\n
+    :transparent_index: palette entry that is always transparent in indexed files\n
+    :return: (rgba, drawn) where rgba is (height, width, 4) uint8 and drawn is a (height, width)
+    bool mask of the pixels the cel paints. Pixels whose RGB is all 0 are not painted."""
+    width, height = cel.data['width'], cel.data['height']
+    raw = np.frombuffer(cel.data['data'], dtype=np.uint8)
+    if color_depth == COLOR_DEPTH_RGBA:
+        rgba = raw[:width * height * 4].reshape(height, width, 4)
+        drawn = rgba[..., :3].any(axis=2)
+    elif color_depth == COLOR_DEPTH_GRAYSCALE:
+        pixels = raw[:width * height * 2].reshape(height, width, 2)
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+        rgba[..., :3] = pixels[..., :1]
+        rgba[..., 3] = pixels[..., 1]
+        drawn = pixels[..., 0] != 0
+    elif color_depth == COLOR_DEPTH_INDEXED:
+        if palette is None:
+            raise ValueError('Indexed cel decoded without a palette')
+        indices = raw[:width * height].reshape(height, width)
+        rgba = palette[indices]
+        drawn = rgba[..., :3].any(axis=2) & (indices != transparent_index)
+    else:
+        raise ValueError('Unsupported color depth {}'.format(color_depth))
+    return rgba, drawn
+
+
+def cel_surface(rgba, drawn, opacity=255, blend_mode=BLEND_NORMAL):
+    """Builds the surface a cel is composited with
+
+    :rgba/drawn: output of decode_cel_pixels()\n
+    :opacity: combined cel and layer opacity, 0-255\n
+    :blend_mode: Aseprite blend mode of the layer\n
+    :return: pygame.Surface() the size of the cel. For normal layers the opacity is folded
+    into per-pixel alpha; for the RGB blend modes in BLEND_FLAGS colours are pre-blended
+    towards the mode's neutral colour, since pygame's blend flags ignore alpha."""
+    height, width = drawn.shape
+    alpha = np.where(drawn, rgba[..., 3], 0).astype(np.uint16)
+    if opacity < 255:
+        alpha = (alpha * opacity + 127) // 255
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    if blend_mode in BLEND_FLAGS:
+        neutral = BLEND_FLAGS[blend_mode][1]
+        weight = alpha[..., None]
+        pixels[..., :3] = (rgba[..., :3] * weight + neutral * (255 - weight) + 127) // 255
+        pixels[..., 3] = 255
+    else:
+        pixels[..., :3] = rgba[..., :3]
+        pixels[..., 3] = alpha
+    return pygame.image.frombuffer(pixels.tobytes(), (width, height), 'RGBA')
+
+
+def read_tags(aseprite_file):
+    """Collects the frame tags of a parsed file
+
+    :aseprite_file: parsed AsepriteFile\n
+    :return: list of dicts with name, from, to (inclusive) and loop (0 forward, 1 reverse, 2 ping-pong)"""
+    tags = []
+    for frame in aseprite_file.frames:
+        for chunk in frame.chunks:
+            if isinstance(chunk, FrameTagsChunk):
+                tags.extend({'name': tag['name'], 'from': tag['from'], 'to': tag['to'], 'loop': tag['loop']}
+                            for tag in chunk.tags)
+    return tags
+
+
+def select_tags(tags, names):
+    """Filters read_tags() output to the given names, compared case-insensitively
+
+    :names: iterable of tag names, or None to keep every tag"""
+    if names is None:
+        return list(tags)
+    wanted = {name.lower() for name in names}
+    return [tag for tag in tags if tag['name'].lower() in wanted]
+
+
+def read_slices(aseprite_file):
+    """Collects the slices of a parsed file
+
+    :aseprite_file: parsed AsepriteFile\n
+    :return: list of dicts with name and keys (start_frame, x, y, width, height and optional center/pivot)"""
+    slices = []
+    for frame in aseprite_file.frames:
+        for chunk in frame.chunks:
+            if isinstance(chunk, SliceChunk):
+                slices.append({'name': chunk.name, 'keys': [dict(key) for key in chunk.slices]})
+    return slices
+
+
+class FrameList(Sequence):
+    """List of frames that are decoded on first access
+
+    Indexing and slicing behave like a list of pygame.Surface() objects; a frame is drawn
+    by the :decode: callback the first time it is read and kept afterwards.
+
+    :length: number of frames\n
+    :decode: callable num_frame -> pygame.Surface()\n
+    :frames: optional {num_frame: Surface} of frames that are already decoded"""
+
+    def __init__(self, length, decode, frames=None):
+        self._frames = [None] * length
+        self._decode = decode
+        for num_frame, frame in (frames or {}).items():
+            self._frames[num_frame] = frame
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._frames)))]
+        frame = self._frames[index]
+        if frame is None:
+            frame = self._frames[index] = self._decode(index % len(self._frames))
+        return frame
+
+    def is_decoded(self, num_frame):
+        return self._frames[num_frame] is not None
+
+    def decoded(self):
+        """Returns {num_frame: Surface} for every frame decoded so far"""
+        return {num_frame: frame for num_frame, frame in enumerate(self._frames) if frame is not None}
+
+
 class Animation(object):
     """A class that contains all of the animations and frame duration information
     TODO: Maybe add name property to assign to animations
 
     Artibutes:
         :aseprite_file: the loaded in aseprite file. Shouldn't have to use this file\n
-        :animation_frames: a list of pygame.Surface() objects, each containing a single frames\n
-        :frame_duration: a list of the duration each frame should be displayed. Index matches that of :animation_frame:"""
+        :animation_frames: a FrameList of pygame.Surface() objects, each containing a single frame, decoded on first access\n
+        :frame_duration: a list of the duration each frame should be displayed. Index matches that of :animation_frame:\n
+        :tags: frame tags read from the file, see read_tags()\n
+        :slices: slices read from the file, see read_slices()"""
 
-    def __init__(self, _filedir):
+    def __init__(self, _filedir, _tags=None, _lazy=False):
         """Instanciate a animation object
         
         :_filedir: Path to your .ase or .aseprite files\n
+        :_tags: optional tag names (case-insensitive) this animation is used for. Only those
+        tags are listed in :tags: and decoded by prefetch(); other frames still decode on access\n
+        :_lazy: if True, frames are decoded on first access instead of up front\n
         :return: Animation object containt your frames as a list of pygame.surface() objects """
 
+        self.filedir = _filedir
         # load aseprite file
         self.aseprite_file = self.parseFile(_filedir)
-        # create precompiled list of surfaces for each frame
-        self.animation_frames = self.draw_all_animation_frames()
+        # list of surfaces for each frame, drawn when first used
+        self.animation_frames = FrameList(self.aseprite_file.header.num_frames, self.draw_single_frame)
         # Create list of frame duration for each frame
         self.frame_duration = [frame.frame_duration for frame in self.aseprite_file.frames]
+        # Metadata, so callers don't have to parse the file a second time
+        self.tags = select_tags(read_tags(self.aseprite_file), _tags)
+        self.slices = read_slices(self.aseprite_file)
+        self.tag_subset = _tags is not None
+        if not _lazy:
+            self.prefetch()
+
+    @classmethod
+    def from_frames(cls, _frames, _durations, _tags=(), _slices=(), _filedir=None):
+        """Builds an Animation from already decoded frames, e.g. loaded from a cache
+
+        :_frames: list of pygame.Surface() objects, or {num_frame: Surface} for a subset\n
+        :_durations: duration of each frame in milliseconds\n
+        :_tags/_slices: metadata in the format of read_tags()/read_slices()\n
+        :_filedir: file to parse if a frame missing from :_frames: is accessed\n
+        :return: Animation object; the file is only parsed when a missing frame is needed"""
+        animation = cls.__new__(cls)
+        animation.filedir = _filedir
+        animation.aseprite_file = None
+        if not isinstance(_frames, dict):
+            _frames = dict(enumerate(_frames))
+        animation.animation_frames = FrameList(len(_durations), animation.draw_single_frame, _frames)
+        animation.frame_duration = list(_durations)
+        animation.tags = list(_tags)
+        animation.slices = list(_slices)
+        animation.tag_subset = False
+        return animation
+
+    def tag_ranges(self):
+        """Maps each tag name to its inclusive (from, to) frame range"""
+        return {tag['name']: (tag['from'], tag['to']) for tag in self.tags}
+
+    def tag_frames(self, _tags=None):
+        """Frame indices covered by tags
+
+        :_tags: tag names (case-insensitive); None means :tags:, or every frame when the
+        animation was not built for a tag subset"""
+        if _tags is None and not self.tag_subset:
+            return list(range(len(self.frame_duration)))
+        tags = self.tags if _tags is None else select_tags(self.tags, _tags)
+        return sorted({num_frame for tag in tags for num_frame in range(tag['from'], tag['to'] + 1)})
+
+    def prefetch(self, _tags=None):
+        """Decodes frames now rather than on first access
+
+        :_tags: tag names to decode, see tag_frames()\n
+        :return: the number of frames that had to be decoded"""
+        decoded = 0
+        for num_frame in self.tag_frames(_tags):
+            if not self.animation_frames.is_decoded(num_frame):
+                self.animation_frames[num_frame]
+                decoded += 1
+        return decoded
 
     def parseFile(self, filedir):
         """Uses py_aseprite to load the file
@@ -40,55 +287,103 @@ class Animation(object):
         """Goes through .ase or .aseprite file and draws all of your frames
         
         :return: animation_frames which is a list of every individual frame"""
-        animation_frames = []
-        for frame_number in range(self.aseprite_file.header.num_frames):
-                frame = self.draw_single_frame(frame_number)
-                animation_frames.append(frame)
+        return [self.animation_frames[frame_number] for frame_number in range(len(self.animation_frames))]
+
+    def visible_layers(self, _layers=None, _opacity=255):
+        """Walks the layer tree bottom to top, descending into groups
 
-        return animation_frames
+        :return: list of (layer, opacity) for every visible image layer; opacity includes
+        the opacity of the groups it is nested in"""
+        if _layers is None:
+            _layers = self.aseprite_file.layer_tree
+        use_opacity = self.aseprite_file.header.flags & HEADER_LAYER_OPACITY_VALID
+        layers = []
+        for layer in _layers:
+            if not layer.flags & LAYER_VISIBLE:
+                continue
+            opacity = (_opacity * layer.opacity + 127) // 255 if use_opacity else _opacity
+            if isinstance(layer, LayerGroupChunk):
+                layers.extend(self.visible_layers(layer.children, opacity))
+            else:
+                layers.append((layer, opacity))
+        return layers
+
+    def resolve_cel(self, num_frame, layer_index):
+        """Finds the cel drawn for a layer in a frame, following linked cels
+
+        :return: (frame index owning the pixel data, CelChunk) or None if the layer is empty"""
+        seen = set()
+        while num_frame not in seen:
+            seen.add(num_frame)
+            cel = self._cels[num_frame].get(layer_index)
+            if cel is None or cel.cel_type != CEL_LINKED:
+                return (num_frame, cel) if cel is not None else None
+            num_frame = cel.data['link']
+        return None
 
     def draw_single_frame(self, num_frame):
         """Draws single frame onto an empty pygame.Surface
-        
+
+        Cels are decoded once per unique (frame, layer) after resolving links, and frames
+        made of the same cels share one surface.
+
         :num_frame: index of the frame to be drawn\n
         :return: frame which is a pygame.Surface() of the same size as the aseprite file onto which the pixels are drawn """
-        cel_slice = [None] * len(self.aseprite_file.layers)
+        if self.aseprite_file is None:
+            # Built from cached frames; parse only once a frame that wasn't cached is needed
+            self.aseprite_file = self.parseFile(self.filedir)
+        if getattr(self, '_cels', None) is None:
+            # per frame: layer index -> CelChunk
+            self._cels = [{chunk.layer_index: chunk for chunk in frame.chunks if isinstance(chunk, CelChunk)}
+                          for frame in self.aseprite_file.frames]
+            self._layers = self.visible_layers()
+            self._cel_surfaces = {}
+            self._frame_surfaces = {}
 
-        #read slices
-        for chunk in self.aseprite_file.frames[num_frame].chunks:
-            if isinstance(chunk, CelChunk):
-                cel_slice[chunk.layer_index] = chunk
+        cels = []
+        for layer, opacity in self._layers:
+            resolved = self.resolve_cel(num_frame, layer.layer_index)
+            if resolved is not None:
+                cels.append((layer, opacity, resolved[0], resolved[1]))
+        key = tuple((layer.layer_index, source) for layer, _, source, _ in cels)
+        frame = self._frame_surfaces.get(key)
+        if frame is not None:
+            return frame
 
         #initialize frame surface
         frame = pygame.Surface((self.aseprite_file.header.width, self.aseprite_file.header.height), pygame.SRCALPHA)
         frame.fill((255,0,0,0))
         # draw layers on top of each other
-        for layer in self.aseprite_file.layer_tree:
-            current_cel = cel_slice[layer.layer_index]
-            if current_cel:
-                frame = self.draw_raw_image_data(current_cel, frame)
+        for layer, opacity, source, cel in cels:
+            frame = self.draw_raw_image_data(cel, frame, layer, opacity, source)
+        self._frame_surfaces[key] = frame
         return frame
 
-    def draw_raw_image_data(self, cel :CelChunk, frame):
+    def draw_raw_image_data(self, cel :CelChunk, frame, layer=None, opacity=255, source=None):
         """Actually reads the pixel data and draw it onto the surface() layer by layer
         
         :cel: CelChunk object from the raw aseprite file, handles by py_aseprite\n
         :frame: the pygame.Surface() onto which the data will be drawn\n
+        :layer: the LayerChunk the cel belongs to (for its blend mode)\n
+        :opacity: opacity of the layer, combined with the cel's own opacity\n
+        :source: frame index owning the cel; decoded cels are reused per (source, layer)\n
         :return: the pygame.Surface(), but with the layer drawn onto it"""
-        data = list(cel.data['data'])
-        for y in range(cel.data['height']):
-            for x in range(cel.data['width']):
-                base_offset = y * cel.data['width'] + x
-                CHANNELRED      = data[base_offset * 4]
-                CHANNELGREEN    = data[base_offset * 4 + 1]
-                CHANNELBLUE     = data[base_offset * 4 + 2]
-                if (CHANNELRED + CHANNELGREEN + CHANNELBLUE == 0):
-                    CHANNELALPHA = 0
-                else:
-                    CHANNELALPHA    = data[base_offset * 4 + 3]
-                    frame.set_at((x + cel.x_pos, y + cel.y_pos), pygame.Color(CHANNELRED, CHANNELGREEN, CHANNELBLUE, CHANNELALPHA))
-                
-                
+        blend_mode = layer.blend_mode if layer is not None else BLEND_NORMAL
+        key = (source, cel.layer_index)
+        surface = self._cel_surfaces.get(key) if source is not None else None
+        if surface is None:
+            header = self.aseprite_file.header
+            palette = None
+            if header.color_depth == COLOR_DEPTH_INDEXED:
+                if getattr(self, '_palette', None) is None:
+                    self._palette = palette_table(self.aseprite_file)
+                palette = self._palette
+            rgba, drawn = decode_cel_pixels(cel, header.color_depth, palette, header.palette_mask)
+            surface = cel_surface(rgba, drawn, (opacity * cel.opacity + 127) // 255, blend_mode)
+            if source is not None:
+                self._cel_surfaces[key] = surface
+        flags = BLEND_FLAGS[blend_mode][0] if blend_mode in BLEND_FLAGS else 0
+        frame.blit(surface, (cel.x_pos, cel.y_pos), special_flags=flags)
         return frame
 
 class AnimationManager(object):
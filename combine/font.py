@@ -4,6 +4,7 @@ This file is a direct move of `src/utils/font.py` so that lightweight
 `combine` scripts can use font helpers without importing from `src`.
 """
 import os
+from collections import OrderedDict
 import pygame
 
 _FONT_PATHS = [
@@ -20,11 +21,17 @@ _FONT_PATHS = [
 ]
 
 
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 def _find_font_path():
-    # Check common explicit locations first
-    for p in _FONT_PATHS:
-        if os.path.exists(p):
-            return p
+    # Check common explicit locations first, relative to the working
+    # directory and then to the repository root
+    for base in ('', _REPO_ROOT):
+        for p in _FONT_PATHS:
+            p = os.path.join(base, p)
+            if os.path.exists(p):
+                return p
 
     # If not found, walk the assets directory looking for a file that
     # contains 'silver' in the filename (case-insensitive) and has a
@@ -41,27 +48,242 @@ def _find_font_path():
     return None
 
 
+_UNRESOLVED = object()
+
+
+class FontRegistry:
+    """Process-wide cache of pygame Font objects.
+
+    The Silver.ttf lookup (stat calls and possibly an `os.walk` of assets/)
+    runs once per process, and each (path, size, bold, italic) combination
+    is constructed once. Fonts handed out are shared: request styles through
+    `get(..., bold=True)` instead of calling `set_bold` on the result.
+    """
+    def __init__(self):
+        self._path = _UNRESOLVED
+        self._fonts = {}
+
+    @property
+    def path(self):
+        """Resolved Silver.ttf path (or None), looked up on first use."""
+        if self._path is _UNRESOLVED:
+            self._path = _find_font_path()
+        return self._path
+
+    def get(self, size: int, bold: bool = False, italic: bool = False, path=_UNRESOLVED,
+            sysfont=None):
+        """Return the cached Font for `size`; `path` defaults to Silver.ttf.
+
+        Pass `path=None` for pygame's default font. A font file that fails to
+        load falls back to `pygame.font.SysFont(sysfont)` when given, else to
+        the default font (cached under the same key).
+        """
+        if path is _UNRESOLVED:
+            path = self.path
+        key = (path, int(size), bool(bold), bool(italic), sysfont)
+        font = self._fonts.get(key)
+        if font is None:
+            if path:
+                try:
+                    font = pygame.font.Font(path, key[1])
+                except Exception:
+                    # fall through to default
+                    pass
+            if font is None:
+                if sysfont:
+                    font = pygame.font.SysFont(sysfont, key[1])
+                else:
+                    font = pygame.font.Font(None, key[1])
+            if bold:
+                font.set_bold(True)
+            if italic:
+                font.set_italic(True)
+            self._fonts[key] = font
+        return font
+
+    def clear(self, forget_path: bool = False):
+        """Drop cached fonts (required after `pygame.font.quit()`)."""
+        self._fonts.clear()
+        if forget_path:
+            self._path = _UNRESOLVED
+
+
+font_registry = FontRegistry()
+
+
 def get_font_path():
     """Return the path to the Silver.ttf if found, otherwise None."""
-    return _find_font_path()
+    return font_registry.path
 
 
-def get_font(size: int):
+def get_font(size: int, bold: bool = False, italic: bool = False):
     """Return a pygame Font of the requested size. Prefer Silver.ttf if present.
 
     Falls back to pygame's default font if Silver.ttf is not found or fails to load.
+    Fonts come from `font_registry` and are shared between callers.
+    """
+    return font_registry.get(size, bold=bold, italic=italic)
+
+
+def get_font_from(path, size: int, bold: bool = False, italic: bool = False, sysfont=None):
+    """Cached Font for an explicit file (`None` = pygame's default font).
+
+    For scenes that carry their own font path; a missing or broken file
+    falls back to `SysFont(sysfont)` or the default font, like a try/except
+    around `Font(path)`.
+    """
+    return font_registry.get(size, bold=bold, italic=italic,
+                             path=str(path) if path else None, sysfont=sysfont)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces with hit/miss counters.
+
+    Keyed by (font, text, colour, antialias, background). HUD labels, boss
+    names and dialogue lines are the same strings frame after frame, so
+    `render` returns the surface rendered the first time. Returned surfaces
+    are shared: copy before changing their alpha or drawing on them.
     """
-    font_path = _find_font_path()
-    try:
-        if font_path:
-            return pygame.font.Font(font_path, size)
-    except Exception:
-        # fall through to default
-        pass
-    return pygame.font.Font(None, size)
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = max(1, int(maxsize))
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
 
+    def __len__(self):
+        return len(self._surfaces)
 
-def draw_text(surface, font, text, color, pos, spacing=0, align='center'):
+    def render(self, font, text, color, antialias: bool = True, background=None):
+        """Cached equivalent of `font.render(text, antialias, color, background)`."""
+        key = (font, text, tuple(color), bool(antialias),
+               tuple(background) if background is not None else None)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        if background is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, background)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias: bool = True, background=None):
+    """Render `text` through the shared `text_cache` (see `TextCache`)."""
+    return text_cache.render(font, text, color, antialias, background)
+
+
+class GlyphAtlas:
+    """Glyphs of one (font, colour) rendered once into a shared sheet.
+
+    Letter-spaced text is laid out glyph by glyph; with an atlas each glyph
+    is rendered the first time it appears and every draw is a single
+    `Surface.blits` of sub-rects of the sheet. The sheet grows as new
+    characters show up.
+    """
+    def __init__(self, font, color, width: int = 512):
+        self.font = font
+        self.color = tuple(color)
+        self.width = width
+        self.surface = pygame.Surface((width, font.get_height() + 2), pygame.SRCALPHA)
+        self._rects = {}
+        self._pen_x = 0
+        self._pen_y = 0
+        self._row_h = 0
+
+    def glyph(self, ch) -> pygame.Rect:
+        """Sub-rect of the sheet holding `ch` (rendered on first use)."""
+        rect = self._rects.get(ch)
+        if rect is None:
+            rect = self._rects[ch] = self._add(ch)
+        return rect
+
+    def _add(self, ch) -> pygame.Rect:
+        gsurf = self.font.render(ch, True, self.color)
+        w, h = gsurf.get_size()
+        if self._pen_x + w > self.width:
+            self._pen_x = 0
+            self._pen_y += self._row_h + 1
+            self._row_h = 0
+        need_w = max(self.surface.get_width(), w)
+        need_h = self._pen_y + h
+        if need_w > self.surface.get_width() or need_h > self.surface.get_height():
+            grown = pygame.Surface((need_w, max(need_h, self.surface.get_height() * 2)), pygame.SRCALPHA)
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+        rect = pygame.Rect(self._pen_x, self._pen_y, w, h)
+        self.surface.blit(gsurf, rect)
+        self._pen_x += w + 1
+        self._row_h = max(self._row_h, h)
+        return rect
+
+    def layout(self, text, spacing=0):
+        """Return ([(sheet_rect, x_offset), ...], total_width, height) for `text`."""
+        placed = []
+        x = 0
+        height = 0
+        for ch in text:
+            rect = self.glyph(ch)
+            placed.append((rect, x))
+            x += rect.width + spacing
+            height = max(height, rect.height)
+        total_width = x - spacing if placed else 0
+        return placed, total_width, height or self.font.get_height()
+
+    def draw(self, surface, text, pos, spacing=0, align='center', count=None):
+        """Blit `text` in one call; `count` limits it to the first glyphs (typewriter).
+
+        Alignment is computed from the whole string so revealed text does not shift.
+        """
+        placed, total_width, height = self.layout(text, spacing)
+        if align == 'center':
+            start_x = int(pos[0] - total_width // 2)
+            y = int(pos[1] - height // 2)
+        else:
+            start_x = int(pos[0])
+            y = int(pos[1])
+        if count is not None:
+            placed = placed[:max(0, count)]
+        sheet = self.surface
+        surface.blits([(sheet, (start_x + x, y), rect) for rect, x in placed], doreturn=False)
+        return pygame.Rect(start_x, y, total_width, height)
+
+
+_atlases = {}
+
+
+def glyph_atlas(font, color) -> GlyphAtlas:
+    """Shared `GlyphAtlas` for (font, colour); fonts are per size already."""
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color)
+    return atlas
+
+
+def draw_text(surface, font, text, color, pos, spacing=0, align='center', count=None):
     """Draw text with custom letter spacing.
 
     Args:
@@ -72,21 +294,9 @@ def draw_text(surface, font, text, color, pos, spacing=0, align='center'):
         pos: (x, y) position. Interpreted as center if align=='center', or topleft if 'topleft'.
         spacing: extra pixels between glyphs (can be negative)
         align: 'center' or 'topleft'
+        count: draw only the first `count` glyphs, laid out as the full string
+
+    Glyphs come from the shared atlas for (font, color); see `GlyphAtlas`.
+    Returns the rect the full string occupies.
     """
-    # Pre-render each glyph to measure widths
-    glyphs = [font.render(ch, True, color) for ch in text]
-    widths = [g.get_width() for g in glyphs]
-    total_width = sum(widths) + max(0, (len(glyphs) - 1)) * spacing
-    height = max((g.get_height() for g in glyphs), default=font.get_height())
-
-    if align == 'center':
-        start_x = int(pos[0] - total_width // 2)
-        y = int(pos[1] - height // 2)
-    else:
-        start_x = int(pos[0])
-        y = int(pos[1])
-
-    x = start_x
-    for gsurf in glyphs:
-        surface.blit(gsurf, (x, y))
-        x += gsurf.get_width() + spacing
+    return glyph_atlas(font, color).draw(surface, text, pos, spacing, align, count)
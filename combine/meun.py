@@ -16,7 +16,8 @@ repo_root = Path(__file__).resolve().parents[1]
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
 import globals as g
-from combine.font import get_font, draw_text
+from combine.font import draw_text, font_registry
+from src.utils.atlas import load_image
 from PIL import Image
 
 
@@ -66,61 +67,18 @@ class Meun:
             except Exception:
                 self.font_path = None
 
-        # If a Silver.ttf (or similar) was found, create Font objects directly from it
-        if self.font_path:
-            try:
-                self.font_large = pygame.font.Font(self.font_path, 96)
-                self.font_subtitle = pygame.font.Font(self.font_path, 28)
-                self.font_medium = pygame.font.Font(self.font_path, 48)
-                self.font_small = pygame.font.Font(self.font_path, 24)
-
-                # Create bold variants by copying and requesting fake bold where necessary
-                self.font_large_bold = pygame.font.Font(self.font_path, 96)
-                self.font_large_bold.set_bold(True)
-                self.font_subtitle_bold = pygame.font.Font(self.font_path, 28)
-                self.font_subtitle_bold.set_bold(True)
-                self.font_medium_bold = pygame.font.Font(self.font_path, 48)
-                self.font_medium_bold.set_bold(True)
-                self.font_small_bold = pygame.font.Font(self.font_path, 24)
-                self.font_small_bold.set_bold(True)
-            except Exception:
-                # If direct loading fails for any reason, fall back to helper
-                self.font_large = get_font(96)
-                self.font_subtitle = get_font(28)
-                self.font_medium = get_font(48)
-                self.font_small = get_font(24)
-                self.font_large_bold = get_font(96)
-                self.font_large_bold.set_bold(True)
-                self.font_subtitle_bold = get_font(28)
-                self.font_subtitle_bold.set_bold(True)
-                self.font_medium_bold = get_font(48)
-                self.font_medium_bold.set_bold(True)
-                self.font_small_bold = get_font(24)
-                self.font_small_bold.set_bold(True)
-        else:
-            # No explicit font found; use the helper which searches for Silver.ttf or falls back
-            self.font_large = get_font(96)   # title
-            self.font_subtitle = get_font(28)  # subtitle (smaller)
-            self.font_medium = get_font(48)  # menu options
-            self.font_small = get_font(24)   # instructions/footer
-
-            # Create bold variants. Some TTFs don't include a bold face;
-            # pygame will fake bolding if necessary via set_bold(True).
-            try:
-                self.font_large_bold = get_font(96)
-                self.font_large_bold.set_bold(True)
-                self.font_subtitle_bold = get_font(28)
-                self.font_subtitle_bold.set_bold(True)
-                self.font_medium_bold = get_font(48)
-                self.font_medium_bold.set_bold(True)
-                self.font_small_bold = get_font(24)
-                self.font_small_bold.set_bold(True)
-            except Exception:
-                # Fallback to non-bold if creation fails
-                self.font_large_bold = self.font_large
-                self.font_subtitle_bold = self.font_subtitle
-                self.font_medium_bold = self.font_medium
-                self.font_small_bold = self.font_small
+        # Fonts come from the shared registry. Bold variants are separate
+        # registry entries (pygame fakes bolding when the TTF has no bold
+        # face), so the regular faces are never bolded in place.
+        kw = {'path': self.font_path} if self.font_path else {}
+        self.font_large = font_registry.get(96, **kw)     # title
+        self.font_subtitle = font_registry.get(28, **kw)  # subtitle (smaller)
+        self.font_medium = font_registry.get(48, **kw)    # menu options
+        self.font_small = font_registry.get(24, **kw)     # instructions/footer
+        self.font_large_bold = font_registry.get(96, bold=True, **kw)
+        self.font_subtitle_bold = font_registry.get(28, bold=True, **kw)
+        self.font_medium_bold = font_registry.get(48, bold=True, **kw)
+        self.font_small_bold = font_registry.get(24, bold=True, **kw)
 
         # Debug: store and print resolved font path (if any)
         try:
@@ -381,7 +339,7 @@ class Meun:
                 frame_path = repo_root / 'assets' / 'UI' / 'Complete_UI_Essential_Pack_Free' / '01_Flat_Theme' / 'Sprites' / 'UI_Flat_FrameSlot01a.png'
                 frame_orig = None
                 if frame_path.exists():
-                    frame_orig = pygame.image.load(str(frame_path)).convert_alpha()
+                    frame_orig = load_image(str(frame_path))
 
                 screen_w, screen_h = self.screen.get_size()
                 fw = 400
@@ -400,7 +358,7 @@ class Meun:
                 try:
                     bg_path = repo_root / 'assets' / 'UI' / 'settings_background.png'
                     if bg_path.exists():
-                        bg_img = pygame.image.load(str(bg_path)).convert_alpha()
+                        bg_img = load_image(str(bg_path))
                         bw = frame_surf.get_width() if frame_surf else fw
                         bh = frame_surf.get_height() if frame_surf else fh
                         bg_s = pygame.transform.smoothscale(bg_img, (bw, bh))
@@ -425,13 +383,13 @@ class Meun:
                     gen_handle_path = repo_root / 'assets' / 'UI' / 'settings_handle.png'
                     handle_path = sprites_dir / 'UI_Flat_Handle01a.png'
                     
-                    bar_img = pygame.image.load(str(bar_path)).convert_alpha() if bar_path.exists() else None
-                    fill_img = pygame.image.load(str(fill_path)).convert_alpha() if fill_path.exists() else None
+                    bar_img = load_image(str(bar_path)) if bar_path.exists() else None
+                    fill_img = load_image(str(fill_path)) if fill_path.exists() else None
                     
                     if gen_handle_path.exists():
-                        handle_img = pygame.image.load(str(gen_handle_path)).convert_alpha()
+                        handle_img = load_image(str(gen_handle_path))
                     elif handle_path.exists():
-                        handle_img = pygame.image.load(str(handle_path)).convert_alpha()
+                        handle_img = load_image(str(handle_path))
                     else:
                         handle_img = None
                 except Exception:
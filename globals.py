@@ -2,14 +2,21 @@
 SCREENWIDTH = 1280
 SCREENHEIGHT = 720
 FPS = 60
+# Internal render scale for fill-rate-heavy layers (procedural backgrounds,
+# fog, full-screen gradients): 1 = native, 2 = render at 640x360 and upscale.
+# Sprites, HUD and text always draw at native resolution.
+RENDER_SCALE = 1
+# Optional: mostly static rooms (puzzles) restore and push only the regions
+# their dynamic pass drew, instead of flipping the full screen every frame.
+DIRTY_RECT_RENDERING = False
 
 import os
 
 # Attempt to expose a canonical font path helper for modules that need
-# to locate the project's Silver.ttf. Prefer the compatibility shim at
-# `src.utils.font` (which delegates to `combine.font`), but fall back to
-# known candidate locations inside the `assets/` tree so the project can
-# run even if the shim doesn't resolve a path.
+# to locate the project's Silver.ttf. The lookup is owned by the font
+# registry in `combine.font` (reached through the `src.utils.font` shim),
+# which resolves the path once per process; the candidate list below is
+# only a fallback when that import fails or finds nothing.
 def _resolve_font_path():
     try:
         from src.utils.font import get_font_path as _shim_get
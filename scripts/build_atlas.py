@@ -0,0 +1,279 @@
+"""Pack the images each scene loads into per-scene texture atlas pages.
+
+Writes assets/atlas/<group>_<n>.png and assets/atlas/atlas.json, the manifest
+`src.utils.atlas.load_image` reads at runtime. Rerun it after changing any of
+the images listed in GROUPS; `--check` exits non-zero when the atlas is stale
+or incomplete.
+
+    python scripts/build_atlas.py [--page-size 2048] [--padding 2] [--max-side 512] [--check]
+
+Every group packs into its own pages, so a scene only decodes the pages of
+the images it actually uses. Identical files share one rect. Sprite sheets
+listed in SHEET_FRAMES are cut into their frames (the Hollow strips are wider
+than a page) and put back together on load. Anything else larger than
+--max-side stays out of the atlas and keeps loading from its own file.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+import globals as g
+from src.utils.atlas import ATLAS_DIR, MANIFEST_NAME, MANIFEST_VERSION, asset_key
+
+# group -> [(glob relative to the repo root, longest side stored or None for
+# full size)]. A file matched by several groups belongs to the first one.
+GROUPS = {
+    # map01 scene: the hourglass (and its item fallback)
+    'map01': [
+        ('assets/UI/hourglass.png', None),
+        ('assets/sprites/items/item_clock.png', None),
+    ],
+    # map01 prototype projections: 1024px art only ever drawn at 200px or less
+    'map01_art': [
+        ('assets/1-1-1.png', 256),
+        ('assets/1-2-1.png', 256),
+        ('assets/brush.png', 256),
+        ('assets/chain.png', 256),
+        ('assets/group.png', 256),
+        ('assets/lamp.png', 256),
+    ],
+    # combine menu settings overlay
+    'menu': [
+        ('assets/UI/**/*.png', None),
+    ],
+    'sloth': [
+        (g.BOSS2_SPRITE_WALK_PATH, None),
+        (g.BOSS2_SPRITE_ATTACK_PATH, None),
+        (g.BOSS2_SPRITE_FADE_PATH, None),
+    ],
+    'hollow': [
+        (g.BOSS3_SPRITE_WALK_PATH, None),
+        (g.BOSS3_SPRITE_ATTACK_PATH, None),
+    ],
+}
+
+# Horizontal strips packed frame by frame: path -> frame count
+SHEET_FRAMES = {
+    g.BOSS2_SPRITE_WALK_PATH: g.BOSS2_WALK_FRAME_COUNT,
+    g.BOSS2_SPRITE_ATTACK_PATH: g.BOSS2_ATTACK_FRAME_COUNT,
+    g.BOSS2_SPRITE_FADE_PATH: g.BOSS2_FADE_FRAME_COUNT,
+    g.BOSS3_SPRITE_WALK_PATH: g.BOSS3_WALK_FRAME_COUNT,
+    g.BOSS3_SPRITE_ATTACK_PATH: g.BOSS3_ATTACK_FRAME_COUNT,
+}
+
+
+def collect_sources():
+    """[(group, path, max_side)] for every source image, in GROUPS order without repeats."""
+    seen = set()
+    sources = []
+    for group, patterns in GROUPS.items():
+        for pattern, max_side in patterns:
+            for path in sorted(glob.glob(os.path.join(ROOT, pattern), recursive=True)):
+                if path not in seen:
+                    seen.add(path)
+                    sources.append((group, path, max_side))
+    return sources
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return hashlib.sha1(data).hexdigest(), len(data)
+
+
+def fit_size(size, max_side):
+    w, h = size
+    if max_side is None or max(w, h) <= max_side:
+        return w, h
+    scale = max_side / float(max(w, h))
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+def sheet_frames(path, surf):
+    """[(frame surface, x offset)] for a listed strip, or None to pack `surf` whole."""
+    count = SHEET_FRAMES.get(asset_key(path))
+    if not count:
+        return None
+    w, h = surf.get_size()
+    fw = w // count
+    if fw * count != w:
+        return None
+    return [(surf.subsurface((i * fw, 0, fw, h)), i * fw) for i in range(count)]
+
+
+def pack(sizes, page_size, padding):
+    """Shelf-pack (w, h) boxes, tallest first. Returns {index: (page, x, y)}; oversized boxes are left out."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placed = {}
+    pages = []  # per page: [shelf_y, shelf_h, cursor_x]
+    for i in order:
+        w, h = sizes[i][0] + padding, sizes[i][1] + padding
+        if w > page_size or h > page_size:
+            continue
+        for page, shelf in enumerate(pages):
+            shelf_y, shelf_h, x = shelf
+            if x + w <= page_size and h <= shelf_h:
+                placed[i] = (page, x, shelf_y)
+                shelf[1] = max(shelf_h, h)
+                shelf[2] = x + w
+                break
+            if shelf_y + shelf_h + h <= page_size:
+                # open a new shelf under the current one
+                shelf[:] = [shelf_y + shelf_h, h, w]
+                placed[i] = (page, 0, shelf[0])
+                break
+        else:
+            pages.append([0, h, w])
+            placed[i] = (len(pages) - 1, 0, 0)
+    return placed, len(pages)
+
+
+def build(out_dir, page_size, padding, max_side):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    # per group: unique surfaces to pack, and manifest key -> (parts, source info)
+    groups = {}
+    for group, path, group_max in collect_sources():
+        images, by_digest, entries = groups.setdefault(group, ([], {}, {}))
+        digest, nbytes = file_digest(path)
+        key = asset_key(path)
+        try:
+            surf = pygame.image.load(path).convert_alpha()
+        except pygame.error as e:
+            print(f"skip {key}: {e}")
+            continue
+        source_size = surf.get_size()
+        size = fit_size(source_size, group_max)
+        pieces = sheet_frames(path, surf) if size == source_size else None
+        if pieces is None:
+            if max(size) > max_side:
+                print(f"left out {key}: {size[0]}x{size[1]} is over --max-side {max_side}")
+                continue
+            if size != source_size:
+                surf = pygame.transform.smoothscale(surf, size)
+            pieces = [(surf, 0)]
+        parts = []
+        for n, (piece, dx) in enumerate(pieces):
+            unique = (digest, size, n)
+            if unique not in by_digest:
+                by_digest[unique] = len(images)
+                images.append(piece)
+            parts.append((by_digest[unique], dx))
+        entries[key] = (parts, list(source_size), nbytes, os.path.getmtime(path), digest, len(pieces) > 1)
+
+    os.makedirs(out_dir, exist_ok=True)
+    # drop the previous build's pages; their names depend on the groups
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            old_pages = json.load(f).get('pages', [])
+    except (OSError, ValueError, AttributeError):
+        old_pages = []
+    for name in old_pages:
+        try:
+            os.remove(os.path.join(out_dir, name))
+        except OSError:
+            pass
+
+    page_names = []
+    sprites = {}
+    for group, (images, _, entries) in groups.items():
+        placed, page_count = pack([s.get_size() for s in images], page_size, padding)
+        first_page = len(page_names)
+        for page in range(page_count):
+            on_page = [(i, x, y) for i, (p, x, y) in placed.items() if p == page]
+            # trim the unused right/bottom of the page
+            width = max(x + images[i].get_width() for i, x, y in on_page)
+            height = max(y + images[i].get_height() for i, x, y in on_page)
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            for i, x, y in on_page:
+                # MAX onto a cleared page is an exact copy (a normal blit would premultiply alpha)
+                surf.blit(images[i], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            name = f'{group}_{page}.png'
+            pygame.image.save(surf, os.path.join(out_dir, name))
+            page_names.append(name)
+
+        for key, (parts, source_size, nbytes, mtime, digest, split) in entries.items():
+            if any(i not in placed for i, _ in parts):
+                print(f"left out {key}: does not fit a {page_size}px page")
+                continue
+            entry = {'source_size': source_size, 'bytes': nbytes, 'mtime': mtime, 'sha1': digest}
+            if split:
+                # [page, x, y, w, h, x offset in the sheet] per frame
+                entry['frames'] = [[first_page + placed[i][0], placed[i][1], placed[i][2],
+                                    *images[i].get_size(), dx] for i, dx in parts]
+            else:
+                i = parts[0][0]
+                page, x, y = placed[i]
+                entry['page'] = first_page + page
+                entry['rect'] = [x, y, *images[i].get_size()]
+            sprites[key] = entry
+        print(f"{group}: packed {len(entries)} image(s) into {page_count} page(s)")
+
+    manifest = {'version': MANIFEST_VERSION, 'page_size': page_size, 'pages': page_names, 'sprites': sprites}
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    print(f"wrote {len(page_names)} page(s) and {MANIFEST_NAME} to {out_dir}")
+
+
+def check(out_dir, max_side):
+    """True if the manifest holds every packable source with its current content."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        print('atlas manifest missing or unreadable')
+        return False
+    if manifest.get('version') != MANIFEST_VERSION:
+        print('atlas manifest is from another version')
+        return False
+    sprites = manifest.get('sprites', {})
+    ok = True
+    for _, path, group_max in collect_sources():
+        key = asset_key(path)
+        entry = sprites.get(key)
+        if entry is None:
+            # deliberately left out when over the size limit (and not a sheet)
+            if key in SHEET_FRAMES:
+                print(f"not in atlas: {key}")
+                ok = False
+                continue
+            try:
+                size = fit_size(pygame.image.load(path).get_size(), group_max)
+            except pygame.error:
+                continue
+            if max(size) <= max_side:
+                print(f"not in atlas: {key}")
+                ok = False
+        elif entry['sha1'] != file_digest(path)[0]:
+            print(f"stale: {key}")
+            ok = False
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default=ATLAS_DIR, help='output directory (default: assets/atlas)')
+    parser.add_argument('--page-size', type=int, default=2048, help='page width/height in pixels')
+    parser.add_argument('--padding', type=int, default=2, help='transparent gap between images')
+    parser.add_argument('--max-side', type=int, default=512,
+                        help='leave out images whose stored width or height is larger')
+    parser.add_argument('--check', action='store_true', help='only report whether the atlas is up to date')
+    args = parser.parse_args(argv)
+    if args.check:
+        return 0 if check(args.out, args.max_side) else 1
+    build(args.out, args.page_size, args.padding, args.max_side)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,8 @@ Uses modular components from separate files and globals.py configuration.
 
 #region Imports
 
+import math
+import numpy as np
 import pygame
 import random
 import globals as g
@@ -16,7 +18,11 @@ from .boss_the_hollow import TheHollow
 from .boss_sloth import TheSloth
 from .bullets import BulletManager
 from .platform import Platform
-from ..systems.ui import UIManager, TextPopup, Announcement, draw_ui_overlay, draw_game_over_screen
+from ..systems.ui import UIManager, HUD, TextPopup, Announcement, draw_ui_overlay, draw_game_over_screen
+from ..systems.transitions import HollowVictoryTransition
+from ..systems.camera import Camera
+from ..systems.particles import ParticleEmitter
+from ..systems.static_layer import StaticLayer
 #endregion Imports
 
 
@@ -24,6 +30,7 @@ class BossBattleScene:
     """
     Complete boss battle scene with integrated platformer mechanics
     """
+    VOID_PARTICLE_COUNT = 80
     def __init__(self, boss_type: str = 'hollow'):
         #region Initialization
         # Initialize entities
@@ -32,19 +39,25 @@ class BossBattleScene:
         self.boss = self._create_boss()
         self.bullet_manager = BulletManager()
         self.ui = UIManager()
+        self.hud = HUD()
         self._shown_victory = False
         self._shown_entry = False
         # Transition states
         self._victory_transition = False
         self._defeat_shown = False
         self._transition_timer = 0.0
-        self._earthquake_timer = 0.0
-        self._void_particles = []
+        self.camera = Camera()
+        self._void_particles = ParticleEmitter(
+            capacity=128, palette=[(20, 20, 40), (30, 30, 60), (10, 10, 20), (40, 40, 80)])
         self._falling_platforms = []
+        self._victory_fx = HollowVictoryTransition()
         self._bgm_fading = False
         self._boss_death_location = None  # Store where boss died
         self._boss_defeated = False  # Track if boss is defeated but transition not started
-        self._death_marker_particles = []  # Visual indicator at death location
+        # Visual indicator at death location
+        self._death_marker_particles = ParticleEmitter(
+            capacity=64, palette=[(80, 60, 120), (60, 40, 100), (100, 80, 140), (50, 30, 90)],
+            extra_fields=('orbit_radius', 'orbit_speed'))
         self._death_marker_time = 0.0
         self._player_wants_exit = False  # Track if player pressed space to exit after victory
         # Idle penalty tracking
@@ -78,6 +91,7 @@ class BossBattleScene:
         self.spike_timer = 0.0
         self.spike_wave_elapsed = 0.0
         self.spike_wave_active = False
+        self._spike_wave_id = 0
 
         # Background image (deep cave)
         try:
@@ -85,6 +99,12 @@ class BossBattleScene:
             self.background = pygame.image.load(bg_path).convert()
         except Exception:
             self.background = None
+        # Platforms (and the solid fill when there is no cave image) are baked
+        # once; spike walls get their own layer since they draw above the HUD.
+        # Both re-bake only when the arena's topology changes.
+        self._arena_layer = StaticLayer(
+            fill=g.COLORS['background'] if self.background is None else None)
+        self._spike_layer = StaticLayer(variants=3)
         
         # BGM
         try:
@@ -156,11 +176,11 @@ class BossBattleScene:
     def update(self, dt: float):
         """Update the entire battle scene"""
         self._last_dt = dt  # Store for transition effects
+        self.camera.update(dt)
         # Handle victory transition
         if self._victory_transition:
             self._transition_timer += dt
             if isinstance(self.boss, TheHollow):
-                self._earthquake_timer += dt
                 self._update_void_particles(dt)
             # Fade out BGM
             if self._bgm_fading:
@@ -254,7 +274,8 @@ class BossBattleScene:
                     if isinstance(self.boss, TheHollow):
                         if self.earthquake_sfx:
                             self.earthquake_sfx.play()
-                        self._earthquake_timer = 0.0
+                        # Earthquake: 10px shake fading out over 2s
+                        self.camera.shake(2.0, 10, decay=True)
                         self._spawn_void_particles()
                     else:
                         self._spawn_void_particles()
@@ -315,7 +336,7 @@ class BossBattleScene:
                     self._transition_timer = 0.0
                     self._boss_defeated = False
                     self._boss_death_location = None
-                    self._death_marker_particles = []
+                    self._death_marker_particles.clear()
                     self._bgm_fading = False
                     self._player_wants_exit = False
             # SPACE key: exit after victory
@@ -335,12 +356,9 @@ class BossBattleScene:
             # Tile vertically to fake infinite
             screen.blit(self.background, (0, -offset_y))
             screen.blit(self.background, (0, -offset_y + self.background.get_height()))
-        else:
-            screen.fill(g.COLORS['background'])
         
-        # Draw platforms
-        for platform in self.platforms:
-            platform.draw(screen)
+        # Draw platforms (plus the fallback fill) from the baked arena layer
+        self._draw_arena(screen)
         
         # Draw entities
         self.player.draw(screen)
@@ -370,37 +388,18 @@ class BossBattleScene:
             screen.blit(bubble_surf, (int(bx - bubble_radius), int(by - bubble_radius)))
             
             # Draw orbiting particles
-            for p in self._death_marker_particles:
-                particle_surf = pygame.Surface((int(p['size']*2), int(p['size']*2)), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, (*p['color'], int(p['alpha'] * (0.6 + 0.4 * pulse))),
-                                 (int(p['size']), int(p['size'])), int(p['size']))
-                screen.blit(particle_surf, (int(p['x'] - p['size']), int(p['y'] - p['size'])))
+            self._death_marker_particles.draw(screen, alpha_scale=0.6 + 0.4 * pulse)
         
         # Victory transition overlay for Hollow (elaborate void descent)
         if self._victory_transition and isinstance(self.boss, TheHollow):
-            # Phase 1: Earthquake (0-2s)
-            shake_intensity = max(0, 1.0 - self._earthquake_timer / 2.0)
-            if shake_intensity > 0:
-                import random
-                shake_x = random.uniform(-10 * shake_intensity, 10 * shake_intensity)
-                shake_y = random.uniform(-10 * shake_intensity, 10 * shake_intensity)
-                temp_surf = screen.copy()
-                screen.fill((0, 0, 0))
-                screen.blit(temp_surf, (int(shake_x), int(shake_y)))
+            # Phase 1: Earthquake (0-2s) - shift the frame in place
+            self.camera.apply(screen)
             
             # Phase 2: Void particles swirling (0.5s+)
             if self._transition_timer > 0.5:
-                for p in self._void_particles:
-                    # Draw particle trail
-                    for i in range(3):
-                        trail_alpha = int(p['alpha'] * (0.3 - i * 0.1))
-                        if trail_alpha > 0:
-                            trail_x = p['x'] - p['vx'] * i * 0.05
-                            trail_y = p['y'] - p['vy'] * i * 0.05
-                            surf = pygame.Surface((int(p['size']*1.5), int(p['size']*1.5)), pygame.SRCALPHA)
-                            pygame.draw.circle(surf, (*p['color'], trail_alpha), 
-                                             (int(p['size']*0.75), int(p['size']*0.75)), int(p['size']))
-                            screen.blit(surf, (int(trail_x), int(trail_y)))
+                # Particle trail: the same batch drawn at three lags, fading out
+                for i in range(3):
+                    self._void_particles.draw(screen, alpha_scale=0.3 - i * 0.1, lag=i * 0.05)
             
             # Phase 3: Platform crumbling effect (1s+)
             if self._transition_timer > 1.0 and not self._falling_platforms:
@@ -442,226 +441,13 @@ class BossBattleScene:
                 blur_surf.fill((100, 150, 255, 80))
                 screen.blit(blur_surf, (int(self.player.x), int(self.player.y - 20)))
             
-            # Phase 5: Void vortex background (2s+)
-            if self._transition_timer > 2.0:
-                import math
-                vortex_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                center_x, center_y = g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2
-                
-                for ring in range(8):
-                    radius = 50 + ring * 80 + (self._transition_timer - 2.0) * 100
-                    segments = 24 + ring * 4
-                    for seg in range(segments):
-                        angle = (seg / segments) * math.pi * 2 + self._transition_timer * 2
-                        x = center_x + math.cos(angle) * radius
-                        y = center_y + math.sin(angle) * radius
-                        alpha = max(0, 120 - ring * 15)
-                        pygame.draw.circle(vortex_surf, (10, 10, 30, alpha), (int(x), int(y)), 3)
-                
-                screen.blit(vortex_surf, (0, 0))
-            
-            # Phase 6: White fade liberation (3.5s+) - Transition to ethereal realm
-            fade_start = 3.5
-            if self._transition_timer > fade_start:
-                fade_progress = min(1.0, (self._transition_timer - fade_start) / 2.0)
-                
-                # Gentle white fade (not harsh)
-                alpha = int(fade_progress * 220)
-                fade_overlay = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT))
-                fade_overlay.fill((255, 255, 255))
-                fade_overlay.set_alpha(alpha)
-                screen.blit(fade_overlay, (0, 0))
-                
-                # Expanding light rays with soft fade
-                if fade_progress < 0.8:
-                    import math
-                    rays_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                    num_rays = 16
-                    for ray in range(num_rays):
-                        angle = (ray / num_rays) * math.pi * 2 + self._transition_timer * 0.3
-                        # Rays expand outward
-                        ray_length = g.SCREENWIDTH * (0.5 + fade_progress * 1.5)
-                        end_x = g.SCREENWIDTH // 2 + math.cos(angle) * ray_length
-                        end_y = g.SCREENHEIGHT // 2 + math.sin(angle) * ray_length
-                        ray_alpha = int((1 - fade_progress) * 120)
-                        # Gradient rays (thicker at center)
-                        for thickness in range(4, 0, -1):
-                            t_alpha = ray_alpha // (5 - thickness)
-                            pygame.draw.line(rays_surf, (255, 250, 240, t_alpha),
-                                           (g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2),
-                                           (int(end_x), int(end_y)), thickness)
-                    screen.blit(rays_surf, (0, 0))
-                
-                # Void dissolving into light particles (continuity from Phase 5)
-                if fade_progress < 0.6:
-                    dissolve_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                    import random
-                    # Dynamic seed for variation
-                    random.seed(int(self._transition_timer * 10))
-                    for _ in range(int(80 * (1 - fade_progress))):
-                        px = random.randint(0, g.SCREENWIDTH)
-                        py = random.randint(0, g.SCREENHEIGHT)
-                        p_size = random.uniform(2, 6)
-                        # Void colors fading to white
-                        base_color = random.choice([(40, 40, 80), (50, 50, 100), (30, 30, 60)])
-                        fade_to_white = fade_progress * 0.8
-                        final_color = tuple(int(c + (255 - c) * fade_to_white) for c in base_color)
-                        p_alpha = int(random.uniform(60, 150) * (1 - fade_progress))
-                        pygame.draw.circle(dissolve_surf, (*final_color, p_alpha), (px, py), int(p_size))
-                    screen.blit(dissolve_surf, (0, 0))
-                
-                if self._transition_timer > fade_start + 0.8 and self.fade_sfx and not getattr(self, '_fade_played', False):
-                    self.fade_sfx.play()
-                    self._fade_played = True
-            
-            # Phase 7: Waking from dream (5.5s+) - Ethereal pixel realm dissolve
-            dream_start = 5.5
-            if self._transition_timer > dream_start:
-                import math
-                import random
-                wake_progress = min(1.0, (self._transition_timer - dream_start) / 4.0)
-                
-                # Soft pastel gradient background - ethereal sky
-                dawn_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT))
-                for y in range(0, g.SCREENHEIGHT, 2):
-                    ratio = y / g.SCREENHEIGHT
-                    # Lavender-to-cream gradient with subtle shimmer
-                    shimmer = math.sin(self._transition_timer * 1.5 + ratio * math.pi) * 10
-                    r = int(210 + 45 * ratio * wake_progress + shimmer)
-                    g_val = int(190 + 65 * ratio * wake_progress + shimmer * 0.7)
-                    b = int(230 - 50 * ratio * wake_progress + shimmer * 0.5)
-                    pygame.draw.line(dawn_surf, (r, g_val, b), (0, y), (g.SCREENWIDTH, y), 2)
-                dawn_surf.set_alpha(int(200 * wake_progress))
-                screen.blit(dawn_surf, (0, 0))
-                
-                # Dynamic pixelated dissolve - world fragmenting
-                if wake_progress < 0.75:
-                    dissolve_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                    pixel_size = int(3 + wake_progress * 15)
-                    # Dynamic pattern each frame
-                    random.seed(int(self._transition_timer * 30))
-                    density = int(200 * (1 - wake_progress * 0.7))
-                    for i in range(density):
-                        x = random.randint(0, g.SCREENWIDTH // pixel_size) * pixel_size
-                        y = random.randint(0, g.SCREENHEIGHT // pixel_size) * pixel_size
-                        fade_chance = random.random()
-                        # Progressive fade based on position and time
-                        spatial_fade = (x / g.SCREENWIDTH + y / g.SCREENHEIGHT) / 2
-                        if fade_chance < wake_progress + spatial_fade * 0.3:
-                            pixel_colors = [(245, 235, 255), (235, 225, 250), (255, 245, 255), (225, 215, 245)]
-                            p_color = random.choice(pixel_colors)
-                            p_alpha = int(random.uniform(70, 160) * (1 - wake_progress))
-                            pygame.draw.rect(dissolve_surf, (*p_color, p_alpha), 
-                                           (x, y, pixel_size, pixel_size))
-                    screen.blit(dissolve_surf, (0, 0))
-                
-                # Floating memory fragments - more organic motion
-                fragment_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                num_fragments = int(30 - 20 * wake_progress)
-                random.seed(100)  # Consistent positions
-                for i in range(max(6, num_fragments)):
-                    # Vertical rising with horizontal wave
-                    base_y = ((i * 60 + self._transition_timer * 20) % (g.SCREENHEIGHT + 120)) - 60
-                    base_x = (i * 79) % g.SCREENWIDTH
-                    wave_x = math.sin(self._transition_timer * 0.6 + i * 0.4) * 40
-                    wave_y = math.cos(self._transition_timer * 0.4 + i * 0.6) * 15
-                    
-                    frag_x = int(base_x + wave_x)
-                    frag_y = int(base_y - wake_progress * 120 + wave_y)
-                    
-                    # Varied shapes with rotation
-                    shape_type = i % 4
-                    size = int(10 + (i % 6) * 4)
-                    rotation = self._transition_timer * 20 + i * 30
-                    frag_alpha = int(140 * (1 - wake_progress) * (1 - min(1.0, base_y / g.SCREENHEIGHT)))
-                    
-                    if frag_alpha > 10:
-                        if shape_type == 0:
-                            # Rotating square
-                            angle_rad = math.radians(rotation)
-                            half = size // 2
-                            corners = [
-                                (frag_x + math.cos(angle_rad + i*math.pi/2) * half,
-                                 frag_y + math.sin(angle_rad + i*math.pi/2) * half)
-                                for i in range(4)
-                            ]
-                            pygame.draw.polygon(fragment_surf, (205, 185, 225, frag_alpha), corners)
-                        elif shape_type == 1:
-                            # Pulsing diamond
-                            pulse = 1 + 0.2 * math.sin(self._transition_timer * 2 + i)
-                            points = [(frag_x, frag_y - int(size*pulse)//2), 
-                                     (frag_x + int(size*pulse)//2, frag_y),
-                                     (frag_x, frag_y + int(size*pulse)//2),
-                                     (frag_x - int(size*pulse)//2, frag_y)]
-                            pygame.draw.polygon(fragment_surf, (215, 195, 235, frag_alpha), points)
-                        elif shape_type == 2:
-                            # Glowing cross
-                            glow_size = int(size * 1.3)
-                            pygame.draw.line(fragment_surf, (225, 205, 245, frag_alpha // 2),
-                                           (frag_x - glow_size//2, frag_y), (frag_x + glow_size//2, frag_y), 3)
-                            pygame.draw.line(fragment_surf, (225, 205, 245, frag_alpha // 2),
-                                           (frag_x, frag_y - glow_size//2), (frag_x, frag_y + glow_size//2), 3)
-                            pygame.draw.line(fragment_surf, (235, 215, 250, frag_alpha),
-                                           (frag_x - size//2, frag_y), (frag_x + size//2, frag_y), 1)
-                            pygame.draw.line(fragment_surf, (235, 215, 250, frag_alpha),
-                                           (frag_x, frag_y - size//2), (frag_x, frag_y + size//2), 1)
-                        else:
-                            # Hollow circle
-                            pygame.draw.circle(fragment_surf, (215, 195, 235, frag_alpha), 
-                                             (frag_x, frag_y), size // 2, 2)
-                
-                screen.blit(fragment_surf, (0, 0))
-                
-                # Enhanced light motes - volumetric feeling
-                mote_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                random.seed(int(self._transition_timer * 25))
-                num_motes = int(50 + 30 * wake_progress)
-                for _ in range(num_motes):
-                    mx = random.randint(0, g.SCREENWIDTH)
-                    my = random.randint(0, g.SCREENHEIGHT)
-                    # Gentle downward drift with horizontal sway
-                    my_offset = int(self._transition_timer * 12 + random.random() * 80) % (g.SCREENHEIGHT + 40)
-                    mx_sway = int(math.sin(self._transition_timer + my * 0.01) * 15)
-                    my = (my + my_offset) % g.SCREENHEIGHT
-                    mx = (mx + mx_sway) % g.SCREENWIDTH
-                    
-                    mote_size = random.uniform(1.5, 4)
-                    # Organic twinkling
-                    twinkle = (math.sin(self._transition_timer * 3.5 + mx * 0.015 + my * 0.01) * 0.4 + 0.6)
-                    mote_alpha = int(random.uniform(120, 220) * twinkle * wake_progress)
-                    # Warm ethereal glow
-                    mote_colors = [(255, 250, 235), (250, 245, 225), (255, 248, 230), (245, 242, 220)]
-                    m_color = random.choice(mote_colors)
-                    # Soft glow halo
-                    pygame.draw.circle(mote_surf, (*m_color, mote_alpha // 3), (mx, my), int(mote_size * 2))
-                    pygame.draw.circle(mote_surf, (*m_color, mote_alpha), (mx, my), int(mote_size))
-                
-                screen.blit(mote_surf, (0, 0))
-                
-                # Soft radial vignette - consciousness focusing
-                if wake_progress > 0.35:
-                    vignette_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                    center_x, center_y = g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2
-                    max_dist = math.sqrt(center_x**2 + center_y**2)
-                    vignette_strength = (wake_progress - 0.35) / 0.65
-                    
-                    # Multi-ring soft vignette
-                    for ring in range(10):
-                        radius = int(max_dist * (0.3 + ring * 0.08))
-                        ring_alpha = int(25 * ring * vignette_strength)
-                        if ring_alpha > 0:
-                            pygame.draw.circle(vignette_surf, (255, 252, 248, ring_alpha),
-                                             (center_x, center_y), radius, max(2, 18 - ring * 2))
-                    
-                    screen.blit(vignette_surf, (0, 0))
-                
-                # Final fade to bright white (awakening) at 70%+
-                if wake_progress > 0.7:
-                    awaken_alpha = int((wake_progress - 0.7) / 0.3 * 255)
-                    awaken_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT))
-                    awaken_surf.fill((255, 255, 250))
-                    awaken_surf.set_alpha(awaken_alpha)
-                    screen.blit(awaken_surf, (0, 0))
+            # Phases 5-7: vortex, white liberation and dawn awakening are
+            # composited from cached layers (see src/systems/transitions.py)
+            self._victory_fx.draw(screen, self._transition_timer)
+            fade_start = HollowVictoryTransition.FADE_START
+            if self._transition_timer > fade_start + 0.8 and self.fade_sfx and not getattr(self, '_fade_played', False):
+                self.fade_sfx.play()
+                self._fade_played = True
         
         # Draw game over screen on top of all effects
         if self.is_game_over():
@@ -672,28 +458,47 @@ class BossBattleScene:
         
         # Draw active spikes
         if self.spikes_active:
+            self._draw_spikes(screen)
+
+        # Draw debug information
+        if g.SHOW_DEBUG_INFO:
+            self._draw_debug_info(screen)
+
+    def _draw_arena(self, screen: pygame.Surface):
+        """Blit the static arena; ledges drop out once the crumble phase starts."""
+        crumbled = bool(self._falling_platforms)
+        layer = self._arena_layer
+        if layer.begin(key=(crumbled, g.SHOW_COLLISION_BOXES)):
+            for platform in (self.platforms[:1] if crumbled else self.platforms):
+                platform.draw(layer.surface)
+        layer.blit(screen)
+
+    def _draw_spikes(self, screen: pygame.Surface):
+        """Blit the current spike wave, baked once per wave and flash state."""
+        if self.spike_wave_active and self.spike_wave_elapsed < self._preflash_time():
+            # Pre-flash: alternate bright/dim to warn
             flash_phase = (pygame.time.get_ticks() / 100.0) % 2.0
-            pre_spawn = self.spike_wave_active and self.spike_wave_elapsed < self._preflash_time()
+            state = 'bright' if flash_phase < 1.0 else 'dim'
+        else:
+            state = 'solid'
+        layer = self._spike_layer
+        if layer.begin(key=(self._spike_wave_id, state)):
+            surf = layer.surface
             for r, top in self.spikes_active:
-                # Pre-flash: alternate bright/dim to warn
-                if pre_spawn:
-                    if flash_phase < 1.0:
-                        color = (120, 120, 130)
-                    else:
-                        color = (40, 40, 50)
+                if state == 'bright':
+                    color = (120, 120, 130)
+                elif state == 'dim':
+                    color = (40, 40, 50)
                 else:
                     color = (15, 15, 20) if top else (20, 15, 25)
-                pygame.draw.rect(screen, color, r)
+                pygame.draw.rect(surf, color, r)
                 tip_w = r.width
                 tip_h = 12
                 if top:
-                    pygame.draw.polygon(screen, (8,8,12), [(r.left, r.bottom), (r.left+tip_w//2, r.bottom+tip_h), (r.right, r.bottom)])
+                    pygame.draw.polygon(surf, (8,8,12), [(r.left, r.bottom), (r.left+tip_w//2, r.bottom+tip_h), (r.right, r.bottom)])
                 else:
-                    pygame.draw.polygon(screen, (8,8,12), [(r.left, r.top), (r.left+tip_w//2, r.top - tip_h), (r.right, r.top)])
-
-        # Draw debug information
-        if g.SHOW_DEBUG_INFO:
-            self._draw_debug_info(screen)
+                    pygame.draw.polygon(surf, (8,8,12), [(r.left, r.top), (r.left+tip_w//2, r.top - tip_h), (r.right, r.top)])
+        layer.blit(screen)
     #endregion Draw
     
     #region Debug/Helpers
@@ -746,108 +551,81 @@ class BossBattleScene:
     
     def _spawn_void_particles(self):
         """Create swirling void particles for Hollow transition"""
-        import random
-        import math
-        for _ in range(80):
-            angle = random.uniform(0, math.pi * 2)
-            distance = random.uniform(100, 400)
-            self._void_particles.append({
-                'x': g.SCREENWIDTH // 2 + math.cos(angle) * distance,
-                'y': g.SCREENHEIGHT // 2 + math.sin(angle) * distance,
-                'vx': math.cos(angle) * random.uniform(-100, -50),
-                'vy': math.sin(angle) * random.uniform(-100, -50),
-                'size': random.uniform(2, 6),
-                'alpha': random.randint(150, 255),
-                'color': random.choice([(20, 20, 40), (30, 30, 60), (10, 10, 20), (40, 40, 80)])
-            })
+        vp = self._void_particles
+        n = self.VOID_PARTICLE_COUNT
+        angle = vp.uniform(0, math.pi * 2, n)
+        distance = vp.uniform(100, 400, n)
+        speed = vp.uniform(-100, -50, n)
+        vp.emit(n,
+                x=g.SCREENWIDTH // 2 + np.cos(angle) * distance,
+                y=g.SCREENHEIGHT // 2 + np.sin(angle) * distance,
+                vx=np.cos(angle) * speed,
+                vy=np.sin(angle) * speed,
+                size=vp.uniform(2, 6, n),
+                alpha=vp.uniform(150, 255, n))
     
     def _spawn_death_marker(self):
         """Create pulsing marker at boss death location"""
         if not self._boss_death_location:
             return
-        import random
         bx, by = self._boss_death_location
-        
-        if isinstance(self.boss, TheHollow):
-            # Void-themed: dark purple swirling particles
-            for _ in range(30):
-                angle = random.uniform(0, 6.28)
-                radius = random.uniform(5, 40)
-                self._death_marker_particles.append({
-                    'x': bx,
-                    'y': by,
-                    'orbit_radius': radius,
-                    'orbit_angle': angle,
-                    'orbit_speed': random.uniform(1.5, 3.0),
-                    'size': random.uniform(2, 5),
-                    'alpha': random.randint(180, 255),
-                    'color': random.choice([(80, 60, 120), (60, 40, 100), (100, 80, 140), (50, 30, 90)])
-                })
-        else:
-            # Generic void particles for other bosses
-            for _ in range(30):
-                angle = random.uniform(0, 6.28)
-                radius = random.uniform(5, 40)
-                self._death_marker_particles.append({
-                    'x': bx,
-                    'y': by,
-                    'orbit_radius': radius,
-                    'orbit_angle': angle,
-                    'orbit_speed': random.uniform(1.5, 3.0),
-                    'size': random.uniform(2, 5),
-                    'alpha': random.randint(180, 255),
-                    'color': random.choice([(80, 60, 120), (60, 40, 100), (100, 80, 140), (50, 30, 90)])
-                })
+        # Void-themed: dark purple swirling particles (same look for every boss)
+        dm = self._death_marker_particles
+        n = 30
+        dm.emit(n, x=bx, y=by,
+                phase=dm.uniform(0, 6.28, n),  # orbit angle
+                orbit_radius=dm.uniform(5, 40, n),
+                orbit_speed=dm.uniform(1.5, 3.0, n),
+                size=dm.uniform(2, 5, n),
+                alpha=dm.uniform(180, 255, n))
     
     def _update_death_marker(self, dt):
         """Animate death marker particles in orbit"""
-        import math
         if not self._boss_death_location:
             return
         
         bx, by = self._boss_death_location
         pulse = (math.sin(self._death_marker_time * 3) + 1) / 2  # 0..1
         
-        for p in self._death_marker_particles:
-            p['orbit_angle'] += p['orbit_speed'] * dt
-            # Pulsing orbit radius
-            current_radius = p['orbit_radius'] * (0.8 + 0.4 * pulse)
-            p['x'] = bx + math.cos(p['orbit_angle']) * current_radius
-            p['y'] = by + math.sin(p['orbit_angle']) * current_radius
+        dm = self._death_marker_particles
+        angle = dm.view('phase')
+        angle += dm.view('orbit_speed') * dt
+        # Pulsing orbit radius
+        current_radius = dm.view('orbit_radius') * (0.8 + 0.4 * pulse)
+        dm.view('x')[:] = bx + np.cos(angle) * current_radius
+        dm.view('y')[:] = by + np.sin(angle) * current_radius
     
     def _update_void_particles(self, dt):
         """Update void particle swirl toward center"""
-        import math
         center_x, center_y = g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2
-        for p in self._void_particles:
-            # Pull toward center with spiral
-            dx = center_x - p['x']
-            dy = center_y - p['y']
-            dist = max(1, math.hypot(dx, dy))
-            
-            # Spiral force
-            angle = math.atan2(dy, dx)
-            spiral_angle = angle + math.pi / 4
-            pull_strength = 200
-            
-            p['vx'] = math.cos(spiral_angle) * pull_strength
-            p['vy'] = math.sin(spiral_angle) * pull_strength
-            
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            
-            # Fade near center
-            if dist < 100:
-                p['alpha'] = max(0, p['alpha'] - 300 * dt)
-            
-            # Regenerate at edges
-            if dist > 600 or p['alpha'] <= 0:
-                import random
-                angle = random.uniform(0, math.pi * 2)
-                distance = 500
-                p['x'] = g.SCREENWIDTH // 2 + math.cos(angle) * distance
-                p['y'] = g.SCREENHEIGHT // 2 + math.sin(angle) * distance
-                p['alpha'] = random.randint(150, 255)
+        vp = self._void_particles
+        x, y = vp.view('x'), vp.view('y')
+        alpha = vp.view('alpha')
+        # Pull toward center with spiral
+        dx = center_x - x
+        dy = center_y - y
+        dist = np.maximum(1, np.hypot(dx, dy))
+        spiral_angle = np.arctan2(dy, dx) + math.pi / 4
+        pull_strength = 200
+        vp.view('vx')[:] = np.cos(spiral_angle) * pull_strength
+        vp.view('vy')[:] = np.sin(spiral_angle) * pull_strength
+        # Fade near center
+        vp.view('fade')[:] = np.where(dist < 100, 300, 0)
+        vp.update(dt)
+        
+        # Regenerate at edges: culled particles come back on a 500px ring
+        x, y = vp.view('x'), vp.view('y')
+        far = np.hypot(x - center_x, y - center_y) > 600
+        if far.any():
+            vp.cull(far)
+        missing = self.VOID_PARTICLE_COUNT - len(vp)
+        if missing > 0:
+            angle = vp.uniform(0, math.pi * 2, missing)
+            vp.emit(missing,
+                    x=center_x + np.cos(angle) * 500,
+                    y=center_y + np.sin(angle) * 500,
+                    size=vp.uniform(2, 6, missing),
+                    alpha=vp.uniform(150, 255, missing))
 
     #region Spike System
     def _current_spike_interval(self):
@@ -878,6 +656,7 @@ class BossBattleScene:
 
     def _spawn_spike_wave(self):
         self.spikes_active.clear()
+        self._spike_wave_id += 1  # new topology: re-bake the spike layer
         gap_min = getattr(g, 'HOLLOW_SPIKE_GAP_MIN', 90)
         gap_max = getattr(g, 'HOLLOW_SPIKE_GAP_MAX', 140)
         spike_w = getattr(g, 'HOLLOW_SPIKE_WIDTH', 28)
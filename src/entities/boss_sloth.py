@@ -16,6 +16,14 @@ import pygame
 import globals as g
 from .bullets import BulletManager
 from ..systems.ui import TextPopup
+from ..systems.animation import Animator, clip_store
+
+# Opacity steps for aging trail segments (one cached sprite per step and kind)
+TRAIL_ALPHA_STEPS = 24
+# Progress buckets baked for the melt (defeat) animation
+MELT_STEPS = 32
+# Cached pulse levels of the sprite-less fallback body
+FALLBACK_PULSE_STEPS = 12
 
 
 class SlothState:
@@ -347,6 +355,7 @@ class FadingState(SlothState):
     def enter(self):
         self.timer = 0.0
         self.duration = 4.0 # Longer for melt animation
+        self.boss._bake_melt()
         self.boss.say_once(self.boss.defeat_line)
     def update(self, dt, player, bullet_manager):
         self.timer += dt
@@ -375,9 +384,6 @@ class TheSloth:
         self.dialog_cooldown = 0.0
         self.say_timer = 0.0 # Persistent timer for mid-battle dialogue
         self.fully_defeated = False
-        # Animation
-        self.anim_timer = 0.0
-        self.anim_frame = 0
         self.state_name = 'intro'
         self.states = {
             'intro': IntroState(self),
@@ -391,14 +397,18 @@ class TheSloth:
         }
         self.current_state = self.states['intro']
         self.current_state.enter()
-        # Load sprites (placeholder safe) — lazy slice
-        self.walk_frames = self._load_sheet(g.BOSS2_SPRITE_WALK_PATH, g.BOSS2_WALK_FRAME_COUNT)
-        self.attack_frames = self._load_sheet(g.BOSS2_SPRITE_ATTACK_PATH, g.BOSS2_ATTACK_FRAME_COUNT)
-        self.fade_frames = self._load_sheet(g.BOSS2_SPRITE_FADE_PATH, g.BOSS2_FADE_FRAME_COUNT)
+        # Animation: sheets are sliced once per process and shared (placeholder safe)
+        self.walk_clip = self._load_sheet(g.BOSS2_SPRITE_WALK_PATH, g.BOSS2_WALK_FRAME_COUNT, g.BOSS2_WALK_ANIM_FPS)
+        self.attack_clip = self._load_sheet(g.BOSS2_SPRITE_ATTACK_PATH, g.BOSS2_ATTACK_FRAME_COUNT, g.BOSS2_ATTACK_ANIM_FPS)
+        self.fade_clip = self._load_sheet(g.BOSS2_SPRITE_FADE_PATH, g.BOSS2_FADE_FRAME_COUNT, g.BOSS2_FADE_ANIM_FPS)
+        self.animator = Animator(self.walk_clip)
         # Ground movement context
         self.ground_y = None  # set by scene (top of ground platform) or computed fallback
         # Slime trail system
         self.trail_segments = []  # list of dict {rect, age}
+        self._trail_cache = {}  # (kind, w, h, alpha level) -> pre-rendered segment
+        self._melt_seq = None  # baked on entering the fading state
+        self._fallback_cache = {}  # pulse level -> fallback body surface
         self._trail_last_x = self.x
         self.enraged = False
 
@@ -445,47 +455,30 @@ class TheSloth:
             self.current_state.enter()
 
     # Loading & Animation
-    def _load_sheet(self, path: str, count: int):
-        frames = []
+    def _load_sheet(self, path: str, count: int, fps: float):
         if not path or not os.path.exists(path):
-            return frames
-        try:
-            sheet = pygame.image.load(path).convert_alpha()
-            fw = g.BOSS2_FRAME_W
-            fh = g.BOSS2_FRAME_H
-            for i in range(count):
-                sub = pygame.Surface((fw, fh), pygame.SRCALPHA)
-                sub.blit(sheet, (0,0), area=pygame.Rect(i*fw,0,fw,fh))
-                frames.append(sub)
-        except Exception:
-            return []
-        return frames
+            return None
+        duration = 1.0 / fps if fps > 0 else float('inf')
+        return clip_store.grid(path, (g.BOSS2_FRAME_W, g.BOSS2_FRAME_H), count, duration=duration)
+
+    def _current_clip(self):
+        if self.state_name == 'slime_attack' and self.attack_clip: return self.attack_clip
+        if self.state_name == 'fading' and self.fade_clip: return self.fade_clip
+        return self.walk_clip
 
     def update(self, dt: float, player, bullet_manager: BulletManager):
         if self.health <= 0 and self.state_name != 'fading':
             self.change_state('fading')
         self.current_state.update(dt, player, bullet_manager)
         # basic anim step
-        self.anim_timer += dt
-        fps = g.BOSS2_WALK_ANIM_FPS
-        if self.state_name == 'slime_attack':
-            fps = g.BOSS2_ATTACK_ANIM_FPS
-        elif self.state_name == 'fading':
-            fps = g.BOSS2_FADE_ANIM_FPS
-        if fps>0 and self.anim_timer >= 1.0/fps:
-            self.anim_timer = 0.0
-            self.anim_frame = (self.anim_frame + 1) % max(1, self._frame_count())
+        self.animator.play(self._current_clip())
+        self.animator.update(dt)
         # Ensure y locked to ground when not fading (fading keeps position)
         if self.state_name != 'fading':
             self._enforce_ground()
         # Trail hazard update & player interaction
         self._update_trail(dt, player)
 
-    def _frame_count(self):
-        if self.state_name == 'slime_attack' and self.attack_frames: return len(self.attack_frames)
-        if self.state_name == 'fading' and self.fade_frames: return len(self.fade_frames)
-        return len(self.walk_frames)
-
     def take_damage(self, dmg: float):
         if self.health <=0: return
         self.health -= dmg
@@ -493,52 +486,27 @@ class TheSloth:
 
     def draw(self, screen: pygame.Surface):
         # pick frame set
-        frames = self.walk_frames
-        if self.state_name == 'slime_attack' and self.attack_frames:
-            frames = self.attack_frames
-        elif self.state_name == 'fading' and self.fade_frames:
-            frames = self.fade_frames
+        clip = self._current_clip()
         frame = None
-        if frames:
-            frame = frames[self.anim_frame % len(frames)]
+        if clip:
+            frame = clip.frames[self.animator.index % len(clip)]
         # simple fade overlay during fading
         if self.state_name == 'fading':
             # Melt animation: Squash height, expand width, fade out, sink into ground
             prog = min(1.0, getattr(self.states['fading'], 'timer', 0.0)/ max(0.01, getattr(self.states['fading'], 'duration',1)))
             
-            # Parameters for melt
-            melt_factor = prog ** 2  # Accelerate melting
-            
-            # Dimensions
-            current_w = self.width * (1.0 + 1.5 * melt_factor) # Expand width up to 2.5x
-            current_h = self.height * (1.0 - 0.9 * melt_factor) # Squash height down to 10%
-            
-            # Position (keep bottom centered)
-            # Original bottom is self.y + self.height
-            # New y should be bottom - current_h
-            bottom_y = self.y + self.height
-            # Add sinking effect (move bottom down slightly)
-            sink_y = 20 * melt_factor
-            draw_y = bottom_y - current_h + sink_y
-            draw_x = self.x + (self.width - current_w) / 2
-            
-            # Alpha fade
-            alpha = int(255 * (1.0 - melt_factor))
-            
-            if frame:
-                # Scale and blit sprite
-                scaled_surf = pygame.transform.scale(frame, (int(current_w), int(current_h)))
-                scaled_surf.set_alpha(alpha)
-                screen.blit(scaled_surf, (int(draw_x), int(draw_y)))
-            else:
-                # Fallback shape melt
-                surf = pygame.Surface((int(current_w), int(current_h)), pygame.SRCALPHA)
-                pygame.draw.ellipse(surf, (80, 110, 140, alpha), (0, 0, int(current_w), int(current_h)))
-                screen.blit(surf, (int(draw_x), int(draw_y)))
+            # Pre-baked melt pose for this progress bucket (see _bake_melt)
+            if self._melt_seq is None:
+                self._bake_melt()
+            step = min(MELT_STEPS - 1, int(prog * MELT_STEPS))
+            poses = self._melt_seq[step]
+            surf, draw_x, draw_y = poses[self.animator.index % len(poses)]
+            screen.blit(surf, (int(draw_x), int(draw_y)))
                 
             # Draw some "bubbles" rising from the melt
             if prog < 0.8:
-                import random
+                current_w, current_h = surf.get_size()
+                alpha = surf.get_alpha() or 255
                 for _ in range(2):
                     if random.random() < 0.3:
                         bx = draw_x + random.random() * current_w
@@ -557,35 +525,37 @@ class TheSloth:
         # If frame is None AND not fading, draw fallback.
         if frame is None and self.state_name != 'fading':
              # Improved fallback: soft elliptical body with subtle gradient pulse
-            body_w, body_h = self.width, self.height
-            surf = pygame.Surface((body_w, body_h), pygame.SRCALPHA)
             t = pygame.time.get_ticks() * 0.001
-            pulse = 0.15 + 0.05*math.sin(t*3.4)
-            base_col = (80, 110, 140)  # cooler palette
-            highlight = (140, 190, 220)
-            for r in range(body_w//2):
-                alpha = int(160 * (1 - r/(body_w/2))**1.2)
-                blend = r/(body_w/2)
-                # interpolate color
-                col = (
-                    int(base_col[0] + (highlight[0]-base_col[0])*blend*pulse),
-                    int(base_col[1] + (highlight[1]-base_col[1])*blend*pulse),
-                    int(base_col[2] + (highlight[2]-base_col[2])*blend*pulse),
-                    alpha
-                )
-                pygame.draw.ellipse(surf, col, (body_w/2 - r, body_h*0.15, 2*r, body_h*0.7))
-            # Edge outline
-            pygame.draw.ellipse(surf, (40,60,80,180), (2, body_h*0.15+2, body_w-4, body_h*0.7-4), 2)
-            screen.blit(surf, (int(self.x), int(self.y)))
+            level = int(round((math.sin(t*3.4) + 1) * 0.5 * (FALLBACK_PULSE_STEPS - 1)))
+            screen.blit(self._fallback_body(level), (int(self.x), int(self.y)))
         # Draw slime trail segments (beneath boss, after to avoid covering player)
-        for seg in self.trail_segments:
-            r = seg['rect']
-            age = seg['age']
-            life = g.BOSS2_CRUSH_POOL_LIFETIME if seg.get('kind') == 'crush' else g.BOSS2_SLIME_TRAIL_LIFETIME
-            fade = 1.0 - (age / life)
-            alpha = int(150 * max(0.05, fade))
-            surf = pygame.Surface((r.width, r.height), pygame.SRCALPHA)
-            kind = seg.get('kind')
+        if self.trail_segments:
+            seq = []
+            top = TRAIL_ALPHA_STEPS - 1
+            for seg in self.trail_segments:
+                r = seg['rect']
+                kind = seg.get('kind')
+                life = g.BOSS2_CRUSH_POOL_LIFETIME if kind == 'crush' else g.BOSS2_SLIME_TRAIL_LIFETIME
+                fade = max(0.05, 1.0 - (seg['age'] / life))
+                level = max(1, min(top, int(round(fade * top))))
+                seq.append((self._trail_sprite(kind, r.width, r.height, level), r.topleft))
+            screen.blits(seq, doreturn=False)
+
+    def _trail_sprite(self, kind, w: int, h: int, level: int) -> pygame.Surface:
+        """Gradient slime sprite for a trail kind, faded to `level` of TRAIL_ALPHA_STEPS.
+
+        The base sprite is rendered once per (kind, size) at full trail opacity;
+        age fading is a surface-alpha copy cached per level.
+        """
+        key = (kind, w, h, level)
+        surf = self._trail_cache.get(key)
+        if surf is not None:
+            return surf
+        top = TRAIL_ALPHA_STEPS - 1
+        base_surf = self._trail_cache.get((kind, w, h, top))
+        if base_surf is None:
+            alpha = 150
+            base_surf = pygame.Surface((w, h), pygame.SRCALPHA)
             if kind == 'crush':
                 # Distinct heavier toxic pool (purple/teal mix)
                 base = (50, 40, 90)
@@ -593,18 +563,84 @@ class TheSloth:
             else:
                 base = (40, 120, 130)
                 tip = (70, 190, 200)
-            for y in range(r.height):
-                frac = y / max(1, r.height-1)
+            for y in range(h):
+                frac = y / max(1, h-1)
                 col = (
                     int(base[0] + (tip[0]-base[0])*frac),
                     int(base[1] + (tip[1]-base[1])*frac),
                     int(base[2] + (tip[2]-base[2])*frac),
                     alpha
                 )
-                pygame.draw.line(surf, col, (0,y), (r.width,y))
+                pygame.draw.line(base_surf, col, (0,y), (w,y))
             outline_col = (35,20,60,int(alpha*0.85)) if kind=='crush' else (20,50,60,int(alpha*0.8))
-            pygame.draw.rect(surf, outline_col, (0,0,r.width,r.height), 2, border_radius=6)
-            screen.blit(surf, (r.x, r.y))
+            pygame.draw.rect(base_surf, outline_col, (0,0,w,h), 2, border_radius=6)
+            self._trail_cache[(kind, w, h, top)] = base_surf
+        if level == top:
+            return base_surf
+        surf = base_surf.copy()
+        surf.set_alpha(int(255 * level / top))
+        self._trail_cache[key] = surf
+        return surf
+
+    def _fallback_body(self, level: int) -> pygame.Surface:
+        """Sprite-less body for one of FALLBACK_PULSE_STEPS pulse levels, built once."""
+        surf = self._fallback_cache.get(level)
+        if surf is not None:
+            return surf
+        body_w, body_h = self.width, self.height
+        surf = pygame.Surface((body_w, body_h), pygame.SRCALPHA)
+        pulse = 0.10 + 0.10 * level / max(1, FALLBACK_PULSE_STEPS - 1)
+        base_col = (80, 110, 140)  # cooler palette
+        highlight = (140, 190, 220)
+        for r in range(body_w//2):
+            alpha = int(160 * (1 - r/(body_w/2))**1.2)
+            blend = r/(body_w/2)
+            # interpolate color
+            col = (
+                int(base_col[0] + (highlight[0]-base_col[0])*blend*pulse),
+                int(base_col[1] + (highlight[1]-base_col[1])*blend*pulse),
+                int(base_col[2] + (highlight[2]-base_col[2])*blend*pulse),
+                alpha
+            )
+            pygame.draw.ellipse(surf, col, (body_w/2 - r, body_h*0.15, 2*r, body_h*0.7))
+        # Edge outline
+        pygame.draw.ellipse(surf, (40,60,80,180), (2, body_h*0.15+2, body_w-4, body_h*0.7-4), 2)
+        self._fallback_cache[level] = surf
+        return surf
+
+    def _bake_melt(self):
+        """Bake the melt animation into MELT_STEPS progress buckets.
+
+        Melt: squash height, expand width, fade out and sink into the ground.
+        Each bucket holds one (surface, x, y) pose per fade frame (or a single
+        fallback ellipse), so the defeat animation draws with a plain blit.
+        """
+        clip = self.fade_clip or self.walk_clip
+        frames = clip.frames if clip else ()
+        seq = []
+        for step in range(MELT_STEPS):
+            prog = (step + 0.5) / MELT_STEPS
+            melt_factor = prog ** 2  # Accelerate melting
+            current_w = max(1, int(self.width * (1.0 + 1.5 * melt_factor)))  # Expand width up to 2.5x
+            current_h = max(1, int(self.height * (1.0 - 0.9 * melt_factor)))  # Squash height down to 10%
+            # Keep bottom centered, sinking slightly
+            bottom_y = self.y + self.height
+            draw_y = bottom_y - current_h + 20 * melt_factor
+            draw_x = self.x + (self.width - current_w) / 2
+            alpha = int(255 * (1.0 - melt_factor))
+            poses = []
+            if frames:
+                for frame in frames:
+                    surf = pygame.transform.scale(frame, (current_w, current_h))
+                    surf.set_alpha(alpha)
+                    poses.append((surf, draw_x, draw_y))
+            else:
+                # Fallback shape melt
+                surf = pygame.Surface((current_w, current_h), pygame.SRCALPHA)
+                pygame.draw.ellipse(surf, (80, 110, 140, alpha), (0, 0, current_w, current_h))
+                poses.append((surf, draw_x, draw_y))
+            seq.append(poses)
+        self._melt_seq = seq
 
     # --- Ground & Trail helpers ---
     def set_ground(self, ground_top: float):
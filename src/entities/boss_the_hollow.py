@@ -15,12 +15,17 @@ import os
 from pathlib import Path
 import pygame
 import globals as g
-from src.utils.font import get_font
+from src.utils.font import get_font, render_text
+from src.utils.atlas import load_image
 
 from .bullets import BulletManager
 from ..systems.ui import TextPopup
+from ..systems.animation import Animator, Clip, clip_store
 #endregion Imports
 
+# Progress buckets baked for the implode (defeat) animation
+IMPLODE_STEPS = 32
+
 
 #region State Base
 class BossState:
@@ -487,12 +492,12 @@ class TheHollow:
             print(f"SFX Load Error (Hollow): {e}")
 
         # Animation state
-        self.anim_timer = 0.0
-        self.anim_index = 0
-        self.animations = {}
         self.anim_name = 'walk'
-        self.anim_fps_by_name = {}
-        self._load_animations()
+        self.clips = self._load_animations()
+        self.animator = Animator(self.clips.get('walk'))
+        self._death_seq = None  # implode frames, baked on the first fading draw
+        self._death_key = None  # (anim_name, facing_right) they were baked for
+        self._death_shards = {}
 
     def get_backlog_boost(self) -> float:
         return (getattr(g, 'BOSS3_BACKLOG_BOOST_MULT', 1.5) if self.backlog_boost_timer > 0.0 else 1.0)
@@ -540,13 +545,12 @@ class TheHollow:
                 self.anim_name = 'walk'
             else:
                 # For now, non-drift states use attack animation if available
-                if 'attack' in self.animations:
+                if 'attack' in self.clips:
                     self.anim_name = 'attack'
                 else:
                     self.anim_name = 'walk'
             if self.anim_name != prev_anim:
-                self.anim_timer = 0.0
-                self.anim_index = 0
+                self.animator.play(self.clips.get(self.anim_name), restart=True)
 
     # Update
     def update(self, dt, player, bullet_manager: BulletManager):
@@ -593,14 +597,7 @@ class TheHollow:
         self.prev_x = self.x
 
         # Advance animation
-        frames = self.animations.get(self.anim_name) if self.animations else None
-        if frames:
-            self.anim_timer += dt
-            fps = int(self.anim_fps_by_name.get(self.anim_name, 8))
-            frame_time = 1.0 / max(1, fps)
-            while self.anim_timer >= frame_time:
-                self.anim_timer -= frame_time
-                self.anim_index = (self.anim_index + 1) % len(frames)
+        self.animator.update(dt)
 
     # Combat
     def take_damage(self, dmg):
@@ -618,41 +615,37 @@ class TheHollow:
                 # Don't draw main body sometimes
                 pass
             else:
-                # Draw distorted body
-                frames = self.animations.get(self.anim_name) if self.animations else None
+                # Draw distorted body: pre-scaled implode frame for this progress bucket
+                if self._death_key != (self.anim_name, self.facing_right):
+                    self._bake_death()
+                step = min(IMPLODE_STEPS - 1, int(prog * IMPLODE_STEPS))
+                frames = self._death_seq[step]
+                # Jitter position
+                jx = random.uniform(-5, 5) * prog * 10
+                jy = random.uniform(-5, 5) * prog * 10
                 if frames:
-                    frame = frames[self.anim_index]
-                    if not self.facing_right:
-                        frame = pygame.transform.flip(frame, True, False)
-                    
-                    # Scale down (implode)
-                    scale = max(0.01, 1.0 - prog)
-                    w = int(self.width * scale)
-                    h = int(self.height * scale)
-                    if w > 0 and h > 0:
-                        scaled = pygame.transform.scale(frame, (w, h))
-                        # Jitter position
-                        jx = self.x + (self.width - w)/2 + random.uniform(-5, 5) * prog * 10
-                        jy = self.y + (self.height - h)/2 + random.uniform(-5, 5) * prog * 10
-                        screen.blit(scaled, (int(jx), int(jy)))
-                else:
+                    scaled = frames[self.animator.index % len(frames)]
+                    w, h = scaled.get_size()
+                    screen.blit(scaled, (int(self.x + (self.width - w)/2 + jx), int(self.y + (self.height - h)/2 + jy)))
+                elif not self.clips.get(self.anim_name):
                     # Fallback rect implosion
                     scale = max(0.01, 1.0 - prog)
                     w = int(self.width * scale)
                     h = int(self.height * scale)
-                    jx = self.x + (self.width - w)/2 + random.uniform(-5, 5) * prog * 10
-                    jy = self.y + (self.height - h)/2 + random.uniform(-5, 5) * prog * 10
-                    pygame.draw.rect(screen, (10, 10, 10), (int(jx), int(jy), w, h))
+                    pygame.draw.rect(screen, (10, 10, 10), (int(self.x + (self.width - w)/2 + jx), int(self.y + (self.height - h)/2 + jy), w, h))
 
             # 2. Void Shards (Black squares) drifting away
-            # Generate deterministic random shards based on time to look like they are flying apart
-            random.seed(int(self.current_state.timer * 10)) 
-            for _ in range(int(10 * prog)):
-                sx = self.x + self.width/2 + random.uniform(-50, 50) * prog * 5
-                sy = self.y + self.height/2 + random.uniform(-50, 50) * prog * 5
-                size = random.randint(4, 12)
-                pygame.draw.rect(screen, (0, 0, 0), (int(sx), int(sy), size, size))
-            random.seed() # Reset seed
+            # Deterministic per 0.1 s tick so they look like they are flying apart
+            tick = int(self.current_state.timer * 10)
+            shards = self._death_shards.get(tick)
+            if shards is None:
+                rng = random.Random(tick)
+                shards = [(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.randint(4, 12)) for _ in range(10)]
+                self._death_shards[tick] = shards
+            cx = self.x + self.width/2
+            cy = self.y + self.height/2
+            for ux, uy, size in shards[:int(10 * prog)]:
+                pygame.draw.rect(screen, (0, 0, 0), (int(cx + ux * prog * 5), int(cy + uy * prog * 5), size, size))
 
             # 3. Static/Noise lines (Horizontal glitches)
             if random.random() < 0.3 * prog:
@@ -664,12 +657,9 @@ class TheHollow:
             return
 
         # Normal Sprite-based draw if frames loaded; fallback to silhouette rect
-        frames = self.animations.get(self.anim_name) if self.animations else None
-        if frames:
-            frame = frames[self.anim_index]
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (int(self.x), int(self.y)))
+        clip = self._facing_clip()
+        if clip:
+            screen.blit(clip.frames[self.animator.index % len(clip)], (int(self.x), int(self.y)))
         else:
             body_color = (10, 10, 10)
             pygame.draw.rect(screen, body_color, (int(self.x), int(self.y), self.width, self.height))
@@ -678,31 +668,56 @@ class TheHollow:
             pygame.draw.rect(screen, (200, 200, 200), (int(self.x), int(self.y), self.width, self.height), 2)
         # phase label (gray)
         font = get_font(22)
-        label = font.render(f"The Hollow - P{self.phase}", True, (220, 220, 220))
+        label = render_text(font, f"The Hollow - P{self.phase}", (220, 220, 220))
         screen.blit(label, (self.x, self.y - 24))
 
     # Internal helpers
+    def _facing_clip(self):
+        """Current animation's clip for the facing direction (the flip is shared)."""
+        clip = self.clips.get(self.anim_name)
+        if not clip:
+            return None
+        return clip if self.facing_right else clip.flipped()
+
+    def _bake_death(self):
+        """Pre-scale the implode animation into IMPLODE_STEPS progress buckets.
+
+        Bakes the current animation and facing; `draw` rebakes when either
+        changes, so the frames always match `self.animator`'s clip. Shard
+        layouts are generated lazily per 0.1 s tick from a local RNG, so the
+        global `random` state is never reseeded.
+        """
+        self._death_key = (self.anim_name, self.facing_right)
+        clip = self._facing_clip()
+        seq = []
+        for step in range(IMPLODE_STEPS):
+            scale = max(0.01, 1.0 - (step + 0.5) / IMPLODE_STEPS)
+            w = int(self.width * scale)
+            h = int(self.height * scale)
+            if clip and w > 0 and h > 0:
+                seq.append(clip.scaled(size=(w, h)).frames)
+            else:
+                seq.append(())
+        self._death_seq = seq
+        self._death_shards = {}
+
     def _load_animations(self):
-        try:
-            # Load walk
-            rel_walk = getattr(g, 'BOSS3_SPRITE_WALK_PATH', os.path.join('assets', 'sprites', 'boss', 'boss_hollow_walk.png'))
-            walk_frames = self._load_sheet(rel_walk, getattr(g, 'BOSS3_WALK_FRAME_COUNT', 15))
-            if walk_frames:
-                self.animations['walk'] = walk_frames
-                self.anim_fps_by_name['walk'] = getattr(g, 'BOSS3_WALK_ANIM_FPS', 8)
-
-            # Load attack
-            rel_attack = getattr(g, 'BOSS3_SPRITE_ATTACK_PATH', os.path.join('assets', 'sprites', 'boss', 'boss_hollow_attack.png'))
-            attack_frames = self._load_sheet(rel_attack, getattr(g, 'BOSS3_ATTACK_FRAME_COUNT', 12))
-            if attack_frames:
-                self.animations['attack'] = attack_frames
-                self.anim_fps_by_name['attack'] = getattr(g, 'BOSS3_ATTACK_ANIM_FPS', 10)
-
-            # default if something missing
-            if not self.animations:
-                self.animations = {}
-        except Exception:
-            self.animations = {}
+        """Walk/attack clips, sliced once per process and shared by every instance."""
+        specs = {
+            'walk': (getattr(g, 'BOSS3_SPRITE_WALK_PATH', os.path.join('assets', 'sprites', 'boss', 'boss_hollow_walk.png')),
+                     getattr(g, 'BOSS3_WALK_FRAME_COUNT', 15), getattr(g, 'BOSS3_WALK_ANIM_FPS', 8)),
+            'attack': (getattr(g, 'BOSS3_SPRITE_ATTACK_PATH', os.path.join('assets', 'sprites', 'boss', 'boss_hollow_attack.png')),
+                       getattr(g, 'BOSS3_ATTACK_FRAME_COUNT', 12), getattr(g, 'BOSS3_ATTACK_ANIM_FPS', 10)),
+        }
+        clips = {}
+        for name, (rel_path, count, fps) in specs.items():
+            def build(rel_path=rel_path, count=count, fps=fps):
+                frames = self._load_sheet(rel_path, count)
+                return Clip(frames, 1.0 / max(1, int(fps))) if frames else None
+            clip = clip_store.get(('hollow', rel_path, count, self.width, self.height, fps), build)
+            if clip:
+                clips[name] = clip
+        return clips
 
     def _resolve_sprite_path(self, rel_path: str) -> Path:
         repo_root = Path(__file__).resolve().parents[2]
@@ -717,7 +732,7 @@ class TheHollow:
         try:
             sprite_path = self._resolve_sprite_path(rel_path)
             # Resolve against repo root (two levels up from this file: src/entities -> repo root)
-            image = pygame.image.load(str(sprite_path)).convert_alpha()
+            image = load_image(str(sprite_path))
 
             # Determine frame size with support for margins/spacing
             img_w, img_h = image.get_width(), image.get_height()
@@ -12,7 +12,7 @@ import math
 import os
 from typing import List, Tuple
 import globals as g
-from src.utils.sprite_loader import load_animation_strip
+from src.systems.animation import Animator, Clip, clip_store
 #endregion Imports
 
 
@@ -20,6 +20,18 @@ class Player:
     """
     2D Platformer Player with physics and combat abilities
     """
+    SPRITE_SCALE = 1.5
+    FLASH_COLOR = (255, 255, 255, 128)
+    SPRITE_DIR = os.path.join('assets', 'sprites', 'Blue_witch')
+    ANIMATION_FILES = {
+        'idle': 'B_witch_idle.png',
+        'run': 'B_witch_run.png',
+        'attack': 'B_witch_attack.png',
+        'take_damage': 'B_witch_take_damage.png',
+        'death': 'B_witch_death.png',
+        'charge': 'B_witch_charge.png',
+    }
+
     def __init__(self, x: float, y: float):
         #region Init/State
         self.x = x
@@ -47,36 +59,14 @@ class Player:
         self.mouse_pressed = False
         self.mouse_pressed_right = False
 
-        # Animation State
-        self.animations = {}
+        # Animation State: clips are shared through the clip store, this
+        # player only keeps its frame index and timer in the animator
         self.current_anim = 'idle'
         self.facing_right = True
-        self.frame_index = 0
-        self.anim_timer = 0.0
         self.anim_speed = 0.1  # 10 FPS
-
-        # Load Sprites
-        try:
-            sprite_dir = os.path.join('assets', 'sprites', 'Blue_witch')
-            self.animations['idle'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_idle.png'))
-            self.animations['run'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_run.png'))
-            self.animations['attack'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_attack.png'))
-            self.animations['take_damage'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_take_damage.png'))
-            self.animations['death'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_death.png'))
-            self.animations['charge'] = load_animation_strip(os.path.join(sprite_dir, 'B_witch_charge.png'))
-            
-            # Fallback if loading fails or returns empty
-            if not self.animations.get('idle'):
-                 s = pygame.Surface((self.width, self.height))
-                 s.fill(g.COLORS['player'])
-                 self.animations['idle'] = [s]
-                 
-        except Exception as e:
-            print(f"Failed to load player sprites: {e}")
-            # Fallback
-            s = pygame.Surface((self.width, self.height))
-            s.fill(g.COLORS['player'])
-            self.animations = {'idle': [s]}
+        self.clips = self._load_clips()
+        # restart the timer on each frame advance to keep the original cadence
+        self.animator = Animator(self.clips['idle'], carry=False)
 
         # SFX
         try:
@@ -160,20 +150,31 @@ class Player:
         target_anim = 'idle'
         if abs(self.vx) > 10: # Threshold for movement
             target_anim = 'run'
-            
-        if target_anim != self.current_anim:
+        if target_anim in self.clips:
             self.current_anim = target_anim
-            self.frame_index = 0
-            self.anim_timer = 0.0
-            
+
         # Advance frame
-        self.anim_timer += dt
-        frames = self.animations.get(self.current_anim, self.animations.get('idle', []))
-        if not frames: frames = [] # Should be handled by fallback
-        
-        if frames and self.anim_timer >= self.anim_speed:
-            self.anim_timer = 0.0
-            self.frame_index = (self.frame_index + 1) % len(frames)
+        self.animator.play(self.clips[self.current_anim])
+        self.animator.update(dt)
+    
+    def _load_clips(self) -> dict:
+        """Blue witch clips at display scale; a plain rect if the idle strip is missing."""
+        clips = {}
+        for name, filename in self.ANIMATION_FILES.items():
+            try:
+                clip = clip_store.strip(os.path.join(self.SPRITE_DIR, filename), self.anim_speed)
+            except Exception as e:
+                print(f"Failed to load player sprites: {e}")
+                clip = None
+            if clip:
+                clips[name] = clip.scaled(self.SPRITE_SCALE)
+        if 'idle' not in clips:
+            def build():
+                s = pygame.Surface((self.width, self.height))
+                s.fill(g.COLORS['player'])
+                return Clip([s], self.anim_speed)
+            clips['idle'] = clip_store.get(('player_fallback', self.width, self.height), build).scaled(self.SPRITE_SCALE)
+        return clips
     #endregion Update & Physics
     
     #region Collisions
@@ -267,44 +268,25 @@ class Player:
     #region Rendering
     def draw(self, screen: pygame.Surface):
         """Draw the player"""
-        # Get current frame
-        frames = self.animations.get(self.current_anim, self.animations.get('idle', []))
+        # Get current frame (scaled, flipped and flash variants are shared clips)
+        clip = self.animator.clip
         
-        if not frames:
+        if not clip:
             # Fallback
             pygame.draw.rect(screen, g.COLORS['player'], (int(self.x), int(self.y), self.width, self.height))
             return
 
-        idx = self.frame_index % len(frames)
-        image = frames[idx]
-        
-        # Scale the sprite for visual size (1.5x)
-        scale_factor = 1.5
-        if scale_factor != 1.0:
-            new_size = (int(image.get_width() * scale_factor), int(image.get_height() * scale_factor))
-            image = pygame.transform.scale(image, new_size)
-
-        # Flip if facing left (Blue witch sprites face right by default usually, let's assume right)
-        # Actually, let's check the sprites. Usually sprites face right.
-        # If facing_right is False, we flip.
         if not self.facing_right:
-            image = pygame.transform.flip(image, True, False)
+            clip = clip.flipped()
+        # Flashing effect during invincibility: white silhouette on odd ticks
+        if self.invincible_time > 0 and int(self.invincible_time * 10) % 2:
+            clip = clip.silhouette(self.FLASH_COLOR)
+        image = clip.frames[self.animator.index % len(clip)]
             
         # Draw centered on hitbox bottom
         rect = image.get_rect()
         rect.midbottom = (self.x + self.width // 2, self.y + self.height)
-        
-        # Flashing effect during invincibility
-        if self.invincible_time > 0:
-            if int(self.invincible_time * 10) % 2:
-                # Draw white silhouette or just skip drawing to flash
-                mask = pygame.mask.from_surface(image)
-                white_surf = mask.to_surface(setcolor=(255, 255, 255, 128), unsetcolor=(0,0,0,0))
-                screen.blit(white_surf, rect)
-            else:
-                screen.blit(image, rect)
-        else:
-            screen.blit(image, rect)
+        screen.blit(image, rect)
         
         # Draw collision box in debug mode
         if g.SHOW_COLLISION_BOXES:
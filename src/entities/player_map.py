@@ -7,13 +7,61 @@ map viewer and tested easily.
 """
 
 import os
+import numpy as np
 import pygame
 
+from src.systems.animation import Animator, Clip, clip_store
+
+
+def _remove_background(frame_surf):
+	"""Alpha copy of `frame_surf` with pixels matching its top-left colour cleared.
+
+	Frames whose top-left pixel is already transparent are only converted.
+	"""
+	try:
+		fs = frame_surf.convert_alpha()
+	except pygame.error:
+		# no display yet: copy into an alpha surface instead
+		fs = pygame.Surface(frame_surf.get_size(), pygame.SRCALPHA)
+		fs.blit(frame_surf, (0, 0))
+	w0, h0 = fs.get_size()
+	if not w0 or not h0:
+		return fs
+	bg = frame_surf.get_at((0, 0))
+	if bg.a == 0:
+		return fs
+	rgb = pygame.surfarray.pixels3d(fs)
+	alpha = pygame.surfarray.pixels_alpha(fs)
+	match = (rgb == (bg.r, bg.g, bg.b)).all(axis=2)
+	rgb[match] = 0
+	alpha[match] = 0
+	del rgb, alpha
+	return fs
+
+
+def _foot_pivot(surf, search_frac=4):
+	"""Centre of the lowest opaque row within the bottom 1/search_frac of `surf`.
+
+	Falls back to the bottom centre when that band is empty.
+	"""
+	w, h = surf.get_size()
+	search_h = max(1, h // search_frac)
+	band = pygame.surfarray.pixels_alpha(surf)[:, h - search_h:]
+	rows = np.flatnonzero(band.any(axis=0))
+	if not rows.size:
+		return w // 2, h - 1
+	row = int(rows[-1])
+	xs = np.flatnonzero(band[:, row])
+	return int(round(xs.sum() / len(xs))), h - search_h + row
+
+
 
 class MapPlayer:
 	SPEED = 120
 	JUMP_V = -320
 	GRAVITY = 900
+	# Aseprite tags the map player can use (see the `preferred` groups in _load_sprite)
+	ASE_TAGS = ('idle_right', 'idle_left', 'idle', 'run_right', 'run_left', 'run', 'walk')
 
 	def __init__(self, x=0, y=0, scale=1, tile_w=16, tile_h=16, jump_tiles=None):
 		"""Create a player sized to 1 tile wide and 2 tiles tall by default.
@@ -61,9 +109,17 @@ class MapPlayer:
 
 		# sprite surface lazy-loaded in draw
 		self._sprite = None
+		# playback state; the clips themselves are shared (see clip_store)
+		self.animations = {}
+		self.cur_anim = None
+		self.animator = Animator()
 		# mark whether we've attempted to load sprite/animations
 		self._loaded = False
 
+	@property
+	def anim_frame(self):
+		return self.animator.index
+
 	@property
 	def rect(self):
 		return pygame.Rect(int(self.x), int(self.y), int(self.cw), int(self.ch))
@@ -148,279 +204,190 @@ class MapPlayer:
 
 		if chosen:
 			# If switching between direction variants of the same base animation
-			# (e.g. 'run_right' <-> 'run_left'), preserve the anim_frame and
-			# anim_time so the flip doesn't look like a teleport. Only reset
+			# (e.g. 'run_right' <-> 'run_left'), preserve the frame index and
+			# timer so the flip doesn't look like a teleport. Only reset
 			# when the base animation actually changed.
-			prev = getattr(self, 'cur_anim', None)
+			prev = self.cur_anim
+			same_base = True
 			if prev != chosen:
 				prev_base = prev.split('_')[0] if prev else None
-				new_base = chosen.split('_')[0]
-				if prev_base == new_base:
-					# same base (directional change) -> keep frame/time
-					self.cur_anim = chosen
-				else:
+				same_base = prev_base == chosen.split('_')[0]
+				if not same_base:
 					print(f"[player_map] anim change: {prev} -> {chosen}")
-					self.cur_anim = chosen
-					self.anim_frame = 0
-					self.anim_time = 0.0
-
-			# advance animation frame timer (durations expected in ms)
-			self.anim_time += dt * 1000.0
-			dur_list = self.animations.get(self.cur_anim, {}).get('durations', None)
-			frames = self.animations.get(self.cur_anim, {}).get('frames', [])
-			if frames:
-				cur_dur = dur_list[self.anim_frame] if dur_list and len(dur_list) > self.anim_frame else 100
-				while self.anim_time >= cur_dur:
-					self.anim_time -= cur_dur
-					self.anim_frame = (self.anim_frame + 1) % len(frames)
-					cur_dur = dur_list[self.anim_frame] if dur_list and len(dur_list) > self.anim_frame else 100
+				self.cur_anim = chosen
+			# same base (directional change) -> keep frame/time
+			self.animator.play(self.animations[chosen], keep_phase=same_base)
+			self.animator.update(dt)
 
-	def _load_sprite(self):
-		# Attempt to use the local Aseprite plugin to load tagged animations
-		root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-		ase_path = os.path.join(root, 'assets', 'sprites', 'Blue_witch', 'B_witch.aseprite')
-		# If an .aseprite file exists and the plugin is available, parse tags
-		if os.path.exists(ase_path):
-			try:
-				# add plugin src to sys.path so we can import py_aseprite and the helper
-				plugin_src = os.path.join(root, 'combine', 'aseprite_plugin', 'src')
-				if plugin_src not in __import__('sys').path:
-					__import__('sys').path.insert(0, plugin_src)
-
-				from pygame_aseprite_animation import Animation as AseAnim
-				from py_aseprite import AsepriteFile
-
-				ase_anim = AseAnim(ase_path)
-				# ase_anim.animation_frames is a list of full-frame surfaces
-				# try to find frame tag ranges from the .aseprite metadata
-				af = None
-				with open(ase_path, 'rb') as f:
-					af = AsepriteFile(f.read())
-
-				tags = {}
-				# frame tags are stored in FrameTagsChunk instances inside frames
-				for frame in getattr(af, 'frames', []):
-					for chunk in getattr(frame, 'chunks', []):
-						if hasattr(chunk, 'tags'):
-							for t in getattr(chunk, 'tags', []):
-								name = t.get('name', '').lower()
-								tags[name] = (t.get('from', 0), t.get('to', 0))
-
-				# Build animations by tag name (if present)
-				animations = {}
-				if tags:
-					for name, (f0, f1) in tags.items():
-						frames = ase_anim.animation_frames[f0:f1 + 1]
-						durations = ase_anim.frame_duration[f0:f1 + 1]
-						animations[name] = {'frames': frames, 'durations': durations}
-
-					# Debug: print discovered tags and built animation keys
-					try:
-						print('[player_map] discovered ase sprite tags:', list(tags.keys()))
-						print('[player_map] built animation keys:', list(animations.keys()))
-					except Exception:
-						pass
+	def _process_frame(self, frame_surf):
+		"""Fit a source frame into the visual sprite size.
 
-				# Common tag names to look for
-				preferred = [
-					('idle_right', 'idle_left', 'idle'),
-					('run_right', 'run_left', 'run', 'walk')
-				]
-
-				# Decide which animations to use for idle/run + facing
-				self.animations = {}
-				for group in preferred:
-					# base is group[0] mapping to facing right; try to find specific tags
-					base = group[0]
-					for name in group:
-						if name in animations:
-							# If tag includes direction, split on suffix; otherwise use as both
-							if name.endswith('_right'):
-								self.animations['idle_right' if 'idle' in name else 'run_right'] = animations[name]
-							elif name.endswith('_left'):
-								self.animations['idle_left' if 'idle' in name else 'run_left'] = animations[name]
-							else:
-								# assign generic to both
-								key_idle = 'idle' if 'idle' in name else 'run'
-								self.animations[key_idle] = animations[name]
-
-				# If we didn't find separate left/right tags, but found generic idle/run, assign them
-				for k in ('idle', 'run'):
-					if k in animations and k not in self.animations:
-						self.animations[k] = animations[k]
-
-				# store frames list for fallback if no tags
-				if not self.animations:
-					# fallback: use entire frame list as 'idle' if short, else split
-					frames = ase_anim.animation_frames
-					if len(frames) <= 2:
-						self.animations['idle'] = {'frames': frames, 'durations': ase_anim.frame_duration}
-					else:
-						mid = max(1, len(frames) // 2)
-						self.animations['idle'] = {'frames': frames[:mid], 'durations': ase_anim.frame_duration[:mid]}
-						self.animations['run'] = {'frames': frames[mid:], 'durations': ase_anim.frame_duration[mid:]}
-
-				# set animator state
-				self.cur_anim = 'idle'
-				self.anim_frame = 0
-				self.anim_time = 0.0
-				self.facing = 'right'
-				self._ase_frame_size = ase_anim.animation_frames[0].get_size() if ase_anim.animation_frames else (int(self.w_vis), int(self.h_vis))
-				# scale frames to player size
-				def _process_frame(frame_surf):
-					# Ensure we have per-pixel alpha. If the source has no alpha, use the top-left pixel as background
-					try:
-						# If frame already has alpha channel and corner is transparent, keep as-is
-						corner = frame_surf.get_at((0, 0))
-					except Exception:
-						corner = None
-					fs = frame_surf
-					# convert to alpha-capable surface
-					try:
-						fs = frame_surf.convert_alpha()
-					except Exception:
-						fs = frame_surf.copy()
-					# if corner pixel is transparent we keep per-pixel alpha; otherwise attempt to remove solid bg
-					bg = None
-					try:
-						bg = frame_surf.get_at((0, 0))
-					except Exception:
-						bg = None
-					# If the frame already has per-pixel alpha and corner is transparent, we keep it as-is
-					if bg is not None and getattr(bg, 'a', None) == 0:
-						pass
-					else:
-						# If frame has no alpha or corner was opaque, try to remove exact background color
-						# Create an alpha-capable surface to copy into
-						try:
-							w0, h0 = fs.get_size()
-							clean = pygame.Surface((w0, h0), pygame.SRCALPHA)
-							# If we have a bg candidate, make pixels matching that RGB fully transparent
-							if bg is not None:
-								bg_rgb = (bg.r, bg.g, bg.b) if getattr(bg, 'r', None) is not None else (bg[0], bg[1], bg[2])
-								for yy in range(h0):
-									for xx in range(w0):
-										col = fs.get_at((xx, yy))
-										try:
-											pix_rgb = (col.r, col.g, col.b) if getattr(col, 'r', None) is not None else (col[0], col[1], col[2])
-										except Exception:
-											pix_rgb = (col[0], col[1], col[2])
-										if pix_rgb == bg_rgb:
-											# leave transparent
-											continue
-										else:
-											clean.set_at((xx, yy), col)
-							else:
-								# No bg candidate: just copy (we already have alpha via convert_alpha)
-								clean.blit(fs, (0, 0))
-							fs = clean
-						except Exception:
-							# on any failure, leave fs as-is
-							pass
-
-					# preserve aspect ratio when fitting into player rect
-					fw, fh = fs.get_size()
-					if fw == 0 or fh == 0:
-						# empty frame, return blank sized to visual sprite plus pivot
-						blank = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
-						pivot = (int(self.w_vis) // 2, int(self.h_vis) - 1)
-						return blank, pivot
-					# desired float scale
-					float_scale_w = float(self.w_vis) / fw
-					float_scale_h = float(self.h_vis) / fh
-					float_scale = min(float_scale_w, float_scale_h)
-					# Compute target pixel size and use nearest-neighbour scaling to avoid blur
-					new_w = max(1, int(round(fw * float_scale)))
-					new_h = max(1, int(round(fh * float_scale)))
-					try:
-						# use nearest-neighbour scaling (pygame.transform.scale is nearest by default)
-						scaled = pygame.transform.scale(fs, (new_w, new_h))
-					except Exception:
-						scaled = pygame.Surface((new_w, new_h), pygame.SRCALPHA)
-					# blit into a target surface sized to the visual sprite, align bottom (feet on floor)
-					target = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
-					tx = (int(self.w_vis) - new_w) // 2
-					# place the scaled image so its bottom aligns with the visual sprite bottom
-					ty = max(0, int(self.h_vis) - new_h)
-					try:
-						target.blit(scaled, (tx, ty))
-					except Exception:
-						pass
-					# compute pivot: try to find non-transparent pixels near the bottom
-					w_t, h_t = target.get_size()
-					pivot_x = None
-					pivot_y = None
-					search_h = max(1, h_t // 4)
-					for row in range(h_t - 1, h_t - 1 - search_h, -1):
-						xs = []
-						for xx in range(w_t):
-							col = target.get_at((xx, row))
-							# col may be (r,g,b,a) or similar
-							alpha = getattr(col, 'a', None) if hasattr(col, 'a') else (col[3] if len(col) > 3 else 255)
-							if alpha and alpha > 0:
-								xs.append(xx)
-						if xs:
-							pivot_x = int(round(sum(xs) / len(xs)))
-							pivot_y = row
-							break
-					if pivot_x is None:
-						pivot_x = w_t // 2
-						pivot_y = h_t - 1
-					return target, (pivot_x, pivot_y)
-
-				for a in self.animations.values():
+		Removes a solid background, scales with nearest-neighbour preserving the
+		aspect ratio, bottom-aligns the result in a (w_vis, h_vis) surface and
+		returns it with the foot pivot.
+		"""
+		fs = _remove_background(frame_surf)
+
+		# preserve aspect ratio when fitting into player rect
+		fw, fh = fs.get_size()
+		if fw == 0 or fh == 0:
+			# empty frame, return blank sized to visual sprite plus pivot
+			blank = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
+			pivot = (int(self.w_vis) // 2, int(self.h_vis) - 1)
+			return blank, pivot
+		float_scale = min(float(self.w_vis) / fw, float(self.h_vis) / fh)
+		# Compute target pixel size and use nearest-neighbour scaling to avoid blur
+		new_w = max(1, int(round(fw * float_scale)))
+		new_h = max(1, int(round(fh * float_scale)))
+		scaled = pygame.transform.scale(fs, (new_w, new_h))
+		# blit into a target surface sized to the visual sprite, align bottom (feet on floor)
+		target = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
+		tx = (int(self.w_vis) - new_w) // 2
+		ty = max(0, int(self.h_vis) - new_h)
+		target.blit(scaled, (tx, ty))
+		return target, _foot_pivot(target)
+
+	def _reset_animation(self):
+		self.cur_anim = 'idle'
+		self.animator.play(self.animations.get('idle'), restart=True)
+		self.facing = 'right'
+
+	def _build_ase_animations(self, root, ase_path):
+		"""Processed {name: Clip} for the tagged Aseprite sheet, or None if the plugin can't load it."""
+		try:
+			# add plugin src to sys.path so we can import py_aseprite and the helper
+			plugin_src = os.path.join(root, 'combine', 'aseprite_plugin', 'src')
+			if plugin_src not in __import__('sys').path:
+				__import__('sys').path.insert(0, plugin_src)
+
+			from pygame_aseprite_animation import load_animation
+
+			# Decoded frames, durations and tags come from the plugin's on-disk
+			# cache (one PNG decode) and are only re-decoded when the file changes.
+			# Only the idle/run tags are decoded; other tags never play on the map.
+			ase_anim = load_animation(ase_path, tags=self.ASE_TAGS)
+			# ase_anim.animation_frames is a list of full-frame surfaces
+			tags = {name.lower(): rng for name, rng in ase_anim.tag_ranges().items()}
+
+			# Build animations by tag name (if present)
+			animations = {}
+			if tags:
+				for name, (f0, f1) in tags.items():
+					frames = ase_anim.animation_frames[f0:f1 + 1]
+					durations = ase_anim.frame_duration[f0:f1 + 1]
+					animations[name] = {'frames': frames, 'durations': durations}
+
+				# Debug: print discovered tags and built animation keys
+				try:
+					print('[player_map] discovered ase sprite tags:', list(tags.keys()))
+					print('[player_map] built animation keys:', list(animations.keys()))
+				except Exception:
+					pass
+
+			# Common tag names to look for
+			preferred = [
+				('idle_right', 'idle_left', 'idle'),
+				('run_right', 'run_left', 'run', 'walk')
+			]
+
+			# Decide which animations to use for idle/run + facing
+			picked = {}
+			for group in preferred:
+				# base is group[0] mapping to facing right; try to find specific tags
+				base = group[0]
+				for name in group:
+					if name in animations:
+						# If tag includes direction, split on suffix; otherwise use as both
+						if name.endswith('_right'):
+							picked['idle_right' if 'idle' in name else 'run_right'] = animations[name]
+						elif name.endswith('_left'):
+							picked['idle_left' if 'idle' in name else 'run_left'] = animations[name]
+						else:
+							# assign generic to both
+							key_idle = 'idle' if 'idle' in name else 'run'
+							picked[key_idle] = animations[name]
+
+			# If we didn't find separate left/right tags, but found generic idle/run, assign them
+			for k in ('idle', 'run'):
+				if k in animations and k not in picked:
+					picked[k] = animations[k]
+
+			# store frames list for fallback if no tags
+			if not picked:
+				# fallback: use entire frame list as 'idle' if short, else split
+				frames = ase_anim.animation_frames
+				if len(frames) <= 2:
+					picked['idle'] = {'frames': frames, 'durations': ase_anim.frame_duration}
+				else:
+					mid = max(1, len(frames) // 2)
+					picked['idle'] = {'frames': frames[:mid], 'durations': ase_anim.frame_duration[:mid]}
+					picked['run'] = {'frames': frames[mid:], 'durations': ase_anim.frame_duration[mid:]}
+
+			# Fit every frame to the visual size once; animations sharing a tag
+			# share the resulting clip. Aseprite durations are in ms.
+			clips = {}
+			for k, a in picked.items():
+				if id(a) not in clips:
 					scaled = []
 					pivots = []
 					for f in a['frames']:
 						try:
-							proc, pivot = _process_frame(f)
+							proc, pivot = self._process_frame(f)
 						except Exception:
 							proc = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
 							pivot = (int(self.w_vis) // 2, int(self.h_vis) - 1)
 						scaled.append(proc)
 						pivots.append(pivot)
-					a['frames'] = scaled
-					a['pivots'] = pivots
-				# After scaling frames to visual size, generate flipped variants for
-				# missing left/right animations so we can reuse a single-set of
-				# frames and smoothly flip them when needed.
-				# Example: if 'run' exists but 'run_left'/'run_right' do not, create
-				# 'run_right' (copy) and 'run_left' (flipped).
-				try:
-					keys = list(self.animations.keys())
-					for k in keys:
-						# skip already direction-specific keys
-						if k.endswith('_left') or k.endswith('_right'):
-							continue
-						base = k
-						right = f"{base}_right"
-						left = f"{base}_left"
-						# ensure right exists (copy of base if missing)
-						if right not in self.animations:
-							self.animations[right] = {
-								'frames': [f.copy() for f in self.animations[base]['frames']],
-								'durations': list(self.animations[base].get('durations', [])),
-								'pivots': list(self.animations[base].get('pivots', []))
-							}
-						# ensure left exists (flipped from right)
-						if left not in self.animations:
-							src = self.animations[right]
-							flipped = [pygame.transform.flip(f, True, False) for f in src['frames']]
-							# flip pivots horizontally
-							flipped_pivots = []
-							for (px, py) in src.get('pivots', []):
-								fw = src['frames'][0].get_width() if src['frames'] else int(self.w_vis)
-								flipped_pivots.append((fw - px, py))
-							self.animations[left] = {'frames': flipped, 'durations': list(src.get('durations', [])), 'pivots': flipped_pivots}
-				except Exception:
-					# non-fatal: if flipping fails, continue without variants
-					pass
+					durations = list(a.get('durations') or [])
+					durations = [d / 1000.0 for d in durations[:len(scaled)]]
+					durations += [0.1] * (len(scaled) - len(durations))
+					clips[id(a)] = Clip(scaled, durations, pivots=pivots)
+				picked[k] = clips[id(a)]
+			# After scaling frames to visual size, generate flipped variants for
+			# missing left/right animations so we can reuse a single-set of
+			# frames and smoothly flip them when needed.
+			# Example: if 'run' exists but 'run_left'/'run_right' do not, create
+			# 'run_right' (same frames) and 'run_left' (flipped).
+			try:
+				keys = list(picked.keys())
+				for k in keys:
+					# skip already direction-specific keys
+					if k.endswith('_left') or k.endswith('_right'):
+						continue
+					base = k
+					right = f"{base}_right"
+					left = f"{base}_left"
+					# ensure right exists (same clip as base if missing)
+					if right not in picked:
+						picked[right] = picked[base]
+					# ensure left exists (flipped from right, pivots mirrored)
+					if left not in picked:
+						picked[left] = picked[right].flipped()
+			except Exception:
+				# non-fatal: if flipping fails, continue without variants
+				pass
+			return picked
+		except Exception:
+			# plugin missing or the file can't be parsed; nothing gets cached
+			return None
+
+	def _load_sprite(self):
+		# Attempt to use the local Aseprite plugin to load tagged animations
+		root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+		ase_path = os.path.join(root, 'assets', 'sprites', 'Blue_witch', 'B_witch.aseprite')
+		# If an .aseprite file exists and the plugin is available, parse tags
+		if os.path.exists(ase_path):
+			# processed clips are built once per sprite file and visual size and
+			# shared by every MapPlayer; only the name -> clip mapping is per instance
+			key = (ase_path, os.path.getmtime(ase_path), int(self.w_vis), int(self.h_vis))
+			animations = clip_store.get(key, lambda: self._build_ase_animations(root, ase_path))
+			if animations:
+				self.animations = dict(animations)
 				# mark loaded so we don't reparse every frame
+				self._reset_animation()
 				self._loaded = True
 				return
-			except Exception:
-				# plugin failed; fall through to simple PNG loading below
-				pass
+			# plugin failed; fall through to simple PNG loading below
 
 		# Fallback: load individual PNGs (idle/run) if present and scale them
 		candidates = [
@@ -434,16 +401,13 @@ class MapPlayer:
 					surf = pygame.image.load(p)
 					# process the loaded surface the same way as ase frames
 					try:
-						proc, pivot = _process_frame(surf)
+						proc, pivot = self._process_frame(surf)
 					except Exception:
 						proc = pygame.Surface((int(self.w_vis), int(self.h_vis)), pygame.SRCALPHA)
 						pivot = (int(self.w_vis) // 2, int(self.h_vis) - 1)
 					# store as single-frame idle animation
-					self.animations = {'idle': {'frames': [proc], 'durations': [200], 'pivots': [pivot]}}
-					self.cur_anim = 'idle'
-					self.anim_frame = 0
-					self.anim_time = 0.0
-					self.facing = 'right'
+					self.animations = {'idle': Clip([proc], 0.2, pivots=[pivot])}
+					self._reset_animation()
 					self._loaded = True
 					return
 				except Exception:
@@ -456,18 +420,17 @@ class MapPlayer:
 		if not getattr(self, '_loaded', False):
 			self._load_sprite()
 		# prefer playing animations if available
-		if hasattr(self, 'animations') and getattr(self, 'cur_anim', None) in getattr(self, 'animations', {}):
+		if self.cur_anim in self.animations:
 			key = self.cur_anim
 			# if key is generic (no direction suffix), try direction-specific variant
 			if not (key.endswith('_left') or key.endswith('_right')):
 				candidate = f"{key}_{self.facing}"
 				if candidate in self.animations:
 					key = candidate
-			anim = self.animations.get(key, self.animations.get(self.cur_anim, {}))
-			frames = anim.get('frames', [])
-			if frames:
-				idx = self.anim_frame % len(frames)
-				frame = frames[idx]
+			clip = self.animations[key]
+			if clip:
+				idx = self.animator.index % len(clip)
+				frame = clip.frames[idx]
 				# base draw position (centered over collision box, bottom-aligned)
 				draw_x_base = int(self.x + (self.cw - self.w_vis) // 2)
 				draw_y = int(self.y + (self.ch - self.h_vis))
@@ -478,10 +441,11 @@ class MapPlayer:
 				base_name = key.rsplit('_', 1)[0] if '_' in key else key
 				# Prefer pivot data from the right-facing animation (base_right)
 				right_key = f"{base_name}_right"
-				if is_left and right_key in self.animations and 'pivots' in self.animations[right_key]:
-					pivot_used = self.animations[right_key]['pivots'][idx]
-				elif 'pivots' in anim and len(anim.get('pivots', [])) > idx:
-					pivot_used = anim['pivots'][idx]
+				right_pivots = self.animations[right_key].pivots if right_key in self.animations else None
+				if is_left and right_pivots and len(right_pivots) > idx:
+					pivot_used = right_pivots[idx]
+				elif clip.pivots and len(clip.pivots) > idx:
+					pivot_used = clip.pivots[idx]
 				else:
 					pivot_used = (frame_w // 2, frame.get_height() - 1)
 				# compute correction = frameWidth - 2 * pivotX (pixels)
@@ -522,28 +486,28 @@ class MapPlayer:
 				self._load_sprite()
 
 			# prefer playing animations if available
-			if hasattr(self, 'animations') and getattr(self, 'cur_anim', None) in getattr(self, 'animations', {}):
+			if self.cur_anim in self.animations:
 				key = self.cur_anim
 				# if generic key, prefer direction-specific
 				if not (key.endswith('_left') or key.endswith('_right')):
 					candidate = f"{key}_{self.facing}"
 					if candidate in self.animations:
 						key = candidate
-				anim = self.animations.get(key, self.animations.get(self.cur_anim, {}))
-				frames = anim.get('frames', [])
-				if frames:
-					idx = getattr(self, 'anim_frame', 0) % len(frames)
-					frame = frames[idx]
+				clip = self.animations[key]
+				if clip:
+					idx = self.animator.index % len(clip)
+					frame = clip.frames[idx]
 					frame_w = frame.get_width()
 					# determine pivot_used as in draw()
 					is_left = key.endswith('_left')
 					base_name = key.rsplit('_', 1)[0] if '_' in key else key
 					right_key = f"{base_name}_right"
-					if is_left and right_key in self.animations and 'pivots' in self.animations[right_key]:
-						pivots = self.animations[right_key].get('pivots', [])
+					right_pivots = self.animations[right_key].pivots if right_key in self.animations else None
+					if is_left and right_key in self.animations:
+						pivots = right_pivots or ()
 						pivot_used = pivots[idx] if len(pivots) > idx else (frame_w // 2, frame.get_height() - 1)
-					elif 'pivots' in anim and len(anim.get('pivots', [])) > idx:
-						pivot_used = anim['pivots'][idx]
+					elif clip.pivots and len(clip.pivots) > idx:
+						pivot_used = clip.pivots[idx]
 					else:
 						pivot_used = (frame_w // 2, frame.get_height() - 1)
 					vis_w = int(getattr(self, 'w_vis', frame.get_width()))
@@ -15,12 +15,32 @@ If missing, a dark green-to-black vertical gradient is rendered.
 """
 from __future__ import annotations
 import pygame, os, random, math
+import numpy as np
 import globals as g
 from .player import Player
 from .boss_sloth import TheSloth
 from .bullets import BulletManager
 from .platform import Platform
-from ..systems.ui import UIManager, TextPopup, draw_ui_overlay, draw_game_over_screen
+from ..systems.ui import UIManager, HUD, TextPopup, draw_ui_overlay, draw_game_over_screen
+from ..systems.particles import ParticleEmitter, glow_dot
+from ..systems.render_target import RenderTarget
+from ..systems.static_layer import StaticLayer
+
+
+def _dandelion_seed(radius: int, color) -> pygame.Surface:
+    """Seed body with eight parachute filaments, rendered once per size."""
+    size = radius * 3
+    center = int(radius * 1.5)
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, 255), (center, center), radius)
+    for i in range(8):
+        angle = (i / 8) * 6.28
+        length = radius * 2.5
+        end_x = center + math.cos(angle) * length
+        end_y = center + math.sin(angle) * length * 0.6
+        pygame.draw.line(surf, (255, 255, 230, 178), (center, center), (int(end_x), int(end_y)), 1)
+        pygame.draw.circle(surf, (255, 255, 220, 204), (int(end_x), int(end_y)), 1)
+    return surf
 
 
 class SlothBattleScene:
@@ -29,6 +49,7 @@ class SlothBattleScene:
         self.boss = TheSloth(g.SCREENWIDTH*0.25, 0)
         self.bullet_manager = BulletManager()
         self.ui = UIManager()
+        self.hud = HUD()
         # Inject UI into boss for dialogue
         self.boss.ui = self.ui
         self._shown_entry = False
@@ -38,13 +59,19 @@ class SlothBattleScene:
         self._victory_transition = False
         self._defeat_shown = False
         self._transition_timer = 0.0
-        self._dandelion_particles = []
-        self._wind_trails = []
-        self._light_specks = []
+        self._dandelion_particles = ParticleEmitter(
+            capacity=64, sprite=_dandelion_seed, palette=[(240, 235, 200)], rotation_steps=24)
+        self._wind_trails = ParticleEmitter(capacity=100, extra_fields=('length',))
+        self._light_specks = ParticleEmitter(capacity=64, palette=[(255, 250, 200)])
+        self._glow_specks = ParticleEmitter(capacity=32, palette=[(255, 240, 180)])
+        self._glow_bucket = None
         self._bgm_fading = False
         self._boss_death_location = None
         self._boss_defeated = False
-        self._death_marker_particles = []
+        self._death_marker_particles = ParticleEmitter(
+            capacity=32, sprite=glow_dot,
+            palette=[(240, 250, 220), (230, 245, 210), (250, 255, 230), (220, 240, 200)],
+            extra_fields=('float_speed', 'drift_radius', 'drift_angle'))
         self._death_marker_time = 0.0
 
         ground_h = 78
@@ -60,6 +87,12 @@ class SlothBattleScene:
 
         # Background
         self.background = self._load_background()
+        # Fill-rate-heavy layers render at 1/g.RENDER_SCALE and are upscaled once
+        self._bg_target = RenderTarget()
+        self._bg_layer = pygame.Surface(self._bg_target.get_size(), pygame.SRCALPHA)
+        self._sunset_target = RenderTarget(alpha=True)
+        # Platforms never move here: baked once over the animated forest
+        self._arena_layer = StaticLayer()
 
         # BGM
         try:
@@ -117,11 +150,16 @@ class SlothBattleScene:
           5. Multi band fog + occasional flash silhouettes
         All procedural so it matches the Sloth's unsettling, fast crawl style.
         """
-        w,h = g.SCREENWIDTH, g.SCREENHEIGHT
+        # Rasterised into the (optionally low-res) background target; every
+        # logical length goes through rt.s() so the layout matches at any scale.
+        rt = self._bg_target
+        surf = rt.surface
+        s = rt.s
+        w,h = rt.get_size()
+        layer = self._bg_layer
         time_ms = pygame.time.get_ticks()
         t = time_ms / 1000.0
         # Sky gradient with subtle pulsating hue
-        sky = pygame.Surface((w,h))
         pulse = (math.sin(t*0.6)+1)/2  # 0..1
         top_col = (
             int(6 + 12*pulse),
@@ -140,8 +178,7 @@ class SlothBattleScene:
                 int(top_col[1] + (bot_col[1]-top_col[1])*k),
                 int(top_col[2] + (bot_col[2]-top_col[2])*k)
             )
-            pygame.draw.line(sky, col, (0,y), (w,y))
-        screen.blit(sky,(0,0))
+            pygame.draw.line(surf, col, (0,y), (w,y))
 
         rng = random.Random(0)  # deterministic layout base
         # Parallax speed multipliers (higher than previous for "flying" feel)
@@ -149,59 +186,61 @@ class SlothBattleScene:
         mid_speed = 210
         fg_speed = 360
         # FAR layer (thin silhouettes)
-        far = pygame.Surface((w,h), pygame.SRCALPHA)
+        layer.fill((0,0,0,0))
         for i in range(34):
-            base_x = (i * 150 - int(t*far_speed)) % (w+150) - 75
-            trunk_h = rng.randint(int(h*0.40), int(h*0.68))
-            trunk_w = rng.randint(8,16)
+            base_x = s((i * 150 - int(t*far_speed)) % (g.SCREENWIDTH+150) - 75)
+            trunk_h = s(rng.randint(int(g.SCREENHEIGHT*0.40), int(g.SCREENHEIGHT*0.68)))
+            trunk_w = max(1, s(rng.randint(8,16)))
             alpha = 50
-            pygame.draw.rect(far, (18,38,26,alpha), (base_x, h-trunk_h, trunk_w, trunk_h))
-        screen.blit(far,(0,0))
+            pygame.draw.rect(layer, (18,38,26,alpha), (base_x, h-trunk_h, trunk_w, trunk_h))
+        surf.blit(layer,(0,0))
         # MID layer (branchy)
-        mid = pygame.Surface((w,h), pygame.SRCALPHA)
+        layer.fill((0,0,0,0))
         for i in range(26):
-            base_x = (i * 180 - int(t*mid_speed)) % (w+180) - 90
-            trunk_h = rng.randint(int(h*0.50), int(h*0.78))
+            base_x = (i * 180 - int(t*mid_speed)) % (g.SCREENWIDTH+180) - 90
+            trunk_h = rng.randint(int(g.SCREENHEIGHT*0.50), int(g.SCREENHEIGHT*0.78))
             trunk_w = rng.randint(24,36)
+            top = g.SCREENHEIGHT - trunk_h
             color = (26,60,40,140)
-            pygame.draw.rect(mid, color, (base_x, h-trunk_h, trunk_w, trunk_h))
+            pygame.draw.rect(layer, color, (s(base_x), s(top), s(trunk_w), s(trunk_h)))
             # Branch shards
             branch_count = 4
             for b in range(branch_count):
-                by = h-trunk_h + rng.randint(28, trunk_h-40)
+                by = top + rng.randint(28, trunk_h-40)
                 dir = -1 if b%2==0 else 1
                 length = rng.randint(60,120)
-                pygame.draw.polygon(mid, (26,60,42,120), [
-                    (base_x + trunk_w//2, by),
-                    (base_x + trunk_w//2 + dir*length, by - rng.randint(8,18)),
-                    (base_x + trunk_w//2, by + rng.randint(6,14))
+                pygame.draw.polygon(layer, (26,60,42,120), [
+                    (s(base_x + trunk_w//2), s(by)),
+                    (s(base_x + trunk_w//2 + dir*length), s(by - rng.randint(8,18))),
+                    (s(base_x + trunk_w//2), s(by + rng.randint(6,14)))
                 ])
-        screen.blit(mid,(0,0))
+        surf.blit(layer,(0,0))
         # FOREGROUND fast bushes / thorns
-        fg = pygame.Surface((w,h), pygame.SRCALPHA)
+        layer.fill((0,0,0,0))
         for i in range(40):
-            bx = (i*100 - int(t*fg_speed)) % (w+100) - 50
-            by = h - rng.randint(70,110)
+            bx = (i*100 - int(t*fg_speed)) % (g.SCREENWIDTH+100) - 50
+            by = g.SCREENHEIGHT - rng.randint(70,110)
             rad_x = rng.randint(50,90)
             rad_y = rng.randint(30,60)
-            pygame.draw.ellipse(fg, (16,46,32,210), (bx, by, rad_x*2, rad_y))
-        screen.blit(fg,(0,0))
+            pygame.draw.ellipse(layer, (16,46,32,210), (s(bx), s(by), s(rad_x*2), s(rad_y)))
+        surf.blit(layer,(0,0))
         # Layered fog bands drifting opposite direction for depth
-        fog = pygame.Surface((w,h), pygame.SRCALPHA)
+        layer.fill((0,0,0,0))
         for band in range(5):
-            band_h = h//6
+            band_h = g.SCREENHEIGHT//6
             y0 = band * band_h + int(math.sin(t*0.8 + band)*6)
             fog_alpha = int(28 + 18*math.sin(t*1.2 + band*0.7))
-            pygame.draw.rect(fog, (40,60,50,fog_alpha), (0,y0, w, band_h))
-        screen.blit(fog,(0,0))
+            pygame.draw.rect(layer, (40,60,50,fog_alpha), (0, s(y0), w, s(band_h)))
+        surf.blit(layer,(0,0))
         # Flash silhouettes (rare): brief dark vertical streaks to add tension
         if int(t*4) % 7 == 0:  # periodic condition
-            streaks = pygame.Surface((w,h), pygame.SRCALPHA)
+            layer.fill((0,0,0,0))
             for _ in range(6):
-                sx = random.randint(0,w)
-                sh = random.randint(int(h*0.3), int(h*0.7))
-                pygame.draw.rect(streaks, (10,20,14,90), (sx, h-sh, 6, sh))
-            screen.blit(streaks,(0,0))
+                sx = random.randint(0,g.SCREENWIDTH)
+                sh = random.randint(int(g.SCREENHEIGHT*0.3), int(g.SCREENHEIGHT*0.7))
+                pygame.draw.rect(layer, (10,20,14,90), (s(sx), s(g.SCREENHEIGHT-sh), max(1, s(6)), s(sh)))
+            surf.blit(layer,(0,0))
+        rt.present(screen)
 
     # --- Public API ---
     def update(self, dt: float):
@@ -305,14 +344,17 @@ class SlothBattleScene:
                     self._transition_timer = 0.0
                     self._boss_defeated = False
                     self._boss_death_location = None
-                    self._death_marker_particles = []
+                    self._death_marker_particles.clear()
                     self._bgm_fading = False
             # SPACE key: continue after victory (handled by main.py CLI runner)
 
     def draw(self, screen: pygame.Surface):
         self._draw_background(screen)
-        for p in self.platforms:
-            p.draw(screen)
+        layer = self._arena_layer
+        if layer.begin(key=g.SHOW_COLLISION_BOXES):
+            for p in self.platforms:
+                p.draw(layer.surface)
+        layer.blit(screen)
         # Draw player after trail so player is visible; trail drawn inside boss.draw
         self.boss.draw(screen)
         self.player.draw(screen)
@@ -339,71 +381,28 @@ class SlothBattleScene:
                              (bubble_radius, bubble_radius), bubble_radius, 3)
             screen.blit(bubble_surf, (int(bx - bubble_radius), int(by - bubble_radius)))
             
-            # Draw floating dandelion wisps
-            for p in self._death_marker_particles:
-                # Wisp with slight glow
-                wisp_surf = pygame.Surface((int(p['size']*4), int(p['size']*4)), pygame.SRCALPHA)
-                glow_size = int(p['size'] * 2)
-                particle_alpha = int(p['alpha'] * (0.7 + 0.3 * pulse))
-                # Outer glow
-                pygame.draw.circle(wisp_surf, (*p['color'], particle_alpha // 3),
-                                 (glow_size, glow_size), glow_size)
-                # Inner core
-                pygame.draw.circle(wisp_surf, (*p['color'], particle_alpha),
-                                 (glow_size, glow_size), int(p['size']))
-                screen.blit(wisp_surf, (int(p['x'] - glow_size), int(p['y'] - glow_size)))
+            # Draw floating dandelion wisps (core + faint glow sprite)
+            self._death_marker_particles.draw(screen, alpha_scale=0.7 + 0.3 * pulse)
         
         # Victory transition: elaborate dandelion float escape
         if self._victory_transition:
             import math
             
             # Phase 1: Wind trails (0s+)
-            for t in self._wind_trails:
-                if t['alpha'] > 0:
-                    end_x = t['x'] + math.cos(t['vy'] * 0.01) * t['length']
-                    end_y = t['y'] + math.sin(t['vx'] * 0.01) * t['length'] * 0.3
-                    pygame.draw.line(screen, (220, 240, 200, int(t['alpha'])), 
-                                   (int(t['x']), int(t['y'])),
-                                   (int(end_x), int(end_y)), 2)
+            wt = self._wind_trails
+            if len(wt):
+                x, y, length = wt.view('x'), wt.view('y'), wt.view('length')
+                end_x = x + np.cos(wt.view('vy') * 0.01) * length
+                end_y = y + np.sin(wt.view('vx') * 0.01) * length * 0.3
+                for x0, y0, x1, y1 in zip(x.astype(int).tolist(), y.astype(int).tolist(),
+                                          end_x.astype(int).tolist(), end_y.astype(int).tolist()):
+                    pygame.draw.line(screen, (220, 240, 200), (x0, y0), (x1, y1), 2)
             
             # Phase 2: Light specks (0s+)
-            for s in self._light_specks:
-                if s['alpha'] > 0:
-                    surf = pygame.Surface((int(s['size']*2), int(s['size']*2)), pygame.SRCALPHA)
-                    glow_alpha = max(0, min(255, int(s['alpha'])))
-                    pygame.draw.circle(surf, (255, 250, 200, glow_alpha), 
-                                     (int(s['size']), int(s['size'])), int(s['size']))
-                    screen.blit(surf, (int(s['x']), int(s['y'])))
+            self._light_specks.draw(screen)
             
-            # Phase 3: Dandelion seeds with detailed rendering (0s+)
-            for p in self._dandelion_particles:
-                if p['alpha'] > 0:
-                    # Draw seed body
-                    surf = pygame.Surface((int(p['size']*3), int(p['size']*3)), pygame.SRCALPHA)
-                    center = int(p['size']*1.5)
-                    
-                    # Seed center
-                    pygame.draw.circle(surf, (240, 235, 200, int(p['alpha'])), 
-                                     (center, center), int(p['size']))
-                    
-                    # Parachute filaments
-                    import random
-                    random.seed(int(p['x'] + p['y']))
-                    for i in range(8):
-                        angle = (i / 8) * 6.28 + p['rotation'] * 0.01
-                        length = p['size'] * 2.5
-                        end_x = center + math.cos(angle) * length
-                        end_y = center + math.sin(angle) * length * 0.6
-                        pygame.draw.line(surf, (255, 255, 230, int(p['alpha'] * 0.7)),
-                                       (center, center), (int(end_x), int(end_y)), 1)
-                        # Tip of filament
-                        pygame.draw.circle(surf, (255, 255, 220, int(p['alpha'] * 0.8)),
-                                         (int(end_x), int(end_y)), 1)
-                    
-                    # Rotate and blit
-                    rotated = pygame.transform.rotate(surf, p['rotation'])
-                    screen.blit(rotated, (int(p['x'] - rotated.get_width()/2), 
-                                        int(p['y'] - rotated.get_height()/2)))
+            # Phase 3: Dandelion seeds (pre-rendered, rotated sprite variants)
+            self._dandelion_particles.draw(screen)
             
             # Phase 4: Player floats upward (0.5s+)
             if self._transition_timer > 0.5:
@@ -419,33 +418,35 @@ class SlothBattleScene:
             
             # Phase 5: Sky gradient shift (1.5s+)
             if self._transition_timer > 1.5:
-                gradient_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
+                gradient = self._sunset_target
+                gw, gh = gradient.get_size()
                 progress = min(1.0, (self._transition_timer - 1.5) / 2.0)
                 
                 # Warm sunset colors
-                for y in range(g.SCREENHEIGHT):
-                    ratio = y / g.SCREENHEIGHT
+                for y in range(gh):
+                    ratio = y / gh
                     r = int(180 + 75 * progress * (1 - ratio))
                     g_val = int(140 + 110 * progress * (1 - ratio))
                     b = int(100 + 155 * progress * ratio)
                     alpha = int(120 * progress)
-                    pygame.draw.line(gradient_surf, (r, g_val, b, alpha), 
-                                   (0, y), (g.SCREENWIDTH, y))
+                    pygame.draw.line(gradient.surface, (r, g_val, b, alpha), 
+                                   (0, y), (gw, y))
                 
-                screen.blit(gradient_surf, (0, 0))
+                gradient.present(screen)
             
             # Phase 6: Golden hour glow particles (2s+)
             if self._transition_timer > 2.0:
-                glow_surf = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
-                import random
-                random.seed(int(self._transition_timer * 10))
-                for _ in range(30):
-                    x = random.randint(0, g.SCREENWIDTH)
-                    y = random.randint(0, g.SCREENHEIGHT)
-                    size = random.uniform(2, 5)
-                    alpha = int(random.uniform(80, 150))
-                    pygame.draw.circle(glow_surf, (255, 240, 180, alpha), (x, y), int(size))
-                screen.blit(glow_surf, (0, 0))
+                # New random scatter every 0.1s, seeded from the time bucket
+                bucket = int(self._transition_timer * 10)
+                if bucket != self._glow_bucket:
+                    self._glow_bucket = bucket
+                    rng = random.Random(bucket)
+                    specks = [(rng.randint(0, g.SCREENWIDTH), rng.randint(0, g.SCREENHEIGHT),
+                               int(rng.uniform(2, 5)), rng.uniform(80, 150)) for _ in range(30)]
+                    xs, ys, sizes, alphas = zip(*specks)
+                    self._glow_specks.clear()
+                    self._glow_specks.emit(30, x=xs, y=ys, size=sizes, alpha=alphas, color=0)
+                self._glow_specks.draw(screen)
             
             # Phase 7: Fade to warm white (3.5s+)
             fade_start = 3.5
@@ -497,125 +498,106 @@ class SlothBattleScene:
 
     def _spawn_dandelions(self):
         """Create dandelion particles around player"""
-        import random
         px, py = self.player.x + self.player.width/2, self.player.y + self.player.height/2
         # Main dandelion cluster
-        for _ in range(40):
-            angle = random.uniform(0, 6.28)
-            speed = random.uniform(40, 120)
-            self._dandelion_particles.append({
-                'x': px + random.uniform(-30, 30),
-                'y': py + random.uniform(-30, 30),
-                'vx': speed * 0.3 * random.choice([-1, 1]),
-                'vy': -speed,
-                'size': random.uniform(3, 10),
-                'alpha': 255,
-                'rotation': random.uniform(0, 360),
-                'spin': random.uniform(-2, 2)
-            })
+        dp = self._dandelion_particles
+        n = 40
+        speed = dp.uniform(40, 120, n)
+        side = np.where(dp.uniform(0, 1, n) < 0.5, -1.0, 1.0)
+        dp.emit(n,
+                x=px + dp.uniform(-30, 30, n),
+                y=py + dp.uniform(-30, 30, n),
+                vx=speed * 0.3 * side,
+                vy=-speed,
+                size=dp.uniform(3, 10, n),
+                alpha=255,
+                fade=40,
+                rotation=dp.uniform(0, 360, n),
+                spin=dp.uniform(-120, 120, n))  # degrees per second
         # Spawn light specks
-        for _ in range(60):
-            self._light_specks.append({
-                'x': random.uniform(0, g.SCREENWIDTH),
-                'y': random.uniform(0, g.SCREENHEIGHT),
-                'vx': random.uniform(-20, 20),
-                'vy': random.uniform(-60, -20),
-                'size': random.uniform(1, 3),
-                'alpha': random.randint(100, 255),
-                'twinkle': random.uniform(0, 6.28)
-            })
+        ls = self._light_specks
+        n = 60
+        ls.emit(n,
+                x=ls.uniform(0, g.SCREENWIDTH, n),
+                y=ls.uniform(0, g.SCREENHEIGHT, n),
+                vx=ls.uniform(-20, 20, n),
+                vy=ls.uniform(-60, -20, n),
+                size=ls.uniform(1, 3, n),
+                alpha=ls.uniform(100, 255, n),
+                phase=ls.uniform(0, 6.28, n))  # twinkle
     
     def _spawn_death_marker(self):
         """Create dandelion-themed marker at boss death location"""
         if not self._boss_death_location:
             return
-        import random
         bx, by = self._boss_death_location
         
         # Gentle dandelion wisps floating upward
-        for _ in range(25):
-            angle = random.uniform(0, 6.28)
-            radius = random.uniform(5, 35)
-            self._death_marker_particles.append({
-                'x': bx,
-                'y': by,
-                'float_offset': random.uniform(0, 6.28),
-                'float_speed': random.uniform(0.8, 1.5),
-                'drift_radius': radius,
-                'drift_angle': angle,
-                'size': random.uniform(2, 6),
-                'alpha': random.randint(200, 255),
-                'color': random.choice([(240, 250, 220), (230, 245, 210), (250, 255, 230), (220, 240, 200)])
-            })
+        dm = self._death_marker_particles
+        n = 25
+        dm.emit(n, x=bx, y=by,
+                phase=dm.uniform(0, 6.28, n),  # float offset
+                float_speed=dm.uniform(0.8, 1.5, n),
+                drift_radius=dm.uniform(5, 35, n),
+                drift_angle=dm.uniform(0, 6.28, n),
+                size=dm.uniform(2, 6, n),
+                alpha=dm.uniform(200, 255, n))
     
     def _update_death_marker(self, dt):
         """Animate dandelion wisps floating gently upward"""
-        import math
         if not self._boss_death_location:
             return
         
         bx, by = self._boss_death_location
         
-        for p in self._death_marker_particles:
-            p['float_offset'] += p['float_speed'] * dt
-            # Gentle upward float with horizontal drift
-            float_y = -20 * math.sin(p['float_offset'])
-            drift_x = math.cos(self._death_marker_time * 0.5 + p['drift_angle']) * p['drift_radius']
-            drift_y = math.sin(self._death_marker_time * 0.5 + p['drift_angle']) * p['drift_radius'] * 0.5
-            
-            p['x'] = bx + drift_x
-            p['y'] = by + drift_y + float_y
+        dm = self._death_marker_particles
+        float_offset = dm.view('phase')
+        float_offset += dm.view('float_speed') * dt
+        # Gentle upward float with horizontal drift
+        drift = self._death_marker_time * 0.5 + dm.view('drift_angle')
+        radius = dm.view('drift_radius')
+        dm.view('x')[:] = bx + np.cos(drift) * radius
+        dm.view('y')[:] = by + np.sin(drift) * radius * 0.5 - 20 * np.sin(float_offset)
     
     def _update_dandelion_particles(self, dt):
         """Update dandelion particle positions with wind effect"""
-        import math
-        for p in self._dandelion_particles:
-            # Wind sway
-            wind_x = math.sin(self._transition_timer * 2 + p['y'] * 0.01) * 30
-            p['x'] += (p['vx'] + wind_x) * dt
-            p['y'] += p['vy'] * dt
-            p['rotation'] += p['spin']
-            p['alpha'] = max(0, p['alpha'] - 40 * dt)
-            
-            # Spawn wind trail
-            if len(self._wind_trails) < 100 and p['alpha'] > 100:
-                import random
-                if random.random() < 0.3:
-                    self._wind_trails.append({
-                        'x': p['x'],
-                        'y': p['y'],
-                        'vx': p['vx'] * 0.5,
-                        'vy': p['vy'] * 0.5,
-                        'length': random.uniform(10, 30),
-                        'alpha': 150
-                    })
+        dp = self._dandelion_particles
+        if not len(dp):
+            return
+        # Wind sway
+        x, y = dp.view('x'), dp.view('y')
+        x += np.sin(self._transition_timer * 2 + y * 0.01) * 30 * dt
+        dp.update(dt)
         
-        self._dandelion_particles = [p for p in self._dandelion_particles if p['alpha'] > 0]
+        # Spawn wind trails behind the brighter seeds
+        room = 100 - len(self._wind_trails)
+        if room > 0 and len(dp):
+            src = np.flatnonzero((dp.view('alpha') > 100) & (dp.uniform(0, 1, len(dp)) < 0.3))[:room]
+            if len(src):
+                n = len(src)
+                self._wind_trails.emit(n,
+                                       x=dp.view('x')[src], y=dp.view('y')[src],
+                                       vx=dp.view('vx')[src] * 0.5, vy=dp.view('vy')[src] * 0.5,
+                                       length=dp.uniform(10, 30, n),
+                                       alpha=150, fade=100)
     
     def _update_wind_trails(self, dt):
         """Update wind trail streaks"""
-        for t in self._wind_trails:
-            t['x'] += t['vx'] * dt
-            t['y'] += t['vy'] * dt
-            t['alpha'] = max(0, t['alpha'] - 100 * dt)
-        self._wind_trails = [t for t in self._wind_trails if t['alpha'] > 0]
+        self._wind_trails.update(dt)
     
     def _update_light_specks(self, dt):
         """Update floating light particles"""
-        import math
-        for s in self._light_specks:
-            s['x'] += s['vx'] * dt
-            s['y'] += s['vy'] * dt
-            s['twinkle'] += 3 * dt
-            s['alpha'] = int(200 + 55 * math.sin(s['twinkle']))
-            
-            # Wrap around screen
-            if s['y'] < -10:
-                s['y'] = g.SCREENHEIGHT + 10
-            if s['x'] < -10:
-                s['x'] = g.SCREENWIDTH + 10
-            elif s['x'] > g.SCREENWIDTH + 10:
-                s['x'] = -10
+        ls = self._light_specks
+        ls.update(dt)
+        twinkle = ls.view('phase')
+        twinkle += 3 * dt
+        ls.view('alpha')[:] = 200 + 55 * np.sin(twinkle)
+        
+        # Wrap around screen
+        x, y = ls.view('x'), ls.view('y')
+        y[y < -10] = g.SCREENHEIGHT + 10
+        x[x < -10] = g.SCREENWIDTH + 10
+        x[x > g.SCREENWIDTH + 10] = -10
 
     def is_game_over(self):
         if self.player.health <= 0:
@@ -6,6 +6,7 @@ All scenes should inherit from this class.
 """
 
 import pygame
+from src.systems.camera import Camera
 
 class BaseScene:
     """
@@ -21,6 +22,8 @@ class BaseScene:
         """
         self.game_manager = game_manager
         self.active = False
+        # Shared viewport: scenes shake/scroll through this offset
+        self.camera = Camera()
     
     def enter(self):
         """
@@ -8,7 +8,8 @@ from src.scenes.base_scene import BaseScene
 from src.entities.player import Player
 from src.entities.bullets import BulletManager
 from src.entities.platform import Platform
-from src.systems.ui import UIManager, draw_ui_overlay
+from src.systems.ui import UIManager, HUD, draw_ui_overlay
+from src.systems.particles import ParticleEmitter
 
 class Boss1ScriptedScene(BaseScene):
     """
@@ -27,6 +28,7 @@ class Boss1ScriptedScene(BaseScene):
         self.player.health = 1
         self.bullet_manager = BulletManager()
         self.ui = UIManager()
+        self.hud = HUD()
         self._dummy_boss = type('B', (), {'x':-9999,'y':-9999,'width':1,'height':1})()  # prevent None access for player bullets
         self._orig_player_move_speed = g.PLAYER_MOVE_SPEED
         
@@ -43,7 +45,9 @@ class Boss1ScriptedScene(BaseScene):
         self.game_over_timer = 0.0
         self._is_game_over = False
         self._death_fade_progress = 0.0  # 0.0 to 1.0 for fade to chaos effect
-        self._chaos_particles = []  # Particle effect for death chaos
+        # Particle effect for death chaos
+        self._chaos_particles = ParticleEmitter(
+            capacity=256, palette=[(80, 0, 0), (60, 0, 20), (40, 0, 40), (20, 0, 20)])
         self._death_transition_started = False  # Track if death SFX/transition played
         self._hit_flash_timer = 0.0  # Screen flash on hit
         
@@ -83,7 +87,7 @@ class Boss1ScriptedScene(BaseScene):
         self.attack_started = False
         self._is_game_over = False
         self._death_fade_progress = 0.0
-        self._chaos_particles = []
+        self._chaos_particles.clear()
         self._death_transition_started = False
         self._hit_flash_timer = 0.0
         # One-hit kill feel (redundant guard if reset)
@@ -126,26 +130,21 @@ class Boss1ScriptedScene(BaseScene):
             self.player.vx *= 0.92
             self.player.vy *= 0.92
             
-            # Update chaos particles
-            for p in self._chaos_particles:
-                p['x'] += p['vx'] * dt
-                p['y'] += p['vy'] * dt
-                p['life'] -= dt
-                p['alpha'] = max(0, min(255, int(p['life'] * 100)))
-            self._chaos_particles = [p for p in self._chaos_particles if p['life'] > 0]
+            # Update chaos particles (alpha tracks remaining life)
+            cp = self._chaos_particles
+            cp.update(dt)
+            cp.view('alpha')[:] = cp.view('life').clip(0, 2.55) * 100
             
             # Spawn new chaos particles
             if random.random() < 0.4:
-                self._chaos_particles.append({
-                    'x': random.uniform(0, g.SCREENWIDTH),
-                    'y': random.uniform(0, g.SCREENHEIGHT),
-                    'vx': random.uniform(-50, 50),
-                    'vy': random.uniform(-50, 50),
-                    'life': random.uniform(1.0, 2.5),
-                    'alpha': 255,
-                    'size': random.randint(2, 8),
-                    'color': random.choice([(80, 0, 0), (60, 0, 20), (40, 0, 40), (20, 0, 20)])
-                })
+                cp.emit(1,
+                        x=random.uniform(0, g.SCREENWIDTH),
+                        y=random.uniform(0, g.SCREENHEIGHT),
+                        vx=random.uniform(-50, 50),
+                        vy=random.uniform(-50, 50),
+                        life=random.uniform(1.0, 2.5),
+                        alpha=255,
+                        size=random.randint(2, 8) // 2)
             
             self.bullet_manager.update(dt, self.player, None)
             return
@@ -275,10 +274,7 @@ class Boss1ScriptedScene(BaseScene):
         
         # 5. Death chaos particles
         if self._is_game_over:
-            for p in self._chaos_particles:
-                surf = pygame.Surface((p['size'], p['size']), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (*p['color'], p['alpha']), (p['size']//2, p['size']//2), p['size']//2)
-                screen.blit(surf, (int(p['x']), int(p['y'])))
+            self._chaos_particles.draw(screen)
             
             # Gradual dark chaos overlay
             chaos_overlay = pygame.Surface((g.SCREENWIDTH, g.SCREENHEIGHT), pygame.SRCALPHA)
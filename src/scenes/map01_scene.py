@@ -19,6 +19,7 @@ def run(screen, inventory=None):
 	from src.tiled_loader import load_map, draw_map, extract_collision_rects
 	from src.entities.player_map import MapPlayer
 	from src.ui.dialog_box_notusing import SpeechBubble
+	from src.utils.atlas import load_image
 
 	ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 	# find Room1.tmj first, fallback to any Room1.tmx if necessary
@@ -243,7 +244,7 @@ def run(screen, inventory=None):
 				img_path = _find_asset('hourglass.png') or _find_asset('item_clock.png') or _find_asset('clock.png')
 			if img_path:
 				try:
-					img = pygame.image.load(img_path).convert_alpha()
+					img = load_image(img_path)
 				except Exception:
 					img = None
 			else:
@@ -306,7 +307,7 @@ def run(screen, inventory=None):
 		img_path = _find_asset('lamp.png') or _find_asset('item_lamp.png')
 		if img_path:
 			try:
-				img = pygame.image.load(img_path).convert_alpha()
+				img = load_image(img_path)
 			except Exception:
 				img = None
 		else:
@@ -0,0 +1,286 @@
+"""
+Shared animation clips and per-entity playback.
+
+Every entity used to carry its own frame lists, timer and flip logic, and
+loaded its own copy of the same sprites (the Blue witch frames existed once
+per `Player`, `MapPlayer` and puzzle `Character`, again after every retry).
+Here the frame data lives in immutable `Clip`s held by the process-wide
+`clip_store`, which loads each image once and hands the same clip to every
+caller. Derived looks (flipped, scaled, hit-flash silhouettes, sub-ranges)
+are memoized on the clip they come from, so they are built once as well.
+
+An entity keeps only an `Animator`: the clip it plays, a frame index and a
+timer. Clips support per-frame durations and loop, ping-pong and one-shot
+playback.
+
+Typical use:
+
+    walk = clip_store.grid('hero.png', (32, 32), count=8, duration=0.1)
+    self.animator = Animator(walk)
+    ...
+    self.animator.play(walk.flipped() if facing_left else walk, keep_phase=True)
+    self.animator.update(dt)
+    screen.blit(self.animator.frame, pos)
+"""
+
+#region Imports
+import os
+import pygame
+from src.utils.atlas import load_image
+#endregion Imports
+
+
+LOOP = 'loop'
+PINGPONG = 'pingpong'
+ONCE = 'once'
+
+
+class Clip:
+    """Immutable frame sequence shared by every entity that plays it.
+
+    frames: surfaces; treat them as read-only, they are shared.
+    durations: seconds per frame, a single number or one per frame.
+    mode: LOOP, PINGPONG or ONCE.
+    pivots: optional (x, y) anchor per frame (e.g. the feet).
+    """
+    __slots__ = ('frames', 'durations', 'mode', 'pivots', '_derived')
+
+    def __init__(self, frames, durations=0.1, mode: str = LOOP, pivots=None):
+        self.frames = tuple(frames)
+        if isinstance(durations, (int, float)):
+            durations = (float(durations),) * len(self.frames)
+        self.durations = tuple(max(1e-6, float(d)) for d in durations)
+        if len(self.durations) != len(self.frames):
+            raise ValueError("Clip needs one duration per frame")
+        self.mode = mode
+        self.pivots = tuple(pivots) if pivots is not None else None
+        self._derived = {}
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __bool__(self):
+        return bool(self.frames)
+
+    @property
+    def size(self):
+        return self.frames[0].get_size() if self.frames else (0, 0)
+
+    def derive(self, key, frame_fn, pivot_fn=None) -> 'Clip':
+        """Clip with `frame_fn` applied to every frame, built once per `key`.
+
+        pivot_fn: maps (pivot, source frame) to the derived pivot; pivots are
+        dropped without it.
+        """
+        clip = self._derived.get(key)
+        if clip is None:
+            pivots = None
+            if self.pivots is not None and pivot_fn is not None:
+                pivots = [pivot_fn(p, f) for p, f in zip(self.pivots, self.frames)]
+            clip = Clip([frame_fn(f) for f in self.frames], self.durations, self.mode, pivots)
+            self._derived[key] = clip
+        return clip
+
+    def flipped(self) -> 'Clip':
+        """Horizontally mirrored clip (pivots mirrored too)."""
+        return self.derive('flipped', lambda f: pygame.transform.flip(f, True, False),
+                           lambda p, f: (f.get_width() - p[0], p[1]))
+
+    def scaled(self, factor=None, size=None) -> 'Clip':
+        """Nearest-neighbour scaled clip, each frame by `factor` or all to an exact `size`."""
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            key = ('scaled', size)
+        elif factor is None or factor == 1.0:
+            return self
+        else:
+            key = ('scaled', float(factor))
+
+        def target(f):
+            if size is not None:
+                return size
+            return (int(f.get_width() * factor), int(f.get_height() * factor))
+
+        def pivot(p, f):
+            (tw, th), (fw, fh) = target(f), f.get_size()
+            return (p[0] * tw // max(1, fw), p[1] * th // max(1, fh))
+        return self.derive(key, lambda f: pygame.transform.scale(f, target(f)), pivot)
+
+    def silhouette(self, color) -> 'Clip':
+        """Solid `color` (RGBA) silhouette of every frame, e.g. for hit flashes."""
+        color = tuple(color)
+        return self.derive(('silhouette', color),
+                           lambda f: pygame.mask.from_surface(f).to_surface(
+                               setcolor=color, unsetcolor=(0, 0, 0, 0)),
+                           lambda p, f: p)
+
+    def sub(self, start: int, stop: int = None, mode: str = None, durations=None) -> 'Clip':
+        """Clip over frames [start:stop], sharing the surfaces."""
+        if isinstance(durations, list):
+            durations = tuple(durations)
+        key = ('sub', start, stop, mode, durations)
+        clip = self._derived.get(key)
+        if clip is None:
+            frames = self.frames[start:stop]
+            if durations is None:
+                durations = self.durations[start:stop]
+            pivots = self.pivots[start:stop] if self.pivots is not None else None
+            clip = Clip(frames, durations, mode or self.mode, pivots)
+            self._derived[key] = clip
+        return clip
+
+
+class ClipStore:
+    """Process-wide cache of source images and the clips cut from them."""
+    def __init__(self):
+        self._images = {}
+        self._clips = {}
+
+    def clear(self):
+        self._images.clear()
+        self._clips.clear()
+
+    def get(self, key, build):
+        """Clip for `key`, calling `build()` the first time. A None result is not cached."""
+        clip = self._clips.get(key)
+        if clip is None:
+            clip = build()
+            if clip is not None:
+                self._clips[key] = clip
+        return clip
+
+    def image(self, path: str):
+        """Source image (from the texture atlas when packed there); None if it can't be read."""
+        key = os.path.abspath(path)
+        image = self._images.get(key)
+        if image is None:
+            try:
+                image = load_image(path)
+            except (pygame.error, FileNotFoundError):
+                return None
+            self._images[key] = image
+        return image
+
+    def grid(self, path: str, frame_size, count: int = None, origin=(0, 0), vertical: bool = False,
+             size=None, duration=0.1, mode: str = LOOP):
+        """Clip of equally sized frames laid out in a row (or column) of a sheet.
+
+        frame_size: (w, h) of a frame in the sheet; origin: top-left of the first.
+        count: number of frames; None takes as many as fit. Frames that would
+        cross the sheet's edge are dropped.
+        size: scale every frame to this (w, h); None keeps the sheet pixels
+        (frames are then subsurfaces of the shared image).
+        Returns None when the image is missing or holds no frame.
+        """
+        frame_size = (int(frame_size[0]), int(frame_size[1]))
+        size = (int(size[0]), int(size[1])) if size is not None else None
+        key = ('grid', os.path.abspath(path), frame_size, count, tuple(origin), vertical, size, duration, mode)
+
+        def build():
+            image = self.image(path)
+            if image is None:
+                return None
+            fw, fh = frame_size
+            x0, y0 = origin
+            sheet = image.get_rect()
+            n = count
+            if n is None:
+                n = (sheet.height - y0) // fh if vertical else (sheet.width - x0) // fw
+            frames = []
+            for i in range(max(0, n)):
+                rect = pygame.Rect(x0, y0 + i * fh, fw, fh) if vertical else pygame.Rect(x0 + i * fw, y0, fw, fh)
+                if not sheet.contains(rect):
+                    continue
+                frame = image.subsurface(rect)
+                frames.append(pygame.transform.scale(frame, size) if size and size != frame_size else frame)
+            return Clip(frames, duration, mode) if frames else None
+        return self.get(key, build)
+
+    def strip(self, path: str, duration=0.1, mode: str = LOOP):
+        """Clip from an auto-sliced strip (see `sprite_loader.load_animation_strip`)."""
+        from src.utils.sprite_loader import load_animation_strip  # needs a display; import lazily
+
+        def build():
+            frames = load_animation_strip(path)
+            return Clip(frames, duration, mode) if frames else None
+        return self.get(('strip', os.path.abspath(path), duration, mode), build)
+
+
+clip_store = ClipStore()
+
+
+class Animator:
+    """Per-entity playback state: the clip being played, a frame index and a timer.
+
+    carry: keep the time left over after a frame advance (exact frame rate).
+    Without it the timer restarts at zero on every advance and at most one
+    frame is advanced per update, so frames last a whole number of ticks.
+    """
+    __slots__ = ('clip', 'index', 'time', 'step', 'finished', 'speed', 'carry')
+
+    def __init__(self, clip: Clip = None, speed: float = 1.0, carry: bool = True):
+        self.clip = clip
+        self.speed = speed
+        self.carry = carry
+        self.reset()
+
+    def reset(self):
+        self.index = 0
+        self.time = 0.0
+        self.step = 1
+        self.finished = False
+
+    def play(self, clip: Clip, restart: bool = False, keep_phase: bool = False):
+        """Switch to `clip`. Playing the current clip again is a no-op unless `restart`.
+
+        keep_phase: keep the frame index and timer (e.g. when swapping to the
+        mirrored variant of the same animation).
+        """
+        if clip is self.clip and not restart:
+            return
+        self.clip = clip
+        if keep_phase and clip:
+            self.index = min(self.index, len(clip) - 1)
+            self.finished = False
+        else:
+            self.reset()
+
+    def update(self, dt: float):
+        clip = self.clip
+        if not clip or self.finished:
+            return
+        n = len(clip)
+        self.time += dt * self.speed
+        durations = clip.durations
+        while self.time >= durations[self.index]:
+            self.time -= durations[self.index]
+            if n == 1:
+                self.time = 0.0
+                break
+            if clip.mode == PINGPONG:
+                if not 0 <= self.index + self.step < n:
+                    self.step = -self.step
+                self.index += self.step
+            elif self.index + 1 < n:
+                self.index += 1
+            elif clip.mode == ONCE:
+                self.finished = True
+                self.time = 0.0
+                break
+            else:
+                self.index = 0
+            if not self.carry:
+                self.time = 0.0
+                break
+
+    @property
+    def frame(self):
+        clip = self.clip
+        return clip.frames[self.index % len(clip)] if clip else None
+
+    @property
+    def pivot(self):
+        clip = self.clip
+        if not clip or clip.pivots is None:
+            return None
+        return clip.pivots[self.index % len(clip)]
@@ -0,0 +1,110 @@
+"""
+Camera / viewport shared by battle scenes and puzzle rooms.
+
+Screen shake (and any future zoom) is expressed as an offset that scenes
+apply when they compose the frame, instead of copying the finished frame to
+a temporary surface and re-blitting it. Scenes that already position their
+world with a camera offset add `camera.offset`; scenes that draw in fixed
+screen space call `camera.apply(screen)` once at the end of the world pass,
+which scrolls the display surface in place.
+"""
+
+#region Imports
+import random
+import pygame
+#endregion Imports
+
+
+class Camera:
+    """Scroll position plus a decaying shake offset.
+
+    `shake()` has the same signature as the old `DreamEffect.shake` so every
+    scene gets one shake API. The offset is rolled once per `update()` rather
+    than on every query, so all layers drawn in a frame move together.
+    """
+    def __init__(self, x: float = 0.0, y: float = 0.0, zoom: float = 1.0):
+        self.x = float(x)
+        self.y = float(y)
+        # Reserved for composition-time zoom; only `to_screen` honours it so far.
+        self.zoom = float(zoom)
+        self.shake_time = 0.0
+        self.shake_duration = 0.0
+        self.shake_intensity = 0.0
+        self.shake_decay = False
+        self.shake_x = 0
+        self.shake_y = 0
+        self._rng = random.Random()
+
+    def shake(self, duration: float = 0.3, intensity: float = 5, decay: bool = False):
+        """Start a shake, replacing any shake in progress.
+
+        duration: seconds the shake lasts.
+        intensity: maximum offset in pixels.
+        decay: fade the intensity linearly to zero over the duration.
+        """
+        self.shake_time = duration
+        self.shake_duration = max(1e-6, duration)
+        self.shake_intensity = intensity
+        self.shake_decay = decay
+        self._roll()
+
+    def is_shaking(self) -> bool:
+        return self.shake_time > 0
+
+    def stop_shake(self):
+        self.shake_time = 0.0
+        self.shake_x = 0
+        self.shake_y = 0
+
+    def update(self, dt: float):
+        if self.shake_time > 0:
+            self.shake_time = max(0.0, self.shake_time - dt)
+        self._roll()
+
+    def _roll(self):
+        if self.shake_time <= 0:
+            self.shake_x = 0
+            self.shake_y = 0
+            return
+        k = self.shake_intensity
+        if self.shake_decay:
+            k *= self.shake_time / self.shake_duration
+        self.shake_x = int(self._rng.uniform(-k, k))
+        self.shake_y = int(self._rng.uniform(-k, k))
+
+    @property
+    def shake_offset(self):
+        return (self.shake_x, self.shake_y)
+
+    @property
+    def offset(self):
+        """Screen-space translation for world drawing: scroll plus shake."""
+        return (self.shake_x - int(self.x), self.shake_y - int(self.y))
+
+    def to_screen(self, wx: float, wy: float, center=None):
+        """Map a world position to screen space (scroll, zoom about `center`, shake)."""
+        sx, sy = wx - self.x, wy - self.y
+        if self.zoom != 1.0 and center is not None:
+            sx = center[0] + (sx - center[0]) * self.zoom
+            sy = center[1] + (sy - center[1]) * self.zoom
+        return (sx + self.shake_x, sy + self.shake_y)
+
+    def apply(self, screen: pygame.Surface, fill=(0, 0, 0)):
+        """Shift an already-composed frame by the shake offset in place.
+
+        Uses `Surface.scroll`, so no full-screen surface is allocated; only the
+        thin strips uncovered by the shift are filled.
+        """
+        dx, dy = self.shake_x, self.shake_y
+        if not dx and not dy:
+            return
+        w, h = screen.get_size()
+        screen.scroll(dx, dy)
+        if dx > 0:
+            screen.fill(fill, (0, 0, dx, h))
+        elif dx < 0:
+            screen.fill(fill, (w + dx, 0, -dx, h))
+        if dy > 0:
+            screen.fill(fill, (0, 0, w, dy))
+        elif dy < 0:
+            screen.fill(fill, (0, h + dy, w, -dy))
@@ -0,0 +1,171 @@
+"""
+Typewriter dialogue box shared by the puzzle rooms.
+
+The rooms' dialogue boxes used to rebuild the translucent box surface and
+re-render the whole revealed prefix every frame, so a long passage cost
+more per frame the further it got. Here the box chrome is rendered once
+per size, each line of text is rendered once into a persistent surface
+when the passage is shown, and revealing a character only widens the
+blitted part of its line. A frame is one chrome blit plus one blit per
+line, however long the passage is.
+
+Rooms subclass `DialogueBox` (or instantiate it) with their colours and
+layout; the show/update/skip/draw API is the one they already use. `draw`
+returns the rects it blitted, for the rooms' dirty-rect renderer.
+"""
+
+#region Imports
+import pygame
+from src.utils.font import render_text
+#endregion Imports
+
+
+class TypewriterText:
+    """Multi-line text revealed character by character.
+
+    Each line is rendered once, in full, when the passage is set; revealing
+    characters only widens the part of that line surface that gets blitted
+    (measured with `font.size` of the revealed prefix), so glyph positions and
+    kerning match rendering the prefix directly.
+    """
+    def __init__(self, font, color, line_height: int):
+        self.font = font
+        self.color = tuple(color)
+        self.line_height = line_height
+        self.text = ""
+        self.revealed = -1
+        self._lines = []  # [surface, text, visible width] per line
+        self._visible = []
+
+    def set_text(self, text: str):
+        self.text = text
+        self.revealed = -1
+        self._lines = [[render_text(self.font, line, self.color), line, 0] for line in text.split('\n')]
+        self._visible = []
+
+    def reveal(self, count: int):
+        """Show the first `count` characters; only changed lines are re-measured."""
+        count = max(0, min(count, len(self.text)))
+        if count == self.revealed:
+            return
+        self.revealed = count
+        start = 0
+        visible = []
+        for entry in self._lines:
+            surf, line, _ = entry
+            shown = max(0, min(len(line), count - start))
+            if shown == 0 and count <= start:
+                break
+            width = surf.get_width() if shown == len(line) else self.font.size(line[:shown])[0]
+            entry[2] = width
+            visible.append((surf, pygame.Rect(0, 0, width, surf.get_height())))
+            start += len(line) + 1  # newline
+        self._visible = visible
+
+    def draw(self, surface: pygame.Surface, pos):
+        x, y = pos
+        lh = self.line_height
+        return surface.blits([(surf, (x, y + i * lh), area) for i, (surf, area) in enumerate(self._visible)])
+
+
+class DialogueBox:
+    """Typewriter dialogue box with cached chrome.
+
+    font / small_font: Font for the text and the continue indicator
+    (small_font defaults to font).
+    box: (margin_x, height, bottom) - the box spans the screen width minus
+    margin_x on both sides and sits `bottom` pixels above the screen edge.
+    size: fixed screen size; None uses the size of the surface drawn to.
+    indicator: text shown (blinking) once the passage is fully revealed,
+    placed at `indicator_offset` from the box's bottom-right corner, with
+    its top-left ('topleft') or top-right ('topright') at that point.
+    auto_close: seconds after the reveal completes before the box closes.
+    """
+    def __init__(self, font, text_color=(255, 255, 255), char_speed: float = 0.02,
+                 box=(30, 110, 30), size=None, fill=(20, 10, 35, 240), border=(120, 80, 160),
+                 border_radius: int = 0, text_offset=(20, 15), line_height: int = 28,
+                 indicator=">>", indicator_color=(180, 150, 220), indicator_offset=(-45, -30),
+                 indicator_anchor='topleft', small_font=None, auto_close: float = None):
+        self.font = font
+        self.small_font = small_font or font
+        self.active = False
+        self.text = ""
+        self.display_text = ""
+        self.char_index = 0
+        self.char_timer = 0
+        self.char_speed = char_speed
+        self.display_time = 0
+        self.auto_close_time = auto_close
+        self.box = box
+        self.size = size
+        self.fill = fill
+        self.border = border
+        self.border_radius = border_radius
+        self.text_offset = text_offset
+        self.indicator = indicator
+        self.indicator_color = indicator_color
+        self.indicator_offset = indicator_offset
+        self.indicator_anchor = indicator_anchor
+        self._typewriter = TypewriterText(font, text_color, line_height)
+        self._chrome = None
+
+    def show(self, text):
+        self.active = True
+        self.text = text
+        self.display_text = ""
+        self.char_index = 0
+        self.char_timer = 0
+        self.display_time = 0
+        self._typewriter.set_text(text)
+
+    def update(self, dt):
+        if not self.active:
+            return
+        if self.char_index < len(self.text):
+            self.char_timer += dt
+            if self.char_timer >= self.char_speed:
+                self.char_timer = 0
+                self.display_text += self.text[self.char_index]
+                self.char_index += 1
+        elif self.auto_close_time is not None:
+            self.display_time += dt
+            if self.display_time >= self.auto_close_time:
+                self.active = False
+
+    def skip(self):
+        if self.char_index < len(self.text):
+            self.display_text = self.text
+            self.char_index = len(self.text)
+        else:
+            self.active = False
+
+    def box_rect(self, surface=None) -> pygame.Rect:
+        sw, sh = self.size or surface.get_size()
+        margin_x, box_h, bottom = self.box
+        return pygame.Rect(margin_x, sh - box_h - bottom, sw - 2 * margin_x, box_h)
+
+    def _get_chrome(self, size):
+        if self._chrome is None or self._chrome.get_size() != size:
+            chrome = pygame.Surface(size, pygame.SRCALPHA)
+            chrome.fill(self.fill)
+            pygame.draw.rect(chrome, self.border, chrome.get_rect(), 3, border_radius=self.border_radius)
+            self._chrome = chrome
+        return self._chrome
+
+    def draw(self, surface):
+        if not self.active:
+            return []
+        box_rect = self.box_rect(surface)
+        drawn = [surface.blit(self._get_chrome(box_rect.size), box_rect.topleft)]
+
+        self._typewriter.reveal(self.char_index)
+        drawn += self._typewriter.draw(surface, (box_rect.x + self.text_offset[0], box_rect.y + self.text_offset[1]))
+
+        if self.indicator and self.char_index >= len(self.text):
+            if int(pygame.time.get_ticks() / 500) % 2:
+                ind = render_text(self.small_font, self.indicator, self.indicator_color)
+                x = box_rect.right + self.indicator_offset[0]
+                if self.indicator_anchor == 'topright':
+                    x -= ind.get_width()
+                drawn.append(surface.blit(ind, (x, box_rect.bottom + self.indicator_offset[1])))
+        return drawn
@@ -0,0 +1,207 @@
+"""
+Dirty-rectangle rendering for mostly static rooms.
+
+The puzzle rooms redraw the whole screen and flip every frame although only
+the player, a few animated props, particles and the dialogue box change.
+`DirtyRectRenderer` keeps the static part of the room in a cached background
+surface and pushes only the regions dynamic content touched with
+`pygame.display.update(rects)`.
+
+The dirty list is built from what was actually drawn: the scene's dynamic
+pass hands every rect returned by `blit` / `pygame.draw.*` to `add()`. The
+renderer restores last frame's regions (grown by a few pixels) from the
+cache and runs the pass. If something landed outside those regions it also
+restores the new ones and runs the pass once more, so overlays drawn during
+the pass (vignettes, foreground layers) are applied exactly once per pixel.
+
+Anything that touches the whole screen (camera scroll, shake, flash, static
+noise, fades) calls `invalidate()` or changes the background key, and the
+frame falls back to a full restore and `pygame.display.flip()`.
+
+Typical frame:
+
+    if dirty.begin(key=(cam_x, cam_y)):
+        draw_static_room(dirty.background)
+
+    def draw_dynamic(screen):
+        dirty.add(player.draw(screen))
+        dirty.overlay(screen, vignette)
+        dirty.add(dialogue.draw(screen))
+
+    dirty.render(screen, draw_dynamic)
+    dirty.present()
+"""
+
+#region Imports
+import pygame
+import globals as g
+#endregion Imports
+
+
+_NO_KEY = object()
+
+
+def merge_rects(rects):
+    """Collapse overlapping rects so no pixel is covered twice."""
+    merged = []
+    for r in rects:
+        r = pygame.Rect(r)
+        i = r.collidelist(merged)
+        while i != -1:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
+
+
+def _subtract(r, cut):
+    """The parts of `r` outside `cut`, as up to four rects."""
+    if not r.colliderect(cut):
+        return [r]
+    parts = []
+    if cut.top > r.top:
+        parts.append(pygame.Rect(r.left, r.top, r.width, cut.top - r.top))
+    if cut.bottom < r.bottom:
+        parts.append(pygame.Rect(r.left, cut.bottom, r.width, r.bottom - cut.bottom))
+    top, bottom = max(r.top, cut.top), min(r.bottom, cut.bottom)
+    if cut.left > r.left:
+        parts.append(pygame.Rect(r.left, top, cut.left - r.left, bottom - top))
+    if cut.right < r.right:
+        parts.append(pygame.Rect(cut.right, top, r.right - cut.right, bottom - top))
+    return parts
+
+
+def _uncovered(rects, regions):
+    """The parts of `rects` not inside any of `regions`."""
+    rest = [pygame.Rect(r) for r in rects]
+    for cut in regions:
+        rest = [part for r in rest for part in _subtract(r, cut)]
+    return rest
+
+
+def disjoint_rects(rects):
+    """Exactly the union of `rects`, as rects that do not overlap.
+
+    Unlike `merge_rects` nothing outside the input is added, so scattered
+    rects near a big one (particles around the dialogue box) do not grow
+    into a large bounding box.
+    """
+    out = []
+    for r in rects:
+        out.extend(_uncovered((r,), out))
+    return out
+
+
+class DirtyRectRenderer:
+    """Restores and presents only the regions dynamic content touched.
+
+    size: screen size; the cached background has the same size.
+    enabled: defaults to `g.DIRTY_RECT_RENDERING`; when False every frame is
+    a full restore + flip, i.e. the classic redraw-everything loop.
+    full_ratio: if the dirty area exceeds this fraction of the screen the
+    frame is presented with a full flip instead.
+    margin: pixels last frame's rects are grown by before restoring, so
+    content that drifts a little per frame (particles, a walking player)
+    usually stays inside them and the dynamic pass runs once.
+    """
+    def __init__(self, size, enabled: bool = None, full_ratio: float = 0.5, margin: int = 4):
+        self.size = tuple(size)
+        if enabled is None:
+            enabled = getattr(g, 'DIRTY_RECT_RENDERING', False)
+        self.enabled = enabled
+        self.full_ratio = full_ratio
+        self.margin = margin
+        self.screen_rect = pygame.Rect((0, 0), self.size)
+        self.background = pygame.Surface(self.size)
+        self._key = _NO_KEY
+        self._prev = []
+        self._cur = []
+        self._regions = []
+        self._full_frames = 1
+        self.full = True
+
+    def invalidate(self, frames: int = 2):
+        """Force full frames: this one and the next, so the effect also gets erased."""
+        self._full_frames = max(self._full_frames, frames)
+
+    def begin(self, key=None) -> bool:
+        """Start a frame. Returns True when `background` must be redrawn.
+
+        key: anything identifying the background's appearance (camera
+        position, room state). A change rebuilds the cache and forces a full
+        frame.
+        """
+        rebuild = self._key is _NO_KEY or key != self._key
+        if rebuild:
+            self._key = key
+            self.invalidate()
+        self._cur = []
+        self.full = not self.enabled or self._full_frames > 0
+        if self._full_frames > 0:
+            self._full_frames -= 1
+        return rebuild
+
+    def add(self, drawn):
+        """Register what the dynamic pass drew: a Rect, a list of them, or None."""
+        if drawn is None:
+            return
+        if isinstance(drawn, pygame.Rect):
+            drawn = (drawn,)
+        for rect in drawn:
+            if rect is None:
+                continue
+            r = pygame.Rect(rect).clip(self.screen_rect)
+            if r.width and r.height:
+                self._cur.append(r)
+
+
+    def _restore(self, screen: pygame.Surface, regions):
+        self._regions = regions
+        if regions == [self.screen_rect]:
+            screen.blit(self.background, (0, 0))
+        else:
+            screen.blits([(self.background, r, r) for r in regions], doreturn=False)
+
+    def render(self, screen: pygame.Surface, draw):
+        """Restore the dirty regions and run `draw(screen)`, the dynamic pass.
+
+        The pass reports its drawing through `add()`. It runs a second time
+        when it drew outside last frame's regions, after those regions plus
+        the new ones have been restored; it should draw the same thing both
+        times.
+        """
+        self._cur = []
+        if self.full:
+            self._restore(screen, [self.screen_rect])
+            draw(screen)
+            return
+        grow = 2 * self.margin
+        self._restore(screen, disjoint_rects(r.inflate(grow, grow).clip(self.screen_rect) for r in self._prev))
+        draw(screen)
+        missing = disjoint_rects(_uncovered(self._cur, self._regions))
+        if not missing:
+            return
+        regions = self._regions + missing
+        if sum(r.width * r.height for r in regions) > self.full_ratio * self.size[0] * self.size[1]:
+            self.full = True
+            regions = [self.screen_rect]
+        self._cur = []
+        self._restore(screen, regions)
+        draw(screen)
+        if not self.full:
+            # the second pass may have strayed further; push whatever it touched
+            self._regions = regions + disjoint_rects(_uncovered(self._cur, regions))
+
+    def overlay(self, screen: pygame.Surface, surf: pygame.Surface, dest=(0, 0)):
+        """Blit a static full-screen overlay (vignette, foreground) over the restored regions."""
+        dx, dy = dest
+        screen.blits([(surf, r, r.move(-dx, -dy)) for r in self._regions], doreturn=False)
+
+    def present(self):
+        """Push the frame: full flip or only the dirty regions."""
+        if self.full:
+            pygame.display.flip()
+        elif self._regions:
+            pygame.display.update(self._regions)
+        self._prev = self._cur
+        self._cur = []
@@ -0,0 +1,230 @@
+"""
+Array-backed particle emitters for boss and puzzle effects.
+
+Particles used to be lists of dicts updated one by one and drawn through a
+freshly allocated SRCALPHA surface each. An emitter here keeps every
+attribute in a preallocated NumPy array, integrates, fades and culls the
+whole population with a handful of vector operations, and draws from a
+cache of pre-rendered sprites (one per colour / radius / alpha level /
+rotation step) submitted in a single `Surface.blits` call.
+
+Scene-specific motion (spirals, orbits, wrap-around) stays in the scenes:
+they operate directly on the live slices returned by `emitter.view(name)`.
+"""
+
+#region Imports
+import random
+import numpy as np
+import pygame
+#endregion Imports
+
+
+#region Sprites
+def dot(radius: int, color) -> pygame.Surface:
+    """Hard-edged filled circle (the look the dict particles had)."""
+    size = radius * 2 + 1
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color[:3], 255), (radius, radius), radius)
+    return surf
+
+
+def soft_dot(radius: int, color) -> pygame.Surface:
+    """Circle whose alpha falls off quadratically towards the rim."""
+    size = radius * 2 + 1
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    for r in range(radius, 0, -1):
+        a = int(255 * (1.0 - (r / (radius + 1)) ** 2))
+        pygame.draw.circle(surf, (*color[:3], a), (radius, radius), r)
+    return surf
+
+
+def glow_dot(radius: int, color) -> pygame.Surface:
+    """Solid core with a faint halo twice its radius."""
+    size = radius * 4 + 1
+    c = radius * 2
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color[:3], 85), (c, c), radius * 2)
+    pygame.draw.circle(surf, (*color[:3], 255), (c, c), radius)
+    return surf
+#endregion Sprites
+
+
+class ParticleEmitter:
+    """Fixed-capacity particle pool with vectorized update and batched draw.
+
+    capacity: maximum live particles; `emit` drops the overflow.
+    sprite: callable (radius, color) -> Surface rendered at full opacity.
+    palette: list of RGB colours; particles store an index into it.
+    gravity: (ax, ay) acceleration applied to every particle.
+    drag: fraction of velocity kept per second (1.0 = no drag).
+    alpha_levels: number of cached opacity steps per sprite.
+    rotation_steps: cached rotation steps (1 disables rotation).
+    extra_fields: names of additional per-particle float fields (orbit radius,
+    twinkle phase, ...) for scene-specific motion; set them through `emit`.
+    """
+    FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'alpha', 'fade',
+              'life', 'rotation', 'spin', 'phase')
+
+    def __init__(self, capacity: int = 512, sprite=dot, palette=((255, 255, 255),),
+                 gravity=(0.0, 0.0), drag: float = 1.0, alpha_levels: int = 16,
+                 rotation_steps: int = 1, extra_fields=(), rng: random.Random = None):
+        self.capacity = int(capacity)
+        self.sprite = sprite
+        self.palette = [tuple(c[:3]) for c in palette]
+        self.gravity = gravity
+        self.drag = drag
+        self.alpha_levels = max(2, int(alpha_levels))
+        self.rotation_steps = max(1, int(rotation_steps))
+        self.rng = rng or random.Random()
+        self._np_rng = np.random.default_rng(self.rng.getrandbits(32))
+        self.count = 0
+        self._data = {name: np.zeros(self.capacity, dtype=np.float32)
+                      for name in self.FIELDS + tuple(extra_fields)}
+        self._color = np.zeros(self.capacity, dtype=np.int16)
+        # (color, radius, rotation step, alpha level) -> (surface, half_w, half_h)
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    #region State
+    def view(self, name: str) -> np.ndarray:
+        """Live slice of a field; writes go straight into the pool."""
+        if name == 'color':
+            return self._color[:self.count]
+        return self._data[name][:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def uniform(self, low, high, n: int) -> np.ndarray:
+        """Random helper for spawn code (uses the emitter's own generator)."""
+        return self._np_rng.uniform(low, high, n).astype(np.float32)
+
+    def emit(self, n: int, x, y, vx=0.0, vy=0.0, size=2.0, alpha=255.0, fade=0.0,
+             life=np.inf, rotation=0.0, spin=0.0, phase=0.0, color=None, **extra) -> slice:
+        """Spawn up to `n` particles; every argument is a scalar or length-n array.
+
+        color: palette index (scalar or array); None picks uniformly at random.
+        Returns the slice of the pool the new particles occupy.
+        """
+        n = min(int(n), self.capacity - self.count)
+        if n <= 0:
+            return slice(self.count, self.count)
+        s = slice(self.count, self.count + n)
+        values = dict(x=x, y=y, vx=vx, vy=vy, size=size, alpha=alpha, fade=fade,
+                      life=life, rotation=rotation, spin=spin, phase=phase, **extra)
+        for name, arr in self._data.items():
+            v = np.asarray(values.pop(name, 0.0), dtype=np.float32)
+            arr[s] = v[:n] if v.ndim else v
+        if values:
+            raise KeyError(f"unknown particle fields: {', '.join(values)}")
+        if color is None:
+            self._color[s] = self._np_rng.integers(0, len(self.palette), n)
+        else:
+            c = np.asarray(color)
+            self._color[s] = c[:n] if c.ndim else c
+        self.count += n
+        return s
+
+    def cull(self, dead: np.ndarray):
+        """Remove particles where `dead` is True, keeping the pool packed."""
+        if not dead.any():
+            return
+        keep = np.flatnonzero(~dead)
+        k = len(keep)
+        for arr in self._data.values():
+            arr[:k] = arr[keep]
+        self._color[:k] = self._color[keep]
+        self.count = k
+    #endregion State
+
+    def update(self, dt: float):
+        """Integrate motion, apply fade/lifetime and drop dead particles."""
+        n = self.count
+        if not n:
+            return
+        d = self._data
+        vx, vy = d['vx'][:n], d['vy'][:n]
+        ax, ay = self.gravity
+        if ax:
+            vx += ax * dt
+        if ay:
+            vy += ay * dt
+        if self.drag != 1.0:
+            k = self.drag ** dt
+            vx *= k
+            vy *= k
+        d['x'][:n] += vx * dt
+        d['y'][:n] += vy * dt
+        d['rotation'][:n] += d['spin'][:n] * dt
+        alpha = d['alpha'][:n]
+        alpha -= d['fade'][:n] * dt
+        np.maximum(alpha, 0.0, out=alpha)
+        life = d['life'][:n]
+        life -= dt
+        self.cull((alpha <= 0.0) | (life <= 0.0))
+
+    #region Draw
+    def _get_sprite(self, ci: int, radius: int, rot: int, level: int):
+        key = (ci, radius, rot, level)
+        entry = self._sprites.get(key)
+        if entry is None:
+            base_key = (ci, radius, rot, self.alpha_levels - 1)
+            base = self._sprites.get(base_key)
+            if base is None:
+                surf = self.sprite(radius, self.palette[ci])
+                if rot:
+                    surf = pygame.transform.rotate(surf, rot * 360.0 / self.rotation_steps)
+                base = (surf, surf.get_width() // 2, surf.get_height() // 2)
+                self._sprites[base_key] = base
+            if level == self.alpha_levels - 1:
+                return base
+            surf = base[0].copy()
+            surf.set_alpha(int(255 * level / (self.alpha_levels - 1)))
+            entry = (surf, base[1], base[2])
+            self._sprites[key] = entry
+        return entry
+
+    def draw(self, surface: pygame.Surface, offset=(0, 0), alpha_scale: float = 1.0,
+             size_scale: float = 1.0, lag: float = 0.0):
+        """Blit every live particle centred on its position.
+
+        offset: screen-space translation (e.g. a camera offset).
+        alpha_scale / size_scale: multipliers for the whole batch this frame.
+        lag: draw each particle `lag` seconds behind along its velocity, used
+        for cheap motion trails by drawing the same emitter several times.
+        Returns the blitted rects (e.g. for dirty-rect updates).
+        """
+        n = self.count
+        if not n:
+            return []
+        d = self._data
+        top = self.alpha_levels - 1
+        levels = np.rint(d['alpha'][:n] * (alpha_scale * top / 255.0))
+        np.clip(levels, 0, top, out=levels)
+        visible = levels > 0
+        if not visible.any():
+            return []
+        x = d['x'][:n] + offset[0]
+        y = d['y'][:n] + offset[1]
+        if lag:
+            x = x - d['vx'][:n] * lag
+            y = y - d['vy'][:n] * lag
+        radii = np.maximum(1, np.rint(d['size'][:n] * size_scale))
+        if self.rotation_steps > 1:
+            rots = np.rint(d['rotation'][:n] * (self.rotation_steps / 360.0)).astype(np.int32)
+            rots %= self.rotation_steps
+        else:
+            rots = np.zeros(n, dtype=np.int32)
+        idx = np.flatnonzero(visible)
+        get = self._get_sprite
+        seq = []
+        for ci, r, t, lv, px, py in zip(self._color[idx].tolist(), radii[idx].astype(np.int32).tolist(),
+                                        rots[idx].tolist(), levels[idx].astype(np.int32).tolist(),
+                                        x[idx].astype(np.int32).tolist(), y[idx].astype(np.int32).tolist()):
+            surf, hw, hh = get(ci, r, t, lv)
+            seq.append((surf, (px - hw, py - hh)))
+        return surface.blits(seq)
+    #endregion Draw
+
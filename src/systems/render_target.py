@@ -0,0 +1,86 @@
+"""
+Low-resolution offscreen render targets with integer upscale.
+
+All art is 16-32 px pixel art, so fill-rate-bound layers (procedural
+backgrounds, fog bands, full-screen gradients) do not need to be rasterised
+at 1280x720. A `RenderTarget` owns a surface at 1/scale of the display size;
+a layer draws into it using `target.s(...)` to convert logical (display)
+coordinates, then `present()` upscales it once. Sprites, HUD and text keep
+drawing straight into the display surface at native resolution.
+
+The scale comes from `g.RENDER_SCALE` (1 = native, 2 = 640x360 on a
+1280x720 display). At scale 1 a target is a plain offscreen surface and
+behaves exactly like drawing at full resolution.
+"""
+
+#region Imports
+import pygame
+import globals as g
+#endregion Imports
+
+
+class RenderTarget:
+    """Offscreen surface at 1/scale of `size`, presented with an integer upscale.
+
+    size: logical (display) size in pixels; defaults to the screen size.
+    scale: integer downscale factor; defaults to `g.RENDER_SCALE`.
+    alpha: allocate per-pixel alpha (for overlay layers blended on top).
+    """
+    def __init__(self, size=None, scale: int = None, alpha: bool = False):
+        self.size = tuple(size or (g.SCREENWIDTH, g.SCREENHEIGHT))
+        if scale is None:
+            scale = getattr(g, 'RENDER_SCALE', 1)
+        self.scale = max(1, int(scale))
+        self.alpha = alpha
+        flags = pygame.SRCALPHA if alpha else 0
+        self.surface = pygame.Surface(
+            (max(1, self.size[0] // self.scale), max(1, self.size[1] // self.scale)), flags)
+        # Reused destination for the upscale when it cannot go straight to the screen
+        self._upscaled = pygame.Surface(self.size, flags) if self.scale > 1 else None
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def s(self, v):
+        """Convert a logical length/coordinate to target pixels."""
+        return int(v // self.scale) if self.scale > 1 else int(v)
+
+    def clear(self, color=(0, 0, 0, 0)):
+        self.surface.fill(color)
+
+    def present(self, screen: pygame.Surface, dest=(0, 0)):
+        """Upscale onto `screen`. Opaque full-screen targets scale straight into it."""
+        if self.scale == 1:
+            screen.blit(self.surface, dest)
+            return
+        if not self.alpha and tuple(dest) == (0, 0) and screen.get_size() == self.size:
+            try:
+                pygame.transform.scale(self.surface, self.size, screen)
+                return
+            except ValueError:
+                pass  # pixel formats differ; go through the reusable buffer
+        pygame.transform.scale(self.surface, self.size, self._upscaled)
+        screen.blit(self._upscaled, dest)
+
+
+class RenderTargetPool:
+    """Named RenderTargets reused from frame to frame.
+
+    A target is reallocated only when the requested size changes, so
+    overlays that come and go do not allocate a surface per frame.
+    """
+    def __init__(self, scale: int = None, alpha: bool = True):
+        self.scale = scale
+        self.alpha = alpha
+        self._targets = {}
+
+    def get(self, name, size) -> RenderTarget:
+        size = tuple(size)
+        target = self._targets.get(name)
+        if target is None or target.size != size:
+            target = RenderTarget(size, self.scale, self.alpha)
+            self._targets[name] = target
+        return target
+
+    def clear(self):
+        self._targets.clear()
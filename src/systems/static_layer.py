@@ -0,0 +1,82 @@
+"""
+Cached layers for static arena geometry.
+
+Platforms and spike walls only change when the arena's topology does (a
+spike wave spawns or switches from warning to solid, the crumble phase
+removes the ledges), yet the battle scenes redrew every rect and polygon
+each frame. A `StaticLayer` bakes that geometry into one screen-sized
+surface keyed by the topology, and each frame costs a single blit.
+
+Transparent layers use a colour key with RLE acceleration, so blitting a
+mostly empty screen-sized layer only touches the pixels that were drawn.
+
+Typical frame:
+
+    if layer.begin(key=(wave_id, flash_on)):
+        for p in platforms:
+            p.draw(layer.surface)
+    layer.blit(screen)
+"""
+
+#region Imports
+from collections import OrderedDict
+import pygame
+import globals as g
+#endregion Imports
+
+
+class StaticLayer:
+    """Screen-sized surface rebuilt only when its key changes.
+
+    size: layer size; defaults to the screen size.
+    fill: opaque background colour baked under the geometry; None makes the
+    layer transparent (colour-keyed) so it can sit over an animated background.
+    variants: number of recently used keys kept baked, so geometry that
+    alternates between a few looks (e.g. a warning flash) is not rebuilt on
+    every toggle.
+    """
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, size=None, fill=None, variants: int = 1):
+        self.size = tuple(size or (g.SCREENWIDTH, g.SCREENHEIGHT))
+        self.fill = fill
+        self.variants = max(1, int(variants))
+        self.surface = None
+        self._cache = OrderedDict()
+        self._unsealed = None
+
+    def invalidate(self):
+        """Drop every baked variant; the next `begin` rebuilds."""
+        self._cache.clear()
+        self.surface = None
+
+    def begin(self, key=None) -> bool:
+        """Select the variant for `key`. Returns True when `surface` must be drawn.
+
+        A rebuilt surface arrives cleared (filled with `fill` or the colour key).
+        """
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            self.surface = surf
+            return False
+        if len(self._cache) >= self.variants:
+            _, surf = self._cache.popitem(last=False)
+        else:
+            surf = pygame.Surface(self.size)
+        surf.fill(self.fill if self.fill is not None else self.COLORKEY)
+        self._cache[key] = surf
+        self.surface = surf
+        self._unsealed = surf
+        return True
+
+    def blit(self, screen: pygame.Surface, dest=(0, 0)):
+        """Draw the current variant; the first blit after a rebuild RLE-encodes it."""
+        surf = self.surface
+        if surf is None:
+            return
+        if surf is self._unsealed:
+            if self.fill is None:
+                surf.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+            self._unsealed = None
+        screen.blit(surf, dest)
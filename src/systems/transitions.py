@@ -0,0 +1,354 @@
+"""
+Transition compositor for full-screen scene outros.
+
+The victory outros used to allocate several full-screen SRCALPHA surfaces
+per frame and redraw every gradient line, ray and ring from scratch. The
+compositor here allocates its layers once, bakes the time-invariant pieces
+(gradient bases, ray fans, vignette rings, small sprite stamps) on first use
+and animates them with alpha, blits and cheap transforms afterwards.
+
+Every frame is a pure function of the elapsed transition time: randomised
+layers use a local `random.Random` seeded from the time bucket instead of
+reseeding the global generator, so a transition can be stepped and inspected
+frame by frame.
+"""
+
+#region Imports
+import math
+import random
+import pygame
+import globals as g
+from src.systems.dirty_rects import merge_rects
+#endregion Imports
+
+
+def _clear_rects(layer: pygame.Surface, rects):
+    """Clear only the regions drawn last time instead of the whole layer."""
+    for r in rects:
+        layer.fill((0, 0, 0, 0), r)
+    rects.clear()
+
+
+def _blit_regions(screen: pygame.Surface, layer: pygame.Surface, rects):
+    """Blit only the occupied parts of a sparse layer; `rects` must not overlap,
+    or the overlap is composited twice."""
+    screen.blits([(layer, r, r) for r in rects], doreturn=False)
+
+
+def _clamp(v: float) -> int:
+    return max(0, min(255, int(v)))
+
+
+class HollowVictoryTransition:
+    """Void vortex -> white liberation -> dawn awakening for The Hollow.
+
+    Covers phases 5-7 of the Hollow victory sequence (t >= 2s). The battle
+    scene still owns the earthquake, void particles, crumbling platforms and
+    the player's descent; call `draw` after those with the transition timer.
+    """
+    VORTEX_START = 2.0
+    FADE_START = 3.5
+    DREAM_START = 5.5
+
+    # Ray fans rotate slowly; re-bake the fan only when the quantised angle
+    # changes (about every fourth frame) and fade it with surface alpha.
+    RAY_COUNT = 16
+    RAY_ANGLE_STEP = 0.02
+    MOTE_ALPHA_LEVELS = 16
+    # Dissolve layers follow their progress in steps of 1/PROGRESS_STEPS
+    PROGRESS_STEPS = 20
+
+    def __init__(self, size=None):
+        self.width, self.height = size or (g.SCREENWIDTH, g.SCREENHEIGHT)
+        self.center = (self.width // 2, self.height // 2)
+        self._baked = False
+
+    #region Baking
+    def _bake(self):
+        w, h = self.width, self.height
+        cx, cy = self.center
+
+        # Opaque overlays faded with set_alpha
+        self._white = pygame.Surface((w, h))
+        self._white.fill((255, 255, 255))
+        self._awaken = pygame.Surface((w, h))
+        self._awaken.fill((255, 255, 250))
+
+        # Vortex: unit vectors per ring plus one dot stamp per ring alpha
+        self._vortex_rings = []
+        for ring in range(8):
+            segments = 24 + ring * 4
+            units = [(math.cos(seg / segments * math.pi * 2), math.sin(seg / segments * math.pi * 2))
+                     for seg in range(segments)]
+            dot = pygame.Surface((7, 7), pygame.SRCALPHA)
+            pygame.draw.circle(dot, (10, 10, 30, max(0, 120 - ring * 15)), (3, 3), 3)
+            self._vortex_rings.append((units, dot))
+
+        # Ray fan layer (re-baked per quantised angle)
+        self._rays = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._rays_key = None
+        # Long enough to reach every screen edge from the centre
+        self._ray_length = math.hypot(cx, cy) + 4
+
+        # Randomised layers re-rendered when their seed or progress bucket changes
+        self._dissolve = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._dissolve_key = None
+        self._dissolve_dirty = []
+        self._pixels = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._pixels_key = None
+        self._pixels_dirty = []
+
+        # Dawn gradient: per-row bases, a 1px column and a reusable target
+        rows = h // 2
+        self._dawn_rows = [(y * 2) / h for y in range(rows)]
+        self._dawn_col = pygame.Surface((1, rows))
+        self._dawn = pygame.Surface((w, h))
+
+        # Vignette rings baked at full strength
+        self._vignette = pygame.Surface((w, h), pygame.SRCALPHA)
+        max_dist = math.sqrt(cx ** 2 + cy ** 2)
+        for ring in range(1, 10):
+            radius = int(max_dist * (0.3 + ring * 0.08))
+            pygame.draw.circle(self._vignette, (255, 252, 248, 25 * ring), (cx, cy), radius, max(2, 18 - ring * 2))
+
+        # Small stamp caches (fragments, motes)
+        self._stamps = {}
+        self._baked = True
+    #endregion Baking
+
+    #region Public API
+    def draw(self, screen: pygame.Surface, t: float):
+        """Composite the outro for transition time `t` (seconds) onto `screen`."""
+        if t <= self.VORTEX_START:
+            return
+        if not self._baked:
+            self._bake()
+        self._draw_vortex(screen, t)
+        if t > self.FADE_START:
+            self._draw_liberation(screen, t)
+        if t > self.DREAM_START:
+            self._draw_awakening(screen, t)
+    #endregion Public API
+
+    #region Phase 5: Vortex
+    def _draw_vortex(self, screen, t):
+        cx, cy = self.center
+        spin = t * 2
+        cs, sn = math.cos(spin), math.sin(spin)
+        w, h = self.width, self.height
+        blits = []
+        for ring, (units, dot) in enumerate(self._vortex_rings):
+            radius = 50 + ring * 80 + (t - self.VORTEX_START) * 100
+            for ca, sa in units:
+                x = cx + (ca * cs - sa * sn) * radius - 3
+                y = cy + (sa * cs + ca * sn) * radius - 3
+                if -7 < x < w and -7 < y < h:
+                    blits.append((dot, (int(x), int(y))))
+        screen.blits(blits, doreturn=False)
+    #endregion Phase 5: Vortex
+
+    #region Phase 6: White Liberation
+    def _draw_liberation(self, screen, t):
+        fade_progress = min(1.0, (t - self.FADE_START) / 2.0)
+        self._white.set_alpha(int(fade_progress * 220))
+        screen.blit(self._white, (0, 0))
+
+        if fade_progress < 0.8:
+            self._bake_rays(t * 0.3)
+            self._rays.set_alpha(_clamp(255 * (1 - fade_progress)))
+            screen.blit(self._rays, (0, 0))
+
+        if fade_progress < 0.6:
+            key = (int(t * 10), int(fade_progress * self.PROGRESS_STEPS))
+            if key != self._dissolve_key:
+                self._dissolve_key = key
+                self._render_dissolve(key[0], key[1] / self.PROGRESS_STEPS)
+            self._dissolve.set_alpha(_clamp(255 * (1 - fade_progress)))
+            _blit_regions(screen, self._dissolve, self._dissolve_dirty)
+
+    def _bake_rays(self, angle: float):
+        period = math.pi * 2 / self.RAY_COUNT
+        key = int((angle % period) / self.RAY_ANGLE_STEP)
+        if key == self._rays_key:
+            return
+        self._rays_key = key
+        base = key * self.RAY_ANGLE_STEP
+        cx, cy = self.center
+        self._rays.fill((0, 0, 0, 0))
+        for ray in range(self.RAY_COUNT):
+            a = ray * period + base
+            end = (int(cx + math.cos(a) * self._ray_length), int(cy + math.sin(a) * self._ray_length))
+            # Gradient rays (thicker at center)
+            for thickness in range(4, 0, -1):
+                pygame.draw.line(self._rays, (255, 250, 240, 120 // (5 - thickness)), (cx, cy), end, thickness)
+
+    def _render_dissolve(self, key: int, fade_progress: float):
+        _clear_rects(self._dissolve, self._dissolve_dirty)
+        rng = random.Random(key)
+        fade_to_white = fade_progress * 0.8
+        for _ in range(int(80 * (1 - fade_progress))):
+            px = rng.randint(0, self.width)
+            py = rng.randint(0, self.height)
+            p_size = rng.uniform(2, 6)
+            base_color = rng.choice([(40, 40, 80), (50, 50, 100), (30, 30, 60)])
+            color = tuple(int(c + (255 - c) * fade_to_white) for c in base_color)
+            p_alpha = int(rng.uniform(60, 150))
+            self._dissolve_dirty.append(pygame.draw.circle(self._dissolve, (*color, p_alpha), (px, py), int(p_size)))
+        self._dissolve_dirty[:] = merge_rects(self._dissolve_dirty)
+    #endregion Phase 6: White Liberation
+
+    #region Phase 7: Awakening
+    def _draw_awakening(self, screen, t):
+        wake_progress = min(1.0, (t - self.DREAM_START) / 4.0)
+
+        self._draw_dawn(screen, t, wake_progress)
+
+        if wake_progress < 0.75:
+            key = (int(t * 30), int(wake_progress * self.PROGRESS_STEPS))
+            if key != self._pixels_key:
+                self._pixels_key = key
+                self._render_pixels(key[0], key[1] / self.PROGRESS_STEPS)
+            self._pixels.set_alpha(_clamp(255 * (1 - wake_progress)))
+            _blit_regions(screen, self._pixels, self._pixels_dirty)
+
+        self._draw_fragments(screen, t, wake_progress)
+        self._draw_motes(screen, t, wake_progress)
+
+        if wake_progress > 0.35:
+            self._vignette.set_alpha(_clamp(255 * (wake_progress - 0.35) / 0.65))
+            screen.blit(self._vignette, (0, 0))
+
+        if wake_progress > 0.7:
+            self._awaken.set_alpha(_clamp((wake_progress - 0.7) / 0.3 * 255))
+            screen.blit(self._awaken, (0, 0))
+
+    def _draw_dawn(self, screen, t, wake_progress):
+        """Lavender-to-cream sky: fill a 1px column, upscale into the cached layer."""
+        col = self._dawn_col
+        phase = t * 1.5
+        col.lock()
+        for i, ratio in enumerate(self._dawn_rows):
+            shimmer = math.sin(phase + ratio * math.pi) * 10
+            k = ratio * wake_progress
+            col.set_at((0, i), (_clamp(210 + 45 * k + shimmer),
+                                _clamp(190 + 65 * k + shimmer * 0.7),
+                                _clamp(230 - 50 * k + shimmer * 0.5)))
+        col.unlock()
+        pygame.transform.scale(col, (self.width, self.height), self._dawn)
+        self._dawn.set_alpha(int(200 * wake_progress))
+        screen.blit(self._dawn, (0, 0))
+
+    def _render_pixels(self, key: int, wake_progress: float):
+        _clear_rects(self._pixels, self._pixels_dirty)
+        rng = random.Random(key)
+        pixel_size = int(3 + wake_progress * 15)
+        density = int(200 * (1 - wake_progress * 0.7))
+        pixel_colors = [(245, 235, 255), (235, 225, 250), (255, 245, 255), (225, 215, 245)]
+        for _ in range(density):
+            x = rng.randint(0, self.width // pixel_size) * pixel_size
+            y = rng.randint(0, self.height // pixel_size) * pixel_size
+            fade_chance = rng.random()
+            spatial_fade = (x / self.width + y / self.height) / 2
+            if fade_chance < wake_progress + spatial_fade * 0.3:
+                p_color = rng.choice(pixel_colors)
+                p_alpha = int(rng.uniform(70, 160))
+                self._pixels_dirty.append(
+                    pygame.draw.rect(self._pixels, (*p_color, p_alpha), (x, y, pixel_size, pixel_size)))
+        self._pixels_dirty[:] = merge_rects(self._pixels_dirty)
+
+    def _stamp(self, key, build):
+        s = self._stamps.get(key)
+        if s is None:
+            s = build()
+            self._stamps[key] = s
+        return s
+
+    def _fragment_stamp(self, shape_type: int, size: int, rotation: float, pulse: float):
+        if shape_type == 0:
+            # Square has 90 degree symmetry: cache 15 rotation steps
+            step = int(rotation % 90) // 6
+            def build():
+                half = size // 2
+                base = pygame.Surface((size + 2, size + 2), pygame.SRCALPHA)
+                c = (size + 2) / 2
+                corners = [(c + math.cos(k * math.pi / 2) * half, c + math.sin(k * math.pi / 2) * half) for k in range(4)]
+                pygame.draw.polygon(base, (205, 185, 225), corners)
+                return pygame.transform.rotate(base, -step * 6)
+            return self._stamp(('sq', size, step), build)
+        if shape_type == 1:
+            half = int(size * pulse) // 2
+            def build():
+                d = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+                pygame.draw.polygon(d, (215, 195, 235), [(half, 0), (half * 2, half), (half, half * 2), (0, half)])
+                return d
+            return self._stamp(('dia', half), build)
+        if shape_type == 2:
+            def build():
+                glow = int(size * 1.3)
+                n = glow + 4
+                c = n // 2
+                s = pygame.Surface((n, n), pygame.SRCALPHA)
+                pygame.draw.line(s, (225, 205, 245, 128), (c - glow // 2, c), (c + glow // 2, c), 3)
+                pygame.draw.line(s, (225, 205, 245, 128), (c, c - glow // 2), (c, c + glow // 2), 3)
+                pygame.draw.line(s, (235, 215, 250), (c - size // 2, c), (c + size // 2, c), 1)
+                pygame.draw.line(s, (235, 215, 250), (c, c - size // 2), (c, c + size // 2), 1)
+                return s
+            return self._stamp(('cross', size), build)
+        def build():
+            s = pygame.Surface((size + 2, size + 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (215, 195, 235), ((size + 2) // 2, (size + 2) // 2), size // 2, 2)
+            return s
+        return self._stamp(('ring', size), build)
+
+    def _draw_fragments(self, screen, t, wake_progress):
+        """Floating memory fragments drawn from cached shape stamps."""
+        num_fragments = int(30 - 20 * wake_progress)
+        for i in range(max(6, num_fragments)):
+            base_y = ((i * 60 + t * 20) % (self.height + 120)) - 60
+            base_x = (i * 79) % self.width
+            frag_x = int(base_x + math.sin(t * 0.6 + i * 0.4) * 40)
+            frag_y = int(base_y - wake_progress * 120 + math.cos(t * 0.4 + i * 0.6) * 15)
+            frag_alpha = int(140 * (1 - wake_progress) * (1 - min(1.0, base_y / self.height)))
+            if frag_alpha <= 10:
+                continue
+            shape_type = i % 4
+            size = int(10 + (i % 6) * 4)
+            rotation = t * 20 + i * 30
+            pulse = 1 + 0.2 * math.sin(t * 2 + i)
+            stamp = self._fragment_stamp(shape_type, size, rotation, pulse)
+            stamp.set_alpha(min(255, frag_alpha))
+            screen.blit(stamp, stamp.get_rect(center=(frag_x, frag_y)))
+
+    def _mote_stamp(self, color, size: float, level: int):
+        halo, core = int(size * 2), int(size)
+        def build():
+            a = int(255 * (level + 1) / self.MOTE_ALPHA_LEVELS)
+            s = pygame.Surface((halo * 2 + 1, halo * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, a // 3), (halo, halo), halo)
+            pygame.draw.circle(s, (*color, a), (halo, halo), core)
+            return s
+        return self._stamp(('mote', color, halo, core, level), build), halo
+
+    def _draw_motes(self, screen, t, wake_progress):
+        """Light motes: same seeded layout as before, batched through `blits`."""
+        rng = random.Random(int(t * 25))
+        mote_colors = [(255, 250, 235), (250, 245, 225), (255, 248, 230), (245, 242, 220)]
+        blits = []
+        for _ in range(int(50 + 30 * wake_progress)):
+            mx = rng.randint(0, self.width)
+            my = rng.randint(0, self.height)
+            my_offset = int(t * 12 + rng.random() * 80) % (self.height + 40)
+            mx_sway = int(math.sin(t + my * 0.01) * 15)
+            my = (my + my_offset) % self.height
+            mx = (mx + mx_sway) % self.width
+            mote_size = rng.uniform(1.5, 4)
+            twinkle = math.sin(t * 3.5 + mx * 0.015 + my * 0.01) * 0.4 + 0.6
+            mote_alpha = rng.uniform(120, 220) * twinkle * wake_progress
+            m_color = rng.choice(mote_colors)
+            level = min(self.MOTE_ALPHA_LEVELS - 1, int(mote_alpha / 256 * self.MOTE_ALPHA_LEVELS))
+            if mote_alpha < 1:
+                continue
+            stamp, halo = self._mote_stamp(m_color, mote_size, level)
+            blits.append((stamp, (mx - halo, my - halo)))
+        screen.blits(blits, doreturn=False)
+    #endregion Phase 7: Awakening
@@ -8,12 +8,16 @@ fade-in/fade-out and lifetime.
 #region Imports
 import pygame
 import globals as g
-from src.utils.font import get_font
+from src.utils.font import get_font, render_text
 #endregion Imports
 
 
 class TextPopup:
-    """A small text bubble that can be anchored to a world position/entity."""
+    """A small text bubble that can be anchored to a world position/entity.
+
+    Bubble, pointer and text are composited once at creation; fading only
+    changes the composite's surface alpha and the anchor only moves the blit.
+    """
     def __init__(self, text: str, pos_fn, duration: float = 2.5,
                  fade: float = 0.3, color=(255, 255, 255), bg=(0, 0, 0),
                  padding: int = 6):
@@ -31,6 +35,22 @@ class TextPopup:
         self.padding = padding
         self.elapsed = 0.0
         self.font = get_font(28)
+        self._bubble, self._box_size = self._build()
+        self._alpha = None
+
+    def _build(self):
+        txt = render_text(self.font, self.text, self.color)
+        w = txt.get_width() + self.padding * 2
+        h = txt.get_height() + self.padding * 2
+        bubble = pygame.Surface((w, h + 7), pygame.SRCALPHA)
+        bg_col = (*self.bg, 180)
+        pygame.draw.rect(bubble, bg_col, (0, 0, w, h), border_radius=6)
+        # small pointer triangle below the bubble
+        tri = pygame.Surface((12, 8), pygame.SRCALPHA)
+        pygame.draw.polygon(tri, bg_col, [(0, 0), (12, 0), (6, 8)])
+        bubble.blit(tri, (w // 2 - 6, h - 1))
+        bubble.blit(txt, (self.padding, self.padding))
+        return bubble, (w, h)
 
     def update(self, dt: float):
         self.elapsed += dt
@@ -46,36 +66,19 @@ class TextPopup:
             a = max(0.0, min(1.0, t / self.fade))
         elif t > self.duration - self.fade:
             a = max(0.0, min(1.0, (self.duration - t) / self.fade))
+        alpha = int(255 * a)
+        if alpha != self._alpha:
+            self._bubble.set_alpha(alpha)
+            self._alpha = alpha
 
-        # Render text surface
-        txt = self.font.render(self.text, True, self.color)
-        rect = txt.get_rect()
-        rect.inflate_ip(self.padding * 2, self.padding * 2)
-
-        # Anchor position
+        # Anchor position: bubble centred above the anchor
         x, y = self.pos_fn()
-        rect.center = (int(x), int(y - 40))  # above anchor
-
-        # Draw background with alpha by drawing onto temporary surface
-        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
-        bg_col = (*self.bg, int(180 * a))
-        pygame.draw.rect(surf, bg_col, surf.get_rect(), border_radius=6)
-        # small pointer triangle
-        tri = pygame.Surface((12, 8), pygame.SRCALPHA)
-        pygame.draw.polygon(tri, bg_col, [(0, 0), (12, 0), (6, 8)])
-        # Blit
-        screen.blit(surf, rect.topleft)
-        # triangle below bubble
-        screen.blit(tri, (rect.centerx - 6, rect.bottom - 1))
-
-        # Draw text with alpha
-        txt_surf = txt.copy()
-        txt_surf.set_alpha(int(255 * a))
-        screen.blit(txt_surf, (rect.left + self.padding, rect.top + self.padding))
+        w, h = self._box_size
+        screen.blit(self._bubble, (int(x) - w // 2, int(y - 40) - h // 2))
 
 
 class Announcement:
-    """Centered announcement banner."""
+    """Centered announcement banner (composited once, faded via set_alpha)."""
     def __init__(self, text: str, duration: float = 2.5, fade: float = 0.4,
                  color=(255, 255, 255), bg=(0, 0, 0)):
         self.text = text
@@ -85,6 +88,15 @@ class Announcement:
         self.bg = bg
         self.elapsed = 0.0
         self.font = get_font(36)
+        txt = render_text(self.font, self.text, self.color)
+        rect = txt.get_rect()
+        rect.inflate_ip(20, 12)
+        rect.center = (g.SCREENWIDTH // 2, int(g.SCREENHEIGHT * 0.22))
+        self._rect = rect
+        self._banner = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._banner, (*self.bg, 160), self._banner.get_rect(), border_radius=8)
+        self._banner.blit(txt, (10, 6))
+        self._alpha = None
 
     def update(self, dt: float):
         self.elapsed += dt
@@ -99,20 +111,11 @@ class Announcement:
             a = max(0.0, min(1.0, t / self.fade))
         elif t > self.duration - self.fade:
             a = max(0.0, min(1.0, (self.duration - t) / self.fade))
-
-        txt = self.font.render(self.text, True, self.color)
-        rect = txt.get_rect()
-        rect.inflate_ip(20, 12)
-        rect.center = (g.SCREENWIDTH // 2, int(g.SCREENHEIGHT * 0.22))
-
-        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
-        bg_col = (*self.bg, int(160 * a))
-        pygame.draw.rect(surf, bg_col, surf.get_rect(), border_radius=8)
-        screen.blit(surf, rect.topleft)
-
-        txt_surf = txt.copy()
-        txt_surf.set_alpha(int(255 * a))
-        screen.blit(txt_surf, (rect.left + 10, rect.top + 6))
+        alpha = int(255 * a)
+        if alpha != self._alpha:
+            self._banner.set_alpha(alpha)
+            self._alpha = alpha
+        screen.blit(self._banner, self._rect.topleft)
 
 
 class UIManager:
@@ -171,18 +174,18 @@ def draw_health_bar(screen, current, maximum, x, y, width, height, label, icon=N
 
     pygame.draw.rect(screen, g.COLORS.get('ui_text', (255, 255, 255)), (x, y, width, height), 2, border_radius=4)
 
-    value_surf = font.render(f"{int(current)}/{int(maximum)}", True, g.COLORS.get('ui_text', (255, 255, 255)))
+    value_surf = render_text(font, f"{int(current)}/{int(maximum)}", g.COLORS.get('ui_text', (255, 255, 255)))
     label_x = x + 6
     if icon:
         pygame.draw.circle(screen, icon_color, (x - 10, y + height // 2), height // 2 + 4)
-        icon_surf = font.render(icon, True, (0, 0, 0))
+        icon_surf = render_text(font, icon, (0, 0, 0))
         icon_rect = icon_surf.get_rect(center=(x - 10, y + height // 2))
         screen.blit(icon_surf, icon_rect)
         label_x = x + 10
     # Only draw the textual label if provided (non-empty). Some HUDs may want
     # to omit the redundant "Boss" label above the health bar.
     if label:
-        label_surf = font.render(str(label), True, g.COLORS.get('ui_text', (255, 255, 255)))
+        label_surf = render_text(font, str(label), g.COLORS.get('ui_text', (255, 255, 255)))
         screen.blit(label_surf, (label_x, y - 22))
     screen.blit(value_surf, (x + width - value_surf.get_width() - 6, y - 22))
 
@@ -207,7 +210,7 @@ def draw_meter_bar(screen, current, maximum, x, y, width, height, label,
 
     # Render the label to the left of the meter bar for clarity. If there
     # isn't enough room to the left, fall back to placing it above the bar.
-    label_surf = font.render(str(label), True, g.COLORS.get('ui_text', (255, 255, 255)))
+    label_surf = render_text(font, str(label), g.COLORS.get('ui_text', (255, 255, 255)))
     label_x = x - label_surf.get_width() - 8
     if label_x < 6:
         # Not enough left-side room; place above the bar as a fallback
@@ -232,17 +235,17 @@ def draw_game_over_screen(screen, boss_scene):
     boss_defeated = getattr(boss_scene, 'boss', None) and boss_scene.boss.health <= 0
     
     if player_defeated:
-        title = title_font.render("DEFEAT", True, g.COLORS.get('ui_health_low'))
+        title = render_text(title_font, "DEFEAT", g.COLORS.get('ui_health_low'))
         sub_text = "Press R to restart"
     elif boss_defeated:
-        title = title_font.render("VICTORY!", True, g.COLORS.get('ui_health_high'))
+        title = render_text(title_font, "VICTORY!", g.COLORS.get('ui_health_high'))
         sub_text = "Press SPACE to continue"
     else:
-        title = title_font.render("GAME OVER", True, g.COLORS.get('ui_text'))
+        title = render_text(title_font, "GAME OVER", g.COLORS.get('ui_text'))
         sub_text = "Press R to restart"
 
     screen.blit(title, title.get_rect(center=(g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2 - 20)))
-    sub = small_font.render(sub_text, True, g.COLORS.get('ui_text'))
+    sub = render_text(small_font, sub_text, g.COLORS.get('ui_text'))
     screen.blit(sub, sub.get_rect(center=(g.SCREENWIDTH // 2, g.SCREENHEIGHT // 2 + 40)))
 
 
@@ -251,106 +254,186 @@ def _format_time(seconds):
     return f"{seconds // 60:02}:{seconds % 60:02}"
 
 
-def _draw_status_pill(screen, text, pos, color):
+def _render_status_pill(text, color):
     font = get_font(24)
-    surf = font.render(text, True, (10, 10, 10))
+    surf = render_text(font, text, (10, 10, 10))
     padding = 10
     pill = pygame.Surface((surf.get_width() + padding * 2, surf.get_height() + 8), pygame.SRCALPHA)
     pygame.draw.rect(pill, color, pill.get_rect(), border_radius=12)
     pill.blit(surf, (padding, 4))
+    return pill
+
+
+def _draw_status_pill(screen, text, pos, color):
+    pill = _render_status_pill(text, color)
     screen.blit(pill, pill.get_rect(midtop=pos))
 
 
-def draw_ui_overlay(screen, boss_scene):
-    """Stylized HUD overlay for all boss scenes."""
-    margin = 28
-    bar_height = 24
-
-    # Player pane (top-left)
-    if getattr(boss_scene, 'player', None):
-        pane_width = 320
-        pane_rect = pygame.Rect(14, 14, pane_width, 90)
-        _draw_shadow_box(screen, pane_rect, alpha=180, radius=12)
-        draw_health_bar(
-            screen,
-            boss_scene.player.health,
-            boss_scene.player.max_health,
-            pane_rect.x + 40,
-            pane_rect.y + 30,
-            pane_width - 60,
-            bar_height,
-            "Aria",
-            icon="P",
-            icon_color=(80, 180, 255)
-        )
-
-    # Boss pane (top-center)
-    boss = getattr(boss_scene, 'boss', None)
-    if boss:
-        pane_width = 600
-        pane_rect = pygame.Rect((g.SCREENWIDTH - pane_width) // 2, 14, pane_width, 110)
-        _draw_shadow_box(screen, pane_rect, alpha=180, radius=18)
-
-        boss_name = getattr(boss, 'display_name', None) or getattr(boss, 'name', '') or boss.__class__.__name__
-        base_name = str(boss_name).replace('_', ' ')
-        title_font = get_font(32)
-        suffix_font = get_font(18)
+def _bar_state(current, maximum, width):
+    """What a health/meter bar looks like: fill width and colour band."""
+    maximum = max(1.0, float(maximum) if maximum else 1.0)
+    pct = max(0.0, min(1.0, float(current) / maximum))
+    return int(width * pct), pct > 0.6, pct > 0.3
+
+
+def _offscreen(rect, draw):
+    """Run `draw(surface, ox, oy)` on a transparent surface covering screen `rect`.
+
+    ox/oy translate screen coordinates into the surface, so the immediate-mode
+    helpers above can render into a widget unchanged.
+    """
+    surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+    draw(surf, -rect.x, -rect.y)
+    return surf
+
+
+class HudWidget:
+    """One cached piece of the HUD, re-rendered only when its key changes.
+
+    key: the values the widget shows (e.g. HP and fill width); anything equal
+    to last frame's key reuses the cached surface.
+    """
+    def __init__(self):
+        self.key = None
+        self.surface = None
+        self.renders = 0
+
+    def get(self, key, render) -> pygame.Surface:
+        if self.surface is None or key != self.key:
+            self.key = key
+            self.surface = render()
+            self.renders += 1
+        return self.surface
+
+
+class HUD:
+    """Retained-mode boss-fight HUD (player pane, boss pane, footer).
+
+    Panels, bars, meters and the phase pill are widgets whose surfaces are
+    rebuilt only when the value they display changes; a steady frame is a
+    handful of blits.
+    """
+    BAR_HEIGHT = 24
+    FOOTER_HEIGHT = 52
+    CONTROLS = "WASD move  |  W jump (double)  |  Left Click shoot  |  R restart  |  ESC exit"
+
+    def __init__(self):
+        self._widgets = {}
+
+    def widget(self, name) -> HudWidget:
+        w = self._widgets.get(name)
+        if w is None:
+            w = self._widgets[name] = HudWidget()
+        return w
+
+    def _shadow(self, name, rect, alpha, radius):
+        return self.widget(name).get(
+            (tuple(rect), alpha, radius),
+            lambda: _offscreen(rect, lambda s, ox, oy: _draw_shadow_box(s, rect.move(ox, oy), alpha, radius)))
+
+    def _health_bar(self, name, current, maximum, x, y, width, label, icon, icon_color):
+        h = self.BAR_HEIGHT
+        rect = pygame.Rect(x - 30, y - 24, width + 34, h + 28)
+        key = (int(max(0.0, float(current))), int(max(1.0, float(maximum))),
+               _bar_state(max(0.0, float(current)), maximum, width), x, y, width, label)
+        return self.widget(name).get(key, lambda: _offscreen(rect, lambda s, ox, oy: draw_health_bar(
+            s, current, maximum, x + ox, y + oy, width, h, label, icon=icon, icon_color=icon_color))), rect
+
+    def _meter_bar(self, name, current, maximum, x, y, width, height, label, color):
+        rect = pygame.Rect(x - 120, y - 20, width + 124, height + 22)
+        key = (_bar_state(current, maximum, width), x, y, width, label, color)
+        return self.widget(name).get(key, lambda: _offscreen(rect, lambda s, ox, oy: draw_meter_bar(
+            s, current, maximum, x + ox, y + oy, width, height, label, color_high=color))), rect
+
+    def draw(self, screen, boss_scene):
+        blits = []
+        bar_height = self.BAR_HEIGHT
+
+        # Player pane (top-left)
+        player = getattr(boss_scene, 'player', None)
+        if player:
+            pane_width = 320
+            pane_rect = pygame.Rect(14, 14, pane_width, 90)
+            blits.append((self._shadow('player_pane', pane_rect, 180, 12), pane_rect.topleft))
+            surf, rect = self._health_bar('player_hp', player.health, player.max_health,
+                                          pane_rect.x + 40, pane_rect.y + 30, pane_width - 60,
+                                          "Aria", "P", (80, 180, 255))
+            blits.append((surf, rect.topleft))
+
+        # Boss pane (top-center)
+        boss = getattr(boss_scene, 'boss', None)
+        if boss:
+            pane_width = 600
+            pane_rect = pygame.Rect((g.SCREENWIDTH - pane_width) // 2, 14, pane_width, 110)
+            blits.append((self._shadow('boss_pane', pane_rect, 180, 18), pane_rect.topleft))
+
+            boss_name = getattr(boss, 'display_name', None) or getattr(boss, 'name', '') or boss.__class__.__name__
+            base_name = str(boss_name).replace('_', ' ')
+            blits.append((self.widget('boss_title').get(base_name, lambda: self._render_title(base_name)),
+                          (pane_rect.x + 20, pane_rect.y + 6)))
+
+            # The boss name is already in the title, so the bar has no label
+            surf, rect = self._health_bar('boss_hp', boss.health, boss.max_health,
+                                          pane_rect.x + 20, pane_rect.y + 42, pane_width - 40,
+                                          "", "B", (220, 120, 120))
+            blits.append((surf, rect.topleft))
+
+            meter_y = pane_rect.y + 42 + bar_height + 18
+            meters = []
+            if hasattr(boss, 'stress') and hasattr(boss, 'max_stress'):
+                # Only show stress meter if boss is alive
+                if boss.health > 0:
+                    meters.append((boss.stress, boss.max_stress, "Stress", (220, 120, 120)))
+            if hasattr(boss, 'deadline_left') and hasattr(boss, 'deadline_total'):
+                meters.append((boss.deadline_left, boss.deadline_total, "Deadline", (120, 200, 180)))
+            meter_width = (pane_width - 60)
+            for idx, (curr, maximum, label, color) in enumerate(meters):
+                surf, rect = self._meter_bar(f"meter_{label}", curr, max(0.01, maximum), pane_rect.x + 30,
+                                             meter_y + idx * 22, meter_width, 16, label, color)
+                blits.append((surf, rect.topleft))
+
+            # Status pill (phase/enrage etc.)
+            if hasattr(boss, 'phase'):
+                pill_color = (200, 120, 255) if getattr(boss, 'enraged', False) else (140, 200, 255)
+                text = f"Phase {getattr(boss, 'phase', 1)}"
+                pill = self.widget('pill').get((text, pill_color), lambda: _render_status_pill(text, pill_color))
+                blits.append((pill, pill.get_rect(midtop=(pane_rect.centerx, pane_rect.bottom - 16))))
+
+        # Bottom reading (controls + timers)
+        footer_rect = pygame.Rect(0, g.SCREENHEIGHT - self.FOOTER_HEIGHT, g.SCREENWIDTH, self.FOOTER_HEIGHT)
+        blits.append((self._shadow('footer', footer_rect, 200, 0), footer_rect.topleft))
+        # Text over a translucent panel is blitted separately: compositing it
+        # into the panel first would blend its antialiased edges differently
+        blits.append((render_text(get_font(24), self.CONTROLS, (230, 230, 230)),
+                      (40, g.SCREENHEIGHT - self.FOOTER_HEIGHT + 12)))
+
+        # Right-aligned runtime info (without FPS); cached per distinct string
+        runtime = _format_time(getattr(boss_scene, 'elapsed_time', pygame.time.get_ticks() / 1000))
+        info_surf = render_text(get_font(22), f"Time: {runtime}", (200, 200, 200))
+        blits.append((info_surf, info_surf.get_rect(bottomright=(g.SCREENWIDTH - 40, g.SCREENHEIGHT - 12))))
+
+        screen.blits(blits, doreturn=False)
+
+    def _render_title(self, base_name):
         # Render the main name and a smaller 'Boss' suffix so the label is less
         # visually dominant.
-        name_surf = title_font.render(base_name, True, (230, 230, 230))
-        name_pos = (pane_rect.x + 20, pane_rect.y + 6)
-        screen.blit(name_surf, name_pos)
-        suffix_surf = suffix_font.render("Boss", True, (200, 200, 200))
-        suffix_x = name_pos[0] + name_surf.get_width() + 8
-        suffix_y = name_pos[1] + (name_surf.get_height() - suffix_surf.get_height()) // 2
-        screen.blit(suffix_surf, (suffix_x, suffix_y))
-
-        # Omit the textual label above the boss health bar (we already show the
-        # boss name in the title area). Keep the icon and numeric readout.
-        draw_health_bar(
-            screen,
-            boss.health,
-            boss.max_health,
-            pane_rect.x + 20,
-            pane_rect.y + 42,
-            pane_width - 40,
-            bar_height,
-            "",
-            icon="B",
-            icon_color=(220, 120, 120)
-        )
-
-        meter_y = pane_rect.y + 42 + bar_height + 18
-        meters = []
-        if hasattr(boss, 'stress') and hasattr(boss, 'max_stress'):
-            # Only show stress meter if boss is alive
-            if boss.health > 0:
-                meters.append((boss.stress, boss.max_stress, "Stress", (220, 120, 120)))
-        if hasattr(boss, 'deadline_left') and hasattr(boss, 'deadline_total'):
-            meters.append((boss.deadline_left, boss.deadline_total, "Deadline", (120, 200, 180)))
-        meter_width = (pane_width - 60)
-        for idx, (curr, maximum, label, color) in enumerate(meters):
-            draw_meter_bar(screen, curr, max(0.01, maximum), pane_rect.x + 30, meter_y + idx * 22, meter_width, 16, f"{label}", color_high=color)
-
-        # Status pill (phase/enrage etc.)
-        if hasattr(boss, 'phase'):
-            pill_color = (200, 120, 255) if getattr(boss, 'enraged', False) else (140, 200, 255)
-            _draw_status_pill(screen, f"Phase {getattr(boss, 'phase', 1)}", (pane_rect.centerx, pane_rect.bottom - 16), pill_color)
-
-    # Bottom reading (controls + timers)
-    footer_height = 52
-    footer_rect = pygame.Rect(0, g.SCREENHEIGHT - footer_height, g.SCREENWIDTH, footer_height)
-    _draw_shadow_box(screen, footer_rect, alpha=200, radius=0)
-    font = get_font(24)
-    controls = "WASD move  |  W jump (double)  |  Left Click shoot  |  R restart  |  ESC exit"
-    screen.blit(font.render(controls, True, (230, 230, 230)), (40, g.SCREENHEIGHT - footer_height + 12))
+        name_surf = render_text(get_font(32), base_name, (230, 230, 230))
+        suffix_surf = render_text(get_font(18), "Boss", (200, 200, 200))
+        surf = pygame.Surface((name_surf.get_width() + 8 + suffix_surf.get_width(), name_surf.get_height()),
+                              pygame.SRCALPHA)
+        surf.blit(name_surf, (0, 0))
+        surf.blit(suffix_surf, (name_surf.get_width() + 8, (name_surf.get_height() - suffix_surf.get_height()) // 2))
+        return surf
+
 
-    # Right-aligned runtime info (without FPS)
-    info_font = get_font(22)
-    runtime = _format_time(getattr(boss_scene, 'elapsed_time', pygame.time.get_ticks() / 1000))
-    info_text = f"Time: {runtime}"
-    info_surf = info_font.render(info_text, True, (200, 200, 200))
-    screen.blit(info_surf, info_surf.get_rect(bottomright=(g.SCREENWIDTH - 40, g.SCREENHEIGHT - 12)))
+_default_hud = HUD()
 
-    # Debug text intentionally removed per latest UI direction.
 
+def draw_ui_overlay(screen, boss_scene):
+    """Stylized HUD overlay for all boss scenes.
+
+    Draws the scene's retained `hud` (a `HUD`); scenes without one share a
+    module-level instance.
+    """
+    hud = getattr(boss_scene, 'hud', None) or _default_hud
+    hud.draw(screen, boss_scene)
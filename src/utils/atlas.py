@@ -0,0 +1,149 @@
+"""
+Runtime lookup for the texture atlas built by `scripts/build_atlas.py`.
+
+The build step packs the images each scene loads into per-scene pages under
+assets/atlas/ with a JSON manifest of sub-rects. `load_image` hands out
+subsurfaces of those pages: each page is decoded once, on first use, and
+every image cut from it shares its pixels. Sprite sheets packed frame by
+frame are put back together into one surface. Images that are not in the
+atlas, or whose source file changed since the atlas was built, are loaded
+directly (once per process).
+
+Large art is stored downscaled in the atlas. Callers that only draw it at a
+reduced size say so with `draw_size`; everyone else gets the full-size file.
+
+Returned surfaces are shared: copy() them before drawing onto them.
+"""
+import hashlib
+import json
+import os
+from typing import Optional, Tuple
+
+import pygame
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+ATLAS_DIR = os.path.join(ROOT, 'assets', 'atlas')
+MANIFEST_NAME = 'atlas.json'
+MANIFEST_VERSION = 2
+
+
+def asset_key(path: str) -> str:
+    """Manifest key for `path`: repo-relative with forward slashes."""
+    return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, '/')
+
+
+class Atlas:
+    """Atlas pages and the images cut from them, loaded lazily."""
+    def __init__(self, directory: str = ATLAS_DIR):
+        self.directory = directory
+        self._manifest = None
+        self._pages = {}
+        self._images = {}  # (key, 'atlas' | 'file') -> surface
+        self._lookups = {}  # (key, draw_size) -> surface, skips the staleness check
+        self._fresh = {}  # key -> whether the source still matches the manifest
+
+    def clear(self):
+        self._manifest = None
+        self._pages.clear()
+        self._images.clear()
+        self._lookups.clear()
+        self._fresh.clear()
+
+    def manifest(self) -> dict:
+        """Parsed manifest; empty if it is missing, unreadable or from another version."""
+        if self._manifest is None:
+            manifest = {'pages': [], 'sprites': {}}
+            try:
+                with open(os.path.join(self.directory, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    manifest = data
+            except (OSError, ValueError, AttributeError):
+                pass
+            self._manifest = manifest
+        return self._manifest
+
+    def entry(self, path: str) -> Optional[dict]:
+        return self.manifest()['sprites'].get(asset_key(path))
+
+    def _page(self, index: int) -> pygame.Surface:
+        page = self._pages.get(index)
+        if page is None:
+            name = self.manifest()['pages'][index]
+            page = pygame.image.load(os.path.join(self.directory, name)).convert_alpha()
+            self._pages[index] = page
+        return page
+
+    def _is_fresh(self, key: str, path: str, entry: dict) -> bool:
+        """Whether the source file still holds what was packed (size + mtime, else sha1)."""
+        fresh = self._fresh.get(key)
+        if fresh is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                fresh = True  # shipped without sources: the atlas is all there is
+            else:
+                fresh = st.st_size == entry['bytes']
+                if fresh and st.st_mtime != entry.get('mtime'):
+                    # touched since the build (e.g. a fresh checkout): compare the content
+                    with open(path, 'rb') as f:
+                        fresh = hashlib.sha1(f.read()).hexdigest() == entry['sha1']
+            self._fresh[key] = fresh
+        return fresh
+
+    def _usable(self, key: str, path: str, entry: dict, draw_size) -> bool:
+        if 'rect' in entry:
+            w, h = entry['rect'][2:]
+            if [w, h] != list(entry['source_size']):
+                # downscaled: only good enough for callers drawing it no larger than stored
+                if draw_size is None or draw_size[0] > w or draw_size[1] > h:
+                    return False
+        return self._is_fresh(key, path, entry)
+
+    def _assemble(self, entry: dict) -> pygame.Surface:
+        """Sheet packed frame by frame, copied back into one surface."""
+        frames = entry['frames']
+        sheet = pygame.Surface(tuple(entry['source_size']), pygame.SRCALPHA, self._page(frames[0][0]))
+        sheet.fill((0, 0, 0, 0))
+        for page, x, y, w, h, dx in frames:
+            # MAX onto a cleared surface copies the pixels exactly
+            sheet.blit(self._page(page), (dx, 0), pygame.Rect(x, y, w, h), special_flags=pygame.BLEND_RGBA_MAX)
+        return sheet
+
+    def image(self, path: str, draw_size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Shared surface for the image at `path`.
+
+        draw_size: the largest (w, h) the caller draws this image at; allows a
+        downscaled atlas copy. Raises like `pygame.image.load` when the file is
+        neither in the atlas nor on disk.
+        """
+        key = asset_key(path)
+        lookup = (key, tuple(draw_size) if draw_size is not None else None)
+        image = self._lookups.get(lookup)
+        if image is not None:
+            return image
+        entry = self.manifest()['sprites'].get(key)
+        if entry is not None and self._usable(key, path, entry, draw_size):
+            source = (key, 'atlas')
+            image = self._images.get(source)
+            if image is None:
+                if 'frames' in entry:
+                    image = self._assemble(entry)
+                else:
+                    image = self._page(entry['page']).subsurface(pygame.Rect(entry['rect']))
+        else:
+            source = (key, 'file')
+            image = self._images.get(source)
+            if image is None:
+                image = pygame.image.load(path).convert_alpha()
+        self._images[source] = image
+        self._lookups[lookup] = image
+        return image
+
+
+atlas = Atlas()
+
+
+def load_image(path: str, draw_size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """Shared, converted image for `path` (see `Atlas.image`)."""
+    return atlas.image(path, draw_size)
@@ -6,22 +6,46 @@ The original helper was moved to `combine/font.py` to make lightweight
 """
 try:
     # Prefer the moved helper in combine/ (used by combine runner)
-    from combine.font import get_font, draw_text, get_font_path
+    from combine.font import (get_font, draw_text, get_font_path, font_registry,
+                              render_text, text_cache, glyph_atlas, get_font_from)
 except Exception:
     # Fall back to minimal in-place implementations to avoid hard failures
     import pygame
 
+    font_registry = None
+    text_cache = None
+    glyph_atlas = None
+    _fonts = {}
+    _glyphs = {}
+
     def get_font_path():
         return None
 
-    def get_font(size: int):
-        try:
-            return pygame.font.Font(None, size)
-        except Exception:
-            raise
+    def get_font(size: int, bold: bool = False, italic: bool = False):
+        key = (size, bold, italic)
+        if key not in _fonts:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            _fonts[key] = font
+        return _fonts[key]
+
+    def get_font_from(path, size: int, bold: bool = False, italic: bool = False, sysfont=None):
+        return get_font(size, bold, italic)
+
+    def render_text(font, text, color, antialias=True, background=None):
+        if background is None:
+            return font.render(text, antialias, color)
+        return font.render(text, antialias, color, background)
+
+    def _glyph(font, ch, color):
+        key = (font, ch, tuple(color))
+        if key not in _glyphs:
+            _glyphs[key] = font.render(ch, True, color)
+        return _glyphs[key]
 
-    def draw_text(surface, font, text, color, pos, spacing=0, align='center'):
-        glyphs = [font.render(ch, True, color) for ch in text]
+    def draw_text(surface, font, text, color, pos, spacing=0, align='center', count=None):
+        glyphs = [_glyph(font, ch, color) for ch in text]
         total_width = sum(g.get_width() for g in glyphs) + max(0, (len(glyphs) - 1)) * spacing
         height = max((g.get_height() for g in glyphs), default=font.get_height())
         if align == 'center':
@@ -31,6 +55,7 @@ except Exception:
             start_x = int(pos[0])
             y = int(pos[1])
         x = start_x
-        for gsurf in glyphs:
+        for gsurf in glyphs[:count]:
             surface.blit(gsurf, (x, y))
             x += gsurf.get_width() + spacing
+        return pygame.Rect(start_x, y, total_width, height)
@@ -1,15 +1,25 @@
 import pygame
 import os
-from typing import List
+import io
+import json
+import hashlib
+from typing import List, Optional
+
+# Sliced frames per (path, mtime), shared by every caller in this process
+_STRIP_CACHE = {}
+# Detected rects are persisted here, next to the image, keyed by its content hash
+SLICE_CACHE_DIRNAME = '__slicecache__'
+SLICE_CACHE_VERSION = 1
 
 class SpriteSheet:
     """
     Utility class to load and slice sprite sheets.
     Supports automatic slicing using mask detection (connected components).
     """
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, data: Optional[bytes] = None):
         try:
-            self.sheet = pygame.image.load(filename).convert_alpha()
+            source = io.BytesIO(data) if data is not None else filename
+            self.sheet = pygame.image.load(source, filename).convert_alpha()
         except FileNotFoundError:
             print(f"ERROR: Sprite sheet not found: {filename}")
             # Create a placeholder surface (magenta)
@@ -22,10 +32,10 @@ class SpriteSheet:
         image.blit(self.sheet, (0, 0), (x, y, width, height))
         return image
 
-    def auto_slice(self) -> List[pygame.Surface]:
+    def detect_rects(self) -> List[pygame.Rect]:
         """
-        Automatically detects sprites in the sheet using pygame.mask.
-        Returns a list of surfaces, sorted left-to-right.
+        Finds the sprites in the sheet using pygame.mask connected components.
+        Returns their bounding rects sorted top-to-bottom, then left-to-right.
         """
         mask = pygame.mask.from_surface(self.sheet)
         # get_bounding_rects returns a list of Rects for connected components
@@ -34,21 +44,72 @@ class SpriteSheet:
         # Sort rects: top-to-bottom, then left-to-right
         rects.sort(key=lambda r: (r.y, r.x))
         
-        sprites = []
-        for rect in rects:
-            # Filter out tiny noise if necessary
-            if rect.width > 1 and rect.height > 1:
-                sprites.append(self.get_image(rect.x, rect.y, rect.width, rect.height))
-        
-        return sprites
+        # Filter out tiny noise if necessary
+        return [rect for rect in rects if rect.width > 1 and rect.height > 1]
+
+    def auto_slice(self, rects: Optional[List[pygame.Rect]] = None) -> List[pygame.Surface]:
+        """
+        Automatically detects sprites in the sheet using pygame.mask.
+        Returns a list of surfaces, sorted left-to-right.
+        `rects` skips the detection (e.g. rects cached from an earlier run).
+        """
+        if rects is None:
+            rects = self.detect_rects()
+        return [self.get_image(*rect) for rect in rects]
+
+def _slice_cache_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, SLICE_CACHE_DIRNAME, name + '.json')
+
+
+def _read_slice_cache(path: str, digest: str) -> Optional[List[pygame.Rect]]:
+    """Rects stored for this image content, or None if missing/stale/unreadable."""
+    try:
+        with open(_slice_cache_path(path), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != SLICE_CACHE_VERSION or meta.get('hash') != digest:
+            return None
+        return [pygame.Rect(r) for r in meta['rects']]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_slice_cache(path: str, digest: str, rects: List[pygame.Rect]):
+    """Best effort: a read-only asset folder just means no sidecar."""
+    cache_path = _slice_cache_path(path)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SLICE_CACHE_VERSION, 'hash': digest,
+                       'rects': [list(r) for r in rects]}, f)
+    except OSError:
+        pass
+
 
 def load_animation_strip(path: str) -> List[pygame.Surface]:
     """
     Loads an image file and auto-slices it into frames.
+
+    Frames are memoized per path (until the file changes), so repeated calls
+    return the same surfaces; treat them as read-only. The detected rects are
+    stored in a JSON sidecar keyed by the image hash, so later runs skip the
+    connected-component analysis.
     """
     if not os.path.exists(path):
         print(f"Warning: Animation file not found: {path}")
         return []
-        
-    sheet = SpriteSheet(path)
-    return sheet.auto_slice()
+
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    frames = _STRIP_CACHE.get(key)
+    if frames is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        sheet = SpriteSheet(path, data)
+        rects = _read_slice_cache(path, digest)
+        if rects is None:
+            rects = sheet.detect_rects()
+            _write_slice_cache(path, digest, rects)
+        frames = sheet.auto_slice(rects)
+        _STRIP_CACHE[key] = frames
+    return list(frames)
@@ -9,10 +9,19 @@ import sys
 import os
 import math
 import random
+import numpy as np
 import globals as g
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.systems.animation import Animator, clip_store
+from src.systems.camera import Camera
+from src.systems.particles import ParticleEmitter
+from src.systems.render_target import RenderTargetPool
+from src.systems.dirty_rects import DirtyRectRenderer
+from src.systems.dialogue import DialogueBox as BaseDialogueBox
+from src.utils.font import get_font_from
+
 # --------------------------
 # Configuration
 # --------------------------
@@ -50,27 +59,24 @@ class Character:
         self.x = x
         self.y = y
         self.speed = 120.0
-        self.sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-        self.frames = self._load_frames()
+        self.clips = self._load_clips(sprite_path)
         self.direction = 'down'
         self.is_moving = False
-        self.frame_index = 0
-        self.animation_timer = 0.0
+        self.animator = Animator(self.clips['down']['idle'])
+        self.idle_timer = 0.0
         self.collision_width = 16
         self.collision_height = 12
     
-    def _load_frames(self) -> dict:
-        frames = {}
+    def _load_clips(self, sprite_path: str) -> dict:
+        """Idle (column 0) and walk (columns 1-8) clips per direction, shared across rooms."""
+        size = (int(CHAR_FRAME_WIDTH * CHAR_SCALE), int(CHAR_FRAME_HEIGHT * CHAR_SCALE))
+        clips = {}
         for dir_name, row in DIRECTION_MAP.items():
-            frames[dir_name] = []
-            for col in range(9):
-                rect = pygame.Rect(col * CHAR_FRAME_WIDTH, row * CHAR_FRAME_HEIGHT,
-                                   CHAR_FRAME_WIDTH, CHAR_FRAME_HEIGHT)
-                frame = self.sprite_sheet.subsurface(rect)
-                scaled = pygame.transform.scale(frame,
-                    (int(CHAR_FRAME_WIDTH * CHAR_SCALE), int(CHAR_FRAME_HEIGHT * CHAR_SCALE)))
-                frames[dir_name].append(scaled)
-        return frames
+            sheet_row = clip_store.grid(sprite_path, (CHAR_FRAME_WIDTH, CHAR_FRAME_HEIGHT), 9,
+                                        origin=(0, row * CHAR_FRAME_HEIGHT), size=size,
+                                        duration=ANIMATION_SPEED)
+            clips[dir_name] = {'idle': sheet_row.sub(0, 1), 'walk': sheet_row.sub(1)}
+        return clips
     
     def update(self, dt: float, dx: float, dy: float, collision_check=None):
         if dx != 0 or dy != 0:
@@ -91,18 +97,16 @@ class Character:
         else:
             self.is_moving = False
         
-        # Smoother animation: always update timer, gradually return to idle
-        self.animation_timer += dt
+        # Smoother animation: turning keeps the walk phase, stopping returns to idle after a beat
         if self.is_moving:
-            if self.animation_timer >= ANIMATION_SPEED:
-                self.animation_timer -= ANIMATION_SPEED
-                self.frame_index = (self.frame_index % 8) + 1
+            self.idle_timer = 0.0
+            self.animator.play(self.clips[self.direction]['walk'], keep_phase=True)
+            self.animator.update(dt)
         else:
             # Smoothly transition to idle frame
-            if self.animation_timer >= ANIMATION_SPEED * 2:
-                self.animation_timer = 0
-                if self.frame_index != 0:
-                    self.frame_index = 0
+            self.idle_timer += dt
+            if self.idle_timer >= ANIMATION_SPEED * 2:
+                self.animator.play(self.clips[self.direction]['idle'])
     
     def _get_direction(self, dx, dy):
         if dx > 0 and dy > 0: return 'down_right'
@@ -115,10 +119,12 @@ class Character:
         return 'up'
     
     def draw(self, surface, camera_x=0, camera_y=0):
-        frame = self.frames[self.direction][self.frame_index]
+        drawn = []
+        frame = self.animator.frame
         draw_x = self.x - camera_x - frame.get_width() // 2
         draw_y = self.y - camera_y - frame.get_height() + self.collision_height
-        surface.blit(frame, (draw_x, draw_y))
+        drawn.append(surface.blit(frame, (draw_x, draw_y)))
+        return drawn
     
     def get_tile_pos(self):
         return (int(self.x // TILE_SIZE), int(self.y // TILE_SIZE))
@@ -132,18 +138,19 @@ class DreamEffect:
         self.static_intensity = 0
         self.flash_alpha = 0
         self.flash_color = (255, 255, 255)
-        self.screen_shake = 0
-        self.shake_intensity = 0
-        self.particles = []
-        for _ in range(30):
-            self.particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'speed': random.uniform(10, 30),
-                'size': random.randint(1, 3),
-                'alpha': random.randint(50, 120),
-                'color': random.choice([(200, 180, 255), (255, 200, 220), (180, 255, 220)])
-            })
+        self.camera = Camera()
+        # static noise is rasterised at 1/g.RENDER_SCALE; the flash is one uniform fill
+        self._targets = RenderTargetPool(alpha=True)
+        self._flash = None
+        self._vignette = None
+        self.particles = ParticleEmitter(capacity=30, palette=[(200, 180, 255), (255, 200, 220), (180, 255, 220)])
+        n = 30
+        self.particles.emit(n,
+                            x=self.particles.uniform(0, self.screen_width, n),
+                            y=self.particles.uniform(0, self.screen_height, n),
+                            vy=-self.particles.uniform(10, 30, n),
+                            size=self.particles.uniform(1, 3, n),
+                            alpha=self.particles.uniform(50, 120, n))
     
     def trigger_static(self, duration=0.5):
         self.static_timer = duration
@@ -154,14 +161,10 @@ class DreamEffect:
         self.flash_alpha = alpha
     
     def shake(self, duration=0.3, intensity=5):
-        self.screen_shake = duration
-        self.shake_intensity = intensity
+        self.camera.shake(duration, intensity)
     
     def get_shake_offset(self):
-        if self.screen_shake > 0:
-            return (random.uniform(-self.shake_intensity, self.shake_intensity),
-                    random.uniform(-self.shake_intensity, self.shake_intensity))
-        return (0, 0)
+        return self.camera.shake_offset
     
     def update(self, dt):
         if self.static_timer > 0:
@@ -171,100 +174,71 @@ class DreamEffect:
             self.static_intensity = 0
         if self.flash_alpha > 0:
             self.flash_alpha = max(0, self.flash_alpha - 300 * dt)
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
-        for p in self.particles:
-            p['y'] -= p['speed'] * dt
-            p['x'] += math.sin(p['y'] * 0.02) * 0.5
-            if p['y'] < -10:
-                p['y'] = self.screen_height + 10
-                p['x'] = random.randint(0, self.screen_width)
+        self.camera.update(dt)
+        self.particles.update(dt)
+        x, y = self.particles.view('x'), self.particles.view('y')
+        x += np.sin(y * 0.02) * 0.5
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = self.screen_height + 10
+            x[wrapped] = self.particles.uniform(0, self.screen_width, int(wrapped.sum()))
+    
+    def is_fullscreen_active(self):
+        """Static noise and flashes cover the whole screen."""
+        return self.static_intensity > 0 or self.flash_alpha > 0
+    
+    @property
+    def vignette(self):
+        if self._vignette is None:
+            sw, sh = self.screen_width, self.screen_height
+            self._vignette = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            for i in range(60):
+                alpha = int(80 * (1 - i / 60))
+                pygame.draw.rect(self._vignette, (0, 0, 0, alpha), (i, i, sw-i*2, sh-i*2), 1)
+        return self._vignette
     
-    def draw(self, surface):
+    def draw(self, surface, dirty=None):
+        """Draw particles and overlays; with `dirty` the vignette only covers dirty regions.
+
+        Returns the particle rects; static and flash only run on full frames.
+        """
         sw = surface.get_width()
         sh = surface.get_height()
         
-        for p in self.particles:
-            ps = pygame.Surface((p['size']*2+2, p['size']*2+2), pygame.SRCALPHA)
-            pygame.draw.circle(ps, (*p['color'], p['alpha']), (p['size']+1, p['size']+1), p['size'])
-            surface.blit(ps, (int(p['x']), int(p['y'])))
+        drawn = self.particles.draw(surface)
         
         if self.static_intensity > 0:
-            ss = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            target = self._targets.get('static', surface.get_size())
+            target.clear()
+            dot = max(1, target.s(2))
             for _ in range(int(800 * self.static_intensity / 255)):
                 x, y = random.randint(0, sw-1), random.randint(0, sh-1)
                 gray = random.randint(100, 255)
-                pygame.draw.rect(ss, (gray, gray, gray, min(255, self.static_intensity)), (x, y, 2, 2))
-            surface.blit(ss, (0, 0))
+                pygame.draw.rect(target.surface, (gray, gray, gray, min(255, self.static_intensity)),
+                                 (target.s(x), target.s(y), dot, dot))
+            target.present(surface)
         
         if self.flash_alpha > 0:
-            fs = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            fs.fill((*self.flash_color, int(self.flash_alpha)))
-            surface.blit(fs, (0, 0))
-        
-        vignette = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        for i in range(60):
-            alpha = int(80 * (1 - i / 60))
-            pygame.draw.rect(vignette, (0, 0, 0, alpha), (i, i, sw-i*2, sh-i*2), 1)
-        surface.blit(vignette, (0, 0))
+            if self._flash is None or self._flash.get_size() != surface.get_size():
+                self._flash = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._flash.fill((*self.flash_color, int(self.flash_alpha)))
+            surface.blit(self._flash, (0, 0))
+        
+        if dirty is not None:
+            dirty.overlay(surface, self.vignette)
+        else:
+            surface.blit(self.vignette, (0, 0))
+        return drawn
 
 
-class DialogueBox:
+class DialogueBox(BaseDialogueBox):
     def __init__(self, screen_width=1280, screen_height=720):
+        font = get_font_from(FONT_PATH, 26)
+        super().__init__(font, text_color=COLOR_TEXT, char_speed=0.02,
+                         fill=(20, 10, 35, 240), border=(120, 80, 160),
+                         indicator_color=(180, 150, 220))
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.active = False
-        self.text = ""
-        self.display_text = ""
-        self.char_index = 0
-        self.char_timer = 0
-        self.char_speed = 0.02
-        try:
-            self.font = pygame.font.Font(FONT_PATH, 26)
-        except:
-            self.font = pygame.font.Font(None, 26)
-    
-    def show(self, text):
-        self.active = True
-        self.text = text
-        self.display_text = ""
-        self.char_index = 0
-    
-    def update(self, dt):
-        if self.active and self.char_index < len(self.text):
-            self.char_timer += dt
-            if self.char_timer >= self.char_speed:
-                self.char_timer = 0
-                self.display_text += self.text[self.char_index]
-                self.char_index += 1
-    
-    def skip(self):
-        if self.char_index < len(self.text):
-            self.display_text = self.text
-            self.char_index = len(self.text)
-        else:
-            self.active = False
-    
-    def draw(self, surface):
-        if not self.active:
-            return
-        sw = surface.get_width()
-        sh = surface.get_height()
-        box_h = 110
-        box_rect = pygame.Rect(30, sh - box_h - 30, sw - 60, box_h)
-        box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-        box_surf.fill((20, 10, 35, 240))
-        pygame.draw.rect(box_surf, (120, 80, 160), (0, 0, box_rect.width, box_rect.height), 3)
-        surface.blit(box_surf, box_rect.topleft)
-        
-        for i, line in enumerate(self.display_text.split('\n')):
-            text_surf = self.font.render(line, True, COLOR_TEXT)
-            surface.blit(text_surf, (box_rect.x + 20, box_rect.y + 15 + i * 28))
-        
-        if self.char_index >= len(self.text):
-            if int(pygame.time.get_ticks() / 500) % 2:
-                ind = self.font.render(">>", True, (180, 150, 220))
-                surface.blit(ind, (box_rect.right - 45, box_rect.bottom - 30))
 
 
 # ==================== PUZZLE CLASSES ====================
@@ -310,6 +284,7 @@ class SequencePuzzle:
             self.flash_timer -= dt
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         for i, (tx, ty) in enumerate(self.tiles_pos):
             draw_x = tx * TILE_SIZE - camera_x
             draw_y = ty * TILE_SIZE - camera_y
@@ -325,14 +300,12 @@ class SequencePuzzle:
             
             # Draw symbol
             symbols = ['◆', '●', '▲', '■']
-            try:
-                font = pygame.font.Font(None, 24)
-            except:
-                font = pygame.font.Font(None, 24)
+            font = get_font_from(None, 24)
             sym = font.render(symbols[i % 4], True, color)
             tile_surf.blit(sym, (TILE_SIZE//2 - sym.get_width()//2, TILE_SIZE//2 - sym.get_height()//2))
             
-            surface.blit(tile_surf, (draw_x, draw_y))
+            drawn.append(surface.blit(tile_surf, (draw_x, draw_y)))
+        return drawn
 
 
 class MemoryPuzzle:
@@ -438,6 +411,7 @@ class MemoryPuzzle:
         return highlights
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         base_x = self.x * TILE_SIZE - camera_x
         base_y = self.y * TILE_SIZE - camera_y
         
@@ -465,29 +439,27 @@ class MemoryPuzzle:
             if is_highlighted:
                 glow = pygame.Surface((TILE_SIZE+16, TILE_SIZE+16), pygame.SRCALPHA)
                 pygame.draw.rect(glow, (*color, 120), (0, 0, TILE_SIZE+16, TILE_SIZE+16), border_radius=8)
-                surface.blit(glow, (dx-8, dy-8))
+                drawn.append(surface.blit(glow, (dx-8, dy-8)))
             
             cell_surf = pygame.Surface((TILE_SIZE-2, TILE_SIZE-2), pygame.SRCALPHA)
             pygame.draw.rect(cell_surf, (*color, alpha), (0, 0, TILE_SIZE-2, TILE_SIZE-2))
             pygame.draw.rect(cell_surf, (*color, 200), (0, 0, TILE_SIZE-2, TILE_SIZE-2), 2)
-            surface.blit(cell_surf, (dx+1, dy+1))
+            drawn.append(surface.blit(cell_surf, (dx+1, dy+1)))
         
         # Draw status text
-        try:
-            font = pygame.font.Font(FONT_PATH, 18)
-        except:
-            font = pygame.font.Font(None, 18)
+        font = get_font_from(FONT_PATH, 18)
         
         if not self.started:
             hint = font.render("Press SPACE to start", True, (200, 180, 220))
-            surface.blit(hint, (base_x - 20, base_y - 25))
+            drawn.append(surface.blit(hint, (base_x - 20, base_y - 25)))
         elif self.showing_pattern:
             hint = font.render(f"Memorize! ({len(self.pattern)} lights)", True, (255, 200, 100))
-            surface.blit(hint, (base_x - 25, base_y - 25))
+            drawn.append(surface.blit(hint, (base_x - 25, base_y - 25)))
         elif self.input_mode:
             progress = f"{len(self.player_input)}/{len(self.pattern)}"
             hint = font.render(f"Repeat! {progress} - Level {self.level}/{self.max_level}", True, (100, 255, 150))
-            surface.blit(hint, (base_x - 45, base_y - 25))
+            drawn.append(surface.blit(hint, (base_x - 45, base_y - 25)))
+        return drawn
 
 
 class LightsPuzzle:
@@ -540,6 +512,7 @@ class LightsPuzzle:
             self.click_timer -= dt
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         base_x = self.x * TILE_SIZE - camera_x
         base_y = self.y * TILE_SIZE - camera_y
         
@@ -556,7 +529,7 @@ class LightsPuzzle:
                     glow = pygame.Surface((TILE_SIZE+14, TILE_SIZE+14), pygame.SRCALPHA)
                     pygame.draw.circle(glow, (200, 150, 255, 60), 
                                       (TILE_SIZE//2+7, TILE_SIZE//2+7), TILE_SIZE//2+7)
-                    surface.blit(glow, (dx-7, dy-7))
+                    drawn.append(surface.blit(glow, (dx-7, dy-7)))
                 
                 # Click feedback - show affected cells
                 if (gx, gy) in self.affected_cells and self.click_timer > 0:
@@ -565,23 +538,20 @@ class LightsPuzzle:
                 cell_surf = pygame.Surface((TILE_SIZE-2, TILE_SIZE-2), pygame.SRCALPHA)
                 pygame.draw.rect(cell_surf, (*color, 230), (0, 0, TILE_SIZE-2, TILE_SIZE-2), border_radius=4)
                 pygame.draw.rect(cell_surf, (180, 140, 220), (0, 0, TILE_SIZE-2, TILE_SIZE-2), 2, border_radius=4)
-                surface.blit(cell_surf, (dx+1, dy+1))
+                drawn.append(surface.blit(cell_surf, (dx+1, dy+1)))
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 18)
-            small_font = pygame.font.Font(FONT_PATH, 14)
-        except:
-            font = pygame.font.Font(None, 18)
-            small_font = pygame.font.Font(None, 14)
+        font = get_font_from(FONT_PATH, 18)
+        small_font = get_font_from(FONT_PATH, 14)
         
         # Count how many are on
         on_count = sum(self.grid[y][x] for y in range(self.size) for x in range(self.size))
         hint = font.render(f"Make all same! ({on_count}/4 lit)", True, (200, 180, 220))
-        surface.blit(hint, (base_x - 25, base_y - 25))
+        drawn.append(surface.blit(hint, (base_x - 25, base_y - 25)))
         
         # Show that clicking affects neighbors
         hint2 = small_font.render("Click toggles + neighbors", True, (150, 130, 170))
-        surface.blit(hint2, (base_x - 30, base_y + self.size * TILE_SIZE + 5))
+        drawn.append(surface.blit(hint2, (base_x - 30, base_y + self.size * TILE_SIZE + 5)))
+        return drawn
 
 
 class CodePuzzle:
@@ -615,21 +585,17 @@ class CodePuzzle:
         return "adjust"
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         base_x = self.x * TILE_SIZE - camera_x
         base_y = self.y * TILE_SIZE - camera_y
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 32)
-            small_font = pygame.font.Font(FONT_PATH, 18)
-            big_font = pygame.font.Font(FONT_PATH, 24)
-        except:
-            font = pygame.font.Font(None, 32)
-            small_font = pygame.font.Font(None, 18)
-            big_font = pygame.font.Font(None, 24)
+        font = get_font_from(FONT_PATH, 32)
+        small_font = get_font_from(FONT_PATH, 18)
+        big_font = get_font_from(FONT_PATH, 24)
         
         # Draw title
         title = big_font.render("CODE LOCK", True, (255, 200, 100))
-        surface.blit(title, (base_x + 52 - title.get_width()//2, base_y - 55))
+        drawn.append(surface.blit(title, (base_x + 52 - title.get_width()//2, base_y - 55)))
         
         # Draw code display
         for i in range(3):
@@ -637,8 +603,8 @@ class CodePuzzle:
             
             # Up arrow
             up_color = (100, 255, 100) if self.selected == i else (80, 80, 80)
-            pygame.draw.polygon(surface, up_color, 
-                              [(dx+15, base_y-15), (dx+5, base_y), (dx+25, base_y)])
+            drawn.append(pygame.draw.polygon(surface, up_color, 
+                                           [(dx+15, base_y-15), (dx+5, base_y), (dx+25, base_y)]))
             
             # Number box - highlight if correct
             box_surf = pygame.Surface((30, 40), pygame.SRCALPHA)
@@ -651,20 +617,21 @@ class CodePuzzle:
             
             num_text = font.render(str(self.current[i]), True, (255, 200, 150))
             box_surf.blit(num_text, (15 - num_text.get_width()//2, 5))
-            surface.blit(box_surf, (dx, base_y + 5))
+            drawn.append(surface.blit(box_surf, (dx, base_y + 5)))
             
             # Down arrow
             down_color = (100, 255, 100) if self.selected == i else (80, 80, 80)
-            pygame.draw.polygon(surface, down_color,
-                              [(dx+15, base_y+60), (dx+5, base_y+45), (dx+25, base_y+45)])
+            drawn.append(pygame.draw.polygon(surface, down_color,
+                                           [(dx+15, base_y+60), (dx+5, base_y+45), (dx+25, base_y+45)]))
         
         # Instructions
         hint = small_font.render("<-/->: select, Up/Down: change", True, (180, 160, 200))
-        surface.blit(hint, (base_x - 25, base_y + 68))
+        drawn.append(surface.blit(hint, (base_x - 25, base_y + 68)))
         
         # Show how many hints found (without revealing the actual digits)
         hints_text = small_font.render(f"Hints found: {self.hints_found}/3", True, (255, 220, 100))
-        surface.blit(hints_text, (base_x + 5, base_y + 88))
+        drawn.append(surface.blit(hints_text, (base_x + 5, base_y + 88)))
+        return drawn
 
 
 class EffectOrb:
@@ -710,8 +677,9 @@ class EffectOrb:
         return False
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if not self.visible or self.collected:
-            return
+            return drawn
         
         draw_x = self.rect.x - camera_x
         draw_y = self.rect.y - camera_y + math.sin(self.bob_offset) * 8
@@ -724,14 +692,15 @@ class EffectOrb:
             alpha = int(60 * (1 - r / glow_size) * (0.7 + pulse * 0.3))
             pygame.draw.circle(glow_surf, (*self.orb_color, alpha), 
                              (int(glow_size), int(glow_size)), r)
-        surface.blit(glow_surf, (draw_x - glow_size + 12, draw_y - glow_size + 12))
+        drawn.append(surface.blit(glow_surf, (draw_x - glow_size + 12, draw_y - glow_size + 12)))
         
         # Inner orb
         orb_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
         pygame.draw.circle(orb_surf, (*self.orb_color, 200), (15, 15), 10)
         pygame.draw.circle(orb_surf, (255, 255, 255, 200), (15, 15), 6)
         pygame.draw.circle(orb_surf, (255, 255, 255, 255), (12, 12), 3)
-        surface.blit(orb_surf, (draw_x - 3, draw_y - 3))
+        drawn.append(surface.blit(orb_surf, (draw_x - 3, draw_y - 3)))
+        return drawn
 
 
 class DreamDoor:
@@ -753,6 +722,7 @@ class DreamDoor:
         return self.highlight
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         draw_x = self.rect.x - camera_x
         draw_y = self.rect.y - camera_y
         
@@ -764,23 +734,21 @@ class DreamDoor:
                 alpha = int(40 * (1 - r / glow_size))
                 pygame.draw.circle(glow_surf, (200, 180, 255, alpha),
                                  (int(glow_size), int(glow_size)), r)
-            surface.blit(glow_surf, (draw_x + 16 - glow_size, draw_y + 32 - glow_size))
+            drawn.append(surface.blit(glow_surf, (draw_x + 16 - glow_size, draw_y + 32 - glow_size)))
         
         if self.sprite:
-            surface.blit(self.sprite, (draw_x, draw_y))
+            drawn.append(surface.blit(self.sprite, (draw_x, draw_y)))
         else:
-            pygame.draw.rect(surface, (60, 40, 50), (draw_x, draw_y, 32, 64))
-            pygame.draw.rect(surface, (100, 60, 80), (draw_x+4, draw_y+4, 24, 56))
+            drawn.append(pygame.draw.rect(surface, (60, 40, 50), (draw_x, draw_y, 32, 64)))
+            drawn.append(pygame.draw.rect(surface, (100, 60, 80), (draw_x+4, draw_y+4, 24, 56)))
             knob_color = (100, 255, 100) if not self.locked else (150, 50, 50)
-            pygame.draw.circle(surface, knob_color, (draw_x + 24, draw_y + 35), 4)
+            drawn.append(pygame.draw.circle(surface, knob_color, (draw_x + 24, draw_y + 35), 4))
         
         if self.locked and self.highlight:
-            try:
-                font = pygame.font.Font(FONT_PATH, 18)
-            except:
-                font = pygame.font.Font(None, 18)
+            font = get_font_from(FONT_PATH, 18)
             lock_text = font.render("LOCKED", True, (255, 100, 100))
-            surface.blit(lock_text, (draw_x - 5, draw_y - 20))
+            drawn.append(surface.blit(lock_text, (draw_x - 5, draw_y - 20)))
+        return drawn
 
 
 class HintObject:
@@ -802,8 +770,9 @@ class HintObject:
         return math.sqrt(dx*dx + dy*dy) < distance
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if self.found:
-            return
+            return drawn
         
         draw_x = self.rect.x - camera_x
         draw_y = self.rect.y - camera_y
@@ -818,8 +787,8 @@ class HintObject:
                 alpha = int(80 * (1 - r / glow_size) * (0.5 + pulse * 0.5))
                 pygame.draw.circle(glow_surf, (255, 150, 50, alpha),
                                   (int(glow_size), int(glow_size)), r)
-            surface.blit(glow_surf, (draw_x + TILE_SIZE//2 - glow_size, 
-                                    draw_y + TILE_SIZE//2 - glow_size))
+            drawn.append(surface.blit(glow_surf, (draw_x + TILE_SIZE//2 - glow_size, 
+                                                 draw_y + TILE_SIZE//2 - glow_size)))
             
             # Bright golden book/scroll icon
             icon_surf = pygame.Surface((TILE_SIZE + 8, TILE_SIZE + 8), pygame.SRCALPHA)
@@ -827,40 +796,32 @@ class HintObject:
             pygame.draw.rect(icon_surf, (255, 220, 100), (4, 4, TILE_SIZE, TILE_SIZE), 3, border_radius=5)
             
             # Number indicator (1, 2, or 3)
-            try:
-                num_font = pygame.font.Font(FONT_PATH, 28)
-            except:
-                num_font = pygame.font.Font(None, 28)
+            num_font = get_font_from(FONT_PATH, 28)
             num_text = num_font.render(str(self.hint_number), True, (80, 40, 0))
             icon_surf.blit(num_text, (TILE_SIZE//2 + 4 - num_text.get_width()//2, 
                                       TILE_SIZE//2 + 4 - num_text.get_height()//2))
-            surface.blit(icon_surf, (draw_x - 4, draw_y - 4))
+            drawn.append(surface.blit(icon_surf, (draw_x - 4, draw_y - 4)))
             
             # Floating text "HINT"
-            try:
-                label_font = pygame.font.Font(FONT_PATH, 16)
-            except:
-                label_font = pygame.font.Font(None, 16)
+            label_font = get_font_from(FONT_PATH, 16)
             float_y = math.sin(self.glow_timer * 2) * 5
             label = label_font.render("CODE HINT", True, (255, 220, 100))
-            surface.blit(label, (draw_x + TILE_SIZE//2 - label.get_width()//2, 
-                                draw_y - 22 + float_y))
+            drawn.append(surface.blit(label, (draw_x + TILE_SIZE//2 - label.get_width()//2, 
+                                             draw_y - 22 + float_y)))
         else:
             # Regular hint style for other puzzles
             pulse = (math.sin(self.glow_timer * 2) + 1) / 2
             glow_surf = pygame.Surface((TILE_SIZE + 20, TILE_SIZE + 20), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (255, 200, 100, int(50 + pulse * 50)),
                               (TILE_SIZE//2 + 10, TILE_SIZE//2 + 10), TILE_SIZE//2 + 10)
-            surface.blit(glow_surf, (draw_x - 10, draw_y - 10))
+            drawn.append(surface.blit(glow_surf, (draw_x - 10, draw_y - 10)))
             
             # Symbol
-            try:
-                font = pygame.font.Font(None, 32)
-            except:
-                font = pygame.font.Font(None, 32)
+            font = get_font_from(None, 32)
             symbol = font.render("?", True, (255, 220, 150))
-            surface.blit(symbol, (draw_x + TILE_SIZE//2 - symbol.get_width()//2,
-                                  draw_y + TILE_SIZE//2 - symbol.get_height()//2))
+            drawn.append(surface.blit(symbol, (draw_x + TILE_SIZE//2 - symbol.get_width()//2,
+                                               draw_y + TILE_SIZE//2 - symbol.get_height()//2)))
+        return drawn
 
 
 class YumeNikkiPuzzle:
@@ -896,6 +857,8 @@ class YumeNikkiPuzzle:
         
         self.camera_x = 0
         self.camera_y = 0
+        # Static room cache + partial display updates (see src/systems/dirty_rects.py)
+        self.dirty = DirtyRectRenderer(self.screen.get_size())
         
         self.effects_collected = []
         self.dialogue = DialogueBox(self.screen_width, self.screen_height)
@@ -1340,47 +1303,56 @@ class YumeNikkiPuzzle:
     
     def draw(self):
         shake_x, shake_y = self.dream_effect.get_shake_offset()
-        self.screen.fill(COLOR_DREAM)
-        
-        # Draw map
-        self.screen.blit(self.map_surface, (-self.camera_x + shake_x, -self.camera_y + shake_y))
+        map_pos = (int(-self.camera_x + shake_x), int(-self.camera_y + shake_y))
+        
+        # Static layer: background fill + map, rebuilt only when the view moves
+        dirty = self.dirty
+        if self.dream_effect.is_fullscreen_active() or self.game_complete:
+            dirty.invalidate()
+        if dirty.begin(key=map_pos):
+            dirty.background.fill(COLOR_DREAM)
+            dirty.background.blit(self.map_surface, map_pos)
+        
+        dirty.render(self.screen, self._draw_dynamic)
+        dirty.present()
+    
+    def _draw_dynamic(self, screen):
+        """Everything drawn over the cached background; reports its rects to `self.dirty`."""
+        dirty = self.dirty
+        shake_x, shake_y = self.dream_effect.get_shake_offset()
+        cam_x, cam_y = self.camera_x - shake_x, self.camera_y - shake_y
         
         # Draw puzzles
         for ptype, puzzle in self.puzzles:
-            puzzle.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+            dirty.add(puzzle.draw(screen, cam_x, cam_y))
         
         # Draw hints
         for hint in self.hints:
-            hint.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+            dirty.add(hint.draw(screen, cam_x, cam_y))
         
         # Draw door
-        self.exit_door.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.exit_door.draw(screen, cam_x, cam_y))
         
         # Draw orbs
         for orb in self.orbs:
-            orb.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+            dirty.add(orb.draw(screen, cam_x, cam_y))
         
         # Draw character
-        self.character.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.character.draw(screen, cam_x, cam_y))
         
         # Draw effects
-        self.dream_effect.draw(self.screen)
+        dirty.add(self.dream_effect.draw(screen, dirty))
         
         # Draw UI
-        self._draw_ui()
+        dirty.add(self._draw_ui())
         
         # Draw dialogue
-        self.dialogue.draw(self.screen)
-        
-        pygame.display.flip()
+        dirty.add(self.dialogue.draw(screen))
     
     def _draw_ui(self):
-        try:
-            font = pygame.font.Font(FONT_PATH, 24)
-            small_font = pygame.font.Font(FONT_PATH, 18)
-        except:
-            font = pygame.font.Font(None, 24)
-            small_font = pygame.font.Font(None, 18)
+        drawn = []
+        font = get_font_from(FONT_PATH, 24)
+        small_font = get_font_from(FONT_PATH, 18)
         
         # Effect indicators
         effect_colors = {
@@ -1390,21 +1362,21 @@ class YumeNikkiPuzzle:
         
         ui_bg = pygame.Surface((200, 80), pygame.SRCALPHA)
         ui_bg.fill((0, 0, 0, 100))
-        self.screen.blit(ui_bg, (5, 5))
+        drawn.append(self.screen.blit(ui_bg, (5, 5)))
         
         title_text = font.render("EFFECTS", True, COLOR_TEXT)
-        self.screen.blit(title_text, (15, 10))
+        drawn.append(self.screen.blit(title_text, (15, 10)))
         
         all_effects = ['cat', 'knife', 'bicycle', 'neon']
         for i, effect in enumerate(all_effects):
             x, y = 15 + i * 45, 40
             if effect in self.effects_collected:
                 color = effect_colors[effect]
-                pygame.draw.circle(self.screen, color, (x + 15, y + 10), 12)
-                pygame.draw.circle(self.screen, (255, 255, 255), (x + 15, y + 10), 8)
+                drawn.append(pygame.draw.circle(self.screen, color, (x + 15, y + 10), 12))
+                drawn.append(pygame.draw.circle(self.screen, (255, 255, 255), (x + 15, y + 10), 8))
             else:
-                pygame.draw.circle(self.screen, (60, 50, 70), (x + 15, y + 10), 12)
-                pygame.draw.circle(self.screen, (40, 30, 50), (x + 15, y + 10), 10, 2)
+                drawn.append(pygame.draw.circle(self.screen, (60, 50, 70), (x + 15, y + 10), 12))
+                drawn.append(pygame.draw.circle(self.screen, (40, 30, 50), (x + 15, y + 10), 10, 2))
         
         # Controls hint
         hint_text = "WASD/Arrows: Move | SPACE: Interact | E: Effects"
@@ -1419,28 +1391,26 @@ class YumeNikkiPuzzle:
         
         hint = small_font.render(hint_text, True, (100, 80, 120))
         screen_w, screen_h = self.screen.get_size()
-        self.screen.blit(hint, (10, screen_h - 25))
+        drawn.append(self.screen.blit(hint, (10, screen_h - 25)))
         
         # Puzzle status
         solved_count = sum(1 for _, p in self.puzzles if p.solved)
         status = small_font.render(f"Puzzles: {solved_count}/4", True, (150, 130, 180))
-        self.screen.blit(status, (screen_w - 100, 10))
+        drawn.append(self.screen.blit(status, (screen_w - 100, 10)))
         
         # Game complete
         if self.game_complete:
             overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
             alpha = min(200, int(pygame.time.get_ticks() % 3000 / 10))
             overlay.fill((255, 255, 255, alpha))
-            self.screen.blit(overlay, (0, 0))
+            drawn.append(self.screen.blit(overlay, (0, 0)))
             
-            try:
-                big_font = pygame.font.Font(FONT_PATH, 64)
-            except:
-                big_font = pygame.font.Font(None, 64)
+            big_font = get_font_from(FONT_PATH, 64)
             text = big_font.render("Awakening...", True, (80, 60, 100))
             sw, sh = self.screen.get_size()
             rect = text.get_rect(center=(sw // 2, sh // 2))
-            self.screen.blit(text, rect)
+            drawn.append(self.screen.blit(text, rect))
+        return drawn
     
     def run(self):
         running = True
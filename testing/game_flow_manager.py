@@ -38,6 +38,9 @@ def run_puzzle_scene(screen):
     返回：'next' 表示完成解谜并触发门，'quit' 表示退出游戏
     """
     from src.tiled_loader import load_map, draw_map
+    from src.systems.dirty_rects import DirtyRectRenderer
+    from src.systems.dialogue import DialogueBox as BaseDialogueBox
+    from src.utils.font import get_font_from
     import xml.etree.ElementTree as ET
     import random
     
@@ -316,9 +319,9 @@ def run_puzzle_scene(screen):
         bubble_center_x = sx + (tile_draw_size // 2)
         bubble_rect = text_surf.get_rect(center=(bubble_center_x, sy - 18))
         bubble_rect.inflate_ip(10, 8)
-        pygame.draw.rect(screen, (255, 255, 200), bubble_rect, border_radius=5)
-        pygame.draw.rect(screen, (0, 0, 0), bubble_rect, 1, border_radius=5)
-        screen.blit(text_surf, text_surf.get_rect(center=bubble_rect.center))
+        return [pygame.draw.rect(screen, (255, 255, 200), bubble_rect, border_radius=5),
+                pygame.draw.rect(screen, (0, 0, 0), bubble_rect, 1, border_radius=5),
+                screen.blit(text_surf, text_surf.get_rect(center=bubble_rect.center))]
     
     # ========== 收集系统 ==========
     import math
@@ -388,15 +391,16 @@ def run_puzzle_scene(screen):
                 self.active = False
         
         def draw(self, surface):
+            drawn = []
             if not self.active:
-                return
+                return drawn
             
             # 绘制拖尾
             for p in self.particles:
                 color_with_alpha = (*self.color, int(p['alpha']))
                 glow = pygame.Surface((int(p['size']*4), int(p['size']*4)), pygame.SRCALPHA)
                 pygame.draw.circle(glow, color_with_alpha, (int(p['size']*2), int(p['size']*2)), int(p['size']))
-                surface.blit(glow, (p['x'] - p['size']*2, p['y'] - p['size']*2))
+                drawn.append(surface.blit(glow, (p['x'] - p['size']*2, p['y'] - p['size']*2)))
             
             # 绘制主光球
             pulse = (math.sin(self.glow_timer * 10) + 1) / 2
@@ -408,11 +412,12 @@ def run_puzzle_scene(screen):
                 alpha = int(100 * (1 - r / glow_size))
                 pygame.draw.circle(glow_surf, (*self.color, alpha), 
                                  (int(glow_size), int(glow_size)), r)
-            surface.blit(glow_surf, (self.x - glow_size, self.y - glow_size))
+            drawn.append(surface.blit(glow_surf, (self.x - glow_size, self.y - glow_size)))
             
             # 内核
-            pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), 8)
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), 6)
+            drawn.append(pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), 8))
+            drawn.append(pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), 6))
+            return drawn
     
     # 收集动画列表
     collect_animations = []
@@ -440,12 +445,14 @@ def run_puzzle_scene(screen):
                 self.active = False
         
         def draw(self, surface):
+            drawn = []
             for ring in self.rings:
                 if ring['alpha'] > 0:
                     surf = pygame.Surface((int(ring['radius']*2+4), int(ring['radius']*2+4)), pygame.SRCALPHA)
                     pygame.draw.circle(surf, (*self.color, int(ring['alpha'])), 
                                      (int(ring['radius']+2), int(ring['radius']+2)), int(ring['radius']), 3)
-                    surface.blit(surf, (self.x - ring['radius'] - 2, self.y - ring['radius'] - 2))
+                    drawn.append(surface.blit(surf, (self.x - ring['radius'] - 2, self.y - ring['radius'] - 2)))
+            return drawn
     
     absorb_effects = []
     
@@ -494,84 +501,51 @@ def run_puzzle_scene(screen):
                     break
     
     # ========== 对话框系统 ==========
-    class DialogueBox:
+    class DialogueBox(BaseDialogueBox):
         def __init__(self, font_path):
-            self.active = False
-            self.text = ""
-            self.display_text = ""
-            self.char_index = 0
-            self.char_timer = 0
-            self.char_speed = 0.03
-            self.display_time = 0
-            self.auto_close_time = 3.0  # 3秒后自动关闭
-            try:
-                self.font = pygame.font.Font(str(font_path), 28)
-                self.small_font = pygame.font.Font(str(font_path), 20)
-            except:
-                self.font = pygame.font.Font(None, 28)
-                self.small_font = pygame.font.Font(None, 20)
-        
-        def show(self, text):
-            self.active = True
-            self.text = text
-            self.display_text = ""
-            self.char_index = 0
-            self.char_timer = 0
-            self.display_time = 0
-        
-        def update(self, dt):
-            if not self.active:
-                return
-            if self.char_index < len(self.text):
-                self.char_timer += dt
-                if self.char_timer >= self.char_speed:
-                    self.char_timer = 0
-                    self.display_text += self.text[self.char_index]
-                    self.char_index += 1
-            else:
-                self.display_time += dt
-                if self.display_time >= self.auto_close_time:
-                    self.active = False
-        
-        def skip(self):
-            if self.char_index < len(self.text):
-                self.display_text = self.text
-                self.char_index = len(self.text)
-            else:
-                self.active = False
-        
-        def draw(self, surface):
-            if not self.active:
-                return
-            sw, sh = surface.get_size()
-            box_h = 120
-            box_w = sw - 100
-            box_x = 50
-            box_y = sh - box_h - 40
-            
-            # 绘制对话框背景
-            box_surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-            box_surf.fill((20, 15, 30, 230))
-            pygame.draw.rect(box_surf, (150, 130, 180), (0, 0, box_w, box_h), 3, border_radius=8)
-            surface.blit(box_surf, (box_x, box_y))
-            
-            # 绘制文本
-            lines = self.display_text.split('\n')
-            for i, line in enumerate(lines):
-                text_surf = self.font.render(line, True, (255, 255, 255))
-                surface.blit(text_surf, (box_x + 20, box_y + 15 + i * 32))
-            
-            # 绘制继续提示
-            if self.char_index >= len(self.text):
-                if int(pygame.time.get_ticks() / 500) % 2:
-                    hint = self.small_font.render("Press SPACE to continue...", True, (180, 180, 200))
-                    surface.blit(hint, (box_x + box_w - hint.get_width() - 20, box_y + box_h - 30))
+            font = get_font_from(font_path, 28)
+            small_font = get_font_from(font_path, 20)
+            # 打完字 3 秒后自动关闭；提示文字右对齐在框内
+            super().__init__(font, text_color=(255, 255, 255), char_speed=0.03,
+                             box=(50, 120, 40), fill=(20, 15, 30, 230), border=(150, 130, 180),
+                             border_radius=8, line_height=32,
+                             indicator="Press SPACE to continue...", indicator_color=(180, 180, 200),
+                             indicator_offset=(-20, -30), indicator_anchor='topright',
+                             small_font=small_font, auto_close=3.0)
     
     dialogue = DialogueBox(FONT_PATH)
     
     # 显示开场提示
     dialogue.show("I feel like I forgot something...\nIs everything as it should be?")
     
+    # 背景层和前景层只渲染一次，之后每帧直接贴图
+    off_bg = None
+    try:
+        m_bg = dict(m)
+        m_bg['layers'] = [layer for layer in m.get('layers', []) if (layer.get('name') or '') != 'foreground_furniture']
+        off_bg = pygame.Surface((target_w, target_h), pygame.SRCALPHA)
+        draw_map(off_bg, m_bg, tiles_by_gid, scale=scale)
+    except Exception:
+        off_bg = None
+    
+    off_fg = None
+    if foreground_layer:
+        try:
+            m_fg = {
+                'tilewidth': m.get('tilewidth'),
+                'tileheight': m.get('tileheight'),
+                'width': m.get('width'),
+                'height': m.get('height'),
+                'layers': [foreground_layer]
+            }
+            off_fg = pygame.Surface((target_w, target_h), pygame.SRCALPHA)
+            draw_map(off_fg, m_fg, tiles_by_gid, scale=scale)
+        except Exception:
+            off_fg = None
+    
+    # 静态背景缓存 + 局部刷新 (见 src/systems/dirty_rects.py)
+    dirty = DirtyRectRenderer(screen.get_size())
+    
     # 主循环
     clock = pygame.time.Clock()
     running = True
@@ -579,18 +553,6 @@ def run_puzzle_scene(screen):
     current_door = None
     
     while running:
-        screen.fill((0, 0, 0))
-        
-        # 绘制背景
-        try:
-            m_bg = dict(m)
-            m_bg['layers'] = [layer for layer in m.get('layers', []) if (layer.get('name') or '') != 'foreground_furniture']
-            off_bg = pygame.Surface((target_w, target_h), pygame.SRCALPHA)
-            draw_map(off_bg, m_bg, tiles_by_gid, scale=scale)
-            screen.blit(off_bg, (offset_x - int(round(camera_x)), offset_y))
-        except Exception:
-            pass
-        
         # 处理玩家移动
         dt = clock.tick(60) / 1000.0
         keys = pygame.key.get_pressed()
@@ -664,79 +626,52 @@ def run_puzzle_scene(screen):
         desired_camera_x = max(0, min(max_scroll, desired_camera_x))
         lerp_t = max(0.0, min(1.0, camera_smooth * dt))
         camera_x = camera_x + (desired_camera_x - camera_x) * lerp_t
+        map_screen_pos = (offset_x - int(round(camera_x)), offset_y)
         
-        # ===== 绘制可收集物品的发光效果 =====
-        for obj in interactive_objects:
-            item_key = item_mapping.get(id(obj))
-            # 只有标记了 show_glow 且物品未收集时才显示发光效果
-            if item_key and not collectible_items[item_key]['collected'] and obj.get('show_glow', False):
-                # 更新发光计时器
-                obj['glow_timer'] += dt * 3
-                
-                # 计算物品屏幕位置
-                obj_screen_x = int(round(obj['rect'].x * scale)) + offset_x - int(round(camera_x))
-                obj_screen_y = int(round(obj['rect'].y * scale)) + offset_y
-                
-                # 绘制脉动发光效果
-                pulse = (math.sin(obj['glow_timer']) + 1) / 2
-                glow_size = 30 + pulse * 15
-                item_color = collectible_items[item_key]['color']
-                
-                glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
-                for r in range(int(glow_size), 0, -3):
-                    alpha = int(80 * (1 - r / glow_size) * (0.5 + pulse * 0.5))
-                    pygame.draw.circle(glow_surf, (*item_color, alpha), 
-                                     (int(glow_size), int(glow_size)), r)
-                screen.blit(glow_surf, (obj_screen_x + tile_draw_size//2 - glow_size, 
-                                       obj_screen_y + tile_draw_size//2 - glow_size))
-                
-                # 绘制小星星粒子
-                for i in range(3):
-                    angle = obj['glow_timer'] * 2 + i * (math.pi * 2 / 3)
-                    star_dist = 20 + pulse * 8
-                    star_x = obj_screen_x + tile_draw_size//2 + math.cos(angle) * star_dist
-                    star_y = obj_screen_y + tile_draw_size//2 + math.sin(angle) * star_dist
-                    star_alpha = int(150 + pulse * 100)
-                    star_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
-                    pygame.draw.circle(star_surf, (*item_color, star_alpha), (4, 4), 3)
-                    screen.blit(star_surf, (star_x - 4, star_y - 4))
-        
-        # 绘制玩家
+        # 玩家屏幕位置
         screen_x = int(round(player_x * scale)) + offset_x - int(round(camera_x))
         screen_y = int(round(player_y * scale)) + offset_y
         draw_x = screen_x + player_draw_xoff
         draw_y = screen_y + player_draw_yoff
-        screen.blit(player_img, (draw_x, draw_y))
+        player_center_x = draw_x + player_draw_w // 2
+        player_center_y = draw_y + player_draw_h // 2
         
-        # 绘制前景
-        if foreground_layer:
-            try:
-                m_fg = {
-                    'tilewidth': m.get('tilewidth'),
-                    'tileheight': m.get('tileheight'),
-                    'width': m.get('width'),
-                    'height': m.get('height'),
-                    'layers': [foreground_layer]
-                }
-                off_fg = pygame.Surface((target_w, target_h), pygame.SRCALPHA)
-                draw_map(off_fg, m_fg, tiles_by_gid, scale=scale)
-                screen.blit(off_fg, (offset_x - int(round(camera_x)), offset_y))
-            except Exception:
-                pass
+        # ===== 更新收集动画（在绘制之前，位置要是本帧的） =====
+        for anim in collect_animations:
+            anim.update(dt, player_center_x, player_center_y)
+            # 当动画完成时，创建吸收特效
+            if not anim.active:
+                absorb_effects.append(AbsorbEffect(player_center_x, player_center_y, anim.color))
+        collect_animations[:] = [a for a in collect_animations if a.active]
+        
+        # 更新吸收特效
+        for effect in absorb_effects:
+            effect.update(dt)
+        absorb_effects[:] = [e for e in absorb_effects if e.active]
         
-        # 检测交互
+        # 更新发光计时器
+        for obj in interactive_objects:
+            item_key = item_mapping.get(id(obj))
+            if item_key and not collectible_items[item_key]['collected'] and obj.get('show_glow', False):
+                obj['glow_timer'] += dt * 3
+        
+        # 更新对话框
+        dialogue.update(dt)
+        
+        # 检测交互（提示气泡在绘制阶段画）
         player_bbox_rect = pygame.Rect(int(player_x + player_bbox_xoff), int(player_y + player_bbox_yoff), player_bbox_w, player_bbox_h)
         current_interactive = None
         current_door = None
+        bubble = None
         
         # 检查门交互
         for door in door_objects:
             if player_bbox_rect.colliderect(door["rect"].inflate(10, 10)):
                 current_door = door
                 if door_unlocked:
-                    draw_bubble("SPACE: Enter", door["rect"].x, door["rect"].y, camera_x, offset_x, offset_y)
+                    bubble = ("SPACE: Enter", door["rect"])
                 else:
-                    draw_bubble(f"Locked ({len(collected_items)}/{ITEMS_REQUIRED})", door["rect"].x, door["rect"].y, camera_x, offset_x, offset_y)
+                    bubble = (f"Locked ({len(collected_items)}/{ITEMS_REQUIRED})", door["rect"])
                 break
         
         # 检查普通交互
@@ -747,71 +682,103 @@ def run_puzzle_scene(screen):
                     # 检查是否已收集
                     item_key = item_mapping.get(id(obj))
                     if item_key and collectible_items.get(item_key, {}).get('collected'):
-                        draw_bubble("(Collected)", obj["rect"].x, obj["rect"].y, camera_x, offset_x, offset_y)
+                        bubble = ("(Collected)", obj["rect"])
                     elif item_key:
                         # 可收集物品显示特殊提示
-                        draw_bubble("SPACE: Collect", obj["rect"].x, obj["rect"].y, camera_x, offset_x, offset_y)
+                        bubble = ("SPACE: Collect", obj["rect"])
                     else:
-                        draw_bubble("SPACE: Check", obj["rect"].x, obj["rect"].y, camera_x, offset_x, offset_y)
+                        bubble = ("SPACE: Check", obj["rect"])
                     break
         
-        # 绘制收集进度UI
-        try:
-            ui_font = pygame.font.Font(str(FONT_PATH), 24)
-            ui_small = pygame.font.Font(str(FONT_PATH), 18)
-        except:
-            ui_font = pygame.font.Font(None, 24)
-            ui_small = pygame.font.Font(None, 18)
-        
-        # 收集进度背景
-        ui_bg = pygame.Surface((200, 80), pygame.SRCALPHA)
-        ui_bg.fill((0, 0, 0, 150))
-        screen.blit(ui_bg, (10, 10))
-        
-        # 标题
-        title = ui_font.render("Collected Items", True, (255, 220, 150))
-        screen.blit(title, (20, 15))
-        
-        # 进度条
-        progress = len(collected_items) / ITEMS_REQUIRED
-        bar_w, bar_h = 160, 15
-        pygame.draw.rect(screen, (50, 50, 60), (20, 45, bar_w, bar_h), border_radius=3)
-        pygame.draw.rect(screen, (100, 200, 100) if progress >= 1.0 else (200, 150, 50), 
-                        (20, 45, int(bar_w * min(progress, 1.0)), bar_h), border_radius=3)
-        
-        # 进度文本
-        progress_text = ui_small.render(f"{len(collected_items)} / {ITEMS_REQUIRED}", True, (255, 255, 255))
-        screen.blit(progress_text, (20 + bar_w//2 - progress_text.get_width()//2, 65))
-        
-        # ===== 更新和绘制收集动画 =====
-        # 计算玩家中心位置（用于动画跟踪）
-        player_center_x = draw_x + player_draw_w // 2
-        player_center_y = draw_y + player_draw_h // 2
-        
-        # 更新收集动画
-        for anim in collect_animations:
-            anim.update(dt, player_center_x, player_center_y)
-            # 当动画完成时，创建吸收特效
-            if not anim.active:
-                absorb_effects.append(AbsorbEffect(player_center_x, player_center_y, anim.color))
-        collect_animations[:] = [a for a in collect_animations if a.active]
-        
-        # 更新吸收特效
-        for effect in absorb_effects:
-            effect.update(dt)
-        absorb_effects[:] = [e for e in absorb_effects if e.active]
+        # 静态层：黑底 + 地图背景，只在相机移动时重建
+        if dirty.begin(key=map_screen_pos):
+            dirty.background.fill((0, 0, 0))
+            if off_bg is not None:
+                dirty.background.blit(off_bg, map_screen_pos)
         
-        # 绘制收集动画
-        for anim in collect_animations:
-            anim.draw(screen)
-        
-        # 绘制吸收特效
-        for effect in absorb_effects:
-            effect.draw(screen)
+        # 动态层：画到的范围都交给 dirty，可能一帧画两遍
+        def draw_dynamic(screen):
+            # ===== 绘制可收集物品的发光效果 =====
+            for obj in interactive_objects:
+                item_key = item_mapping.get(id(obj))
+                # 只有标记了 show_glow 且物品未收集时才显示发光效果
+                if item_key and not collectible_items[item_key]['collected'] and obj.get('show_glow', False):
+                    # 计算物品屏幕位置
+                    obj_screen_x = int(round(obj['rect'].x * scale)) + offset_x - int(round(camera_x))
+                    obj_screen_y = int(round(obj['rect'].y * scale)) + offset_y
+                    
+                    # 绘制脉动发光效果
+                    pulse = (math.sin(obj['glow_timer']) + 1) / 2
+                    glow_size = 30 + pulse * 15
+                    item_color = collectible_items[item_key]['color']
+                    
+                    glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
+                    for r in range(int(glow_size), 0, -3):
+                        alpha = int(80 * (1 - r / glow_size) * (0.5 + pulse * 0.5))
+                        pygame.draw.circle(glow_surf, (*item_color, alpha), 
+                                         (int(glow_size), int(glow_size)), r)
+                    dirty.add(screen.blit(glow_surf, (obj_screen_x + tile_draw_size//2 - glow_size, 
+                                                      obj_screen_y + tile_draw_size//2 - glow_size)))
+                    
+                    # 绘制小星星粒子
+                    for i in range(3):
+                        angle = obj['glow_timer'] * 2 + i * (math.pi * 2 / 3)
+                        star_dist = 20 + pulse * 8
+                        star_x = obj_screen_x + tile_draw_size//2 + math.cos(angle) * star_dist
+                        star_y = obj_screen_y + tile_draw_size//2 + math.sin(angle) * star_dist
+                        star_alpha = int(150 + pulse * 100)
+                        star_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+                        pygame.draw.circle(star_surf, (*item_color, star_alpha), (4, 4), 3)
+                        dirty.add(screen.blit(star_surf, (star_x - 4, star_y - 4)))
+            
+            # 绘制玩家
+            dirty.add(screen.blit(player_img, (draw_x, draw_y)))
+            
+            # 绘制前景（静态，只覆盖脏区域）
+            if off_fg is not None:
+                dirty.overlay(screen, off_fg, dest=map_screen_pos)
+            
+            # 交互提示气泡
+            if bubble:
+                text, rect = bubble
+                dirty.add(draw_bubble(text, rect.x, rect.y, camera_x, offset_x, offset_y))
+            
+            # 绘制收集进度UI
+            ui_font = get_font_from(FONT_PATH, 24)
+            ui_small = get_font_from(FONT_PATH, 18)
+            
+            # 收集进度背景
+            ui_bg = pygame.Surface((200, 80), pygame.SRCALPHA)
+            ui_bg.fill((0, 0, 0, 150))
+            dirty.add(screen.blit(ui_bg, (10, 10)))
+            
+            # 标题
+            title = ui_font.render("Collected Items", True, (255, 220, 150))
+            dirty.add(screen.blit(title, (20, 15)))
+            
+            # 进度条
+            progress = len(collected_items) / ITEMS_REQUIRED
+            bar_w, bar_h = 160, 15
+            dirty.add(pygame.draw.rect(screen, (50, 50, 60), (20, 45, bar_w, bar_h), border_radius=3))
+            dirty.add(pygame.draw.rect(screen, (100, 200, 100) if progress >= 1.0 else (200, 150, 50), 
+                                       (20, 45, int(bar_w * min(progress, 1.0)), bar_h), border_radius=3))
+            
+            # 进度文本
+            progress_text = ui_small.render(f"{len(collected_items)} / {ITEMS_REQUIRED}", True, (255, 255, 255))
+            dirty.add(screen.blit(progress_text, (20 + bar_w//2 - progress_text.get_width()//2, 65)))
+            
+            # ===== 绘制收集动画 =====
+            for anim in collect_animations:
+                dirty.add(anim.draw(screen))
+            
+            # 绘制吸收特效
+            for effect in absorb_effects:
+                dirty.add(effect.draw(screen))
+            
+            # 绘制对话框
+            dirty.add(dialogue.draw(screen))
         
-        # 更新对话框
-        dialogue.update(dt)
-        dialogue.draw(screen)
+        dirty.render(screen, draw_dynamic)
         
         # 定义交互处理函数
         def handle_interaction():
@@ -922,7 +889,7 @@ def run_puzzle_scene(screen):
                 if result == 'next_scene':
                     return 'next'
         
-        pygame.display.flip()
+        dirty.present()
     
     return 'quit'
 
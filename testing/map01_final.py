@@ -17,6 +17,7 @@ import pygame
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT_DIR not in sys.path:
 	sys.path.insert(0, ROOT_DIR)
+from src.utils.atlas import load_image
 
 def draw_gear(surface, center, radius, teeth=8, color=(120,120,120,128)):
 	import math
@@ -48,6 +49,7 @@ def run(screen):
 	from src.tiled_loader import load_map, draw_map, extract_collision_rects
 	from src.entities.player_map import MapPlayer
 	from src.ui.dialog_box_notusing import SpeechBubble
+	from src.utils.font import get_font_from
 
 	# Local set to track collected items since inventory system is removed
 	collected_items = set()
@@ -274,7 +276,7 @@ def run(screen):
 				img_path = _find_asset('hourglass.png') or _find_asset('item_clock.png') or _find_asset('clock.png')
 			if img_path:
 				try:
-					img = pygame.image.load(img_path).convert_alpha()
+					img = load_image(img_path)
 				except Exception:
 					img = None
 			else:
@@ -308,8 +310,8 @@ def run(screen):
 			try:
 				lamp_img_path = _find_asset('lamp.png')
 				if lamp_img_path:
-					lamp_img = pygame.image.load(lamp_img_path).convert_alpha()
 					lamp_w, lamp_h = item_w * 2, item_h * 2
+					lamp_img = load_image(lamp_img_path, draw_size=(lamp_w, lamp_h))
 					lamp_img_scaled = pygame.transform.smoothscale(lamp_img, (lamp_w, lamp_h))
 					lamp_surf = pygame.Surface((lamp_w, lamp_h), pygame.SRCALPHA)
 					lamp_surf.blit(lamp_img_scaled, (0, 0))
@@ -373,7 +375,7 @@ def run(screen):
 	img_names = ['brush.png', 'group.png', 'chain.png']
 	for name in img_names:
 		try:
-			img = pygame.image.load(os.path.join(ROOT, 'assets', name)).convert_alpha()
+			img = load_image(os.path.join(ROOT, 'assets', name), draw_size=(200, 200))
 			img = pygame.transform.smoothscale(img, (200, 200))
 			projected_imgs.append(img)
 		except Exception as e:
@@ -384,7 +386,7 @@ def run(screen):
 	# 新增：沙漏拾取后只显示group.png
 	group_img = None
 	try:
-		group_img = pygame.image.load(os.path.join(ROOT, 'assets', 'group.png')).convert_alpha()
+		group_img = load_image(os.path.join(ROOT, 'assets', 'group.png'), draw_size=(200, 200))
 		group_img = pygame.transform.smoothscale(group_img, (200, 200))
 	except Exception as e:
 		print(f"[map01_scene DEBUG] Failed to load group.png: {e}")
@@ -393,7 +395,7 @@ def run(screen):
 	# Brush image for lamp projection
 	brush_img = None
 	try:
-		brush_img = pygame.image.load(os.path.join(ROOT, 'assets', 'brush.png')).convert_alpha()
+		brush_img = load_image(os.path.join(ROOT, 'assets', 'brush.png'), draw_size=(200, 200))
 		brush_img = pygame.transform.smoothscale(brush_img, (200, 200))
 	except Exception as e:
 		print(f"[map01_scene DEBUG] Failed to load brush.png: {e}")
@@ -996,7 +998,7 @@ def run(screen):
 
 				# Draw text below the brush, with same alpha
 				text_lines = ["To dwell in the light,", "with a brush, with a truth"]
-				font = pygame.font.Font(os.path.join(ROOT, 'assets', 'Silver.ttf'), 22) if os.path.exists(os.path.join(ROOT, 'assets', 'Silver.ttf')) else pygame.font.SysFont('consolas', 22)
+				font = get_font_from(os.path.join(ROOT, 'assets', 'Silver.ttf'), 22, sysfont='consolas')
 				total_height = 0
 				text_surfs = []
 				for line in text_lines:
@@ -1026,7 +1028,7 @@ def run(screen):
 			try:
 				img_121_path = os.path.join(ROOT, 'assets', '1-2-1.png')
 				if os.path.exists(img_121_path):
-					img_121 = pygame.image.load(img_121_path).convert_alpha()
+					img_121 = load_image(img_121_path, draw_size=(80, 80))
 					img_121 = pygame.transform.smoothscale(img_121, (80, 80))
 
 					if not img_121_clicked:
@@ -1036,7 +1038,7 @@ def run(screen):
 						img_121_pos = (img_x, img_y)
 						screen.blit(img_121, img_121_pos)
 						# Draw 'click' prompt
-						prompt_font2 = pygame.font.Font(os.path.join(ROOT, 'assets', 'Silver.ttf'), 16) if os.path.exists(os.path.join(ROOT, 'assets', 'Silver.ttf')) else pygame.font.SysFont('consolas', 16)
+						prompt_font2 = get_font_from(os.path.join(ROOT, 'assets', 'Silver.ttf'), 16, sysfont='consolas')
 						prompt_text2 = 'click-drag'
 						prompt_surf2 = prompt_font2.render(prompt_text2, True, (255, 255, 255))
 						prompt_bg2 = pygame.Surface((prompt_surf2.get_width()+6, prompt_surf2.get_height()+2), pygame.SRCALPHA)
@@ -1081,7 +1083,7 @@ def run(screen):
 			try:
 				img_121_path = os.path.join(ROOT, 'assets', '1-2-1.png')
 				if os.path.exists(img_121_path):
-					img_121 = pygame.image.load(img_121_path).convert_alpha()
+					img_121 = load_image(img_121_path, draw_size=(80, 80))
 					img_121 = pygame.transform.smoothscale(img_121, (80, 80))
 					if img_121_pos is None:
 						margin = 16
@@ -1104,11 +1106,7 @@ def run(screen):
 			door_shine_timer -= door_shine_period
 		# Show story text if group.png is visible or fading
 		if show_only_group_img or (group_img_fadeout and group_img_alpha > 0):
-			font = None
-			try:
-				font = pygame.font.Font(os.path.join(ROOT, 'assets', 'Silver.ttf'), 22)
-			except Exception:
-				font = pygame.font.SysFont('consolas', 22)
+			font = get_font_from(os.path.join(ROOT, 'assets', 'Silver.ttf'), 22, sysfont='consolas')
 			# Update text alpha based on fadein/fadeout
 			if story_text_fadein and not story_text_fully_visible:
 				story_text_alpha += int(255 * dt / 1.2)
@@ -1142,7 +1140,7 @@ def run(screen):
 			try:
 				reward_img_path = os.path.join(ROOT, 'assets', '1-1-1.png')
 				if os.path.exists(reward_img_path):
-					reward_img = pygame.image.load(reward_img_path).convert_alpha()
+					reward_img = load_image(reward_img_path, draw_size=(80, 80))
 					reward_img = pygame.transform.smoothscale(reward_img, (80, 80))
 					if not reward_img_clicked:
 						# Draw offset to left to avoid overlap
@@ -1152,7 +1150,7 @@ def run(screen):
 						reward_img_pos = (img_x, img_y)
 						screen.blit(reward_img, reward_img_pos)
 						# Draw 'click' prompt
-						prompt_font2 = pygame.font.Font(os.path.join(ROOT, 'assets', 'Silver.ttf'), 16) if os.path.exists(os.path.join(ROOT, 'assets', 'Silver.ttf')) else pygame.font.SysFont('consolas', 16)
+						prompt_font2 = get_font_from(os.path.join(ROOT, 'assets', 'Silver.ttf'), 16, sysfont='consolas')
 						prompt_text2 = 'click-drag'
 						prompt_surf2 = prompt_font2.render(prompt_text2, True, (255, 255, 255))
 						prompt_bg2 = pygame.Surface((prompt_surf2.get_width()+6, prompt_surf2.get_height()+2), pygame.SRCALPHA)
@@ -1194,11 +1192,7 @@ def run(screen):
 
 		# Show 'Check (C)' prompt above hourglass if player is near and reward_img_clicked is False
 		# Show 'Check (C)' prompt above lamp if player is near and reward_img_clicked is True
-		prompt_font = None
-		try:
-			prompt_font = pygame.font.Font(os.path.join(ROOT, 'assets', 'Silver.ttf'), 18)
-		except Exception:
-			prompt_font = pygame.font.SysFont('consolas', 18)
+		prompt_font = get_font_from(os.path.join(ROOT, 'assets', 'Silver.ttf'), 18, sysfont='consolas')
 
 		for it in items:
 			# skip lamp prompt if lamp is collected
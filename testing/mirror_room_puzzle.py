@@ -9,9 +9,18 @@ import sys
 import os
 import math
 import random
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.systems.animation import Animator, Clip, clip_store
+from src.systems.camera import Camera
+from src.systems.particles import ParticleEmitter
+from src.systems.render_target import RenderTargetPool
+from src.systems.dirty_rects import DirtyRectRenderer
+from src.systems.dialogue import DialogueBox as BaseDialogueBox
+from src.utils.font import get_font_from
+
 # --------------------------
 # Configuration
 # --------------------------
@@ -56,92 +65,59 @@ class Character:
         self.x = x
         self.y = y
         self.speed = 120.0
-        self.sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-        self.frames = self._load_frames()
+        self.clips = self._load_clips(sprite_path)
         self.direction = 'down'
         self.is_moving = False
-        self.frame_index = 0
-        self.animation_timer = 0.0
+        self.animator = Animator(self.clips['down']['idle'])
         self.collision_width = 16
         self.collision_height = 12
         
         # Transformation state
         self.transformed = False
-        self.witch_frames = None
+        self.witch_clips = None
         self.transform_timer = 0
         self.transform_particles = []
     
-    def _load_frames(self) -> dict:
-        frames = {}
+    def _load_clips(self, sprite_path: str) -> dict:
+        """Idle (column 0) and walk (columns 1-8) clips per direction, shared across rooms"""
+        size = (int(CHAR_FRAME_WIDTH * CHAR_SCALE), int(CHAR_FRAME_HEIGHT * CHAR_SCALE))
+        clips = {}
         for dir_name, row in DIRECTION_MAP.items():
-            frames[dir_name] = []
-            for col in range(9):
-                rect = pygame.Rect(col * CHAR_FRAME_WIDTH, row * CHAR_FRAME_HEIGHT,
-                                   CHAR_FRAME_WIDTH, CHAR_FRAME_HEIGHT)
-                frame = self.sprite_sheet.subsurface(rect)
-                scaled = pygame.transform.scale(frame,
-                    (int(CHAR_FRAME_WIDTH * CHAR_SCALE), int(CHAR_FRAME_HEIGHT * CHAR_SCALE)))
-                frames[dir_name].append(scaled)
-        return frames
+            sheet_row = clip_store.grid(sprite_path, (CHAR_FRAME_WIDTH, CHAR_FRAME_HEIGHT), 9,
+                                        origin=(0, row * CHAR_FRAME_HEIGHT), size=size,
+                                        duration=ANIMATION_SPEED)
+            clips[dir_name] = {'idle': sheet_row.sub(0, 1), 'walk': sheet_row.sub(1)}
+        return clips
     
-    def _load_witch_frames(self) -> dict:
-        """Load Blue Witch sprite frames (vertical sprite sheets)"""
-        frames = {'idle': [], 'run': []}
-        
-        # Load idle sprite
-        idle_path = os.path.join(BLUE_WITCH_DIR, "B_witch_idle.png")
-        run_path = os.path.join(BLUE_WITCH_DIR, "B_witch_run.png")
-        
-        try:
-            # Load idle frames (vertical sprite sheet: 32x288, 9 frames)
-            idle_sheet = pygame.image.load(idle_path).convert_alpha()
-            idle_rows = idle_sheet.get_height() // WITCH_FRAME_HEIGHT
-            for row in range(idle_rows):
-                rect = pygame.Rect(0, row * WITCH_FRAME_HEIGHT,
-                                   WITCH_FRAME_WIDTH, WITCH_FRAME_HEIGHT)
-                frame = idle_sheet.subsurface(rect)
-                scaled = pygame.transform.scale(frame,
-                    (int(WITCH_FRAME_WIDTH * WITCH_SCALE), int(WITCH_FRAME_HEIGHT * WITCH_SCALE)))
-                frames['idle'].append(scaled)
-            
-            # Load run frames (vertical sprite sheet: 32x384, 12 frames)
-            run_sheet = pygame.image.load(run_path).convert_alpha()
-            run_rows = run_sheet.get_height() // WITCH_FRAME_HEIGHT
-            for row in range(run_rows):
-                rect = pygame.Rect(0, row * WITCH_FRAME_HEIGHT,
-                                   WITCH_FRAME_WIDTH, WITCH_FRAME_HEIGHT)
-                frame = run_sheet.subsurface(rect)
-                scaled = pygame.transform.scale(frame,
-                    (int(WITCH_FRAME_WIDTH * WITCH_SCALE), int(WITCH_FRAME_HEIGHT * WITCH_SCALE)))
-                frames['run'].append(scaled)
-            
-            # Ensure we have at least one frame
-            if not frames['idle']:
-                frames['idle'] = [pygame.Surface((int(WITCH_FRAME_WIDTH * WITCH_SCALE), 
-                                                   int(WITCH_FRAME_HEIGHT * WITCH_SCALE)), pygame.SRCALPHA)]
-            if not frames['run']:
-                frames['run'] = frames['idle'].copy()
-                
-        except Exception as e:
-            print(f"Warning: Could not load witch sprites: {e}")
+    def _load_witch_clips(self) -> dict:
+        """Load Blue Witch clips (vertical sprite sheets: idle 9 frames, run 12 frames)"""
+        size = (int(WITCH_FRAME_WIDTH * WITCH_SCALE), int(WITCH_FRAME_HEIGHT * WITCH_SCALE))
+        frame_size = (WITCH_FRAME_WIDTH, WITCH_FRAME_HEIGHT)
+        idle = clip_store.grid(os.path.join(BLUE_WITCH_DIR, "B_witch_idle.png"), frame_size,
+                               vertical=True, size=size, duration=WITCH_ANIMATION_SPEED)
+        run = clip_store.grid(os.path.join(BLUE_WITCH_DIR, "B_witch_run.png"), frame_size,
+                              vertical=True, size=size, duration=WITCH_ANIMATION_SPEED)
+        
+        if not idle:
+            print("Warning: Could not load witch sprites")
             # Create placeholder frames
-            placeholder = pygame.Surface((int(WITCH_FRAME_WIDTH * WITCH_SCALE), 
-                                         int(WITCH_FRAME_HEIGHT * WITCH_SCALE)), pygame.SRCALPHA)
-            pygame.draw.circle(placeholder, (100, 100, 200), 
-                             (int(WITCH_FRAME_WIDTH * WITCH_SCALE // 2), 
-                              int(WITCH_FRAME_HEIGHT * WITCH_SCALE // 2)), 15)
-            frames['idle'] = [placeholder]
-            frames['run'] = [placeholder]
-        
-        return frames
+            def placeholder():
+                surf = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.circle(surf, (100, 100, 200), (size[0] // 2, size[1] // 2), 15)
+                return Clip([surf], WITCH_ANIMATION_SPEED)
+            idle = run = clip_store.get(('mirror_witch_placeholder', size), placeholder)
+        run = run or idle
+        
+        # Idle holds the first frame; the run cycle skips its first frame
+        return {'idle': idle.sub(0, 1), 'run': run.sub(1) if len(run) > 1 else run}
     
     def transform_to_witch(self):
         """Transform character into Blue Witch"""
         if not self.transformed:
             self.transformed = True
             self.transform_timer = 0
-            self.witch_frames = self._load_witch_frames()
-            self.frame_index = 0
+            self.witch_clips = self._load_witch_clips()
+            self.animator.play(self._current_clip(), restart=True)
             
             # Create transformation particles
             for _ in range(40):
@@ -190,25 +166,10 @@ class Character:
         else:
             self.is_moving = False
         
-        # Different animation speed based on transformation
-        anim_speed = WITCH_ANIMATION_SPEED if self.transformed else ANIMATION_SPEED
-        
+        # Turning keeps the walk phase; the witch and girl clips carry their own speeds
+        self.animator.play(self._current_clip(), keep_phase=self.is_moving)
         if self.is_moving:
-            self.animation_timer += dt
-            if self.animation_timer >= anim_speed:
-                self.animation_timer = 0
-                if self.transformed and self.witch_frames:
-                    max_frames = len(self.witch_frames['run']) - 1
-                    self.frame_index = (self.frame_index % max_frames) + 1 if max_frames > 0 else 0
-                else:
-                    self.frame_index = (self.frame_index % 8) + 1
-        else:
-            if self.transformed and self.witch_frames:
-                # Keep witch at first frame when idle (no animation)
-                self.frame_index = 0
-                self.animation_timer = 0
-            else:
-                self.frame_index = 0
+            self.animator.update(dt)
     
     def _get_direction(self, dx, dy):
         if dx > 0 and dy > 0: return 'down_right'
@@ -220,20 +181,24 @@ class Character:
         elif dy > 0: return 'down'
         return 'up'
     
+    def _current_clip(self, direction=None):
+        """Clip for the current state, facing `direction` (defaults to the character's)"""
+        direction = direction or self.direction
+        if self.transformed and self.witch_clips:
+            clip = self.witch_clips['run'] if self.is_moving else self.witch_clips['idle']
+            # Flip sprite based on direction
+            return clip.flipped() if 'left' in direction else clip
+        return self.clips[direction]['walk' if self.is_moving else 'idle']
+    
+    def _current_frame(self, direction=None):
+        clip = self._current_clip(direction)
+        return clip.frames[self.animator.index % len(clip)]
+    
     def draw(self, surface, camera_x=0, camera_y=0):
-        if self.transformed and self.witch_frames:
+        drawn = []
+        if self.transformed and self.witch_clips:
             # Draw witch sprite
-            if self.is_moving:
-                frames = self.witch_frames['run']
-            else:
-                frames = self.witch_frames['idle']
-            
-            frame_idx = min(self.frame_index, len(frames) - 1)
-            frame = frames[frame_idx]
-            
-            # Flip sprite based on direction
-            if 'left' in self.direction:
-                frame = pygame.transform.flip(frame, True, False)
+            frame = self._current_frame()
             
             draw_x = self.x - camera_x - frame.get_width() // 2
             draw_y = self.y - camera_y - frame.get_height() + self.collision_height
@@ -243,15 +208,15 @@ class Character:
             glow_alpha = int(40 + 20 * math.sin(pygame.time.get_ticks() * 0.005))
             pygame.draw.ellipse(glow_surf, (100, 150, 255, glow_alpha), 
                               (0, glow_surf.get_height() - 15, glow_surf.get_width(), 15))
-            surface.blit(glow_surf, (draw_x - 10, draw_y - 5))
+            drawn.append(surface.blit(glow_surf, (draw_x - 10, draw_y - 5)))
             
-            surface.blit(frame, (draw_x, draw_y))
+            drawn.append(surface.blit(frame, (draw_x, draw_y)))
         else:
             # Draw normal character
-            frame = self.frames[self.direction][self.frame_index]
+            frame = self._current_frame()
             draw_x = self.x - camera_x - frame.get_width() // 2
             draw_y = self.y - camera_y - frame.get_height() + self.collision_height
-            surface.blit(frame, (draw_x, draw_y))
+            drawn.append(surface.blit(frame, (draw_x, draw_y)))
         
         # Draw transformation particles
         if self.transform_particles:
@@ -263,7 +228,8 @@ class Character:
                 if size > 0:
                     ps = pygame.Surface((size * 2 + 2, size * 2 + 2), pygame.SRCALPHA)
                     pygame.draw.circle(ps, (*p['color'], alpha), (size + 1, size + 1), size)
-                    surface.blit(ps, (int(px) - size, int(py) - size))
+                    drawn.append(surface.blit(ps, (int(px) - size, int(py) - size)))
+        return drawn
     
     def get_reflection_direction(self):
         """Get the mirrored direction for reflection"""
@@ -277,21 +243,15 @@ class Character:
     
     def draw_reflection(self, surface, mirror_x, camera_x=0, camera_y=0, alpha=150):
         """Draw a mirrored reflection of the character"""
+        drawn = []
         reflected_dir = self.get_reflection_direction()
         
         # Get the appropriate frame based on transformation state
-        if self.transformed and self.witch_frames:
-            if self.is_moving:
-                frames = self.witch_frames['run']
-            else:
-                frames = self.witch_frames['idle']
-            frame_idx = min(self.frame_index, len(frames) - 1)
-            frame = frames[frame_idx]
-            # Handle left direction for witch
-            if 'left' in self.direction:
-                frame = pygame.transform.flip(frame, True, False)
+        if self.transformed and self.witch_clips:
+            # The witch faces left/right only; use her own facing
+            frame = self._current_frame()
         else:
-            frame = self.frames[reflected_dir][self.frame_index]
+            frame = self._current_frame(reflected_dir)
         
         # Flip horizontally
         flipped = pygame.transform.flip(frame, True, False)
@@ -312,7 +272,8 @@ class Character:
         tint_surf.fill((100, 150, 200, 30))
         reflection_surf.blit(tint_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         
-        surface.blit(reflection_surf, (reflected_x, draw_y))
+        drawn.append(surface.blit(reflection_surf, (reflected_x, draw_y)))
+        return drawn
 
 
 class DreamEffect:
@@ -323,19 +284,19 @@ class DreamEffect:
         self.static_intensity = 0
         self.flash_alpha = 0
         self.flash_color = (255, 255, 255)
-        self.screen_shake = 0
-        self.shake_intensity = 0
-        self.particles = []
+        self.camera = Camera()
+        self._targets = RenderTargetPool(alpha=True)
+        self._flash = None
+        self._vignette = None
         # Dust particles floating in the room
-        for _ in range(20):
-            self.particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'speed': random.uniform(5, 15),
-                'size': random.randint(1, 2),
-                'alpha': random.randint(30, 80),
-                'color': (200, 210, 230)
-            })
+        self.particles = ParticleEmitter(capacity=20, palette=[(200, 210, 230)])
+        n = 20
+        self.particles.emit(n,
+                            x=self.particles.uniform(0, self.screen_width, n),
+                            y=self.particles.uniform(0, self.screen_height, n),
+                            vy=-self.particles.uniform(5, 15, n),
+                            size=self.particles.uniform(1, 2, n),
+                            alpha=self.particles.uniform(30, 80, n))
     
     def trigger_static(self, duration=0.5):
         self.static_timer = duration
@@ -346,14 +307,10 @@ class DreamEffect:
         self.flash_alpha = alpha
     
     def shake(self, duration=0.3, intensity=5):
-        self.screen_shake = duration
-        self.shake_intensity = intensity
+        self.camera.shake(duration, intensity)
     
     def get_shake_offset(self):
-        if self.screen_shake > 0:
-            return (random.uniform(-self.shake_intensity, self.shake_intensity),
-                    random.uniform(-self.shake_intensity, self.shake_intensity))
-        return (0, 0)
+        return self.camera.shake_offset
     
     def update(self, dt):
         if self.static_timer > 0:
@@ -363,100 +320,64 @@ class DreamEffect:
             self.static_intensity = 0
         if self.flash_alpha > 0:
             self.flash_alpha = max(0, self.flash_alpha - 300 * dt)
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
-        for p in self.particles:
-            p['y'] -= p['speed'] * dt
-            p['x'] += math.sin(p['y'] * 0.01) * 0.3
-            if p['y'] < -10:
-                p['y'] = self.screen_height + 10
-                p['x'] = random.randint(0, self.screen_width)
+        self.camera.update(dt)
+        self.particles.update(dt)
+        x, y = self.particles.view('x'), self.particles.view('y')
+        x += np.sin(y * 0.01) * 0.3
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = self.screen_height + 10
+            x[wrapped] = self.particles.uniform(0, self.screen_width, int(wrapped.sum()))
     
-    def draw(self, surface):
-        for p in self.particles:
-            ps = pygame.Surface((p['size']*2+2, p['size']*2+2), pygame.SRCALPHA)
-            pygame.draw.circle(ps, (*p['color'], p['alpha']), (p['size']+1, p['size']+1), p['size'])
-            surface.blit(ps, (int(p['x']), int(p['y'])))
+    def is_fullscreen_active(self):
+        """Static noise and flashes cover the whole screen."""
+        return self.static_intensity > 0 or self.flash_alpha > 0
+    
+    @property
+    def vignette(self):
+        if self._vignette is None:
+            surf_w, surf_h = self.screen_width, self.screen_height
+            self._vignette = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
+            for i in range(60):
+                alpha = int(100 * (1 - i / 60))
+                pygame.draw.rect(self._vignette, (0, 0, 0, alpha), (i, i, surf_w-i*2, surf_h-i*2), 1)
+        return self._vignette
+    
+    def draw(self, surface, dirty=None):
+        drawn = self.particles.draw(surface)
         
         if self.static_intensity > 0:
-            ss = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            target = self._targets.get('static', surface.get_size())
+            target.clear()
             surf_w, surf_h = surface.get_size()
+            dot = max(1, target.s(2))
             for _ in range(int(800 * self.static_intensity / 255)):
                 x, y = random.randint(0, surf_w-1), random.randint(0, surf_h-1)
                 gray = random.randint(100, 255)
-                pygame.draw.rect(ss, (gray, gray, gray, min(255, self.static_intensity)), (x, y, 2, 2))
-            surface.blit(ss, (0, 0))
+                pygame.draw.rect(target.surface, (gray, gray, gray, min(255, self.static_intensity)),
+                                 (target.s(x), target.s(y), dot, dot))
+            target.present(surface)
         
         if self.flash_alpha > 0:
-            fs = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            fs.fill((*self.flash_color, int(self.flash_alpha)))
-            surface.blit(fs, (0, 0))
-        
-        # Vignette effect
-        surf_w, surf_h = surface.get_size()
-        vignette = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        for i in range(60):
-            alpha = int(100 * (1 - i / 60))
-            pygame.draw.rect(vignette, (0, 0, 0, alpha), (i, i, surf_w-i*2, surf_h-i*2), 1)
-        surface.blit(vignette, (0, 0))
-
-
-class DialogueBox:
-    def __init__(self):
-        self.active = False
-        self.text = ""
-        self.display_text = ""
-        self.char_index = 0
-        self.char_timer = 0
-        self.char_speed = 0.02
-        try:
-            self.font = pygame.font.Font(FONT_PATH, 26)
-        except:
-            self.font = pygame.font.Font(None, 26)
-    
-    def show(self, text):
-        self.active = True
-        self.text = text
-        self.display_text = ""
-        self.char_index = 0
-    
-    def update(self, dt):
-        if self.active and self.char_index < len(self.text):
-            self.char_timer += dt
-            if self.char_timer >= self.char_speed:
-                self.char_timer = 0
-                self.display_text += self.text[self.char_index]
-                self.char_index += 1
-    
-    def skip(self):
-        if self.char_index < len(self.text):
-            self.display_text = self.text
-            self.char_index = len(self.text)
+            if self._flash is None or self._flash.get_size() != surface.get_size():
+                self._flash = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._flash.fill((*self.flash_color, int(self.flash_alpha)))
+            surface.blit(self._flash, (0, 0))
+        
+        # Vignette effect (only over the dirty regions when rendering partially)
+        if dirty is not None:
+            dirty.overlay(surface, self.vignette)
         else:
-            self.active = False
-    
-    def draw(self, surface):
-        if not self.active:
-            return
-        box_h = 110
-        surf_w, surf_h = surface.get_size()
-        box_rect = pygame.Rect(30, surf_h - box_h - 30, surf_w - 60, box_h)
-        box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-        box_surf.fill((10, 10, 20, 240))
-        pygame.draw.rect(box_surf, (100, 120, 150), (0, 0, box_rect.width, box_rect.height), 3)
-        surface.blit(box_surf, box_rect.topleft)
-        
-        for i, line in enumerate(self.display_text.split('\n')):
-            text_surf = self.font.render(line, True, COLOR_TEXT)
-            surface.blit(text_surf, (box_rect.x + 20, box_rect.y + 15 + i * 28))
-        
-        if self.char_index >= len(self.text):
-            if int(pygame.time.get_ticks() / 500) % 2:
-                ind = self.font.render(">>", True, (150, 170, 200))
-                surface.blit(ind, (box_rect.right - 45, box_rect.bottom - 30))
+            surface.blit(self.vignette, (0, 0))
+        return drawn
 
 
-# ==================== MIRROR CLASSES ====================
+class DialogueBox(BaseDialogueBox):
+    def __init__(self):
+        font = get_font_from(FONT_PATH, 26)
+        super().__init__(font, text_color=COLOR_TEXT, char_speed=0.02,
+                         fill=(10, 10, 20, 240), border=(100, 120, 150),
+                         indicator_color=(150, 170, 200))
 
 class MirrorShard:
     """A single shard of broken mirror that flies away"""
@@ -493,8 +414,9 @@ class MirrorShard:
         return self.life > 0
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if self.alpha <= 0:
-            return
+            return drawn
         
         draw_x = self.x - camera_x
         draw_y = self.y - camera_y
@@ -510,13 +432,18 @@ class MirrorShard:
         
         # Draw shard with reflection effect
         if len(rotated) >= 3:
-            # Glass color with transparency
-            surf_w, surf_h = surface.get_size()
-            shard_surf = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
-            pygame.draw.polygon(shard_surf, (200, 220, 255, self.alpha), rotated)
+            # Glass color with transparency, on a surface just big enough for the shard
+            left = math.floor(min(x for x, _ in rotated))
+            top = math.floor(min(y for _, y in rotated))
+            right = math.ceil(max(x for x, _ in rotated))
+            bottom = math.ceil(max(y for _, y in rotated))
+            local = [(x - left, y - top) for x, y in rotated]
+            shard_surf = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
+            pygame.draw.polygon(shard_surf, (200, 220, 255, self.alpha), local)
             # Highlight
-            pygame.draw.polygon(shard_surf, (255, 255, 255, self.alpha // 2), rotated, 1)
-            surface.blit(shard_surf, (0, 0))
+            pygame.draw.polygon(shard_surf, (255, 255, 255, self.alpha // 2), local, 1)
+            drawn.append(surface.blit(shard_surf, (left, top)))
+        return drawn
 
 
 class Mirror:
@@ -598,19 +525,20 @@ class Mirror:
         self.shards = [s for s in self.shards if s.update(dt)]
     
     def draw(self, surface, camera_x, camera_y, character=None):
+        drawn = []
         draw_x = self.x - camera_x
         draw_y = self.y - camera_y
         
         if self.broken:
             # Draw broken frame only
-            self._draw_frame(surface, draw_x, draw_y, broken=True)
+            drawn.extend(self._draw_frame(surface, draw_x, draw_y, broken=True))
             # Draw remaining shards
             for shard in self.shards:
-                shard.draw(surface, camera_x, camera_y)
-            return
+                drawn.extend(shard.draw(surface, camera_x, camera_y))
+            return drawn
         
         # Draw mirror frame
-        self._draw_frame(surface, draw_x, draw_y)
+        drawn.extend(self._draw_frame(surface, draw_x, draw_y))
         
         # Draw mirror surface
         mirror_surf = pygame.Surface((self.width - 16, self.height - 16), pygame.SRCALPHA)
@@ -636,7 +564,7 @@ class Mirror:
             
             # Only show reflection if character is in front of mirror
             if abs(char_screen_x - mirror_center_x) < 150:
-                character.draw_reflection(surface, mirror_center_x, camera_x, camera_y, 120)
+                drawn.extend(character.draw_reflection(surface, mirror_center_x, camera_x, camera_y, 120))
         
         # Draw cracks if any
         if self.crack_progress > 0:
@@ -661,38 +589,41 @@ class Mirror:
                     oy = random.randint(-distort, distort)
                     mirror_surf.scroll(ox, oy)
         
-        surface.blit(mirror_surf, (draw_x + 8, draw_y + 8))
+        drawn.append(surface.blit(mirror_surf, (draw_x + 8, draw_y + 8)))
         
         # Draw shards
         for shard in self.shards:
-            shard.draw(surface, camera_x, camera_y)
+            drawn.extend(shard.draw(surface, camera_x, camera_y))
         
         # Highlight effect
         if self.highlight and not self.breaking:
             hl_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             pygame.draw.rect(hl_surf, (255, 255, 255, 30), (0, 0, self.width, self.height))
-            surface.blit(hl_surf, (draw_x, draw_y))
+            drawn.append(surface.blit(hl_surf, (draw_x, draw_y)))
+        return drawn
     
     def _draw_frame(self, surface, draw_x, draw_y, broken=False):
         """Draw ornate mirror frame"""
+        drawn = []
         # Outer frame
         frame_color = (80, 70, 60) if not broken else (50, 45, 40)
-        pygame.draw.rect(surface, frame_color, (draw_x, draw_y, self.width, self.height))
+        drawn.append(pygame.draw.rect(surface, frame_color, (draw_x, draw_y, self.width, self.height)))
         
         # Inner frame details
         inner_color = (60, 50, 45) if not broken else (40, 35, 30)
-        pygame.draw.rect(surface, inner_color, (draw_x + 4, draw_y + 4, self.width - 8, self.height - 8))
+        drawn.append(pygame.draw.rect(surface, inner_color, (draw_x + 4, draw_y + 4, self.width - 8, self.height - 8)))
         
         # Frame border
         border_color = (100, 90, 80) if not broken else (70, 60, 50)
-        pygame.draw.rect(surface, border_color, (draw_x, draw_y, self.width, self.height), 3)
-        pygame.draw.rect(surface, (40, 35, 30), (draw_x + 6, draw_y + 6, self.width - 12, self.height - 12), 2)
+        drawn.append(pygame.draw.rect(surface, border_color, (draw_x, draw_y, self.width, self.height), 3))
+        drawn.append(pygame.draw.rect(surface, (40, 35, 30), (draw_x + 6, draw_y + 6, self.width - 12, self.height - 12), 2))
         
         # Corner decorations
         corners = [(draw_x + 3, draw_y + 3), (draw_x + self.width - 12, draw_y + 3),
                    (draw_x + 3, draw_y + self.height - 12), (draw_x + self.width - 12, draw_y + self.height - 12)]
         for cx, cy in corners:
-            pygame.draw.circle(surface, (120, 100, 80) if not broken else (80, 70, 60), (cx + 4, cy + 4), 5)
+            drawn.append(pygame.draw.circle(surface, (120, 100, 80) if not broken else (80, 70, 60), (cx + 4, cy + 4), 5))
+        return drawn
 
 
 class ReflectionPuzzle:
@@ -733,8 +664,9 @@ class ReflectionPuzzle:
         return None
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if self.solved:
-            return
+            return drawn
         
         # Draw target positions
         for i, (tx, ty) in enumerate(self.target_positions):
@@ -753,7 +685,7 @@ class ReflectionPuzzle:
                 # Draw progress ring
                 if self.stand_timer > 0:
                     progress_angle = (self.stand_timer / self.required_time) * 360
-                    self._draw_progress_ring(surface, draw_x, draw_y, progress_angle)
+                    drawn.extend(self._draw_progress_ring(surface, draw_x, draw_y, progress_angle))
             else:
                 # Future - dim
                 color = (150, 150, 180, 50)
@@ -764,17 +696,16 @@ class ReflectionPuzzle:
             
             # Draw symbol in center
             if i == self.current_target:
-                try:
-                    font = pygame.font.Font(FONT_PATH, 20)
-                except:
-                    font = pygame.font.Font(None, 20)
+                font = get_font_from(FONT_PATH, 20)
                 text = font.render("◈", True, color[:3])
                 marker_surf.blit(text, (30 - text.get_width()//2, 30 - text.get_height()//2))
             
-            surface.blit(marker_surf, (draw_x - 30, draw_y - 30))
+            drawn.append(surface.blit(marker_surf, (draw_x - 30, draw_y - 30)))
+        return drawn
     
     def _draw_progress_ring(self, surface, x, y, angle):
         """Draw a progress ring showing stand time"""
+        drawn = []
         ring_surf = pygame.Surface((70, 70), pygame.SRCALPHA)
         center = (35, 35)
         
@@ -796,7 +727,8 @@ class ReflectionPuzzle:
             
             pygame.draw.line(ring_surf, (100, 255, 150, 200), (x1, y1), (x2, y2), 4)
         
-        surface.blit(ring_surf, (x - 35, y - 35))
+        drawn.append(surface.blit(ring_surf, (x - 35, y - 35)))
+        return drawn
 
 
 class PencilItem:
@@ -883,8 +815,9 @@ class PencilItem:
                 self.visible = False
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if not self.visible:
-            return
+            return drawn
         
         draw_x = self.x - camera_x
         draw_y = self.y - camera_y + math.sin(self.bob_timer * 3) * 5
@@ -897,7 +830,7 @@ class PencilItem:
             alpha = int(60 * (1 - r / glow_size) * (self.appear_alpha / 255))
             pygame.draw.circle(glow_surf, (255, 220, 100, alpha),
                              (int(glow_size), int(glow_size)), r)
-        surface.blit(glow_surf, (draw_x - glow_size + 8, draw_y - glow_size + 20))
+        drawn.append(surface.blit(glow_surf, (draw_x - glow_size + 8, draw_y - glow_size + 20)))
         
         # Draw pencil shape
         pencil_surf = pygame.Surface((20, 50), pygame.SRCALPHA)
@@ -921,7 +854,7 @@ class PencilItem:
         # Highlight
         pygame.draw.line(pencil_surf, (255, 255, 200, body_alpha // 2), (6, 12), (6, 38), 2)
         
-        surface.blit(pencil_surf, (draw_x - 2, draw_y))
+        drawn.append(surface.blit(pencil_surf, (draw_x - 2, draw_y)))
         
         # Draw absorption particles
         if self.absorbing:
@@ -931,16 +864,14 @@ class PencilItem:
                 alpha = max(0, int(255 * (1 - self.absorb_timer)))
                 ps = pygame.Surface((p['size']*2+2, p['size']*2+2), pygame.SRCALPHA)
                 pygame.draw.circle(ps, (*p['color'], alpha), (p['size']+1, p['size']+1), p['size'])
-                surface.blit(ps, (int(px) - p['size'], int(py) - p['size']))
+                drawn.append(surface.blit(ps, (int(px) - p['size'], int(py) - p['size'])))
         
         # Draw "collect" hint if nearby and not absorbing
         if not self.absorbing and self.appear_alpha >= 255:
-            try:
-                font = pygame.font.Font(FONT_PATH, 18)
-            except:
-                font = pygame.font.Font(None, 18)
+            font = get_font_from(FONT_PATH, 18)
             hint = font.render("Press SPACE", True, (255, 220, 100))
-            surface.blit(hint, (draw_x - hint.get_width()//2 + 8, draw_y - 25))
+            drawn.append(surface.blit(hint, (draw_x - hint.get_width()//2 + 8, draw_y - 25)))
+        return drawn
 
 
 class Door:
@@ -1023,27 +954,28 @@ class Door:
         return False
     
     def draw(self, surface, camera_x, camera_y):
+        drawn = []
         if not self.visible:
-            return
+            return drawn
         
         draw_x = self.x - camera_x
         draw_y = self.y - camera_y
         
         # Draw door frame (dark red)
         frame_color = (70, 40, 40)
-        pygame.draw.rect(surface, frame_color, (draw_x - 4, draw_y - 4, self.width + 8, self.height + 8))
-        pygame.draw.rect(surface, (100, 50, 50), (draw_x - 4, draw_y - 4, self.width + 8, self.height + 8), 3)
+        drawn.append(pygame.draw.rect(surface, frame_color, (draw_x - 4, draw_y - 4, self.width + 8, self.height + 8)))
+        drawn.append(pygame.draw.rect(surface, (100, 50, 50), (draw_x - 4, draw_y - 4, self.width + 8, self.height + 8), 3))
         
         # Door body
         if self.locked:
             # Locked door - dark red and dull
             door_color = (50, 25, 25)
-            pygame.draw.rect(surface, door_color, (draw_x, draw_y, self.width, self.height))
+            drawn.append(pygame.draw.rect(surface, door_color, (draw_x, draw_y, self.width, self.height)))
             # Lock symbol
             lock_x = draw_x + self.width // 2
             lock_y = draw_y + self.height // 2
-            pygame.draw.circle(surface, (100, 60, 50), (lock_x, lock_y - 5), 8)
-            pygame.draw.rect(surface, (100, 60, 50), (lock_x - 6, lock_y, 12, 10))
+            drawn.append(pygame.draw.circle(surface, (100, 60, 50), (lock_x, lock_y - 5), 8))
+            drawn.append(pygame.draw.rect(surface, (100, 60, 50), (lock_x - 6, lock_y, 12, 10)))
         else:
             # Unlocked door - glowing dark red magical
             pulse = (math.sin(self.glow_timer * 3) + 1) / 2
@@ -1055,7 +987,7 @@ class Door:
                 alpha = int(glow_alpha * (1 - r / 30))
                 pygame.draw.rect(glow_surf, (180, 60, 60, alpha), 
                                (20 - r, 20 - r, self.width + r * 2, self.height + r * 2))
-            surface.blit(glow_surf, (draw_x - 20, draw_y - 20))
+            drawn.append(surface.blit(glow_surf, (draw_x - 20, draw_y - 20)))
             
             # Door with dark red magical gradient
             door_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
@@ -1063,7 +995,7 @@ class Door:
                 gradient = int(60 + 40 * (y / self.height) + 20 * pulse)
                 color = (gradient + 40, gradient - 20, gradient - 20, 255)  # Dark red gradient
                 pygame.draw.line(door_surf, color, (0, y), (self.width, y))
-            surface.blit(door_surf, (draw_x, draw_y))
+            drawn.append(surface.blit(door_surf, (draw_x, draw_y)))
             
             # Magical runes/symbols (dark red/orange)
             rune_color = (255, 150, 100, int(150 + 100 * pulse))
@@ -1075,13 +1007,13 @@ class Door:
                            (self.width // 2, self.height // 2 + 20), 2)
             pygame.draw.line(rune_surf, rune_color, (self.width // 2 - 15, self.height // 2), 
                            (self.width // 2 + 15, self.height // 2), 2)
-            surface.blit(rune_surf, (draw_x, draw_y))
+            drawn.append(surface.blit(rune_surf, (draw_x, draw_y)))
             
             # Handle/knob (bronze/copper color)
             knob_x = draw_x + self.width - 12
             knob_y = draw_y + self.height // 2
-            pygame.draw.circle(surface, (180, 120, 80), (knob_x, knob_y), 5)
-            pygame.draw.circle(surface, (220, 160, 100), (knob_x, knob_y), 3)
+            drawn.append(pygame.draw.circle(surface, (180, 120, 80), (knob_x, knob_y), 5))
+            drawn.append(pygame.draw.circle(surface, (220, 160, 100), (knob_x, knob_y), 3))
         
         # Draw particles
         for p in self.particles:
@@ -1092,21 +1024,19 @@ class Door:
             if size > 0:
                 ps = pygame.Surface((size * 2 + 2, size * 2 + 2), pygame.SRCALPHA)
                 pygame.draw.circle(ps, (*p['color'], alpha), (size + 1, size + 1), size)
-                surface.blit(ps, (int(px) - size, int(py) - size))
+                drawn.append(surface.blit(ps, (int(px) - size, int(py) - size)))
         
         # Highlight when nearby
         if self.highlight and not self.locked:
             hl_surf = pygame.Surface((self.width + 8, self.height + 8), pygame.SRCALPHA)
             hl_surf.fill((255, 200, 200, 30))  # Light red highlight
-            surface.blit(hl_surf, (draw_x - 4, draw_y - 4))
+            drawn.append(surface.blit(hl_surf, (draw_x - 4, draw_y - 4)))
             
             # Draw hint
-            try:
-                font = pygame.font.Font(FONT_PATH, 18)
-            except:
-                font = pygame.font.Font(None, 18)
+            font = get_font_from(FONT_PATH, 18)
             hint = font.render("Press SPACE to enter", True, (255, 180, 150))  # Dark red/orange text
-            surface.blit(hint, (draw_x + self.width // 2 - hint.get_width() // 2, draw_y - 30))
+            drawn.append(surface.blit(hint, (draw_x + self.width // 2 - hint.get_width() // 2, draw_y - 30)))
+        return drawn
 
 
 class MirrorRoomPuzzle:
@@ -1135,6 +1065,8 @@ class MirrorRoomPuzzle:
         
         self.camera_x = 0
         self.camera_y = 0
+        # Static room cache + partial display updates (see src/systems/dirty_rects.py)
+        self.dirty = DirtyRectRenderer(self.screen.get_size())
         
         screen_w, screen_h = self.screen.get_size()
         self.dialogue = DialogueBox()
@@ -1443,48 +1375,59 @@ class MirrorRoomPuzzle:
     
     def draw(self):
         shake_x, shake_y = self.dream_effect.get_shake_offset()
-        self.screen.fill(COLOR_DREAM)
-        
-        # Draw map
-        self.screen.blit(self.map_surface, (-self.camera_x + shake_x, -self.camera_y + shake_y))
-        
-        # Draw small decorative mirrors
-        for rect in self.small_mirrors:
-            self._draw_small_mirror(rect, shake_x, shake_y)
+        map_pos = (int(-self.camera_x + shake_x), int(-self.camera_y + shake_y))
+        
+        # Static layer: map + small decorative mirrors, rebuilt only when the view moves
+        dirty = self.dirty
+        if self.dream_effect.is_fullscreen_active() or (self.game_complete and self.effect_obtained):
+            dirty.invalidate()
+        if dirty.begin(key=map_pos):
+            dirty.background.fill(COLOR_DREAM)
+            dirty.background.blit(self.map_surface, map_pos)
+            for rect in self.small_mirrors:
+                self._draw_small_mirror(rect, shake_x, shake_y, dirty.background)
+        
+        dirty.render(self.screen, self._draw_dynamic)
+        dirty.present()
+    
+    def _draw_dynamic(self, screen):
+        """Dynamic pass for `dirty.render`; may run twice in a frame."""
+        dirty = self.dirty
+        shake_x, shake_y = self.dream_effect.get_shake_offset()
+        cam_x, cam_y = self.camera_x - shake_x, self.camera_y - shake_y
         
         # Draw door
-        self.door.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.door.draw(screen, cam_x, cam_y))
         
         # Draw puzzle markers
-        self.puzzle.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.puzzle.draw(screen, cam_x, cam_y))
         
         # Draw main mirror
-        self.mirror.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y, self.character)
+        dirty.add(self.mirror.draw(screen, cam_x, cam_y, self.character))
         
         # Draw pencil
-        self.pencil.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.pencil.draw(screen, cam_x, cam_y))
         
         # Draw character
-        self.character.draw(self.screen, self.camera_x - shake_x, self.camera_y - shake_y)
+        dirty.add(self.character.draw(screen, cam_x, cam_y))
         
         # Draw effects
-        self.dream_effect.draw(self.screen)
+        dirty.add(self.dream_effect.draw(screen, dirty))
         
         # Draw UI
-        self._draw_ui()
+        dirty.add(self._draw_ui())
         
         # Draw dialogue
-        self.dialogue.draw(self.screen)
-        
-        pygame.display.flip()
+        dirty.add(self.dialogue.draw(screen))
     
-    def _draw_small_mirror(self, rect, shake_x, shake_y):
+    def _draw_small_mirror(self, rect, shake_x, shake_y, target=None):
         """Draw a small decorative wall mirror"""
+        target = target or self.screen
         draw_x = rect.x - self.camera_x + shake_x
         draw_y = rect.y - self.camera_y + shake_y
         
         # Frame
-        pygame.draw.rect(self.screen, (70, 60, 50), (draw_x - 2, draw_y - 2, rect.width + 4, rect.height + 4))
+        pygame.draw.rect(target, (70, 60, 50), (draw_x - 2, draw_y - 2, rect.width + 4, rect.height + 4))
         
         # Mirror surface
         mirror_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
@@ -1492,62 +1435,57 @@ class MirrorRoomPuzzle:
             gradient = int(150 + 50 * (y / rect.height))
             pygame.draw.line(mirror_surf, (gradient, gradient + 10, gradient + 20, 180),
                            (0, y), (rect.width, y))
-        self.screen.blit(mirror_surf, (draw_x, draw_y))
+        target.blit(mirror_surf, (draw_x, draw_y))
     
     def _draw_ui(self):
-        try:
-            font = pygame.font.Font(FONT_PATH, 24)
-            small_font = pygame.font.Font(FONT_PATH, 18)
-        except:
-            font = pygame.font.Font(None, 24)
-            small_font = pygame.font.Font(None, 18)
+        drawn = []
+        font = get_font_from(FONT_PATH, 24)
+        small_font = get_font_from(FONT_PATH, 18)
         
         # Room title
         ui_bg = pygame.Surface((180, 50), pygame.SRCALPHA)
         ui_bg.fill((0, 0, 0, 100))
-        self.screen.blit(ui_bg, (5, 5))
+        drawn.append(self.screen.blit(ui_bg, (5, 5)))
         
         title = font.render("MIRROR ROOM", True, (180, 200, 220))
-        self.screen.blit(title, (15, 12))
+        drawn.append(self.screen.blit(title, (15, 12)))
         
         # Progress indicator
         if not self.puzzle.solved:
             progress_text = f"Positions: {self.puzzle.current_target}/{len(self.puzzle.target_positions)}"
             progress = small_font.render(progress_text, True, (150, 170, 200))
-            self.screen.blit(progress, (15, 35))
+            drawn.append(self.screen.blit(progress, (15, 35)))
         
         # Controls hint
         hint_text = "WASD/Arrows: Move | SPACE: Interact | E: Effects"
         hint = small_font.render(hint_text, True, (100, 100, 120))
         screen_w, screen_h = self.screen.get_size()
-        self.screen.blit(hint, (10, screen_h - 25))
+        drawn.append(self.screen.blit(hint, (10, screen_h - 25)))
         
         # Effect indicator
         effect_x = screen_w - 60
         if self.effect_obtained:
-            pygame.draw.circle(self.screen, (255, 200, 100), (effect_x, 25), 15)
-            pygame.draw.circle(self.screen, (255, 255, 200), (effect_x, 25), 10)
+            drawn.append(pygame.draw.circle(self.screen, (255, 200, 100), (effect_x, 25), 15))
+            drawn.append(pygame.draw.circle(self.screen, (255, 255, 200), (effect_x, 25), 10))
             # Draw pencil icon instead of emoji
-            pygame.draw.line(self.screen, (80, 60, 40), (effect_x - 5, 30), (effect_x + 5, 20), 3)
-            pygame.draw.line(self.screen, (255, 200, 50), (effect_x - 5, 30), (effect_x + 3, 22), 2)
+            drawn.append(pygame.draw.line(self.screen, (80, 60, 40), (effect_x - 5, 30), (effect_x + 5, 20), 3))
+            drawn.append(pygame.draw.line(self.screen, (255, 200, 50), (effect_x - 5, 30), (effect_x + 3, 22), 2))
         else:
-            pygame.draw.circle(self.screen, (50, 50, 60), (effect_x, 25), 15)
-            pygame.draw.circle(self.screen, (40, 40, 50), (effect_x, 25), 12, 2)
+            drawn.append(pygame.draw.circle(self.screen, (50, 50, 60), (effect_x, 25), 15))
+            drawn.append(pygame.draw.circle(self.screen, (40, 40, 50), (effect_x, 25), 12, 2))
         
         # Game complete overlay
         if self.game_complete and self.effect_obtained:
             overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
             alpha = min(150, int(pygame.time.get_ticks() % 3000 / 15))
             overlay.fill((255, 255, 255, alpha))
-            self.screen.blit(overlay, (0, 0))
+            drawn.append(self.screen.blit(overlay, (0, 0)))
             
-            try:
-                big_font = pygame.font.Font(FONT_PATH, 48)
-            except:
-                big_font = pygame.font.Font(None, 48)
+            big_font = get_font_from(FONT_PATH, 48)
             text = big_font.render("Mirror Cleared", True, (50, 50, 80))
             rect = text.get_rect(center=(screen_w // 2, screen_h // 2))
-            self.screen.blit(text, rect)
+            drawn.append(self.screen.blit(text, rect))
+        return drawn
     
     def run(self):
         running = True
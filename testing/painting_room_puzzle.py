@@ -11,9 +11,17 @@ import sys
 import os
 import math
 import random
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.systems.animation import Animator, Clip, clip_store
+from src.systems.camera import Camera
+from src.systems.particles import ParticleEmitter
+from src.systems.dirty_rects import DirtyRectRenderer
+from src.systems.dialogue import DialogueBox as BaseDialogueBox
+from src.utils.font import get_font_from
+
 # --------------------------
 # config
 # --------------------------
@@ -147,8 +155,9 @@ class Door:
     
     def draw(self, screen: pygame.Surface, offset_x: float, offset_y: float):
         """绘制门"""
+        drawn = []
         if not self.visible:
-            return
+            return drawn
         
         draw_x = self.x + offset_x
         draw_y = self.y + offset_y
@@ -165,7 +174,7 @@ class Door:
             pygame.draw.ellipse(glow_surface, (*DOOR_GLOW_COLOR, alpha),
                               (30 - r, 30 - r, self.width + r * 2, self.height + r * 2))
         
-        screen.blit(glow_surface, (draw_x - 30, draw_y - 30))
+        drawn.append(screen.blit(glow_surface, (draw_x - 30, draw_y - 30)))
         
         # 绘制门本身
         door_copy = self.surface.copy()
@@ -180,7 +189,7 @@ class Door:
             draw_x += (self.width - scaled_w) // 2
             draw_y += (self.height - scaled_h) // 2
         
-        screen.blit(door_copy, (draw_x, draw_y))
+        drawn.append(screen.blit(door_copy, (draw_x, draw_y)))
         
         # 传送门激活特效
         if self.activated:
@@ -188,7 +197,8 @@ class Door:
             flash_alpha = int(200 * (1 + math.sin(self.glow_phase * 3)) / 2)
             pygame.draw.rect(portal_surf, (200, 150, 255, flash_alpha), 
                            (10, 10, self.width - 20, self.height - 20), border_radius=4)
-            screen.blit(portal_surf, (self.x + offset_x, self.y + offset_y))
+            drawn.append(screen.blit(portal_surf, (self.x + offset_x, self.y + offset_y)))
+        return drawn
 
 
 class Character:
@@ -197,8 +207,8 @@ class Character:
         self.x = x
         self.y = y
         self.speed = 120.0
-        self.witch_sprite = self._load_witch_sprite()
-        self.girl_frames = self._load_girl_frames()  # 8方向动画帧
+        self.witch_clip = self._load_witch_clip()
+        self.girl_clips = self._load_girl_clips()  # 8方向动画
         self.direction = 'down'  # 8方向
         self.is_moving = False
         self.collision_width = 16
@@ -206,71 +216,51 @@ class Character:
         self.transformed = False
         self.transform_effect_timer = 0
         self.transform_effect_active = False
-        self.frame_index = 0
-        self.animation_timer = 0.0
+        self.animator = Animator(self.witch_clip)
     
-    def _load_witch_sprite(self):
-        """加载小女巫精灵图（静态）"""
+    def _load_witch_clip(self):
+        """加载小女巫精灵图（静态，取第一帧）"""
         idle_path = os.path.join(BLUE_WITCH_DIR, "B_witch_idle.png")
-        
-        try:
-            sprite_sheet = pygame.image.load(idle_path).convert_alpha()
-            first_frame = sprite_sheet.subsurface(pygame.Rect(0, 0, 32, 32))
-            scaled = pygame.transform.scale(first_frame, (64, 64))
-            return scaled
-        except Exception as e:
-            print(f"Warning: Could not load witch sprite: {e}")
-            placeholder = pygame.Surface((64, 64), pygame.SRCALPHA)
-            pygame.draw.circle(placeholder, (100, 100, 200), (32, 32), 20)
-            return placeholder
+        clip = clip_store.grid(idle_path, (32, 32), 1, size=(64, 64))
+        if clip:
+            return clip
+        
+        print(f"Warning: Could not load witch sprite: {idle_path}")
+        def placeholder():
+            surf = pygame.Surface((64, 64), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (100, 100, 200), (32, 32), 20)
+            return Clip([surf])
+        return clip_store.get(('painting_witch_placeholder',), placeholder)
     
-    def _load_girl_frames(self):
-        """加载小女孩8方向行走动画帧"""
-        frames = {}  # {direction: [idle_frame, walk1, walk2, ...]}
-        
-        try:
-            sprite_sheet = pygame.image.load(GIRL_SPRITE_PATH).convert_alpha()
-            
-            # 8个方向，每行36像素高
-            # 交换left和right的映射
-            directions = ['down', 'down_right', 'right', 'up_right', 'up', 'up_left', 'left', 'down_left']
-            row_height = 36  # 行间距
-            
-            for row, direction in enumerate(directions):
-                frames[direction] = []
-                # 9列: 第0列是idle，第1-8列是行走动画
-                for col in range(9):
-                    x = col * GIRL_FRAME_WIDTH
-                    y = row * row_height  # 使用行间距
-                    
-                    # 确保不超出边界
-                    if x + GIRL_FRAME_WIDTH <= sprite_sheet.get_width() and y + GIRL_FRAME_HEIGHT <= sprite_sheet.get_height():
-                        frame = sprite_sheet.subsurface(pygame.Rect(x, y, GIRL_FRAME_WIDTH, GIRL_FRAME_HEIGHT))
-                        # 缩放
-                        scaled_w = int(GIRL_FRAME_WIDTH * GIRL_SCALE)
-                        scaled_h = int(GIRL_FRAME_HEIGHT * GIRL_SCALE)
-                        scaled = pygame.transform.scale(frame, (scaled_w, scaled_h))
-                        frames[direction].append(scaled)
-                
-                # 确保至少有一帧
-                if not frames[direction]:
-                    placeholder = pygame.Surface((int(GIRL_FRAME_WIDTH * GIRL_SCALE), 
-                                                 int(GIRL_FRAME_HEIGHT * GIRL_SCALE)), pygame.SRCALPHA)
-                    pygame.draw.circle(placeholder, (255, 200, 150), 
-                                     (int(GIRL_FRAME_WIDTH * GIRL_SCALE // 2), 
-                                      int(GIRL_FRAME_HEIGHT * GIRL_SCALE // 2)), 10)
-                    frames[direction] = [placeholder]
-            
-            return frames
-        except Exception as e:
-            print(f"Warning: Could not load girl sprite sheet: {e}")
-            # 创建占位符
-            placeholder = pygame.Surface((int(GIRL_FRAME_WIDTH * GIRL_SCALE), 
-                                         int(GIRL_FRAME_HEIGHT * GIRL_SCALE)), pygame.SRCALPHA)
-            pygame.draw.circle(placeholder, (255, 200, 150), 
-                             (int(GIRL_FRAME_WIDTH * GIRL_SCALE // 2), 
-                              int(GIRL_FRAME_HEIGHT * GIRL_SCALE // 2)), 10)
-            return {d: [placeholder] for d in ['down', 'down_left', 'left', 'up_left', 'up', 'up_right', 'right', 'down_right']}
+    def _load_girl_clips(self):
+        """加载小女孩8方向行走动画（全局共享，不重复切帧）"""
+        clips = {}  # {direction: {'idle': 第0帧, 'walk': 第1-8帧}}
+        size = (int(GIRL_FRAME_WIDTH * GIRL_SCALE), int(GIRL_FRAME_HEIGHT * GIRL_SCALE))
+        
+        def placeholder():
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 200, 150), (size[0] // 2, size[1] // 2), 10)
+            return Clip([surf], GIRL_ANIMATION_SPEED)
+        
+        if clip_store.image(GIRL_SPRITE_PATH) is None:
+            print(f"Warning: Could not load girl sprite sheet: {GIRL_SPRITE_PATH}")
+        
+        # 8个方向，每行36像素高
+        # 交换left和right的映射
+        directions = ['down', 'down_right', 'right', 'up_right', 'up', 'up_left', 'left', 'down_left']
+        row_height = 36  # 行间距
+        
+        for row, direction in enumerate(directions):
+            # 9列: 第0列是idle，第1-8列是行走动画（超出边界的帧会被丢弃）
+            sheet_row = clip_store.grid(GIRL_SPRITE_PATH, (GIRL_FRAME_WIDTH, GIRL_FRAME_HEIGHT), 9,
+                                        origin=(0, row * row_height), size=size,
+                                        duration=GIRL_ANIMATION_SPEED)
+            # 确保至少有一帧
+            if not sheet_row:
+                sheet_row = clip_store.get(('painting_girl_placeholder', size), placeholder)
+            walk = sheet_row.sub(1) if len(sheet_row) > 1 else sheet_row
+            clips[direction] = {'idle': sheet_row.sub(0, 1), 'walk': walk}
+        return clips
     
     def transform_to_girl(self):
         """变身为小女孩"""
@@ -327,34 +317,26 @@ class Character:
         else:
             self.is_moving = False
         
-        # 更新动画帧（变身后）
-        if self.transformed:
-            self.animation_timer += dt
-            if self.animation_timer >= GIRL_ANIMATION_SPEED:
-                self.animation_timer = 0
-                if self.is_moving:
-                    # 行走动画使用第1-8帧（跳过第0帧idle）
-                    frames = self.girl_frames.get(self.direction, self.girl_frames['down'])
-                    if len(frames) > 1:
-                        self.frame_index = ((self.frame_index) % 8) + 1  # 1-8循环
-                        if self.frame_index >= len(frames):
-                            self.frame_index = 1
-                else:
-                    self.frame_index = 0  # idle帧
+        # 更新动画帧（变身后）：行走使用第1-8帧（跳过第0帧idle），转向时保持相位
+        self.animator.play(self._current_clip(), keep_phase=self.transformed and self.is_moving)
+        if self.transformed and self.is_moving:
+            self.animator.update(dt)
     
-    def draw(self, surface, offset_x=0, offset_y=0):
-        # 选择当前精灵
+    def _current_clip(self):
+        """当前状态对应的动画"""
         if self.transformed:
             # 变身后使用8方向动画
-            frames = self.girl_frames.get(self.direction, self.girl_frames['down'])
-            frame_idx = min(self.frame_index, len(frames) - 1)
-            sprite = frames[frame_idx]
-        else:
-            # 变身前使用小女巫静态图
-            sprite = self.witch_sprite
-            # 根据方向翻转（小女巫只有左右）
-            if self.direction in ['left', 'up_left', 'down_left']:
-                sprite = pygame.transform.flip(sprite, True, False)
+            clips = self.girl_clips.get(self.direction, self.girl_clips['down'])
+            return clips['walk'] if self.is_moving else clips['idle']
+        # 变身前使用小女巫静态图，根据方向翻转（小女巫只有左右）
+        if self.direction in ['left', 'up_left', 'down_left']:
+            return self.witch_clip.flipped()
+        return self.witch_clip
+    
+    def draw(self, surface, offset_x=0, offset_y=0):
+        drawn = []
+        # 选择当前精灵（见 _current_clip）
+        sprite = self.animator.frame
         
         # 绘制位置
         draw_x = self.x + offset_x - sprite.get_width() // 2
@@ -384,10 +366,11 @@ class Character:
                 pygame.draw.circle(glow_surf, color, (glow_size, glow_size), glow_size)
                 glow_x = draw_x + sprite.get_width() // 2 - glow_size
                 glow_y = draw_y + sprite.get_height() // 2 - glow_size
-                surface.blit(glow_surf, (glow_x, glow_y), special_flags=pygame.BLEND_ADD)
+                drawn.append(surface.blit(glow_surf, (glow_x, glow_y), special_flags=pygame.BLEND_ADD))
         
         # 绘制精灵
-        surface.blit(sprite, (draw_x, draw_y))
+        drawn.append(surface.blit(sprite, (draw_x, draw_y)))
+        return drawn
 
 
 class DreamEffect:
@@ -397,116 +380,66 @@ class DreamEffect:
         self.screen_height = screen_height
         self.flash_alpha = 0
         self.flash_color = (255, 255, 255)
-        self.screen_shake = 0
-        self.shake_intensity = 0
-        self.particles = []
-        for _ in range(40):
-            self.particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'speed': random.uniform(10, 25),
-                'size': random.randint(2, 5),
-                'alpha': random.randint(30, 80),
-                'color': random.choice([
-                    (255, 100, 100), (100, 255, 100), (100, 100, 255),
-                    (255, 255, 100), (255, 100, 255), (100, 255, 255)
-                ])
-            })
+        self.camera = Camera()
+        self._flash = None
+        self.particles = ParticleEmitter(capacity=40, palette=[
+                (255, 100, 100), (100, 255, 100), (100, 100, 255),
+                (255, 255, 100), (255, 100, 255), (100, 255, 255)
+            ])
+        n = 40
+        self.particles.emit(n,
+                            x=self.particles.uniform(0, self.screen_width, n),
+                            y=self.particles.uniform(0, self.screen_height, n),
+                            vy=-self.particles.uniform(10, 25, n),
+                            size=self.particles.uniform(2, 5, n),
+                            alpha=self.particles.uniform(30, 80, n))
     
     def flash(self, color, alpha):
         self.flash_color = color
         self.flash_alpha = alpha
     
     def shake(self, duration=0.3, intensity=5):
-        self.screen_shake = duration
-        self.shake_intensity = intensity
+        self.camera.shake(duration, intensity)
     
     def get_shake_offset(self):
-        if self.screen_shake > 0:
-            return (random.uniform(-self.shake_intensity, self.shake_intensity),
-                    random.uniform(-self.shake_intensity, self.shake_intensity))
-        return (0, 0)
+        return self.camera.shake_offset
     
     def update(self, dt):
         if self.flash_alpha > 0:
             self.flash_alpha = max(0, self.flash_alpha - 300 * dt)
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
-        for p in self.particles:
-            p['y'] -= p['speed'] * dt
-            p['x'] += math.sin(p['y'] * 0.02) * 0.5
-            if p['y'] < -10:
-                p['y'] = self.screen_height + 10
-                p['x'] = random.randint(0, self.screen_width)
+        self.camera.update(dt)
+        self.particles.update(dt)
+        x, y = self.particles.view('x'), self.particles.view('y')
+        x += np.sin(y * 0.02) * 0.5
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = self.screen_height + 10
+            x[wrapped] = self.particles.uniform(0, self.screen_width, int(wrapped.sum()))
+    
+    def is_fullscreen_active(self):
+        return self.flash_alpha > 0
     
     def draw(self, surface):
-        for p in self.particles:
-            ps = pygame.Surface((p['size']*2+2, p['size']*2+2), pygame.SRCALPHA)
-            pygame.draw.circle(ps, (*p['color'], p['alpha']), (p['size']+1, p['size']+1), p['size'])
-            surface.blit(ps, (int(p['x']), int(p['y'])))
+        drawn = self.particles.draw(surface)
         
         if self.flash_alpha > 0:
-            fs = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            fs.fill((*self.flash_color, int(self.flash_alpha)))
-            surface.blit(fs, (0, 0))
+            if self._flash is None or self._flash.get_size() != surface.get_size():
+                self._flash = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._flash.fill((*self.flash_color, int(self.flash_alpha)))
+            drawn.append(surface.blit(self._flash, (0, 0)))
+        return drawn
 
 
-class DialogueBox:
+class DialogueBox(BaseDialogueBox):
     """对话框"""
     def __init__(self, screen_width, screen_height):
+        font = get_font_from(FONT_PATH, 24)
+        super().__init__(font, text_color=COLOR_TEXT, char_speed=0.03,
+                         box=(40, 100, 40), size=(screen_width, screen_height),
+                         fill=(20, 10, 35, 230), border=(150, 100, 50),
+                         indicator_color=(180, 150, 100), indicator_offset=(-50, -30))
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.active = False
-        self.text = ""
-        self.display_text = ""
-        self.char_index = 0
-        self.char_timer = 0
-        self.char_speed = 0.03
-        try:
-            self.font = pygame.font.Font(FONT_PATH, 24)
-        except:
-            self.font = pygame.font.Font(None, 24)
-    
-    def show(self, text):
-        self.active = True
-        self.text = text
-        self.display_text = ""
-        self.char_index = 0
-    
-    def update(self, dt):
-        if self.active and self.char_index < len(self.text):
-            self.char_timer += dt
-            if self.char_timer >= self.char_speed:
-                self.char_timer = 0
-                self.display_text += self.text[self.char_index]
-                self.char_index += 1
-    
-    def skip(self):
-        if self.char_index < len(self.text):
-            self.display_text = self.text
-            self.char_index = len(self.text)
-        else:
-            self.active = False
-    
-    def draw(self, surface):
-        if not self.active:
-            return
-        box_h = 100
-        box_rect = pygame.Rect(40, self.screen_height - box_h - 40,
-                               self.screen_width - 80, box_h)
-        box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-        box_surf.fill((20, 10, 35, 230))
-        pygame.draw.rect(box_surf, (150, 100, 50), (0, 0, box_rect.width, box_rect.height), 3)
-        surface.blit(box_surf, box_rect.topleft)
-        
-        for i, line in enumerate(self.display_text.split('\n')):
-            text_surf = self.font.render(line, True, COLOR_TEXT)
-            surface.blit(text_surf, (box_rect.x + 20, box_rect.y + 15 + i * 28))
-        
-        if self.char_index >= len(self.text):
-            if int(pygame.time.get_ticks() / 500) % 2:
-                ind = self.font.render(">>", True, (180, 150, 100))
-                surface.blit(ind, (box_rect.right - 50, box_rect.bottom - 30))
 
 
 class PaintingFragment:
@@ -623,8 +556,9 @@ class PaintingFragment:
         return math.sqrt(dx*dx + dy*dy) < distance
     
     def draw(self, surface, offset_x=0, offset_y=0):
+        drawn = []
         if self.collected:
-            return
+            return drawn
         
         draw_x = self.x + offset_x
         draw_y = self.y + offset_y + math.sin(self.bob_offset) * 8
@@ -640,19 +574,20 @@ class PaintingFragment:
             alpha = int((40 + pulse * 30) * (1 - r/glow_size))
             pygame.draw.circle(glow_surf, (*self.color_scheme[0], alpha),
                               (int(glow_size), int(glow_size)), r)
-        surface.blit(glow_surf, (draw_x - glow_size, draw_y - glow_size))
+        drawn.append(surface.blit(glow_surf, (draw_x - glow_size, draw_y - glow_size)))
         
         # 内层光晕
         inner_glow = 25 + pulse2 * 8
         inner_surf = pygame.Surface((int(inner_glow*2), int(inner_glow*2)), pygame.SRCALPHA)
         pygame.draw.circle(inner_surf, (*self.color_scheme[1], int(60 + pulse2 * 40)),
                           (int(inner_glow), int(inner_glow)), int(inner_glow))
-        surface.blit(inner_surf, (draw_x - inner_glow, draw_y - inner_glow))
+        drawn.append(surface.blit(inner_surf, (draw_x - inner_glow, draw_y - inner_glow)))
         
         # 旋转绘制碎片
         rotated = pygame.transform.rotate(self.surface, self.rotation)
         rot_rect = rotated.get_rect(center=(draw_x, draw_y))
-        surface.blit(rotated, rot_rect)
+        drawn.append(surface.blit(rotated, rot_rect))
+        return drawn
 
 
 class PaintingCanvas:
@@ -683,6 +618,7 @@ class PaintingCanvas:
         self.shimmer_offset += dt * 100
     
     def draw(self, surface, offset_x, offset_y, fragment_surfaces):
+        drawn = []
         dx = self.x + offset_x
         dy = self.y + offset_y
         
@@ -692,24 +628,24 @@ class PaintingCanvas:
         frame_color3 = (90, 60, 35)
         
         # 外框阴影
-        pygame.draw.rect(surface, (30, 20, 15), (dx - 14, dy - 14, self.width + 28, self.height + 28), border_radius=6)
+        drawn.append(pygame.draw.rect(surface, (30, 20, 15), (dx - 14, dy - 14, self.width + 28, self.height + 28), border_radius=6))
         # 外框
-        pygame.draw.rect(surface, frame_color1, (dx - 12, dy - 12, self.width + 24, self.height + 24), border_radius=5)
+        drawn.append(pygame.draw.rect(surface, frame_color1, (dx - 12, dy - 12, self.width + 24, self.height + 24), border_radius=5))
         # 装饰线
-        pygame.draw.rect(surface, frame_color2, (dx - 12, dy - 12, self.width + 24, self.height + 24), 3, border_radius=5)
+        drawn.append(pygame.draw.rect(surface, frame_color2, (dx - 12, dy - 12, self.width + 24, self.height + 24), 3, border_radius=5))
         # 内框
-        pygame.draw.rect(surface, frame_color3, (dx - 4, dy - 4, self.width + 8, self.height + 8), border_radius=2)
-        pygame.draw.rect(surface, (200, 160, 100), (dx - 4, dy - 4, self.width + 8, self.height + 8), 2, border_radius=2)
+        drawn.append(pygame.draw.rect(surface, frame_color3, (dx - 4, dy - 4, self.width + 8, self.height + 8), border_radius=2))
+        drawn.append(pygame.draw.rect(surface, (200, 160, 100), (dx - 4, dy - 4, self.width + 8, self.height + 8), 2, border_radius=2))
         # 画布背景
-        pygame.draw.rect(surface, (40, 28, 50), (dx, dy, self.width, self.height))
+        drawn.append(pygame.draw.rect(surface, (40, 28, 50), (dx, dy, self.width, self.height)))
         
         # 画框角落装饰
         corner_size = 8
         corners = [(dx - 10, dy - 10), (dx + self.width + 2, dy - 10),
                    (dx - 10, dy + self.height + 2), (dx + self.width + 2, dy + self.height + 2)]
         for cx, cy in corners:
-            pygame.draw.rect(surface, frame_color2, (cx, cy, corner_size, corner_size))
-            pygame.draw.rect(surface, (220, 180, 120), (cx + 2, cy + 2, corner_size - 4, corner_size - 4))
+            drawn.append(pygame.draw.rect(surface, frame_color2, (cx, cy, corner_size, corner_size)))
+            drawn.append(pygame.draw.rect(surface, (220, 180, 120), (cx + 2, cy + 2, corner_size - 4, corner_size - 4)))
         
         if self.completed:
             pulse = (math.sin(self.glow_timer * 2) + 1) / 2
@@ -717,7 +653,7 @@ class PaintingCanvas:
             for r in range(40, 5, -5):
                 alpha = int((50 + pulse * 60) * (1 - r/40))
                 pygame.draw.rect(glow, (255, 180, 80, alpha), (25-r, 25-r, self.width+r*2, self.height+r*2), border_radius=r//2)
-            surface.blit(glow, (dx - 25, dy - 25))
+            drawn.append(surface.blit(glow, (dx - 25, dy - 25)))
         
         # 3x2 格子排列6个碎片
         slot_w, slot_h = self.width // 3, self.height // 2
@@ -726,14 +662,15 @@ class PaintingCanvas:
             sy = dy + (i // 3) * slot_h
             if slot is not None and slot < len(fragment_surfaces):
                 scaled = pygame.transform.scale(fragment_surfaces[slot], (slot_w - 4, slot_h - 4))
-                surface.blit(scaled, (sx + 2, sy + 2))
+                drawn.append(surface.blit(scaled, (sx + 2, sy + 2)))
             else:
                 # 空槽位装饰
-                pygame.draw.rect(surface, (55, 40, 65), (sx + 3, sy + 3, slot_w - 6, slot_h - 6), 1)
+                drawn.append(pygame.draw.rect(surface, (55, 40, 65), (sx + 3, sy + 3, slot_w - 6, slot_h - 6), 1))
                 # 闪烁效果
                 shimmer = int((math.sin(self.shimmer_offset * 0.05 + i) + 1) * 15)
-                pygame.draw.rect(surface, (70 + shimmer, 50 + shimmer, 80 + shimmer),
-                               (sx + 6, sy + 6, slot_w - 12, slot_h - 12), 1)
+                drawn.append(pygame.draw.rect(surface, (70 + shimmer, 50 + shimmer, 80 + shimmer),
+                                            (sx + 6, sy + 6, slot_w - 12, slot_h - 12), 1))
+        return drawn
 
 
 class BurningEffect:
@@ -797,8 +734,9 @@ class BurningEffect:
             self.active = False
     
     def draw(self, surface, offset_x, offset_y):
+        drawn = []
         if not self.active and not self.flames:
-            return
+            return drawn
         
         for flame in self.flames:
             fx = flame['x'] + offset_x
@@ -816,7 +754,8 @@ class BurningEffect:
             flame_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
             alpha = max(0, min(255, int(220 * life_ratio)))
             pygame.draw.circle(flame_surf, (*color, alpha), (size, size), size)
-            surface.blit(flame_surf, (fx - size, fy - size))
+            drawn.append(surface.blit(flame_surf, (fx - size, fy - size)))
+        return drawn
 
 
 class AbsorptionEffect:
@@ -888,8 +827,9 @@ class AbsorptionEffect:
                 self.active = False
     
     def draw(self, surface, offset_x, offset_y, char_x, char_y):
+        drawn = []
         if not self.active:
-            return
+            return drawn
         
         for p in self.particles:
             if p['absorbed']:
@@ -900,7 +840,7 @@ class AbsorptionEffect:
             ps = pygame.Surface((size*3, size*3), pygame.SRCALPHA)
             pygame.draw.circle(ps, (*p['color'], 180), (size*3//2, size*3//2), size)
             pygame.draw.circle(ps, (255, 255, 200, 220), (size*3//2, size*3//2), size//2)
-            surface.blit(ps, (px - size*3//2, py - size*3//2))
+            drawn.append(surface.blit(ps, (px - size*3//2, py - size*3//2)))
         
         if self.glow_intensity > 0:
             cx = char_x + offset_x
@@ -911,7 +851,8 @@ class AbsorptionEffect:
             for r in range(int(glow_size), 10, -5):
                 alpha = int(self.glow_intensity * (1 - r/glow_size) * 0.6)
                 pygame.draw.circle(glow, (255, 180, 80, alpha), (int(glow_size), int(glow_size)), r)
-            surface.blit(glow, (cx - glow_size, cy - glow_size - 15))
+            drawn.append(surface.blit(glow, (cx - glow_size, cy - glow_size - 15)))
+        return drawn
 
 
 class PaintingRoomPuzzle:
@@ -944,6 +885,8 @@ class PaintingRoomPuzzle:
         
         self.dialogue = DialogueBox(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.dream_effect = DreamEffect(SCREEN_WIDTH, SCREEN_HEIGHT)
+        # 静态背景缓存 + 局部刷新 (见 src/systems/dirty_rects.py)
+        self.dirty = DirtyRectRenderer(self.screen.get_size())
         
         self._create_fragments_and_canvas()
         
@@ -1164,7 +1107,7 @@ class PaintingRoomPuzzle:
                     running = False  # 结束当前关卡
             
             self._render()
-            pygame.display.flip()
+            self.dirty.present()
         
         if self.owns_screen:
             pygame.quit()
@@ -1232,26 +1175,41 @@ class PaintingRoomPuzzle:
         total_offset_x = self.offset_x + shake_x
         total_offset_y = self.offset_y + shake_y
         
-        # 绘制背景
-        self.screen.fill((12, 8, 20))
-        
-        # 背景装饰光晕
-        bg_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
-        for r in range(300, 50, -20):
-            alpha = max(0, 15 - r // 25)
-            pygame.draw.circle(bg_glow, (40, 25, 60, alpha), (center_x, center_y), r)
-        self.screen.blit(bg_glow, (0, 0))
+        # 静态层：背景、光晕、地图，只在震动偏移变化时重建
+        dirty = self.dirty
+        if self.dream_effect.is_fullscreen_active() or self.transition_to_next:
+            dirty.invalidate()
+        if dirty.begin(key=(total_offset_x, total_offset_y)):
+            bg = dirty.background
+            # 绘制背景
+            bg.fill((12, 8, 20))
+            
+            # 背景装饰光晕
+            bg_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+            for r in range(300, 50, -20):
+                alpha = max(0, 15 - r // 25)
+                pygame.draw.circle(bg_glow, (40, 25, 60, alpha), (center_x, center_y), r)
+            bg.blit(bg_glow, (0, 0))
+            
+            # 地图居中绘制
+            bg.blit(self.map_surface, (total_offset_x, total_offset_y))
         
-        # 地图居中绘制
-        self.screen.blit(self.map_surface, (total_offset_x, total_offset_y))
+        dirty.render(self.screen, self._draw_dynamic)
+    
+    def _draw_dynamic(self, screen):
+        """动态层：每帧画在缓存背景之上的内容，画到的范围交给 self.dirty"""
+        drawn = []
+        shake_x, shake_y = self.dream_effect.get_shake_offset()
+        total_offset_x = self.offset_x + shake_x
+        total_offset_y = self.offset_y + shake_y
         
         if not self.burning_effect.complete:
             frag_surfs = [f.surface for f in self.fragments]
-            self.canvas.draw(self.screen, total_offset_x, total_offset_y, frag_surfs)
+            drawn.extend(self.canvas.draw(screen, total_offset_x, total_offset_y, frag_surfs))
         
         for frag in self.fragments:
-            frag.draw(self.screen, total_offset_x, total_offset_y)
+            drawn.extend(frag.draw(screen, total_offset_x, total_offset_y))
         
         for flying in self.flying_fragments:
             fx = flying['x'] + total_offset_x
@@ -1261,73 +1219,63 @@ class PaintingRoomPuzzle:
             # 飞行轨迹光效
             trail_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
             pygame.draw.circle(trail_surf, (*flying['surface'].get_at((28, 28))[:3], 100), (10, 10), 8)
-            self.screen.blit(trail_surf, (fx - 10, fy - 10))
+            drawn.append(screen.blit(trail_surf, (fx - 10, fy - 10)))
             # 碎片本体
             scaled = pygame.transform.scale(flying['surface'], (int(56*scale), int(56*scale)))
             rot_angle = t * 360
             rotated = pygame.transform.rotate(scaled, rot_angle)
             rect = rotated.get_rect(center=(fx, fy))
-            self.screen.blit(rotated, rect)
+            drawn.append(screen.blit(rotated, rect))
         
-        self.burning_effect.draw(self.screen, total_offset_x, total_offset_y)
+        drawn.extend(self.burning_effect.draw(screen, total_offset_x, total_offset_y))
         
         # 绘制门（在角色之前，这样角色可以覆盖部分门）
-        self.exit_door.draw(self.screen, total_offset_x, total_offset_y)
+        drawn.extend(self.exit_door.draw(screen, total_offset_x, total_offset_y))
         
-        self.character.draw(self.screen, total_offset_x, total_offset_y)
-        self.absorption_effect.draw(self.screen, total_offset_x, total_offset_y, self.character.x, self.character.y)
+        drawn.extend(self.character.draw(screen, total_offset_x, total_offset_y))
+        drawn.extend(self.absorption_effect.draw(screen, total_offset_x, total_offset_y, self.character.x, self.character.y))
         
         # 门的交互提示
         if self.exit_door.visible and not self.transition_to_next and not self.dialogue.active:
             if self.exit_door.is_near(self.character.x, self.character.y, 70):
-                try:
-                    font = pygame.font.Font(FONT_PATH, 18)
-                except:
-                    font = pygame.font.Font(None, 18)
+                font = get_font_from(FONT_PATH, 18)
                 hint = font.render("Press SPACE or E to enter", True, (180, 150, 255))
                 hx = self.exit_door.x + total_offset_x + DOOR_WIDTH // 2 - hint.get_width() // 2
                 hy = self.exit_door.y + total_offset_y - 30
                 bg = pygame.Surface((hint.get_width() + 14, hint.get_height() + 8), pygame.SRCALPHA)
                 bg.fill((0, 0, 0, 180))
                 pygame.draw.rect(bg, (120, 80, 160), (0, 0, bg.get_width(), bg.get_height()), 1)
-                self.screen.blit(bg, (hx - 7, hy - 4))
-                self.screen.blit(hint, (hx, hy))
+                drawn.append(screen.blit(bg, (hx - 7, hy - 4)))
+                drawn.append(screen.blit(hint, (hx, hy)))
         
         if not self.dialogue.active and not self.burning_effect.active:
             for frag in self.fragments:
                 if not frag.collected and frag.is_near(self.character.x, self.character.y, 60):
-                    try:
-                        font = pygame.font.Font(FONT_PATH, 18)
-                    except:
-                        font = pygame.font.Font(None, 18)
+                    font = get_font_from(FONT_PATH, 18)
                     hint = font.render("Press SPACE to collect", True, (255, 220, 150))
                     hx = frag.x + total_offset_x - hint.get_width() // 2
                     hy = frag.y + total_offset_y - 60
                     bg = pygame.Surface((hint.get_width() + 14, hint.get_height() + 8), pygame.SRCALPHA)
                     bg.fill((0, 0, 0, 180))
                     pygame.draw.rect(bg, (100, 80, 60), (0, 0, bg.get_width(), bg.get_height()), 1)
-                    self.screen.blit(bg, (hx - 7, hy - 4))
-                    self.screen.blit(hint, (hx, hy))
+                    drawn.append(screen.blit(bg, (hx - 7, hy - 4)))
+                    drawn.append(screen.blit(hint, (hx, hy)))
         
-        self.dream_effect.draw(self.screen)
+        drawn.extend(self.dream_effect.draw(screen))
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 24)
-            small = pygame.font.Font(FONT_PATH, 18)
-        except:
-            font = pygame.font.Font(None, 24)
-            small = pygame.font.Font(None, 18)
+        font = get_font_from(FONT_PATH, 24)
+        small = get_font_from(FONT_PATH, 18)
         
         title = font.render("~ The Painting Room ~", True, (180, 140, 100))
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 15))
+        drawn.append(screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 15)))
         
         collected, total = self.canvas.get_progress()
         progress = small.render(f"Fragments: {collected}/{total}", True, (160, 140, 120))
-        self.screen.blit(progress, (20, 20))
+        drawn.append(screen.blit(progress, (20, 20)))
         
         if self.game_complete:
             status = font.render("[FIRE SOUL] Absorbed", True, (255, 180, 80))
-            self.screen.blit(status, (SCREEN_WIDTH//2 - status.get_width()//2, SCREEN_HEIGHT - 50))
+            drawn.append(screen.blit(status, (SCREEN_WIDTH//2 - status.get_width()//2, SCREEN_HEIGHT - 50)))
         
         # 跳转时的淡出效果
         if self.transition_to_next:
@@ -1344,19 +1292,17 @@ class PaintingRoomPuzzle:
                 alpha = int(255 * ((fade_progress - 0.5) * 2))
                 fade_surface.fill((255, 255, 255, alpha))
             
-            self.screen.blit(fade_surface, (0, 0))
+            drawn.append(screen.blit(fade_surface, (0, 0)))
             
             # 显示跳转文字
-            try:
-                trans_font = pygame.font.Font(FONT_PATH, 32)
-            except:
-                trans_font = pygame.font.Font(None, 32)
+            trans_font = get_font_from(FONT_PATH, 32)
             trans_text = trans_font.render("Entering the next dream...", True, (255, 255, 255))
             text_alpha = int(255 * min(1.0, fade_progress * 2))
             trans_text.set_alpha(text_alpha)
-            self.screen.blit(trans_text, (SCREEN_WIDTH//2 - trans_text.get_width()//2, SCREEN_HEIGHT//2 - 20))
+            drawn.append(screen.blit(trans_text, (SCREEN_WIDTH//2 - trans_text.get_width()//2, SCREEN_HEIGHT//2 - 20)))
         
-        self.dialogue.draw(self.screen)
+        drawn.extend(self.dialogue.draw(screen))
+        self.dirty.add(drawn)
 
 
 def run_painting_room(screen=None):